@@ -0,0 +1,48 @@
+"""
+Shared OpenAI client.
+
+Provides one process-wide async client so every service reuses the same
+HTTP keep-alive connection pool instead of opening new connections per call.
+"""
+
+import httpx
+from openai import AsyncOpenAI
+
+from app.core.settings import settings
+
+_client: AsyncOpenAI | None = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get the process-wide async OpenAI client, creating it on first use.
+
+    Returns:
+        AsyncOpenAI: Shared client backed by a pooled httpx.AsyncClient
+    """
+    global _client
+    if _client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.openai_max_connections,
+                max_keepalive_connections=settings.openai_max_keepalive_connections,
+                keepalive_expiry=settings.openai_keepalive_expiry_seconds,
+            ),
+            # Reason: Whisper calls on long meetings can take minutes; connects should fail fast
+            timeout=httpx.Timeout(settings.openai_timeout_seconds, connect=10.0),
+        )
+        _client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url,
+            max_retries=settings.openai_max_retries,
+            http_client=http_client,
+        )
+    return _client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client and its connection pool."""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
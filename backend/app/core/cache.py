@@ -0,0 +1,378 @@
+"""
+Caching primitives shared by service-level caches.
+
+Provides hit/miss/eviction counters, a bounded in-process LRU/TTL tier,
+a Redis-backed shared tier, and a two-tier cache combining them.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.settings import settings
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters for a single cache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that fell through to the source
+        evictions: Entries removed to respect size bounds
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        """Convert counters to a JSON-serializable dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+# Registry of named cache counters
+# Reason: Lets the stats endpoint report every cache without importing services
+cache_stats: dict[str, CacheStats] = {}
+
+
+def get_cache_stats(name: str) -> CacheStats:
+    """
+    Get (or create) the counters for a named cache.
+
+    Args:
+        name: Cache name
+
+    Returns:
+        CacheStats: Shared counters for that cache
+    """
+    return cache_stats.setdefault(name, CacheStats())
+
+
+class CacheBackend(Protocol):
+    """Byte-oriented key/value store used as a cache tier."""
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None if absent or expired."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Store value under key with an optional time-to-live."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        ...
+
+    def incr(self, key: str, ttl_seconds: int | None = None) -> None:
+        """Increment the integer counter stored under key (missing counts as 0)."""
+        ...
+
+    def set_if(
+        self, key: str, value: bytes, guard_key: str, guard: bytes | None, ttl_seconds: int | None
+    ) -> bool:
+        """Atomically store value only while guard_key still holds guard."""
+        ...
+
+
+class MemoryCache:
+    """
+    Bounded in-process cache with LRU and TTL eviction.
+
+    Also serves as a local stand-in for the shared tier in tests and
+    single-process deployments.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int | None = None,
+        stats: CacheStats | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize memory cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            ttl_seconds: Default time-to-live, None for no expiry
+            stats: Counters to record evictions into
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = stats or CacheStats()
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key and mark it most recently used."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= self.clock():
+                del self._entries[key]
+                self.stats.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Store value and evict least recently used entries over the bound."""
+        with self._lock:
+            self._set_unlocked(key, value, ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str, ttl_seconds: int | None = None) -> None:
+        """Increment the integer counter stored under key (missing counts as 0)."""
+        with self._lock:
+            current = self._get_unlocked(key)
+            self._set_unlocked(key, str(int(current or 0) + 1).encode(), ttl_seconds)
+
+    def set_if(
+        self, key: str, value: bytes, guard_key: str, guard: bytes | None, ttl_seconds: int | None
+    ) -> bool:
+        """Store value only while guard_key still holds guard."""
+        with self._lock:
+            if self._get_unlocked(guard_key) != guard:
+                return False
+            self._set_unlocked(key, value, ttl_seconds)
+            return True
+
+    def _get_unlocked(self, key: str) -> bytes | None:
+        """Return an unexpired value without touching recency (lock held)."""
+        item = self._entries.get(key)
+        if item is None or (item[1] is not None and item[1] <= self.clock()):
+            return None
+        return item[0]
+
+    def _set_unlocked(self, key: str, value: bytes, ttl_seconds: int | None) -> None:
+        """Store value and enforce the entry bound (lock held)."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        self._entries[key] = (value, self.clock() + ttl if ttl is not None else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def __len__(self) -> int:
+        """Number of entries currently held (including not yet purged expired ones)."""
+        return len(self._entries)
+
+
+# Stores ARGV[1] under KEYS[1] only while KEYS[2] holds ARGV[2] ("" for absent)
+SET_IF_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[2] then
+    return 0
+end
+if ARGV[3] == '' then
+    redis.call('SET', KEYS[1], ARGV[1])
+else
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+end
+return 1
+"""
+
+
+class RedisCache:
+    """
+    Shared cache tier backed by Redis.
+
+    Errors are swallowed so an unavailable Redis degrades to a cache miss.
+    """
+
+    def __init__(self, url: str, prefix: str) -> None:
+        """
+        Initialize Redis cache.
+
+        Args:
+            url: Redis connection URL
+            prefix: Key namespace for this cache
+        """
+        import redis
+
+        self.client = redis.Redis.from_url(
+            url,
+            socket_timeout=settings.cache_redis_timeout_seconds,
+            socket_connect_timeout=settings.cache_redis_timeout_seconds,
+        )
+        self.prefix = prefix
+        self._set_if = self.client.register_script(SET_IF_SCRIPT)
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for key, or None on miss or Redis error."""
+        try:
+            return self.client.get(f"{self.prefix}:{key}")
+        except Exception:
+            return None
+
+    def set(self, key: str, value: bytes, ttl_seconds: int | None = None) -> None:
+        """Store value with an optional expiry, ignoring Redis errors."""
+        try:
+            self.client.set(f"{self.prefix}:{key}", value, ex=ttl_seconds)
+        except Exception:
+            pass
+
+    def delete(self, key: str) -> None:
+        """Remove key, ignoring Redis errors."""
+        try:
+            self.client.delete(f"{self.prefix}:{key}")
+        except Exception:
+            pass
+
+    def incr(self, key: str, ttl_seconds: int | None = None) -> None:
+        """Increment a counter and refresh its expiry, ignoring Redis errors."""
+        try:
+            pipeline = self.client.pipeline()
+            pipeline.incr(f"{self.prefix}:{key}")
+            if ttl_seconds is not None:
+                pipeline.expire(f"{self.prefix}:{key}", ttl_seconds)
+            pipeline.execute()
+        except Exception:
+            pass
+
+    def set_if(
+        self, key: str, value: bytes, guard_key: str, guard: bytes | None, ttl_seconds: int | None
+    ) -> bool:
+        """Store value only while guard_key still holds guard; False on Redis error."""
+        try:
+            stored = self._set_if(
+                keys=[f"{self.prefix}:{key}", f"{self.prefix}:{guard_key}"],
+                args=[value, guard or b"", ttl_seconds or ""],
+            )
+        except Exception:
+            return False
+        return bool(stored)
+
+
+class TieredCache:
+    """
+    Two-tier cache: in-process LRU in front of an optional shared backend.
+
+    Reads check the local tier first, then the shared tier (promoting hits
+    into the local tier). Writes and deletes go to both tiers. Async
+    callers use the *_async methods, which run shared-tier calls in the
+    thread pool so a slow Redis does not stall the event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        local: MemoryCache,
+        shared: CacheBackend | None = None,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        """
+        Initialize tiered cache.
+
+        Args:
+            name: Cache name used for the stats registry
+            local: In-process tier
+            shared: Optional shared tier (Redis or a local stand-in)
+            ttl_seconds: Time-to-live applied to both tiers
+        """
+        self.stats = get_cache_stats(name)
+        self.local = local
+        self.local.stats = self.stats
+        self.shared = shared
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> bytes | None:
+        """Look up key in both tiers and record a hit or miss."""
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value, self.ttl_seconds)
+        return self._record(value)
+
+    async def get_async(self, key: str) -> bytes | None:
+        """Look up key like get, without blocking on the shared tier."""
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = await run_in_threadpool(self.shared.get, key)
+            if value is not None:
+                self.local.set(key, value, self.ttl_seconds)
+        return self._record(value)
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store value in both tiers."""
+        self.local.set(key, value, self.ttl_seconds)
+        if self.shared is not None:
+            self.shared.set(key, value, self.ttl_seconds)
+
+    async def set_async(self, key: str, value: bytes) -> None:
+        """Store value like set, without blocking on the shared tier."""
+        self.local.set(key, value, self.ttl_seconds)
+        if self.shared is not None:
+            await run_in_threadpool(self.shared.set, key, value, self.ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        """Remove key from both tiers."""
+        self.local.delete(key)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+    def _record(self, value: bytes | None) -> bytes | None:
+        """Count a lookup as a hit or miss and return its value."""
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+
+def build_tiered_cache(
+    name: str, backend: str, max_entries: int, ttl_seconds: int | None
+) -> TieredCache | None:
+    """
+    Build a tiered cache from configuration.
+
+    Args:
+        name: Cache name (also the Redis key prefix)
+        backend: "none", "memory" (local tier only) or "redis" (local + Redis)
+        max_entries: Size bound of the local tier
+        ttl_seconds: Time-to-live for entries
+
+    Returns:
+        Optional[TieredCache]: Configured cache, or None if caching is disabled
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    if backend == "none":
+        return None
+
+    local = MemoryCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    if backend == "memory":
+        return TieredCache(name, local, ttl_seconds=ttl_seconds)
+    if backend == "redis":
+        shared = RedisCache(settings.redis_url, prefix=f"cache:{name}")
+        return TieredCache(name, local, shared=shared, ttl_seconds=ttl_seconds)
+
+    raise ValueError(f"Unknown cache backend: {backend}")
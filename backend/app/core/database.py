@@ -1,14 +1,25 @@
 """
 Database configuration and session management.
 
-Provides SQLAlchemy engine, session factory, and base model class.
+Provides SQLAlchemy engine, session factory, and base model class, plus an
+optional async engine (asyncpg / aiosqlite) for read-heavy endpoints.
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.core.settings import settings
 
@@ -47,6 +58,124 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# Async engine and session factory, created on first use
+# Reason: Only deployments with async_database_enabled need asyncpg/aiosqlite
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def async_database_url(url: str) -> str:
+    """
+    Convert a sync database URL to its async driver equivalent.
+
+    Args:
+        url: Sync SQLAlchemy URL (postgresql:// or sqlite://)
+
+    Returns:
+        str: URL using asyncpg or aiosqlite
+    """
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix) :]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://") :]
+    return url
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Get the async session factory, creating the async engine on first use.
+
+    Returns:
+        async_sessionmaker: Factory for AsyncSession objects
+    """
+    global _async_engine, _async_session_factory
+    if _async_session_factory is None:
+        url = async_database_url(settings.database_url)
+        pool_options: dict[str, Any] = {}
+        if not url.startswith("sqlite"):
+            # Reason: aiosqlite uses NullPool, which rejects pool sizing arguments
+            pool_options = {"pool_size": settings.async_database_pool_size, "max_overflow": 10}
+        _async_engine = create_async_engine(
+            url, pool_pre_ping=True, echo=settings.debug, **pool_options
+        )
+        # Reason: Keep loaded attributes usable after commit without lazy IO
+        _async_session_factory = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency injection for async database sessions.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def get_read_db(
+    db: Session = Depends(get_db),
+) -> AsyncGenerator[Session | AsyncSession, None]:
+    """
+    Dependency for read endpoints that can run on either database layer.
+
+    Yields an AsyncSession when the experimental settings.async_database_enabled
+    is set, otherwise the regular sync session (which opens no connection unless
+    used).
+
+    Yields:
+        Session | AsyncSession: Database session
+    """
+    if settings.async_database_enabled:
+        async with get_async_session_factory()() as async_db:
+            yield async_db
+    else:
+        yield db
+
+
+async def execute(db: Session | AsyncSession, statement: Any) -> Result:
+    """
+    Execute a statement on a sync or async session.
+
+    Args:
+        db: Sync or async session
+        statement: SQLAlchemy executable
+
+    Returns:
+        Result: Query result
+    """
+    if isinstance(db, AsyncSession):
+        return await db.execute(statement)
+    # Reason: A blocking checkout on the loop deadlocks once the sync pool is exhausted
+    return await run_in_threadpool(db.execute, statement)
+
+
+async def close_session(db: Session | AsyncSession) -> None:
+    """
+    Close a sync or async session, returning its connection to the pool.
+
+    The session stays usable and opens a new connection on its next query.
+
+    Args:
+        db: Sync or async session
+    """
+    if isinstance(db, AsyncSession):
+        await db.close()
+    else:
+        db.close()
+
+
+async def dispose_async_engine() -> None:
+    """Dispose the async engine and its connection pool."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
 def init_db() -> None:
     """
     Initialize database tables.
@@ -54,6 +183,6 @@ def init_db() -> None:
     Creates all tables defined in models if they don't exist.
     """
     # Import all models to register them with Base
-    from app.models import audio, summary, transcription  # noqa: F401
+    from app.models import audio, job, summary, transcription, transcription_cache  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
@@ -0,0 +1,255 @@
+"""
+Publish/subscribe event bus for processing status updates.
+
+The pipeline publishes status events per channel; streaming endpoints
+subscribe to them. The in-memory bus only reaches subscribers in the
+publishing process; the Redis bus relays events between the API and
+separate worker processes.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBER_QUEUE_SIZE = 16
+_REDIS_RECONNECT_SECONDS = 1.0
+
+
+class Subscription:
+    """
+    Events of one channel for one subscriber.
+
+    Must be created on the event loop that consumes it.
+    """
+
+    def __init__(self, bus: "EventBus", channel: str) -> None:
+        """
+        Initialize subscription.
+
+        Args:
+            bus: Bus delivering the events
+            channel: Subscribed channel
+        """
+        self.bus = bus
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    async def get(self) -> dict[str, Any]:
+        """Wait for the next event."""
+        return await self.queue.get()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+    def offer(self, event: dict[str, Any]) -> None:
+        """Queue an event (runs on the subscriber's loop)."""
+        if self.queue.full():
+            # Reason: Events are status snapshots - a slow subscriber only needs the latest
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class EventBus:
+    """
+    In-process event bus.
+
+    publish never blocks and may be called from any thread; events are
+    handed to each subscriber's loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize event bus."""
+        self._subscriptions: dict[str, set[Subscription]] = defaultdict(set)
+        self._listeners: dict[str, list[Callable[[dict[str, Any]], None]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> Subscription:
+        """
+        Subscribe to a channel from the running event loop.
+
+        Args:
+            channel: Channel name
+
+        Returns:
+            Subscription: Handle to read events from and close
+        """
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def add_listener(self, channel: str, listener: Callable[[dict[str, Any]], None]) -> None:
+        """
+        Call a function with every event of a channel for the life of the process.
+
+        Listeners run on the delivering thread, so they must be quick and
+        thread-safe.
+
+        Args:
+            channel: Channel name
+            listener: Function called with each event
+        """
+        with self._lock:
+            self._listeners[channel].append(listener)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Remove a subscription.
+
+        Args:
+            subscription: Subscription to remove
+        """
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        """Return the number of local subscribers of a channel."""
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+    def publish(self, channel: str, event: dict[str, Any]) -> None:
+        """
+        Publish a JSON-serializable event.
+
+        Args:
+            channel: Channel name
+            event: Event payload
+        """
+        self._deliver(channel, event)
+
+    def _deliver(self, channel: str, event: dict[str, Any]) -> None:
+        """Hand an event to the local subscribers of a channel."""
+        with self._lock:
+            subscribers = list(self._subscriptions.get(channel, ()))
+            listeners = list(self._listeners.get(channel, ()))
+        for listener in listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Event listener of %s failed", channel)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Reason: The subscriber's loop is closed - nobody is listening any more
+                self.unsubscribe(subscription)
+
+    async def start(self) -> None:
+        """Start background delivery (nothing to do in process)."""
+
+    async def stop(self) -> None:
+        """Stop background delivery (nothing to do in process)."""
+
+
+class RedisEventBus(EventBus):
+    """
+    Event bus shared between processes through Redis pub/sub.
+
+    Events are published to Redis only and reach local subscribers through
+    the listener started with start(), so each is delivered exactly once.
+    Publishing never raises: when Redis is unavailable, events fall back to
+    local subscribers.
+    """
+
+    def __init__(self, url: str, prefix: str = "events") -> None:
+        """
+        Initialize Redis event bus.
+
+        Args:
+            url: Redis connection URL
+            prefix: Channel namespace
+        """
+        import redis
+
+        super().__init__()
+        self.url = url
+        self.prefix = prefix
+        self.client = redis.Redis.from_url(
+            url,
+            socket_timeout=settings.cache_redis_timeout_seconds,
+            socket_connect_timeout=settings.cache_redis_timeout_seconds,
+        )
+        self._listener: asyncio.Task | None = None
+
+    def publish(self, channel: str, event: dict[str, Any]) -> None:
+        """Publish an event to all processes."""
+        try:
+            self.client.publish(f"{self.prefix}:{channel}", json.dumps(event))
+        except Exception as e:
+            logger.warning("Publishing event to Redis failed, delivering locally: %s", e)
+            self._deliver(channel, event)
+
+    async def start(self) -> None:
+        """Start relaying Redis messages to local subscribers."""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the Redis listener."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        """Relay Redis messages, reconnecting after errors."""
+        import redis.asyncio as aioredis
+
+        while True:
+            client = aioredis.Redis.from_url(self.url)
+            try:
+                pubsub = client.pubsub()
+                await pubsub.psubscribe(f"{self.prefix}:*")
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    channel = message["channel"].decode()[len(self.prefix) + 1 :]
+                    self._deliver(channel, json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Redis event listener failed, reconnecting: %s", e)
+                await asyncio.sleep(_REDIS_RECONNECT_SECONDS)
+            finally:
+                await client.aclose()
+
+
+_event_bus: EventBus | None = None
+
+
+def get_event_bus() -> EventBus:
+    """
+    Get the process-wide event bus configured by settings.event_backend.
+
+    Returns:
+        EventBus: In-memory or Redis event bus
+
+    Raises:
+        ValueError: If the configured backend is unknown
+    """
+    global _event_bus
+    if _event_bus is None:
+        if settings.event_backend == "memory":
+            _event_bus = EventBus()
+        elif settings.event_backend == "redis":
+            _event_bus = RedisEventBus(settings.redis_url)
+        else:
+            raise ValueError(f"Unknown event backend: {settings.event_backend}")
+    return _event_bus
@@ -0,0 +1,95 @@
+"""
+HTTP caching helpers.
+
+Strong ETags, Cache-Control policies and If-None-Match evaluation for
+stored audio and processing results.
+"""
+
+import hashlib
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Response, status
+
+# Reason: Content-addressed bytes never change - browsers, proxies and CDNs may keep them for a year
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Reason: Completed results change only on reprocess - reuse briefly, then revalidate the ETag
+COMPLETED_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+# Reason: Unfinished results may be stored but must be revalidated on every use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def make_etag(resource_id: UUID, updated_at: datetime) -> str:
+    """
+    Build a strong ETag for one version of a resource.
+
+    Args:
+        resource_id: Resource ID
+        updated_at: Last modification time of the resource
+
+    Returns:
+        str: Quoted entity tag
+    """
+    version = f"{resource_id}:{updated_at.isoformat()}".encode()
+    return f'"{hashlib.sha256(version).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against the current ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match.
+
+    Args:
+        if_none_match: Header value (a list of entity tags or "*")
+        etag: Current entity tag
+
+    Returns:
+        bool: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def cache_headers(etag: str, cache_control: str) -> dict[str, str]:
+    """
+    Build the caching headers of a response.
+
+    Args:
+        etag: Entity tag of the resource
+        cache_control: Cache-Control policy (one of the *_CACHE_CONTROL constants)
+
+    Returns:
+        dict[str, str]: ETag and Cache-Control headers
+    """
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def result_cache_control(completed: bool) -> str:
+    """
+    Pick the Cache-Control policy of a transcription or summary.
+
+    Args:
+        completed: Whether processing of the result has completed
+
+    Returns:
+        str: Cache-Control policy
+    """
+    return COMPLETED_CACHE_CONTROL if completed else REVALIDATE_CACHE_CONTROL
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """
+    Build an empty 304 Not Modified response.
+
+    Args:
+        headers: Caching headers of the resource
+
+    Returns:
+        Response: 304 response
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
@@ -0,0 +1,201 @@
+"""
+HTTP range requests for stored files.
+
+Single byte-range parsing (RFC 9110) and a file response that sends the
+selected bytes with constant memory, zero-copy when the server supports
+the ASGI zerocopysend extension.
+"""
+
+import os
+from email.utils import formatdate
+
+import anyio
+from fastapi import Response, status
+from starlette.types import Receive, Scope, Send
+
+FILE_CHUNK_BYTES = 256 * 1024  # Reason: Read size when streaming without zero-copy
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+class RangeNotSatisfiableError(ValueError):
+    """Raised when a Range header selects no bytes of the file."""
+
+
+def parse_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parse a Range header into one inclusive byte range.
+
+    Malformed headers and multiple ranges are ignored (the whole file is
+    served), which RFC 9110 allows.
+
+    Args:
+        range_header: Range header value, e.g. "bytes=0-1023", "bytes=500-" or "bytes=-500"
+        size: File size in bytes
+
+    Returns:
+        Optional[tuple[int, int]]: First and last byte, or None to serve the whole file
+
+    Raises:
+        RangeNotSatisfiableError: If the range starts beyond the end of the file
+    """
+    if not range_header:
+        return None
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = (part.strip() for part in spec.partition("-"))
+    if not dash or not (first or last):
+        return None
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # Reason: Suffix range - the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiableError(range_header)
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size:
+        raise RangeNotSatisfiableError(range_header)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+class FileRangeResponse(Response):
+    """
+    Response sending a byte range of a file.
+
+    The file is read in FILE_CHUNK_BYTES pieces, or handed to the server
+    for sendfile when it offers the zerocopysend extension.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        offset: int,
+        length: int,
+        status_code: int = status.HTTP_200_OK,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+    ) -> None:
+        """
+        Initialize file range response.
+
+        Args:
+            path: Path of the file
+            offset: First byte to send
+            length: Number of bytes to send
+            status_code: 200 for the whole file, 206 for a range
+            headers: Additional headers
+            media_type: Content type
+        """
+        self.path = path
+        self.offset = offset
+        self.length = length
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers({**(headers or {}), "Content-Length": str(length)})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send headers and the selected bytes."""
+        await send(
+            {"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers}
+        )
+        if scope["method"].upper() == "HEAD" or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send(
+                    {
+                        "type": ZEROCOPY_EXTENSION,
+                        "file": file,
+                        "offset": self.offset,
+                        "count": self.length,
+                        "more_body": False,
+                    }
+                )
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await file.read(min(FILE_CHUNK_BYTES, remaining))
+                if not chunk:
+                    # Reason: File shrank since it was measured - end the body early
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": remaining > 0}
+                )
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def file_response(
+    path: str | os.PathLike[str],
+    stat_result: os.stat_result,
+    etag: str,
+    range_header: str | None = None,
+    if_range: str | None = None,
+    media_type: str | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Serve a file, or the part of it selected by a Range header.
+
+    A range is only honoured when If-Range is absent or names the current
+    ETag or Last-Modified date; otherwise the whole file is sent.
+
+    Args:
+        path: Path of the file
+        stat_result: Result of os.stat for the file
+        etag: Entity tag of the file
+        range_header: Range request header
+        if_range: If-Range request header
+        media_type: Content type
+        headers: Additional headers (e.g. Cache-Control)
+
+    Returns:
+        Response: 200 with the whole file, 206 with a range, or 416
+    """
+    size = stat_result.st_size
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    headers = {
+        **(headers or {}),
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Accept-Ranges": "bytes",
+    }
+
+    if if_range and if_range.strip() not in (etag, last_modified):
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiableError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{size}"},
+        )
+
+    if byte_range is None:
+        return FileRangeResponse(path, 0, size, headers=headers, media_type=media_type)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return FileRangeResponse(
+        path,
+        start,
+        end - start + 1,
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        headers=headers,
+        media_type=media_type,
+    )
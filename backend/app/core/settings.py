@@ -31,6 +31,8 @@ class Settings(BaseSettings):
     postgres_host: str = "localhost"
     postgres_port: int = 5432
     database_url: str
+    async_database_enabled: bool = False  # Reason: Experimental - slower than sync on SQLite
+    async_database_pool_size: int = 10
 
     # AI Services
     anthropic_api_key: str | None = None  # Optional: Only needed if using Claude
@@ -38,22 +40,105 @@ class Settings(BaseSettings):
     claude_model: str = "claude-3-5-sonnet-20241022"
     gpt_model: str = "gpt-4o-mini"  # Reason: Cost-effective GPT model for summarization
     whisper_model: str = "whisper-1"
+    openai_base_url: str | None = None  # Reason: Override for proxies or a local fake server
+    openai_timeout_seconds: float = 600.0
+    openai_max_retries: int = 2
+    openai_max_connections: int = 50
+    openai_max_keepalive_connections: int = 20
+    openai_keepalive_expiry_seconds: float = 60.0
 
     # File Upload
     max_upload_size_mb: int = 100
     allowed_audio_formats: str = "mp3,wav,m4a,mp4,webm"
+    batch_max_items: int = 100  # Reason: Bound on files/IDs per batch request
     upload_dir: str = "./uploads"
+    upload_chunk_size_kb: int = 1024  # Reason: Read/write granularity for streamed uploads
+    storage_mode: str = "flat"  # Reason: "flat" or "content_addressed" (dedup by SHA-256)
 
     # Processing
     max_audio_duration_minutes: int = 120
     processing_timeout_seconds: int = 600
 
+    # Audio transcoding (downmix and resample to 16 kHz mono before transcription)
+    transcode_enabled: bool = True
+    transcode_bitrate_kbps: int = 24  # Reason: Opus speech bitrate (used when ffmpeg is installed)
+    transcode_workers: int = 2  # Reason: Processes decoding and encoding off the event loop
+
+    # Voice activity detection (long silences cut out before transcription)
+    vad_enabled: bool = True
+    vad_min_silence_seconds: float = 2.0  # Reason: Shorter pauses are kept
+    vad_padding_seconds: float = 0.3  # Reason: Audio kept around speech so word edges survive
+    vad_gap_seconds: float = 0.5  # Reason: Silence left in place of each cut
+    vad_min_removed_seconds: float = 10.0  # Reason: Recordings with less silence are sent as-is
+
+    # Chunked transcription (long recordings are split at pauses)
+    transcription_chunking_enabled: bool = True
+    transcription_chunk_seconds: int = 600  # Reason: 10 min of 16 kHz WAV stays under 25 MB
+    transcription_chunk_overlap_seconds: float = 1.0
+    transcription_silence_search_seconds: float = 30.0  # Reason: Window searched for a pause
+    transcription_max_concurrency: int = 4  # Reason: Whisper requests in flight per recording
+
+    # Live recording ingest (WebM chunks over WebSocket, transcribed while recording)
+    live_segment_seconds: int = 120  # Reason: Audio left to transcribe after Stop, at most
+    live_summary_interval_seconds: int = 300  # Reason: Running summary update period; 0 disables
+    live_orphan_timeout_seconds: int = 600  # Reason: A recording not written this long was dropped
+
+    # Summary planning (fast path for short meetings, map-reduce for long ones)
+    summary_fast_path_tokens: int = 1500  # Reason: About 10 minutes of speech
+    summary_chunk_tokens: int = 6000  # Reason: Transcripts longer than this are summarized in parts
+    summary_fan_out: int = 4  # Reason: Concurrent model calls per summary
+    summary_reduce_strategy: str = "llm"  # Reason: "llm" (model merges) or "local" (no extra calls)
+
+    # Job queue
+    queue_broker: str = "database"  # Reason: "database" (durable, multi-host) or "memory"
+    worker_concurrency: int = 2
+    worker_embedded: bool = False  # Reason: Run the worker inside the API process
+    worker_poll_interval_seconds: float = 1.0
+    job_visibility_timeout_seconds: int = 900  # Reason: Must exceed processing_timeout_seconds
+    job_heartbeat_seconds: float = 60.0  # Reason: Lease extension period, well inside the lease
+    job_max_attempts: int = 3
+    job_retry_backoff_seconds: int = 30
+
+    # Transcription cache
+    transcription_cache_enabled: bool = True
+    transcription_cache_max_entries: int = 10000
+    transcription_cache_max_mb: int = 256  # Reason: Bound on total cached transcript text
+
+    # Summary cache
+    summary_cache_backend: str = "memory"  # Reason: "none", "memory" or "redis" (memory + shared)
+    summary_cache_max_entries: int = 1000
+    summary_cache_ttl_seconds: int = 7 * 24 * 3600
+
+    # Response cache (serialized transcription/summary responses)
+    response_cache_backend: str = "memory"  # Reason: "none", "memory" or "redis" (memory + shared)
+    response_cache_max_entries: int = 5000
+    response_cache_ttl_seconds: int = 3600
+    cache_redis_timeout_seconds: float = 0.25  # Reason: A slow Redis must not stall the pipeline
+
     # Redis
     redis_host: str = "localhost"
     redis_port: int = 6379
     redis_db: int = 0
     redis_url: str = "redis://localhost:6379/0"
 
+    # Status events
+    event_backend: str = "memory"  # Reason: "memory" (API process only) or "redis" (all workers)
+    events_resync_seconds: float = 5.0  # Reason: Re-read status when no event arrives
+    events_idle_resync_seconds: float = 60.0  # Reason: Re-read backoff cap for idle audio files
+
+    # Full-text search
+    search_language: str = "english"  # Reason: PostgreSQL text search config (stemming, stop words)
+
+    # Semantic search (local CPU embeddings, no network)
+    embedding_backend: str = "hashing"  # Reason: "hashing" or "sentence_transformers" (optional)
+    embedding_model: str = "all-MiniLM-L6-v2"  # Reason: sentence-transformers model name or path
+    embedding_dimensions: int = 256  # Reason: Hashing vector length (bytes per stored vector)
+    semantic_chunk_words: int = 120  # Reason: Transcript passage length
+    semantic_index: str = "exact"  # Reason: "exact" (brute force) or "ivf" (approximate)
+    semantic_ivf_min_vectors: int = 50000  # Reason: Smaller indexes are always searched exactly
+    semantic_ivf_probes: int = 16  # Reason: Clusters scanned per query (recall vs latency)
+    semantic_refresh_seconds: float = 5.0  # Reason: How often new vectors are loaded
+
     # CORS
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
     cors_allow_credentials: bool = True
@@ -4,15 +4,20 @@ Main FastAPI application entry point.
 Configures routers, middleware, CORS, and lifecycle events.
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.core.database import init_db
+from app.core.ai_client import close_openai_client
+from app.core.database import dispose_async_engine, init_db
+from app.core.events import get_event_bus
 from app.core.settings import settings
-from app.routers import audio, health, processing
+from app.routers import audio, cache, health, meetings, processing, search
+from app.services.live_service import sweep_orphaned_recordings
+from app.services.transcode_service import shutdown_transcode_pool
 
 
 @asynccontextmanager
@@ -24,8 +29,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     # Startup: Initialize database tables
     init_db()
+
+    # Reason: Relays events published by other processes (no-op for the in-memory bus)
+    event_bus = get_event_bus()
+    await event_bus.start()
+
+    # Reason: Live recordings of a process that stopped mid-stream could never be processed
+    sweeper = asyncio.create_task(sweep_orphaned_recordings())
+
+    # Reason: Single-process deployments can run the pipeline worker in the API
+    worker_task = None
+    if settings.worker_embedded:
+        from app.worker import Worker
+
+        worker = Worker()
+        worker_task = asyncio.create_task(worker.run())
+
     yield
-    # Shutdown: Clean up resources if needed
+
+    # Shutdown: Let in-flight jobs finish
+    if worker_task:
+        worker.stop()
+        await worker_task
+
+    sweeper.cancel()
+    await event_bus.stop()
+    await close_openai_client()
+    shutdown_transcode_pool()
+    await dispose_async_engine()
 
 
 # Create FastAPI application
@@ -56,6 +87,9 @@ app.add_middleware(
 app.include_router(health.router, prefix="/api/v1", tags=["health"])
 app.include_router(audio.router, prefix="/api/v1/audio", tags=["audio"])
 app.include_router(processing.router, prefix="/api/v1", tags=["processing"])
+app.include_router(meetings.router, prefix="/api/v1/meetings", tags=["meetings"])
+app.include_router(search.router, prefix="/api/v1", tags=["search"])
+app.include_router(cache.router, prefix="/api/v1", tags=["cache"])
 
 
 # Root endpoint
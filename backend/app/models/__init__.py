@@ -5,14 +5,29 @@ Exports all SQLAlchemy models for easy importing.
 """
 
 from app.models.audio import AudioFile, AudioStatus
+from app.models.cache_counter import CacheCounter
+from app.models.embedding import Embedding, PassageKind
+from app.models.job import JobStatus, ProcessingJob
+from app.models.search import SUMMARIES_FTS, TRANSCRIPTIONS_FTS
 from app.models.summary import Summary, SummaryStatus
+from app.models.transcript_segment import TranscriptSegment
 from app.models.transcription import Transcription, TranscriptionStatus
+from app.models.transcription_cache import TranscriptionCacheEntry
 
 __all__ = [
     "AudioFile",
     "AudioStatus",
+    "CacheCounter",
+    "Embedding",
+    "PassageKind",
+    "ProcessingJob",
+    "JobStatus",
     "Transcription",
     "TranscriptionStatus",
+    "TranscriptionCacheEntry",
+    "TranscriptSegment",
     "Summary",
     "SummaryStatus",
+    "TRANSCRIPTIONS_FTS",
+    "SUMMARIES_FTS",
 ]
@@ -8,8 +8,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Float, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Uuid
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -19,6 +18,7 @@ class AudioStatus(str, Enum):
     """Audio file processing status."""
 
     UPLOADED = "uploaded"
+    RECORDING = "recording"  # Reason: Live recording still receiving audio
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
@@ -33,16 +33,29 @@ class AudioFile(Base):
     """
 
     __tablename__ = "audio_files"
+    __table_args__ = (
+        # Reason: Meeting listing seeks and orders on (created_at, id) - keyset pagination
+        Index("ix_audio_files_created_at_id", "created_at", "id"),
+        Index("ix_audio_files_status_created_at_id", "status", "created_at", "id"),
+    )
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
     # File metadata
     filename = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False, unique=True)
+    # Reason: Not unique - content-addressed uploads share one stored file
+    file_path = Column(String(500), nullable=False, index=True)
     file_size = Column(Integer, nullable=False)  # Reason: Size in bytes
+    content_hash = Column(String(64), nullable=True, index=True)  # Reason: Hex SHA-256
     mime_type = Column(String(100), nullable=False)
-    duration_seconds = Column(Float, nullable=True)  # Reason: Extracted after upload
+    # Reason: Read from the container header at upload, or reported by Whisper
+    duration_seconds = Column(Float, nullable=True)
+    sample_rate = Column(Integer, nullable=True)  # Reason: Hz, from the container header
+    channels = Column(Integer, nullable=True)
+    # Reason: Compact 16 kHz mono copy sent to Whisper instead of the original
+    transcoded_path = Column(String(500), nullable=True)
+    transcoded_size = Column(Integer, nullable=True)  # Reason: Compare with file_size
 
     # Processing status
     status = Column(
@@ -70,6 +83,11 @@ class AudioFile(Base):
         cascade="all, delete-orphan",
     )
 
+    @property
+    def speech_path(self) -> str:
+        """Path of the audio to transcribe: the transcoded copy if there is one."""
+        return self.transcoded_path or self.file_path
+
     def __repr__(self) -> str:
         """String representation of audio file."""
         return f"<AudioFile {self.filename} ({self.status})>"
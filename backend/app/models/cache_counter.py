@@ -0,0 +1,29 @@
+"""
+Cache counter database model.
+
+Stores hit/miss/eviction counters of database-backed caches, so every
+process (API and workers) reports the same totals.
+"""
+
+from sqlalchemy import BigInteger, Column, String
+
+from app.core.database import Base
+
+
+class CacheCounter(Base):
+    """
+    Shared counters of one cache.
+
+    Incremented in place by whichever process performs the lookup.
+    """
+
+    __tablename__ = "cache_counters"
+
+    name = Column(String(50), primary_key=True)
+    hits = Column(BigInteger, nullable=False, default=0)
+    misses = Column(BigInteger, nullable=False, default=0)
+    evictions = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """String representation of cache counters."""
+        return f"<CacheCounter {self.name} hits={self.hits} misses={self.misses}>"
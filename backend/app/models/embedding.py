@@ -0,0 +1,74 @@
+"""
+Embedding database model.
+
+Stores quantized embeddings of meeting passages for semantic search.
+"""
+
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    Uuid,
+)
+
+from app.core.database import Base
+
+
+class PassageKind(str, Enum):
+    """Part of a meeting a passage was taken from."""
+
+    SUMMARY = "summary"
+    KEY_POINT = "key_point"
+    TRANSCRIPT = "transcript"
+
+
+class Embedding(Base):
+    """
+    Embedding model for one passage of a meeting.
+
+    The vector is stored as int8 codes plus one float scale, a quarter of
+    the size of float32.
+    """
+
+    __tablename__ = "embeddings"
+    __table_args__ = (
+        # Reason: Index refresh lists the embedding ids of one model
+        Index("ix_embeddings_model_id", "model", "id"),
+    )
+
+    # Reason: Integer - the in-memory index stores ids in a compact int64 array
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Foreign key to audio file
+    audio_file_id = Column(
+        Uuid(as_uuid=True),
+        ForeignKey("audio_files.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Passage
+    kind = Column(String(20), nullable=False)
+    position = Column(Integer, nullable=False)  # Reason: Order within its kind
+    text = Column(Text, nullable=False)
+
+    # Vector
+    model = Column(String(100), nullable=False)  # Reason: Vectors of different models never mix
+    vector = Column(LargeBinary, nullable=False)  # Reason: int8 codes
+    scale = Column(Float, nullable=False)  # Reason: codes * scale approximates the vector
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of embedding."""
+        return f"<Embedding {self.id} ({self.kind} {self.position})>"
@@ -0,0 +1,73 @@
+"""
+Processing job database model.
+
+Stores queued pipeline stages for the durable job queue.
+"""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Uuid
+
+from app.core.database import Base
+
+
+class JobStatus(str, Enum):
+    """Processing job status."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ProcessingJob(Base):
+    """
+    Processing job model for one pipeline stage of one audio file.
+
+    A running job holds a lease until visible_at; if the worker dies the
+    lease expires and another worker picks the job up again.
+    """
+
+    __tablename__ = "processing_jobs"
+    __table_args__ = (
+        # Reason: Claim query filters on status and orders by visibility time
+        Index("ix_processing_jobs_status_visible_at", "status", "visible_at"),
+    )
+
+    # Primary key
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # Foreign key to audio file
+    audio_file_id = Column(
+        Uuid(as_uuid=True),
+        ForeignKey("audio_files.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Job definition
+    stage = Column(String(20), nullable=False)
+    use_cache = Column(Boolean, nullable=False, default=True)
+
+    # Delivery state
+    status = Column(String(20), nullable=False, default=JobStatus.QUEUED.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    visible_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    worker_id = Column(String(100), nullable=True)
+    last_error = Column(String(1000), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation of processing job."""
+        return f"<ProcessingJob {self.stage} {self.audio_file_id} ({self.status})>"
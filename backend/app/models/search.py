@@ -0,0 +1,30 @@
+"""
+Full-text search index tables for SQLite.
+
+PostgreSQL indexes transcripts and summaries in tsvector columns of their
+own tables. SQLite has no tsvector, so the same text is indexed in FTS5
+virtual tables whose rowids are the rowids of the indexed rows. They are
+created and dropped together with the ORM tables.
+"""
+
+from sqlalchemy import DDL, event
+
+from app.core.database import Base
+
+TRANSCRIPTIONS_FTS = "transcriptions_fts"
+SUMMARIES_FTS = "summaries_fts"
+
+for _table in (TRANSCRIPTIONS_FTS, SUMMARIES_FTS):
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {_table} "
+            "USING fts5(body, tokenize='porter unicode61')"
+        ).execute_if(dialect="sqlite"),
+    )
+    event.listen(
+        Base.metadata,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_table}").execute_if(dialect="sqlite"),
+    )
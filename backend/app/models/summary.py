@@ -8,9 +8,21 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -33,13 +45,20 @@ class Summary(Base):
     """
 
     __tablename__ = "summaries"
+    __table_args__ = (
+        # Reason: Covers the ID and status joined into meeting listings (index-only lookup)
+        Index("ix_summaries_transcription_id_status_id", "transcription_id", "status", "id"),
+        Index("ix_summaries_search_vector", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
     # Foreign key to transcription
     transcription_id = Column(
-        UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("transcriptions.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,  # Reason: One summary per transcription
@@ -48,6 +67,8 @@ class Summary(Base):
 
     # Summary content
     summary_text = Column(Text, nullable=True)
+    # Reason: Written by the pipeline on PostgreSQL; SQLite indexes in FTS5 (see models.search)
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
 
     # Structured data (JSON for cross-database compatibility)
     # Reason: Uses JSONB on PostgreSQL, JSON on SQLite for testing
@@ -62,6 +83,10 @@ class Summary(Base):
     # AI usage tracking
     tokens_used = Column(Integer, nullable=True)
     model_used = Column(String(100), nullable=True)
+    cache_hit = Column(Boolean, nullable=False, default=False)  # Reason: Served from summary cache
+    route = Column(String(20), nullable=True)  # Reason: Planner route or "incremental"
+    estimated_prompt_tokens = Column(Integer, nullable=True)  # Reason: Planner estimate
+    prompt_tokens = Column(Integer, nullable=True)  # Reason: Actual, as reported by the API
 
     # Processing metadata
     status = Column(
@@ -0,0 +1,47 @@
+"""
+Transcript segment database model.
+
+Stores the timestamped segments Whisper returns, so parts of a transcript
+can be read by time range without loading the full text.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, Text, Uuid
+
+from app.core.database import Base
+
+
+class TranscriptSegment(Base):
+    """
+    Transcript segment model for one timed piece of a transcription.
+
+    Times are stored as integer milliseconds to keep rows and index entries small.
+    """
+
+    __tablename__ = "transcript_segments"
+    __table_args__ = (
+        # Reason: Time-range reads scan one transcription's segments in start order
+        Index(
+            "ix_transcript_segments_transcription_id_start_ms",
+            "transcription_id",
+            "start_ms",
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Foreign key to transcription
+    transcription_id = Column(
+        Uuid(as_uuid=True),
+        ForeignKey("transcriptions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Segment data
+    position = Column(Integer, nullable=False)  # Reason: Order within the transcript
+    start_ms = Column(Integer, nullable=False)
+    end_ms = Column(Integer, nullable=False)
+    text = Column(Text, nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of transcript segment."""
+        return f"<TranscriptSegment {self.transcription_id} [{self.start_ms}-{self.end_ms}ms]>"
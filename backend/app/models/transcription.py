@@ -8,9 +8,20 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -32,13 +43,20 @@ class Transcription(Base):
     """
 
     __tablename__ = "transcriptions"
+    __table_args__ = (
+        # Reason: Covers the ID and status joined into meeting listings (index-only lookup)
+        Index("ix_transcriptions_audio_file_id_status_id", "audio_file_id", "status", "id"),
+        Index("ix_transcriptions_search_vector", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
     # Foreign key to audio file
     audio_file_id = Column(
-        UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("audio_files.id", ondelete="CASCADE"),
         nullable=False,
         unique=True,  # Reason: One transcription per audio file
@@ -49,9 +67,13 @@ class Transcription(Base):
     full_text = Column(Text, nullable=True)  # Reason: Can be large text
     language = Column(String(10), nullable=True)  # Reason: ISO language code
     confidence_score = Column(Float, nullable=True)  # Reason: 0.0 to 1.0
+    # Reason: Written by the pipeline on PostgreSQL; SQLite indexes in FTS5 (see models.search)
+    search_vector = deferred(Column(Text().with_variant(TSVECTOR(), "postgresql"), nullable=True))
 
     # Processing metadata
     processing_time_ms = Column(Integer, nullable=True)
+    cache_hit = Column(Boolean, nullable=False, default=False)  # Reason: Whisper call was skipped
+    silence_removed_seconds = Column(Float, nullable=True)  # Reason: Cut before the Whisper call
     status = Column(
         String(20),
         nullable=False,
@@ -0,0 +1,47 @@
+"""
+Transcription cache database model.
+
+Stores Whisper results keyed by audio content hash, model and request options.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Float, Integer, String, Text
+
+from app.core.database import Base
+
+
+class TranscriptionCacheEntry(Base):
+    """
+    Cached Whisper API result.
+
+    Lets identical audio be transcribed once and reused across uploads.
+    """
+
+    __tablename__ = "transcription_cache"
+
+    # Reason: SHA-256 of (content hash, model, options)
+    cache_key = Column(String(64), primary_key=True)
+
+    # Key components, kept for inspection and targeted invalidation
+    content_hash = Column(String(64), nullable=False, index=True)
+    model = Column(String(100), nullable=False)
+    options = Column(JSON, nullable=True)
+
+    # Cached result
+    full_text = Column(Text, nullable=True)
+    language = Column(String(10), nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    segments = Column(JSON, nullable=True)  # Reason: [start, end, text] triples
+    size_bytes = Column(
+        Integer, nullable=False, default=0
+    )  # Reason: Used for size-bounded eviction
+
+    # Usage tracking
+    hit_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_accessed_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        """String representation of cache entry."""
+        return f"<TranscriptionCacheEntry {self.cache_key[:12]} ({self.model})>"
@@ -4,6 +4,6 @@ Routers package.
 Exports all API routers for the application.
 """
 
-from app.routers import audio, health, processing
+from app.routers import audio, cache, health, meetings, processing, search
 
-__all__ = ["audio", "health", "processing"]
+__all__ = ["audio", "cache", "health", "meetings", "processing", "search"]
@@ -1,17 +1,52 @@
 """
 Audio router.
 
-Endpoints for audio file upload and status retrieval.
+Endpoints for audio file upload, status retrieval and playback.
 """
 
+import logging
+import os
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import anyio
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.websockets import WebSocketState
 
-from app.core.database import get_db
+from app.core.database import close_session, get_db, get_read_db
+from app.core.events import get_event_bus
+from app.core.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    cache_headers,
+    etag_matches,
+    not_modified,
+)
+from app.core.http_range import file_response
+from app.core.settings import settings
+from app.models.audio import AudioStatus
 from app.schemas.audio import AudioStatusResponse, AudioUploadResponse
+from app.schemas.batch import BatchItemError, BatchUploadItem, BatchUploadResponse
 from app.services.audio_service import AudioService
+from app.services.live_service import LiveRecording, LiveRecordingError
+from app.services.status_events import audio_channel, build_status_response, stream_status
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -25,7 +60,9 @@ async def upload_audio(
     Upload audio file for transcription and summarization.
 
     Accepts audio files in supported formats (webm, mp3, wav, m4a, mp4).
-    Maximum file size configured in settings (default: 100MB).
+    Maximum file size configured in settings (default: 100MB). The container
+    header is checked against the extension and its duration against
+    settings.max_audio_duration_minutes.
 
     Args:
         file: Audio file upload
@@ -35,7 +72,7 @@ async def upload_audio(
         AudioUploadResponse: Created audio file information
 
     Raises:
-        HTTPException 400: Invalid file format or missing file
+        HTTPException 400: Invalid file format, mislabelled content, too long or missing file
         HTTPException 413: File too large
         HTTPException 500: Server error during upload
     """
@@ -46,15 +83,166 @@ async def upload_audio(
         id=audio_file.id,
         filename=audio_file.filename,
         file_size=audio_file.file_size,
+        content_hash=audio_file.content_hash,
+        duration_seconds=audio_file.duration_seconds,
         status=audio_file.status,
         created_at=audio_file.created_at,
     )
 
 
+@router.post("/upload/batch", response_model=BatchUploadResponse, status_code=status.HTTP_200_OK)
+async def upload_audio_batch(
+    files: list[UploadFile] = File(..., description="Audio files to upload"),
+    db: Session = Depends(get_db),
+) -> BatchUploadResponse:
+    """
+    Upload several audio files in one request.
+
+    Each file is validated and stored like a single upload; all records are
+    created in one commit. Rejected files are reported per item.
+
+    Args:
+        files: Audio file uploads
+        db: Database session
+
+    Returns:
+        BatchUploadResponse: Created audio file or error per file
+
+    Raises:
+        HTTPException 400: More files than settings.batch_max_items
+    """
+    if len(files) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.batch_max_items} files per batch",
+        )
+
+    audio_service = AudioService(db)
+    results = await audio_service.upload_audio_batch(files)
+
+    items = []
+    for file, result in zip(files, results, strict=True):
+        if isinstance(result, HTTPException):
+            error = BatchItemError(status_code=result.status_code, detail=str(result.detail))
+            items.append(BatchUploadItem(filename=file.filename, error=error))
+        else:
+            audio = AudioUploadResponse(
+                id=result.id,
+                filename=result.filename,
+                file_size=result.file_size,
+                content_hash=result.content_hash,
+                duration_seconds=result.duration_seconds,
+                status=result.status,
+                created_at=result.created_at,
+            )
+            items.append(BatchUploadItem(filename=file.filename, audio=audio))
+
+    failed = sum(1 for item in items if item.error)
+    return BatchUploadResponse(items=items, succeeded=len(items) - failed, failed=failed)
+
+
+@router.websocket("/live")
+async def record_live(
+    websocket: WebSocket,
+    filename: str = Query("recording.webm", description="Name shown for the recording"),
+    db: Session = Depends(get_db),
+) -> None:
+    """
+    Record a meeting live and transcribe it while it is being recorded.
+
+    The client sends MediaRecorder WebM chunks as binary messages and the
+    text message "stop" when the meeting ends. Each finished segment is
+    transcribed in the background and a running summary is kept up to date;
+    at stop only the last segment is left, then the transcript is stored and
+    the running summary completed (or, for short meetings, summarization is
+    queued).
+
+    Messages sent to the client (JSON):
+        started: {"type": "started", "audio_id"} once the record exists
+        progress: {"type": "progress", "received_bytes", "recorded_seconds",
+            "segments", "summary"?} after every chunk; "summary" carries the
+            running summary when it was updated
+        completed: {"type": "completed", "audio_id", "transcription_id",
+            "summary_id"} (summary_id is null without a running summary)
+        error: {"type": "error", "detail"} before the socket is closed
+
+    Args:
+        websocket: Client connection
+        filename: Name shown for the recording
+        db: Database session
+    """
+    await websocket.accept()
+    # Reason: Creating the record commits and opens the file - keep both off the event loop
+    recording = await run_in_threadpool(LiveRecording.start, db, filename)
+    audio_id = str(recording.audio_file.id)
+    await websocket.send_json({"type": "started", "audio_id": audio_id})
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes"):
+                await recording.append(message["bytes"])
+                if not await _send_live(websocket, recording.progress()):
+                    break
+            elif message.get("text") == "stop":
+                break
+        transcription = await recording.finish()
+    except LiveRecordingError as e:
+        await _fail_live(websocket, recording, str(e), code=1008)
+        return
+    except Exception:
+        logger.exception("Live recording %s failed", audio_id)
+        await _fail_live(websocket, recording, "Live transcription failed", code=1011)
+        return
+
+    # Reason: A client that dropped still gets its meeting transcribed
+    if websocket.client_state == WebSocketState.CONNECTED:
+        summary = transcription.summary
+        completed = {
+            "type": "completed",
+            "audio_id": audio_id,
+            "transcription_id": str(transcription.id),
+            "summary_id": str(summary.id) if summary else None,
+        }
+        if await _send_live(websocket, completed):
+            await websocket.close()
+
+
+async def _send_live(websocket: WebSocket, message: dict) -> bool:
+    """
+    Send a message to a live recording client.
+
+    Returns:
+        bool: False if the client has disconnected (the stream is then over)
+    """
+    try:
+        await websocket.send_json(message)
+    except (WebSocketDisconnect, OSError):
+        return False
+    except RuntimeError:
+        # Reason: Starlette raises RuntimeError when sending on a socket that is no longer connected
+        if websocket.client_state == websocket.application_state == WebSocketState.CONNECTED:
+            raise
+        return False
+    return True
+
+
+async def _fail_live(
+    websocket: WebSocket, recording: LiveRecording, detail: str, code: int
+) -> None:
+    """Mark a live recording failed and tell the client if it is still connected."""
+    await recording.fail(detail)
+    if websocket.client_state == WebSocketState.CONNECTED:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=code)
+
+
 @router.get("/{audio_id}", response_model=AudioStatusResponse, status_code=status.HTTP_200_OK)
 async def get_audio_status(
     audio_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session | AsyncSession = Depends(get_read_db),
 ) -> AudioStatusResponse:
     """
     Get audio file processing status.
@@ -72,7 +260,7 @@ async def get_audio_status(
         HTTPException 404: Audio file not found
     """
     audio_service = AudioService(db)
-    audio_file = audio_service.get_audio_by_id(audio_id)
+    audio_file = await audio_service.get_audio_by_id_async(audio_id, with_results=True)
 
     if not audio_file:
         raise HTTPException(
@@ -80,23 +268,155 @@ async def get_audio_status(
             detail=f"Audio file {audio_id} not found",
         )
 
-    # Get related transcription and summary IDs
-    transcription_id = None
-    summary_id = None
+    return build_status_response(audio_file)
 
-    if audio_file.transcription:
-        transcription_id = audio_file.transcription.id
-        if audio_file.transcription.summary:
-            summary_id = audio_file.transcription.summary.id
 
-    return AudioStatusResponse(
-        id=audio_file.id,
-        filename=audio_file.filename,
-        status=audio_file.status,
-        duration_seconds=audio_file.duration_seconds,
-        error_message=audio_file.error_message,
-        transcription_id=transcription_id,
-        summary_id=summary_id,
-        created_at=audio_file.created_at,
-        updated_at=audio_file.updated_at,
+@router.get("/{audio_id}/content", status_code=status.HTTP_200_OK)
+async def get_audio_content(
+    audio_id: UUID,
+    range_header: str | None = Header(None, alias="Range"),
+    if_range: str | None = Header(None),
+    if_none_match: str | None = Header(None),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> Response:
+    """
+    Stream the stored audio file, with HTTP Range support for playback and seeking.
+
+    Bytes are streamed in fixed-size pieces (or sent zero-copy when the
+    server supports it), so memory use does not depend on the file size.
+    No database connection is held while the file is sent. Hashed content is
+    immutable; a recording still in progress must be revalidated.
+
+    Args:
+        audio_id: UUID of audio file
+        range_header: Byte range to send (a single range; others serve the whole file)
+        if_range: Only honour the range if this ETag or date is current
+        if_none_match: Entity tags of the client's cached copies
+        db: Database session
+
+    Returns:
+        Response: 200 with the file, 206 with a range, 304 Not Modified or 416
+
+    Raises:
+        HTTPException 404: Audio file or its stored content not found
+    """
+    audio_file = await AudioService(db).get_audio_by_id_async(audio_id)
+    if not audio_file:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Audio file {audio_id} not found",
+        )
+    file_path, media_type = audio_file.file_path, audio_file.mime_type
+    # Reason: Hashed bytes never change; a live recording has no hash until it stops
+    content_hash = (
+        audio_file.content_hash if audio_file.status != AudioStatus.RECORDING.value else None
     )
+    await close_session(db)
+
+    if content_hash:
+        headers = cache_headers(f'"{content_hash[:32]}"', IMMUTABLE_CACHE_CONTROL)
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified(headers)
+
+    try:
+        stat_result = await anyio.to_thread.run_sync(os.stat, file_path)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Content of audio file {audio_id} not found",
+        )
+
+    if not content_hash:
+        # Reason: The file may still grow, so validate against its current size and mtime
+        headers = cache_headers(
+            f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"', REVALIDATE_CACHE_CONTROL
+        )
+        if etag_matches(if_none_match, headers["ETag"]):
+            return not_modified(headers)
+    etag = headers["ETag"]
+
+    return file_response(
+        file_path,
+        stat_result,
+        etag,
+        range_header=range_header,
+        if_range=if_range,
+        media_type=media_type,
+        headers={"Cache-Control": headers["Cache-Control"]},
+    )
+
+
+@router.get("/{audio_id}/events", status_code=status.HTTP_200_OK)
+async def stream_audio_events(
+    audio_id: UUID,
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    """
+    Stream audio file processing status as Server-Sent Events.
+
+    Sends the current status first, then a `status` event per pipeline stage
+    transition, and ends once the audio file is completed or failed. No
+    database connection is held between events.
+
+    Args:
+        audio_id: UUID of audio file
+        db: Database session
+
+    Returns:
+        StreamingResponse: text/event-stream of AudioStatusResponse payloads
+
+    Raises:
+        HTTPException 404: Audio file not found
+    """
+    # Reason: Subscribe before reading, so no transition between the two is missed
+    subscription = get_event_bus().subscribe(audio_channel(audio_id))
+    audio_service = AudioService(db)
+    try:
+        audio_file = await audio_service.get_audio_by_id_async(audio_id, with_results=True)
+        if not audio_file:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Audio file {audio_id} not found",
+            )
+        first = build_status_response(audio_file)
+        await close_session(db)
+    except BaseException:
+        subscription.close()
+        raise
+
+    return StreamingResponse(
+        stream_status(audio_service, audio_id, subscription, first),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.delete("/{audio_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_audio(
+    audio_id: UUID,
+    db: Session = Depends(get_db),
+) -> Response:
+    """
+    Delete audio file and its processing results.
+
+    The stored file is removed once no other upload references it.
+
+    Args:
+        audio_id: UUID of audio file
+        db: Database session
+
+    Returns:
+        Response: Empty 204 response
+
+    Raises:
+        HTTPException 404: Audio file not found
+    """
+    audio_service = AudioService(db)
+
+    if not audio_service.delete_audio(audio_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Audio file {audio_id} not found",
+        )
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
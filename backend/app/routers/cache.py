@@ -0,0 +1,41 @@
+"""
+Cache router.
+
+Endpoints for monitoring result caches.
+"""
+
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheStats, cache_stats
+from app.core.database import execute, get_read_db
+from app.models.cache_counter import CacheCounter
+from app.schemas.cache import CacheCounters, CacheStatsResponse
+
+router = APIRouter()
+
+
+@router.get("/cache/stats", response_model=CacheStatsResponse, status_code=status.HTTP_200_OK)
+async def get_cache_stats(
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> CacheStatsResponse:
+    """
+    Get hit/miss/eviction counters for every cache.
+
+    Database-backed caches report the totals of all processes (their
+    lookups run in the workers); the other caches report this process.
+
+    Args:
+        db: Database session
+
+    Returns:
+        CacheStatsResponse: Counters keyed by cache name
+    """
+    caches = {name: CacheCounters(**stats.as_dict()) for name, stats in cache_stats.items()}
+    result = await execute(db, select(CacheCounter))
+    for counter in result.scalars():
+        shared = CacheStats(counter.hits, counter.misses, counter.evictions)
+        caches[counter.name] = CacheCounters(**shared.as_dict())
+    return CacheStatsResponse(caches=caches)
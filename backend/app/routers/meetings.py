@@ -0,0 +1,161 @@
+"""
+Meetings router.
+
+Endpoints listing meetings and returning an audio file with its
+processing results in one call.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_read_db
+from app.models.audio import AudioStatus
+from app.schemas.meeting import MeetingInclude, MeetingListResponse, MeetingResponse
+from app.schemas.summary import SummaryResponse
+from app.schemas.transcription import TranscriptionResponse
+from app.services.audio_service import AudioService
+from app.services.status_events import build_status_response
+from app.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+router = APIRouter()
+
+
+def parse_include(include: str) -> set[MeetingInclude]:
+    """
+    Parse a comma-separated include parameter.
+
+    Args:
+        include: Comma-separated parts, e.g. "summary,transcript"
+
+    Returns:
+        set[MeetingInclude]: Requested parts
+
+    Raises:
+        HTTPException 400: Unknown part
+    """
+    try:
+        return {MeetingInclude(part.strip()) for part in include.split(",") if part.strip()}
+    except ValueError:
+        allowed = ", ".join(part.value for part in MeetingInclude)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"include must be a comma-separated list of: {allowed}",
+        )
+
+
+@router.get("", response_model=MeetingListResponse, status_code=status.HTTP_200_OK)
+async def list_meetings(
+    status_filter: AudioStatus | None = Query(None, alias="status", description="Audio status"),
+    created_from: datetime | None = Query(None, description="Created at or after (inclusive)"),
+    created_to: datetime | None = Query(None, description="Created before (exclusive)"),
+    limit: int = Query(20, ge=1, le=100, description="Page size"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> MeetingListResponse:
+    """
+    List meetings newest first, one page at a time.
+
+    Pages continue after the (created_at, id) of the previous page's last
+    meeting rather than skipping an offset, so every page costs the same
+    and rows inserted meanwhile do not shift later pages.
+
+    Args:
+        status_filter: Only meetings with this audio status
+        created_from: Only meetings created at or after this time
+        created_to: Only meetings created before this time
+        limit: Maximum number of meetings per page
+        cursor: Cursor returned with the previous page
+        db: Database session
+
+    Returns:
+        MeetingListResponse: Page of meeting statuses and the next cursor
+
+    Raises:
+        HTTPException 400: Malformed cursor
+    """
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    audio_service = AudioService(db)
+    # Reason: One extra row tells whether another page follows
+    audio_files = await audio_service.list_meetings_async(
+        limit + 1,
+        after=after,
+        status_filter=status_filter,
+        created_from=created_from,
+        created_to=created_to,
+    )
+
+    page = audio_files[:limit]
+    next_cursor = None
+    if len(audio_files) > limit:
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
+
+    return MeetingListResponse(
+        items=[build_status_response(audio_file) for audio_file in page],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/{audio_id}", response_model=MeetingResponse, status_code=status.HTTP_200_OK)
+async def get_meeting(
+    audio_id: UUID,
+    include: str = Query(
+        "summary,transcript", description="Parts to return: summary, transcript (comma-separated)"
+    ),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> MeetingResponse:
+    """
+    Get an audio file with its transcription and summary.
+
+    Loads everything in one database query and replaces separate calls to
+    the status, transcription and summary endpoints.
+
+    Args:
+        audio_id: UUID of audio file
+        include: Comma-separated parts to return
+        db: Database session
+
+    Returns:
+        MeetingResponse: Audio status plus the requested parts that exist
+
+    Raises:
+        HTTPException 400: Unknown include part
+        HTTPException 404: Audio file not found
+    """
+    parts = parse_include(include)
+    audio_service = AudioService(db)
+    audio_file = await audio_service.get_meeting_async(
+        audio_id,
+        with_transcript=MeetingInclude.TRANSCRIPT in parts,
+        with_summary=MeetingInclude.SUMMARY in parts,
+    )
+
+    if not audio_file:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Audio file {audio_id} not found",
+        )
+
+    transcription = audio_file.transcription
+    summary = transcription.summary if transcription else None
+
+    return MeetingResponse(
+        audio=build_status_response(audio_file),
+        transcription=(
+            TranscriptionResponse.model_validate(transcription)
+            if transcription and MeetingInclude.TRANSCRIPT in parts
+            else None
+        ),
+        summary=(
+            SummaryResponse.model_validate(summary)
+            if summary and MeetingInclude.SUMMARY in parts
+            else None
+        ),
+    )
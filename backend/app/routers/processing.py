@@ -6,63 +6,73 @@ Endpoints for triggering and managing audio processing pipeline.
 
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import close_session, get_db, get_read_db
+from app.core.http_cache import (
+    cache_headers,
+    etag_matches,
+    make_etag,
+    not_modified,
+    result_cache_control,
+)
+from app.core.settings import settings
+from app.models.audio import AudioStatus
+from app.models.summary import SummaryStatus
+from app.models.transcription import TranscriptionStatus
+from app.schemas.batch import (
+    BatchItemError,
+    BatchProcessItem,
+    BatchProcessRequest,
+    BatchProcessResponse,
+    BatchSummaryItem,
+    BatchSummaryResponse,
+)
 from app.schemas.summary import SummaryResponse
-from app.schemas.transcription import TranscriptionResponse
+from app.schemas.transcription import (
+    TranscriptionResponse,
+    TranscriptRangeResponse,
+    TranscriptSegmentResponse,
+)
 from app.services.audio_service import AudioService
+from app.services.job_queue import get_broker
+from app.services.pipeline_service import first_stage
+from app.services.response_cache import (
+    SUMMARY,
+    TRANSCRIPTION,
+    CachedResponse,
+    get_response_cache,
+)
+from app.services.status_events import (
+    ProcessingStage,
+    build_status_response,
+    publish_event,
+    publish_status,
+)
 from app.services.summary_service import SummaryService
 from app.services.transcription_service import TranscriptionService
 
 router = APIRouter()
 
 
-async def process_audio_pipeline(audio_id: UUID, db: Session) -> None:
-    """
-    Background task to process audio file through transcription and summarization.
-
-    Args:
-        audio_id: UUID of audio file
-        db: Database session
-    """
-    audio_service = AudioService(db)
-    transcription_service = TranscriptionService(db)
-    summary_service = SummaryService(db)
-
-    # Get audio file
-    audio_file = audio_service.get_audio_by_id(audio_id)
-    if not audio_file:
-        return
-
-    try:
-        # Step 1: Transcribe audio
-        transcription = await transcription_service.transcribe_audio(audio_file)
-
-        # Step 2: Generate summary
-        await summary_service.generate_summary(transcription)
-
-    except Exception as e:
-        # Error handling is done in individual services
-        print(f"Processing failed for audio {audio_id}: {str(e)}")
-
-
 @router.post("/process/{audio_id}", status_code=status.HTTP_202_ACCEPTED)
 async def start_processing(
     audio_id: UUID,
-    background_tasks: BackgroundTasks,
+    use_cache: bool = Query(True, description="Reuse cached results for identical input"),
     db: Session = Depends(get_db),
 ) -> dict:
     """
     Start processing audio file (transcription + summarization).
 
-    Triggers background processing pipeline. Use GET /audio/{audio_id}
-    to check processing status.
+    Queues the processing pipeline for a worker. Use GET /audio/{audio_id}
+    to check processing status, or GET /audio/{audio_id}/events to stream it.
 
     Args:
         audio_id: UUID of uploaded audio file
-        background_tasks: FastAPI background tasks
+        use_cache: Whether cached results may be reused
         db: Database session
 
     Returns:
@@ -82,22 +92,150 @@ async def start_processing(
         )
 
     # Check if already processing or completed
-    if audio_file.status in ["processing", "completed"]:
+    if audio_file.status in ["recording", "processing", "completed"]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Audio file is already {audio_file.status}",
         )
 
-    # Add processing task to background
-    background_tasks.add_task(process_audio_pipeline, audio_id, db)
+    # Queue first pipeline stage and mark as processing in one transaction
+    job_id = get_broker().enqueue(audio_id, first_stage().value, use_cache, db=db)
+    audio_file.status = AudioStatus.PROCESSING.value
+    audio_file.error_message = None
+    db.commit()
+    publish_status(audio_file, ProcessingStage.QUEUED)
 
     return {
         "message": "Processing started",
         "audio_id": str(audio_id),
+        "job_id": str(job_id),
         "status": "processing",
     }
 
 
+@router.post("/process", response_model=BatchProcessResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_processing_batch(
+    request: BatchProcessRequest,
+    db: Session = Depends(get_db),
+) -> BatchProcessResponse:
+    """
+    Start processing several audio files.
+
+    Looks all files up with one query and queues every accepted pipeline in
+    one transaction. Files that are missing or already processing/completed
+    are reported per item.
+
+    Args:
+        request: Audio file IDs and cache option
+        db: Database session
+
+    Returns:
+        BatchProcessResponse: Queued job or error per audio file
+
+    Raises:
+        HTTPException 400: More IDs than settings.batch_max_items
+    """
+    audio_ids = list(dict.fromkeys(request.audio_ids))
+    if len(audio_ids) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.batch_max_items} audio files per batch",
+        )
+
+    audio_files = AudioService(db).get_audio_by_ids(audio_ids)
+    broker = get_broker()
+
+    items = []
+    queued = []
+    for audio_id in audio_ids:
+        audio_file = audio_files.get(audio_id)
+        if not audio_file:
+            error = BatchItemError(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Audio file {audio_id} not found"
+            )
+        elif audio_file.status in ["recording", "processing", "completed"]:
+            error = BatchItemError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Audio file is already {audio_file.status}",
+            )
+        else:
+            job_id = broker.enqueue(audio_id, first_stage().value, request.use_cache, db=db)
+            audio_file.status = AudioStatus.PROCESSING.value
+            audio_file.error_message = None
+            queued.append(audio_file)
+            items.append(BatchProcessItem(audio_id=audio_id, job_id=job_id))
+            continue
+        items.append(BatchProcessItem(audio_id=audio_id, error=error))
+
+    # Reason: Snapshot before the commit expires the records - no reload per file
+    db.flush()
+    events = [build_status_response(audio_file, ProcessingStage.QUEUED) for audio_file in queued]
+    db.commit()
+    for event in events:
+        publish_event(event)
+
+    return BatchProcessResponse(items=items, succeeded=len(queued), failed=len(items) - len(queued))
+
+
+@router.get("/summaries", response_model=BatchSummaryResponse, status_code=status.HTTP_200_OK)
+async def get_summaries(
+    ids: str = Query(..., description="Comma-separated summary IDs"),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> BatchSummaryResponse:
+    """
+    Get several summaries with one query.
+
+    Malformed and unknown IDs are reported per item.
+
+    Args:
+        ids: Comma-separated summary IDs
+        db: Database session
+
+    Returns:
+        BatchSummaryResponse: Summary or error per ID, in request order
+
+    Raises:
+        HTTPException 400: More IDs than settings.batch_max_items
+    """
+    requested = list(dict.fromkeys(part.strip() for part in ids.split(",") if part.strip()))
+    if len(requested) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.batch_max_items} summaries per batch",
+        )
+
+    parsed: dict[str, UUID] = {}
+    for raw_id in requested:
+        try:
+            parsed[raw_id] = UUID(raw_id)
+        except ValueError:
+            pass
+
+    summaries = await SummaryService(db).get_summaries_by_ids_async(list(parsed.values()))
+
+    items = []
+    for raw_id in requested:
+        summary_id = parsed.get(raw_id)
+        summary = summaries.get(summary_id) if summary_id else None
+        if summary:
+            items.append(
+                BatchSummaryItem(id=raw_id, summary=SummaryResponse.model_validate(summary))
+            )
+            continue
+
+        if summary_id:
+            error = BatchItemError(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f"Summary {raw_id} not found"
+            )
+        else:
+            error = BatchItemError(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid summary ID"
+            )
+        items.append(BatchSummaryItem(id=raw_id, error=error))
+
+    return BatchSummaryResponse(items=items)
+
+
 @router.get(
     "/transcription/{transcription_id}",
     response_model=TranscriptionResponse,
@@ -105,23 +243,50 @@ async def start_processing(
 )
 async def get_transcription(
     transcription_id: UUID,
-    db: Session = Depends(get_db),
-) -> TranscriptionResponse:
+    if_none_match: str | None = Header(None),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> Response:
     """
     Get transcription by ID.
 
+    Responses carry a strong ETag; completed transcriptions may be reused
+    briefly by clients and are served from the response cache without a
+    database query. On a cache miss, a matching If-None-Match is answered
+    with 304 after reading a single column pair, without loading the
+    transcript.
+
     Args:
         transcription_id: UUID of transcription
+        if_none_match: Entity tags of the client's cached copies
         db: Database session
 
     Returns:
-        TranscriptionResponse: Transcription data
+        Response: TranscriptionResponse JSON, or 304 Not Modified
 
     Raises:
         HTTPException 404: Transcription not found
     """
     transcription_service = TranscriptionService(db)
-    transcription = transcription_service.get_transcription_by_id(transcription_id)
+    response_cache = get_response_cache()
+
+    if response_cache:
+        cached = await response_cache.get(TRANSCRIPTION, transcription_id)
+        if cached:
+            return cached.to_response(if_none_match)
+        token = await response_cache.read_token(TRANSCRIPTION, transcription_id)
+
+    if if_none_match:
+        version = await transcription_service.get_transcription_version_async(transcription_id)
+        if version:
+            updated_at, state = version
+            headers = cache_headers(
+                make_etag(transcription_id, updated_at),
+                result_cache_control(state == TranscriptionStatus.COMPLETED.value),
+            )
+            if etag_matches(if_none_match, headers["ETag"]):
+                return not_modified(headers)
+
+    transcription = await transcription_service.get_transcription_by_id_async(transcription_id)
 
     if not transcription:
         raise HTTPException(
@@ -129,7 +294,122 @@ async def get_transcription(
             detail=f"Transcription {transcription_id} not found",
         )
 
-    return TranscriptionResponse.model_validate(transcription)
+    completed = transcription.status == TranscriptionStatus.COMPLETED.value
+    serialized = CachedResponse(
+        body=TranscriptionResponse.model_validate(transcription).model_dump_json().encode(),
+        etag=make_etag(transcription.id, transcription.updated_at),
+        cache_control=result_cache_control(completed),
+    )
+    if response_cache and completed:
+        await response_cache.put(TRANSCRIPTION, transcription_id, serialized, token)
+    return serialized.to_response()
+
+
+@router.get("/transcription/{transcription_id}/text", status_code=status.HTTP_200_OK)
+async def get_transcription_text(
+    transcription_id: UUID,
+    if_none_match: str | None = Header(None),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> Response:
+    """
+    Stream the full text of a transcription as plain text.
+
+    The text is sent in chunks read one at a time from the database, so
+    memory use per request does not depend on the transcript length.
+
+    Args:
+        transcription_id: UUID of transcription
+        if_none_match: Entity tags of the client's cached copies
+        db: Database session
+
+    Returns:
+        Response: text/plain stream of the transcript, or 304 Not Modified
+
+    Raises:
+        HTTPException 404: Transcription not found
+    """
+    transcription_service = TranscriptionService(db)
+    version = await transcription_service.get_transcription_version_async(transcription_id)
+    if not version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transcription {transcription_id} not found",
+        )
+
+    updated_at, state = version
+    headers = cache_headers(
+        make_etag(transcription_id, updated_at),
+        result_cache_control(state == TranscriptionStatus.COMPLETED.value),
+    )
+    await close_session(db)
+    if etag_matches(if_none_match, headers["ETag"]):
+        return not_modified(headers)
+
+    return StreamingResponse(
+        transcription_service.stream_text_async(transcription_id),
+        media_type="text/plain",  # Reason: Starlette appends the utf-8 charset
+        headers=headers,
+    )
+
+
+@router.get(
+    "/transcription/{transcription_id}/segments",
+    response_model=TranscriptRangeResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_transcript_segments(
+    transcription_id: UUID,
+    start: float = Query(0.0, ge=0, description="Range start in seconds"),
+    end: float | None = Query(None, gt=0, description="Range end in seconds (default: end)"),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> TranscriptRangeResponse:
+    """
+    Get the timed transcript segments overlapping a time range.
+
+    Reads only the segments in the range, not the full transcript text.
+
+    Args:
+        transcription_id: UUID of transcription
+        start: Range start (seconds)
+        end: Range end (seconds), None for the end of the recording
+        db: Database session
+
+    Returns:
+        TranscriptRangeResponse: Overlapping segments in order
+
+    Raises:
+        HTTPException 400: end is not after start
+        HTTPException 404: Transcription not found
+    """
+    if end is not None and end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end must be greater than start",
+        )
+
+    transcription_service = TranscriptionService(db)
+    segments = await transcription_service.get_segments_async(transcription_id, start, end)
+
+    # Reason: Only an empty range needs the extra lookup to tell 404 from no speech
+    if not segments and not await transcription_service.get_transcription_version_async(
+        transcription_id
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transcription {transcription_id} not found",
+        )
+
+    return TranscriptRangeResponse(
+        transcription_id=transcription_id,
+        start=start,
+        end=end,
+        segments=[
+            TranscriptSegmentResponse(
+                start=segment.start_ms / 1000, end=segment.end_ms / 1000, text=segment.text
+            )
+            for segment in segments
+        ],
+    )
 
 
 @router.get(
@@ -139,23 +419,49 @@ async def get_transcription(
 )
 async def get_summary(
     summary_id: UUID,
-    db: Session = Depends(get_db),
-) -> SummaryResponse:
+    if_none_match: str | None = Header(None),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> Response:
     """
     Get summary by ID.
 
+    Responses carry a strong ETag; completed summaries may be reused briefly
+    by clients and are served from the response cache without a database
+    query. On a cache miss, a matching If-None-Match is answered with 304
+    after reading a single column pair, without loading the summary.
+
     Args:
         summary_id: UUID of summary
+        if_none_match: Entity tags of the client's cached copies
         db: Database session
 
     Returns:
-        SummaryResponse: Summary data with structured information
+        Response: SummaryResponse JSON with structured information, or 304 Not Modified
 
     Raises:
         HTTPException 404: Summary not found
     """
     summary_service = SummaryService(db)
-    summary = summary_service.get_summary_by_id(summary_id)
+    response_cache = get_response_cache()
+
+    if response_cache:
+        cached = await response_cache.get(SUMMARY, summary_id)
+        if cached:
+            return cached.to_response(if_none_match)
+        token = await response_cache.read_token(SUMMARY, summary_id)
+
+    if if_none_match:
+        version = await summary_service.get_summary_version_async(summary_id)
+        if version:
+            updated_at, state = version
+            headers = cache_headers(
+                make_etag(summary_id, updated_at),
+                result_cache_control(state == SummaryStatus.COMPLETED.value),
+            )
+            if etag_matches(if_none_match, headers["ETag"]):
+                return not_modified(headers)
+
+    summary = await summary_service.get_summary_by_id_async(summary_id)
 
     if not summary:
         raise HTTPException(
@@ -163,4 +469,12 @@ async def get_summary(
             detail=f"Summary {summary_id} not found",
         )
 
-    return SummaryResponse.model_validate(summary)
+    completed = summary.status == SummaryStatus.COMPLETED.value
+    serialized = CachedResponse(
+        body=SummaryResponse.model_validate(summary).model_dump_json().encode(),
+        etag=make_etag(summary.id, summary.updated_at),
+        cache_control=result_cache_control(completed),
+    )
+    if response_cache and completed:
+        await response_cache.put(SUMMARY, summary_id, serialized, token)
+    return serialized.to_response()
@@ -0,0 +1,73 @@
+"""
+Search router.
+
+Endpoints for full-text and semantic search over meeting transcripts and
+summaries.
+"""
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_read_db
+from app.schemas.search import SearchResponse, SemanticSearchResponse
+from app.services.embedding_service import EmbeddingService
+from app.services.search_service import SearchService
+
+router = APIRouter()
+
+MAX_SEARCH_OFFSET = 1000  # Reason: Every page re-ranks all earlier hits - refine the query
+
+
+@router.get("/search", response_model=SearchResponse, status_code=status.HTTP_200_OK)
+async def search_meetings(
+    q: str = Query(..., min_length=1, max_length=500, description="Words to search for"),
+    limit: int = Query(10, ge=1, le=50, description="Page size"),
+    offset: int = Query(0, ge=0, le=MAX_SEARCH_OFFSET, description="Hits to skip"),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> SearchResponse:
+    """
+    Search transcripts and summaries of completed meetings.
+
+    Args:
+        q: Search query
+        limit: Maximum number of hits per page
+        offset: Number of hits to skip (next_offset of the previous page)
+        db: Database session
+
+    Returns:
+        SearchResponse: Ranked hits with highlighted snippets
+    """
+    # Reason: One extra hit tells whether another page follows
+    hits = await SearchService(db).search(q, limit + 1, offset)
+
+    return SearchResponse(
+        query=q,
+        items=hits[:limit],
+        next_offset=offset + limit if len(hits) > limit else None,
+    )
+
+
+@router.get(
+    "/search/semantic", response_model=SemanticSearchResponse, status_code=status.HTTP_200_OK
+)
+async def search_meetings_semantic(
+    q: str = Query(..., min_length=1, max_length=500, description="What the meeting was about"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of meetings"),
+    db: Session | AsyncSession = Depends(get_read_db),
+) -> SemanticSearchResponse:
+    """
+    Find meetings by meaning rather than exact words.
+
+    The query is embedded locally and compared with the embedded summary,
+    key points and transcript passages of every processed meeting.
+
+    Args:
+        q: Search query
+        limit: Maximum number of meetings
+        db: Database session
+
+    Returns:
+        SemanticSearchResponse: Best passage per meeting, most similar first
+    """
+    return SemanticSearchResponse(query=q, items=await EmbeddingService(db).search(q, limit))
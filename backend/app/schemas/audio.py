@@ -18,6 +18,8 @@ class AudioUploadResponse(BaseModel):
         id: Unique audio file identifier
         filename: Original filename
         file_size: File size in bytes
+        content_hash: SHA-256 of the file content
+        duration_seconds: Duration read from the container header, if recorded
         status: Processing status
         created_at: Upload timestamp
     """
@@ -25,6 +27,8 @@ class AudioUploadResponse(BaseModel):
     id: UUID = Field(..., description="Unique audio file ID")
     filename: str = Field(..., description="Original filename")
     file_size: int = Field(..., description="File size in bytes")
+    content_hash: str | None = Field(None, description="SHA-256 of the file content")
+    duration_seconds: float | None = Field(None, description="Audio duration in seconds")
     status: str = Field(..., description="Processing status")
     created_at: datetime = Field(..., description="Upload timestamp")
 
@@ -35,6 +39,8 @@ class AudioUploadResponse(BaseModel):
                     "id": "550e8400-e29b-41d4-a716-446655440000",
                     "filename": "meeting_recording.webm",
                     "file_size": 1024000,
+                    "content_hash": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+                    "duration_seconds": 1830.4,
                     "status": "uploaded",
                     "created_at": "2024-01-15T10:30:00Z",
                 }
@@ -52,6 +58,7 @@ class AudioStatusResponse(BaseModel):
         id: Unique audio file identifier
         filename: Original filename
         status: Current processing status
+        stage: Current pipeline stage
         duration_seconds: Audio duration if available
         error_message: Error details if failed
         transcription_id: ID of transcription if available
@@ -63,6 +70,11 @@ class AudioStatusResponse(BaseModel):
     id: UUID = Field(..., description="Unique audio file ID")
     filename: str = Field(..., description="Original filename")
     status: str = Field(..., description="Processing status")
+    stage: str | None = Field(
+        None,
+        description="Pipeline stage: uploaded, recording, queued, transcoding, transcribing, "
+        "summarizing, retrying, completed or failed",
+    )
     duration_seconds: float | None = Field(None, description="Audio duration in seconds")
     error_message: str | None = Field(None, description="Error message if failed")
     transcription_id: UUID | None = Field(None, description="Transcription ID if available")
@@ -77,6 +89,7 @@ class AudioStatusResponse(BaseModel):
                     "id": "550e8400-e29b-41d4-a716-446655440000",
                     "filename": "meeting_recording.webm",
                     "status": "completed",
+                    "stage": "completed",
                     "duration_seconds": 300.5,
                     "error_message": None,
                     "transcription_id": "660e8400-e29b-41d4-a716-446655440000",
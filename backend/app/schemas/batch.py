@@ -0,0 +1,125 @@
+"""
+Batch schemas.
+
+Pydantic models for batch upload, processing and retrieval endpoints.
+Every item reports its own outcome, so one bad item does not fail the batch.
+"""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas.audio import AudioUploadResponse
+from app.schemas.summary import SummaryResponse
+
+
+class BatchItemError(BaseModel):
+    """
+    Error of one batch item.
+
+    Attributes:
+        status_code: HTTP status the single-item endpoint would have returned
+        detail: Error message
+    """
+
+    status_code: int = Field(..., description="Equivalent HTTP status code")
+    detail: str = Field(..., description="Error message")
+
+
+class BatchUploadItem(BaseModel):
+    """
+    Outcome of one file of a batch upload.
+
+    Attributes:
+        filename: Uploaded filename
+        audio: Created audio file, if the upload succeeded
+        error: Error, if it failed
+    """
+
+    filename: str | None = Field(None, description="Uploaded filename")
+    audio: AudioUploadResponse | None = Field(None, description="Created audio file")
+    error: BatchItemError | None = Field(None, description="Upload error")
+
+
+class BatchUploadResponse(BaseModel):
+    """
+    Response schema for batch upload.
+
+    Attributes:
+        items: Outcome per file, in upload order
+        succeeded: Number of files stored
+        failed: Number of files rejected
+    """
+
+    items: list[BatchUploadItem] = Field(..., description="Outcome per file")
+    succeeded: int = Field(..., description="Files stored")
+    failed: int = Field(..., description="Files rejected")
+
+
+class BatchProcessRequest(BaseModel):
+    """
+    Request schema for batch processing.
+
+    Attributes:
+        audio_ids: Audio files to process
+        use_cache: Whether cached results may be reused
+    """
+
+    audio_ids: list[UUID] = Field(..., min_length=1, description="Audio file IDs")
+    use_cache: bool = Field(True, description="Reuse cached results for identical input")
+
+
+class BatchProcessItem(BaseModel):
+    """
+    Outcome of one audio file of a batch processing request.
+
+    Attributes:
+        audio_id: Audio file ID
+        job_id: Queued job, if processing started
+        error: Error, if it did not
+    """
+
+    audio_id: UUID = Field(..., description="Audio file ID")
+    job_id: UUID | None = Field(None, description="Queued job ID")
+    error: BatchItemError | None = Field(None, description="Reason processing did not start")
+
+
+class BatchProcessResponse(BaseModel):
+    """
+    Response schema for batch processing.
+
+    Attributes:
+        items: Outcome per audio file, in request order
+        succeeded: Number of pipelines queued
+        failed: Number of audio files rejected
+    """
+
+    items: list[BatchProcessItem] = Field(..., description="Outcome per audio file")
+    succeeded: int = Field(..., description="Pipelines queued")
+    failed: int = Field(..., description="Audio files rejected")
+
+
+class BatchSummaryItem(BaseModel):
+    """
+    Outcome of one ID of a batch summary lookup.
+
+    Attributes:
+        id: Requested summary ID
+        summary: Summary, if found
+        error: Error, if not
+    """
+
+    id: str = Field(..., description="Requested summary ID")
+    summary: SummaryResponse | None = Field(None, description="Summary data")
+    error: BatchItemError | None = Field(None, description="Lookup error")
+
+
+class BatchSummaryResponse(BaseModel):
+    """
+    Response schema for batch summary lookup.
+
+    Attributes:
+        items: Outcome per ID, in request order
+    """
+
+    items: list[BatchSummaryItem] = Field(..., description="Outcome per ID")
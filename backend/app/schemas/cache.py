@@ -0,0 +1,52 @@
+"""
+Cache statistics schemas.
+
+Pydantic models for cache monitoring endpoints.
+"""
+
+from pydantic import BaseModel, Field
+
+
+class CacheCounters(BaseModel):
+    """
+    Counters for a single cache.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that fell through to the source
+        evictions: Entries removed to respect size bounds
+        hit_ratio: hits / (hits + misses)
+    """
+
+    hits: int = Field(..., description="Cache hits")
+    misses: int = Field(..., description="Cache misses")
+    evictions: int = Field(..., description="Entries evicted")
+    hit_ratio: float = Field(..., description="Fraction of lookups served from cache")
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    Response schema for cache statistics.
+
+    Attributes:
+        caches: Counters keyed by cache name
+    """
+
+    caches: dict[str, CacheCounters] = Field(..., description="Counters per cache")
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "caches": {
+                        "transcription": {
+                            "hits": 42,
+                            "misses": 108,
+                            "evictions": 0,
+                            "hit_ratio": 0.28,
+                        }
+                    }
+                }
+            ]
+        }
+    }
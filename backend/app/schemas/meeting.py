@@ -0,0 +1,50 @@
+"""
+Meeting schemas.
+
+Pydantic models for the meeting listing and bundle endpoints.
+"""
+
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from app.schemas.audio import AudioStatusResponse
+from app.schemas.summary import SummaryResponse
+from app.schemas.transcription import TranscriptionResponse
+
+
+class MeetingInclude(str, Enum):
+    """Optional parts of a meeting bundle."""
+
+    TRANSCRIPT = "transcript"
+    SUMMARY = "summary"
+
+
+class MeetingResponse(BaseModel):
+    """
+    Response schema for a meeting bundle.
+
+    Attributes:
+        audio: Audio file status and related IDs
+        transcription: Transcription, if requested and available
+        summary: Summary, if requested and available
+    """
+
+    audio: AudioStatusResponse = Field(..., description="Audio file status")
+    transcription: TranscriptionResponse | None = Field(
+        None, description="Transcription (include=transcript)"
+    )
+    summary: SummaryResponse | None = Field(None, description="Summary (include=summary)")
+
+
+class MeetingListResponse(BaseModel):
+    """
+    Response schema for a page of meetings.
+
+    Attributes:
+        items: Audio file statuses, newest first
+        next_cursor: Cursor of the next page, None on the last page
+    """
+
+    items: list[AudioStatusResponse] = Field(..., description="Meetings, newest first")
+    next_cursor: str | None = Field(None, description="Pass as cursor to get the next page")
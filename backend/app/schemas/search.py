@@ -0,0 +1,92 @@
+"""
+Search schemas.
+
+Pydantic models for the full-text and semantic search endpoints.
+"""
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SearchSource(str, Enum):
+    """Indexed text a search hit was found in."""
+
+    TRANSCRIPT = "transcript"
+    SUMMARY = "summary"
+
+
+class SearchHit(BaseModel):
+    """
+    One matching transcript or summary.
+
+    Attributes:
+        audio_id: ID of the meeting's audio file
+        filename: Original filename of the meeting
+        created_at: Upload timestamp of the meeting
+        source: Whether the transcript or the summary matched
+        document_id: ID of the matching transcription or summary
+        rank: Relevance, higher is better (only comparable within one response)
+        snippet: Matching excerpt with terms wrapped in <mark> tags
+    """
+
+    audio_id: UUID = Field(..., description="Audio file ID")
+    filename: str = Field(..., description="Original filename")
+    created_at: datetime = Field(..., description="Upload timestamp")
+    source: SearchSource = Field(..., description="transcript or summary")
+    document_id: UUID = Field(..., description="Transcription or summary ID")
+    rank: float = Field(..., description="Relevance, higher is better")
+    snippet: str = Field(
+        ..., description="Excerpt with matches in <mark> tags (text is not HTML-escaped)"
+    )
+
+
+class SearchResponse(BaseModel):
+    """
+    Response schema for a page of search results.
+
+    Attributes:
+        query: Search query
+        items: Hits, most relevant first
+        next_offset: Offset of the next page, None on the last page
+    """
+
+    query: str = Field(..., description="Search query")
+    items: list[SearchHit] = Field(..., description="Hits, most relevant first")
+    next_offset: int | None = Field(None, description="Pass as offset to get the next page")
+
+
+class SemanticHit(BaseModel):
+    """
+    Meeting whose passage is similar to a semantic query.
+
+    Attributes:
+        audio_id: ID of the meeting's audio file
+        filename: Original filename of the meeting
+        created_at: Upload timestamp of the meeting
+        source: Part of the meeting the passage was taken from
+        passage: Most similar passage of the meeting
+        score: Cosine similarity, higher is better
+    """
+
+    audio_id: UUID = Field(..., description="Audio file ID")
+    filename: str = Field(..., description="Original filename")
+    created_at: datetime = Field(..., description="Upload timestamp")
+    source: str = Field(..., description="summary, key_point or transcript")
+    passage: str = Field(..., description="Most similar passage")
+    score: float = Field(..., description="Cosine similarity, higher is better")
+
+
+class SemanticSearchResponse(BaseModel):
+    """
+    Response schema for semantic search.
+
+    Attributes:
+        query: Search query
+        items: Meetings, most similar first
+    """
+
+    query: str = Field(..., description="Search query")
+    items: list[SemanticHit] = Field(..., description="Meetings, most similar first")
@@ -25,6 +25,10 @@ class SummaryResponse(BaseModel):
         participants: List of participant names
         tokens_used: AI tokens consumed
         model_used: AI model identifier
+        cache_hit: Whether the summary came from the summary cache
+        route: Summarization route chosen by the planner
+        estimated_prompt_tokens: Prompt tokens estimated before the call
+        prompt_tokens: Prompt tokens reported by the API
         status: Processing status
         created_at: Creation timestamp
     """
@@ -38,6 +42,12 @@ class SummaryResponse(BaseModel):
     participants: list[str] | None = Field(None, description="Participant names")
     tokens_used: int | None = Field(None, description="AI tokens used")
     model_used: str | None = Field(None, description="AI model identifier")
+    cache_hit: bool = Field(False, description="Summary reused from cache (no tokens spent)")
+    route: str | None = Field(
+        None, description="Summarization route: fast, single, chunked or incremental"
+    )
+    estimated_prompt_tokens: int | None = Field(None, description="Estimated prompt tokens")
+    prompt_tokens: int | None = Field(None, description="Actual prompt tokens")
     status: str = Field(..., description="Processing status")
     created_at: datetime = Field(..., description="Creation timestamp")
 
@@ -64,6 +74,10 @@ class SummaryResponse(BaseModel):
                     "participants": ["John", "Sarah", "Mike", "Lisa"],
                     "tokens_used": 2500,
                     "model_used": "claude-3-5-sonnet-20241022",
+                    "cache_hit": False,
+                    "route": "single",
+                    "estimated_prompt_tokens": 2140,
+                    "prompt_tokens": 2152,
                     "status": "completed",
                     "created_at": "2024-01-15T10:32:00Z",
                 }
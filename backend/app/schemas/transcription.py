@@ -21,6 +21,8 @@ class TranscriptionResponse(BaseModel):
         language: Detected language
         status: Processing status
         processing_time_ms: Time taken to transcribe
+        cache_hit: Whether the result came from the transcription cache
+        silence_removed_seconds: Silence cut out before transcription
         created_at: Creation timestamp
     """
 
@@ -30,6 +32,10 @@ class TranscriptionResponse(BaseModel):
     language: str | None = Field(None, description="Detected language code")
     status: str = Field(..., description="Processing status")
     processing_time_ms: int | None = Field(None, description="Processing time in milliseconds")
+    cache_hit: bool = Field(False, description="Result reused from the transcription cache")
+    silence_removed_seconds: float | None = Field(
+        None, description="Seconds of silence cut out before transcription"
+    )
     created_at: datetime = Field(..., description="Creation timestamp")
 
     model_config = {
@@ -42,9 +48,45 @@ class TranscriptionResponse(BaseModel):
                     "language": "en",
                     "status": "completed",
                     "processing_time_ms": 5420,
+                    "cache_hit": False,
+                    "silence_removed_seconds": 184.2,
                     "created_at": "2024-01-15T10:30:00Z",
                 }
             ]
         },
         "from_attributes": True,
     }
+
+
+class TranscriptSegmentResponse(BaseModel):
+    """
+    Timed segment of a transcript.
+
+    Attributes:
+        start: Start time (seconds)
+        end: End time (seconds)
+        text: Transcribed text
+    """
+
+    start: float = Field(..., description="Start time in seconds")
+    end: float = Field(..., description="End time in seconds")
+    text: str = Field(..., description="Transcribed text")
+
+
+class TranscriptRangeResponse(BaseModel):
+    """
+    Response schema for the part of a transcript within a time range.
+
+    Attributes:
+        transcription_id: ID of the transcription
+        start: Requested range start (seconds)
+        end: Requested range end (seconds), None for the end of the recording
+        segments: Segments overlapping the range, in order
+    """
+
+    transcription_id: UUID = Field(..., description="Transcription ID")
+    start: float = Field(..., description="Range start in seconds")
+    end: float | None = Field(None, description="Range end in seconds")
+    segments: list[TranscriptSegmentResponse] = Field(
+        ..., description="Segments overlapping the range"
+    )
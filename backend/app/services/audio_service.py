@@ -4,14 +4,25 @@ Audio service for handling audio file operations.
 Manages audio file uploads, validation, and processing coordination.
 """
 
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.database import execute
 from app.core.settings import settings
 from app.models.audio import AudioFile, AudioStatus
-from app.services.storage_service import StorageService
+from app.models.summary import Summary
+from app.models.transcript_segment import TranscriptSegment
+from app.models.transcription import Transcription
+from app.services.embedding_service import EmbeddingService
+from app.services.response_cache import SUMMARY, TRANSCRIPTION, invalidate_response
+from app.services.search_service import SearchService
+from app.services.storage_service import FileTooLargeError, StorageService, StoredFile
+from app.utils.probe import FORMAT_EXTENSIONS, AudioProbe, ProbeError, probe_audio
 
 
 class AudioService:
@@ -21,15 +32,17 @@ class AudioService:
     Handles upload, validation, storage, and database operations.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session | AsyncSession) -> None:
         """
         Initialize audio service.
 
         Args:
-            db: Database session
+            db: Database session (async sessions support the *_async lookups only)
         """
         self.db = db
         self.storage = StorageService()
+        # Reason: Deduplicated uploads keep a spare copy until their records are committed
+        self._unsettled: list[StoredFile] = []
 
     async def upload_audio(self, file: UploadFile) -> AudioFile:
         """
@@ -41,48 +54,109 @@ class AudioService:
         Returns:
             AudioFile: Created database record
 
+        Raises:
+            HTTPException: If validation fails or upload errors
+        """
+        audio_file = await self._store_upload(file)
+        self.db.commit()
+        self._settle_uploads()
+        self.db.refresh(audio_file)
+
+        return audio_file
+
+    async def upload_audio_batch(self, files: list[UploadFile]) -> list[AudioFile | HTTPException]:
+        """
+        Upload and save several audio files, creating all records in one commit.
+
+        A file that fails validation or storage is reported in its slot and
+        does not affect the others.
+
+        Args:
+            files: Uploaded audio files
+
+        Returns:
+            list[AudioFile | HTTPException]: Created record or error, in upload order
+        """
+        results: list[AudioFile | HTTPException] = []
+        for file in files:
+            try:
+                results.append(await self._store_upload(file))
+            except HTTPException as e:
+                results.append(e)
+
+        created = [result for result in results if isinstance(result, AudioFile)]
+        if created:
+            self.db.flush()
+            ids = [audio_file.id for audio_file in created]
+            self.db.commit()
+            self._settle_uploads()
+            # Reason: Reload the expired records with one query instead of one refresh each
+            self.db.query(AudioFile).filter(AudioFile.id.in_(ids)).all()
+
+        return results
+
+    async def _store_upload(self, file: UploadFile) -> AudioFile:
+        """
+        Validate and store an upload, and add its (uncommitted) record.
+
+        Args:
+            file: Uploaded audio file
+
+        Returns:
+            AudioFile: Pending database record
+
         Raises:
             HTTPException: If validation fails or upload errors
         """
         # Validate file
         self._validate_audio_file(file)
 
-        # Read file content
-        file_content = await file.read()
-
-        # Check file size
-        if len(file_content) > settings.max_upload_size_bytes:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File too large. Max size: {settings.max_upload_size_mb}MB",
-            )
+        # Reject early when the declared size is already over the limit
+        if file.size is not None and file.size > settings.max_upload_size_bytes:
+            raise self._file_too_large()
 
-        # Save file to disk
+        # Stream file to disk
+        # Reason: Avoid holding the whole upload in memory and blocking the event loop
         try:
-            file_path, unique_filename = self.storage.save_audio_file(
-                file_content, file.filename or "recording.webm"
+            stored = await self.storage.save_audio_stream(
+                file,
+                file.filename or "recording.webm",
+                max_size=settings.max_upload_size_bytes,
             )
+        except FileTooLargeError:
+            raise self._file_too_large()
         except OSError as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to save file: {str(e)}",
             )
 
+        # Check the real format and duration from the container header
+        probe = self._probe_upload(stored, file.filename or "recording.webm")
+
         # Create database record
         audio_file = AudioFile(
             filename=file.filename or "recording.webm",
-            file_path=file_path,
-            file_size=len(file_content),
-            mime_type=file.content_type or "audio/webm",
+            file_path=stored.file_path,
+            file_size=stored.size,
+            content_hash=stored.content_hash,
+            mime_type=probe.mime_type if probe else file.content_type or "audio/webm",
+            duration_seconds=probe.duration_seconds if probe else None,
+            sample_rate=probe.sample_rate if probe else None,
+            channels=probe.channels if probe else None,
             status=AudioStatus.UPLOADED.value,
         )
-
         self.db.add(audio_file)
-        self.db.commit()
-        self.db.refresh(audio_file)
+        self._unsettled.append(stored)
 
         return audio_file
 
+    def _settle_uploads(self) -> None:
+        """Settle the spare copies of uploads whose records were just committed."""
+        for stored in self._unsettled:
+            self.storage.settle_upload(stored)
+        self._unsettled.clear()
+
     def get_audio_by_id(self, audio_id: UUID) -> AudioFile | None:
         """
         Get audio file by ID.
@@ -95,6 +169,188 @@ class AudioService:
         """
         return self.db.query(AudioFile).filter(AudioFile.id == audio_id).first()
 
+    def get_audio_by_ids(self, audio_ids: list[UUID]) -> dict[UUID, AudioFile]:
+        """
+        Get several audio files, with their transcriptions and summaries, in one query.
+
+        Args:
+            audio_ids: UUIDs of audio files
+
+        Returns:
+            dict[UUID, AudioFile]: Audio files found, by ID
+        """
+        if not audio_ids:
+            return {}
+        audio_files = (
+            self.db.query(AudioFile)
+            .options(joinedload(AudioFile.transcription).joinedload(Transcription.summary))
+            .filter(AudioFile.id.in_(audio_ids))
+            .all()
+        )
+        return {audio_file.id: audio_file for audio_file in audio_files}
+
+    async def get_audio_by_id_async(
+        self, audio_id: UUID, with_results: bool = False
+    ) -> AudioFile | None:
+        """
+        Get audio file by ID on a sync or async session.
+
+        Args:
+            audio_id: UUID of audio file
+            with_results: Also load the transcription and summary in the same query
+                (required on async sessions, which cannot lazy-load)
+
+        Returns:
+            Optional[AudioFile]: Audio file or None if not found
+        """
+        statement = select(AudioFile).where(AudioFile.id == audio_id)
+        if with_results:
+            # Reason: One-to-one relationships - a single joined query, no extra round trips
+            statement = statement.options(
+                joinedload(AudioFile.transcription).joinedload(Transcription.summary)
+            )
+        result = await execute(self.db, statement)
+        return result.scalars().first()
+
+    async def get_meeting_async(
+        self, audio_id: UUID, with_transcript: bool = True, with_summary: bool = True
+    ) -> AudioFile | None:
+        """
+        Get audio file, transcription and summary in one joined query.
+
+        Columns of parts that are not requested are not loaded; their IDs
+        and statuses always are.
+
+        Args:
+            audio_id: UUID of audio file
+            with_transcript: Load the transcript text
+            with_summary: Load the summary content
+
+        Returns:
+            Optional[AudioFile]: Audio file (with transcription and summary) or None if not found
+        """
+        transcription = joinedload(AudioFile.transcription)
+        if not with_transcript:
+            # Reason: Transcripts of long meetings are large and often not needed
+            transcription = transcription.defer(Transcription.full_text)
+
+        summary = transcription.joinedload(Transcription.summary)
+        if not with_summary:
+            summary = summary.load_only(Summary.id, Summary.status)
+
+        statement = select(AudioFile).where(AudioFile.id == audio_id).options(summary)
+        result = await execute(self.db, statement)
+        return result.scalars().first()
+
+    async def list_meetings_async(
+        self,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+        status_filter: AudioStatus | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[AudioFile]:
+        """
+        List audio files newest first, continuing after a keyset cursor.
+
+        The page is selected by an inner query that only reads the
+        (status, created_at, id) index and seeks past the cursor instead of
+        skipping rows, so deep pages cost the same as the first. Page rows
+        are then joined with the IDs and statuses of their transcription and
+        summary; transcript and summary text are never loaded.
+
+        Args:
+            limit: Maximum number of audio files
+            after: (created_at, id) of the last audio file of the previous page
+            status_filter: Only audio files with this status
+            created_from: Only audio files created at or after this time
+            created_to: Only audio files created before this time
+
+        Returns:
+            list[AudioFile]: Audio files ordered by (created_at, id) descending
+        """
+        page = select(AudioFile.id, AudioFile.created_at)
+        if status_filter is not None:
+            page = page.where(AudioFile.status == status_filter.value)
+        if created_from is not None:
+            page = page.where(AudioFile.created_at >= created_from)
+        if created_to is not None:
+            page = page.where(AudioFile.created_at < created_to)
+        if after is not None:
+            page = page.where(tuple_(AudioFile.created_at, AudioFile.id) < after)
+        page = (
+            page.order_by(AudioFile.created_at.desc(), AudioFile.id.desc()).limit(limit).subquery()
+        )
+
+        statement = (
+            select(AudioFile)
+            .join(page, AudioFile.id == page.c.id)
+            .options(
+                joinedload(AudioFile.transcription)
+                .load_only(Transcription.id, Transcription.status)
+                .joinedload(Transcription.summary)
+                .load_only(Summary.id, Summary.status)
+            )
+            .order_by(page.c.created_at.desc(), page.c.id.desc())
+        )
+        result = await execute(self.db, statement)
+        return list(result.scalars().all())
+
+    def count_file_references(self, file_path: str) -> int:
+        """
+        Count audio records pointing at a stored file.
+
+        Args:
+            file_path: Path of the stored file
+
+        Returns:
+            int: Number of referencing audio records
+        """
+        return self.db.query(AudioFile).filter(AudioFile.file_path == file_path).count()
+
+    def delete_audio(self, audio_id: UUID) -> bool:
+        """
+        Delete audio file record and release its stored file.
+
+        The file is only unlinked once no other record references it, and
+        search index entries, transcript segments and cached responses of its
+        results are dropped.
+
+        Args:
+            audio_id: UUID of audio file
+
+        Returns:
+            bool: True if the record was deleted, False if not found
+        """
+        audio_file = self.get_audio_by_id(audio_id)
+        if not audio_file:
+            return False
+
+        file_path, transcoded_path = audio_file.file_path, audio_file.transcoded_path
+        transcription = audio_file.transcription
+        transcription_id = transcription.id if transcription else None
+        summary_id = transcription.summary.id if transcription and transcription.summary else None
+        SearchService(self.db).remove_audio(audio_id)
+        EmbeddingService(self.db).remove_audio(audio_id)
+        if transcription_id:
+            self.db.execute(
+                delete(TranscriptSegment).where(
+                    TranscriptSegment.transcription_id == transcription_id
+                )
+            )
+        self.db.delete(audio_file)
+        self.db.commit()
+
+        # Reason: Cached responses would keep serving the deleted results
+        invalidate_response(TRANSCRIPTION, transcription_id)
+        invalidate_response(SUMMARY, summary_id)
+
+        self.storage.delete_shared_file(file_path, lambda: self.count_file_references(file_path))
+        if transcoded_path:
+            self.storage.delete_audio_file(transcoded_path)
+
+        return True
+
     def update_audio_status(
         self, audio_id: UUID, status: AudioStatus, error_message: str | None = None
     ) -> AudioFile | None:
@@ -122,6 +378,68 @@ class AudioService:
 
         return audio_file
 
+    def _file_too_large(self) -> HTTPException:
+        """Build the 413 error returned for oversized uploads."""
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Max size: {settings.max_upload_size_mb}MB",
+        )
+
+    def _probe_upload(self, stored: StoredFile, filename: str) -> AudioProbe | None:
+        """
+        Read the container header of a stored upload and check it against its name.
+
+        Only the header is read, so this costs well under a millisecond
+        whatever the file size. A rejected upload's file is deleted unless
+        another record shares it.
+
+        Args:
+            stored: Stored upload
+            filename: Original filename
+
+        Returns:
+            Optional[AudioProbe]: Container metadata, or None for extensions with no
+                known container (allowed formats beyond wav, mp3, m4a, mp4 and webm)
+
+        Raises:
+            HTTPException 400: Content is not the format its extension names, or
+                the recording is longer than settings.max_audio_duration_minutes
+        """
+        extension = filename.split(".")[-1].lower()
+        expected = [
+            name for name, extensions in FORMAT_EXTENSIONS.items() if extension in extensions
+        ]
+        if not expected:
+            return None
+
+        detail = None
+        try:
+            # Reason: The spare is this upload's own copy; the shared file may be deleted meanwhile
+            probe = probe_audio(stored.spare_path or stored.file_path)
+        except ProbeError as e:
+            detail = f"File is not a valid {extension} recording: {e}"
+        else:
+            if probe.format not in expected:
+                detail = f"File content is {probe.format}, not {extension}"
+            elif (
+                probe.duration_seconds is not None
+                and probe.duration_seconds > settings.max_audio_duration_minutes * 60
+            ):
+                detail = (
+                    f"Recording too long. Max duration: "
+                    f"{settings.max_audio_duration_minutes} minutes"
+                )
+
+        if detail is None:
+            return probe
+        if stored.spare_path:
+            self.storage.delete_audio_file(stored.spare_path)
+        else:
+            self.storage.delete_shared_file(
+                stored.file_path, lambda: self.count_file_references(stored.file_path)
+            )
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
     def _validate_audio_file(self, file: UploadFile) -> None:
         """
         Validate uploaded audio file.
@@ -0,0 +1,256 @@
+"""
+Embedding service for semantic search.
+
+Splits a processed meeting into passages (summary, key points and
+transcript chunks), embeds them locally and stores the quantized vectors.
+Searches embed the query the same way and score it against the in-memory
+SemanticIndex, which is kept in sync with the embeddings table.
+"""
+
+import logging
+import time
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import execute
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.embedding import Embedding, PassageKind
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.schemas.search import SemanticHit
+from app.services.semantic_index import SemanticIndex
+from app.utils.embeddings import Embedder, get_embedder, quantize
+
+logger = logging.getLogger(__name__)
+
+STALE_FRACTION = 0.2  # Reason: Reload the index once this share of its vectors was deleted
+REFRESH_BATCH_ROWS = 5000  # Reason: Keeps each IN list well below driver parameter limits
+
+
+def build_passages(
+    transcription: Transcription, summary: Summary | None
+) -> list[tuple[PassageKind, int, str]]:
+    """
+    Split a meeting into passages to embed.
+
+    Args:
+        transcription: Completed transcription
+        summary: Completed summary, if any
+
+    Returns:
+        list[tuple[PassageKind, int, str]]: Kind, position within kind and text
+    """
+    passages: list[tuple[PassageKind, int, str]] = []
+    if summary is not None:
+        if summary.summary_text:
+            passages.append((PassageKind.SUMMARY, 0, summary.summary_text))
+        for position, point in enumerate(summary.key_points or []):
+            if isinstance(point, str) and point.strip():
+                passages.append((PassageKind.KEY_POINT, position, point))
+
+    words = (transcription.full_text or "").split()
+    size = settings.semantic_chunk_words
+    for position, start in enumerate(range(0, len(words), size)):
+        passages.append((PassageKind.TRANSCRIPT, position, " ".join(words[start : start + size])))
+    return passages
+
+
+class EmbeddingService:
+    """
+    Service for embedding meetings and searching them semantically.
+
+    Embedding runs on the pipeline's sync session; search works on sync
+    and async sessions.
+    """
+
+    def __init__(self, db: Session | AsyncSession, embedder: Embedder | None = None) -> None:
+        """
+        Initialize embedding service.
+
+        Args:
+            db: Database session
+            embedder: Embedder (defaults to the one configured in settings)
+        """
+        self.db = db
+        self.embedder = embedder or get_embedder()
+
+    async def embed_meeting(self, audio_id: UUID) -> int:
+        """
+        Embed the passages of a meeting, replacing earlier embeddings.
+
+        Args:
+            audio_id: UUID of audio file
+
+        Returns:
+            int: Number of passages stored
+
+        Raises:
+            LookupError: If the meeting has no transcription
+        """
+        transcription = (
+            self.db.query(Transcription).filter(Transcription.audio_file_id == audio_id).first()
+        )
+        if transcription is None:
+            raise LookupError(f"Transcription for audio file {audio_id} not found")
+
+        passages = build_passages(transcription, transcription.summary)
+        # Reason: Embedding is CPU-bound - keep the event loop responsive
+        vectors = await run_in_threadpool(self.embedder.embed, [text for _, _, text in passages])
+        codes, scales = quantize(vectors)
+
+        self.remove_audio(audio_id)
+        self.db.add_all(
+            Embedding(
+                audio_file_id=audio_id,
+                kind=kind.value,
+                position=position,
+                text=text,
+                model=self.embedder.name,
+                vector=codes[row].tobytes(),
+                scale=float(scales[row]),
+            )
+            for row, (kind, position, text) in enumerate(passages)
+        )
+        self.db.commit()
+        return len(passages)
+
+    def remove_audio(self, audio_id: UUID) -> None:
+        """
+        Delete the embeddings of an audio file (not committed).
+
+        Args:
+            audio_id: UUID of audio file
+        """
+        self.db.execute(delete(Embedding).where(Embedding.audio_file_id == audio_id))
+
+    async def search(self, query: str, limit: int) -> list[SemanticHit]:
+        """
+        Find the meetings whose passages are most similar to a query.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of meetings
+
+        Returns:
+            list[SemanticHit]: Best passage per meeting, most similar first
+        """
+        index = await self.refresh_index()
+        # Reason: Embedding and scoring are CPU-bound - keep the event loop responsive
+        vector = (await run_in_threadpool(self.embedder.embed, [query]))[0]
+        if not vector.any():
+            return []
+
+        probes = settings.semantic_ivf_probes if settings.semantic_index == "ivf" else None
+        matches = await run_in_threadpool(index.search, vector, limit, probes=probes)
+        if not matches:
+            return []
+
+        result = await execute(
+            self.db,
+            select(
+                Embedding.id,
+                Embedding.kind,
+                Embedding.text,
+                AudioFile.id.label("audio_id"),
+                AudioFile.filename,
+                AudioFile.created_at,
+            )
+            .join(AudioFile, AudioFile.id == Embedding.audio_file_id)
+            .where(Embedding.id.in_([match.embedding_id for match in matches])),
+        )
+        rows = {row.id: row for row in result}
+
+        # Reason: Passages deleted after the refresh above are skipped
+        return [
+            SemanticHit(
+                audio_id=row.audio_id,
+                filename=row.filename,
+                created_at=row.created_at,
+                source=row.kind,
+                passage=row.text,
+                score=match.score,
+            )
+            for match in matches
+            if (row := rows.get(match.embedding_id)) is not None
+        ]
+
+    async def refresh_index(self) -> SemanticIndex:
+        """
+        Load vectors missing from the process-wide index.
+
+        Checks at most every settings.semantic_refresh_seconds. The stored ids
+        are compared with the indexed ones rather than an id watermark,
+        because rows do not commit in id order. Deleted vectors are masked
+        out of searches, the index is rebuilt from scratch when many of them
+        accumulate, and its IVF lists are (re)built in a worker thread when
+        configured.
+
+        Returns:
+            SemanticIndex: Index of the configured embedder's vectors
+        """
+        global _index, _refreshed_at
+        model = self.embedder.name
+        now = time.monotonic()
+        if _index is not None and _index[0] == model:
+            if now - _refreshed_at < settings.semantic_refresh_seconds:
+                return _index[1]
+            index = _index[1]
+        else:
+            index = SemanticIndex(self.embedder.dimensions)
+            _index = (model, index)
+        _refreshed_at = now
+
+        result = await execute(self.db, select(Embedding.id).where(Embedding.model == model))
+        live_ids = np.fromiter(result.scalars(), dtype=np.int64)
+        indexed = index.contains(live_ids)
+        if index.size - int(indexed.sum()) > index.size * STALE_FRACTION:
+            index = SemanticIndex(self.embedder.dimensions)
+            _index = (model, index)
+            indexed[:] = False
+        index.retain(live_ids)
+
+        missing_ids = live_ids[~indexed].tolist()
+        for start in range(0, len(missing_ids), REFRESH_BATCH_ROWS):
+            result = await execute(
+                self.db,
+                select(Embedding.id, Embedding.audio_file_id, Embedding.vector, Embedding.scale)
+                .where(Embedding.id.in_(missing_ids[start : start + REFRESH_BATCH_ROWS]))
+                .order_by(Embedding.id),
+            )
+            rows = result.all()
+            if rows:
+                codes = np.frombuffer(b"".join(row.vector for row in rows), dtype=np.int8)
+                index.add(
+                    [row.id for row in rows],
+                    [row.audio_file_id for row in rows],
+                    codes.reshape(len(rows), index.dimensions),
+                    np.array([row.scale for row in rows], dtype=np.float32),
+                )
+
+        if settings.semantic_index == "ivf" and index.needs_inverted_lists(
+            settings.semantic_ivf_min_vectors
+        ):
+            started = time.perf_counter()
+            await run_in_threadpool(index.build_inverted_lists)
+            logger.info(
+                "Built semantic IVF index over %d vectors in %.1fs",
+                index.size,
+                time.perf_counter() - started,
+            )
+        return index
+
+
+_index: tuple[str, SemanticIndex] | None = None
+_refreshed_at = 0.0
+
+
+def reset_index() -> None:
+    """Forget the process-wide index (it is reloaded on the next search)."""
+    global _index
+    _index = None
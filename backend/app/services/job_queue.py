@@ -0,0 +1,410 @@
+"""
+Durable job queue for the processing pipeline.
+
+Provides a database-backed broker (shared by every API and worker process)
+and an in-memory broker for tests and single-process deployments. Both use
+leases: a claimed job stays invisible until its visibility timeout expires,
+so a job whose worker dies is delivered again.
+"""
+
+import threading
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.core.database import SessionLocal
+from app.core.settings import settings
+from app.models.job import JobStatus, ProcessingJob
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    A claimed pipeline job.
+
+    Attributes:
+        id: Job identifier
+        audio_id: Audio file to process
+        stage: Pipeline stage to run
+        attempts: Delivery attempts so far, including this one
+        max_attempts: Attempts allowed before the job is failed
+        use_cache: Whether cached results may be reused
+        worker_id: Worker holding the lease
+    """
+
+    id: UUID
+    audio_id: UUID
+    stage: str
+    attempts: int
+    max_attempts: int
+    use_cache: bool = True
+    worker_id: str | None = None
+
+
+class JobBroker(Protocol):
+    """Queue operations used by the API and the worker."""
+
+    def enqueue(
+        self, audio_id: UUID, stage: str, use_cache: bool = True, db: Session | None = None
+    ) -> UUID:
+        """Queue a stage; with db the job joins the caller's transaction."""
+        ...
+
+    def claim(self, worker_id: str) -> Job | None:
+        """Lease the next visible job, or return None if there is none."""
+        ...
+
+    def ack(self, job: Job, next_stage: str | None = None) -> bool:
+        """Mark a job done and atomically queue the next stage."""
+        ...
+
+    def heartbeat(self, job: Job) -> bool:
+        """Extend the lease of a running job; False if it was lost."""
+        ...
+
+    def retry(self, job: Job, error: str) -> bool:
+        """Requeue a failed job with backoff; False if attempts are exhausted or the lease is lost."""
+        ...
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff for the given attempt number."""
+    return timedelta(seconds=settings.job_retry_backoff_seconds * 2 ** max(attempts - 1, 0))
+
+
+class DatabaseBroker:
+    """
+    Job broker backed by the processing_jobs table.
+
+    Claims use a compare-and-set update, so several workers (on one or many
+    machines) can poll the same table safely.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal) -> None:
+        """
+        Initialize database broker.
+
+        Args:
+            session_factory: Factory for short-lived broker sessions
+        """
+        self.session_factory = session_factory
+
+    def enqueue(
+        self, audio_id: UUID, stage: str, use_cache: bool = True, db: Session | None = None
+    ) -> UUID:
+        """
+        Queue a pipeline stage.
+
+        Args:
+            audio_id: Audio file to process
+            stage: Pipeline stage
+            use_cache: Whether cached results may be reused
+            db: Caller session; the caller commits so enqueue is transactional
+
+        Returns:
+            UUID: Job ID
+        """
+        job_id = uuid.uuid4()
+        job = ProcessingJob(
+            id=job_id,
+            audio_file_id=audio_id,
+            stage=stage,
+            use_cache=use_cache,
+            status=JobStatus.QUEUED.value,
+            attempts=0,
+            max_attempts=settings.job_max_attempts,
+            visible_at=datetime.utcnow(),
+        )
+
+        if db is not None:
+            db.add(job)
+            return job_id
+
+        with self.session_factory() as session:
+            session.add(job)
+            session.commit()
+        return job_id
+
+    def claim(self, worker_id: str) -> Job | None:
+        """
+        Lease the oldest visible job.
+
+        Queued jobs and running jobs whose lease has expired are both visible.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+
+        Returns:
+            Optional[Job]: Claimed job or None if the queue is empty
+        """
+        now = datetime.utcnow()
+        lease_until = now + timedelta(seconds=settings.job_visibility_timeout_seconds)
+
+        with self.session_factory() as session:
+            # Reason: Plain rows, so values stay stable across the commits below
+            candidates = (
+                session.query(
+                    ProcessingJob.id,
+                    ProcessingJob.audio_file_id,
+                    ProcessingJob.stage,
+                    ProcessingJob.status,
+                    ProcessingJob.visible_at,
+                    ProcessingJob.attempts,
+                    ProcessingJob.max_attempts,
+                    ProcessingJob.use_cache,
+                )
+                .filter(
+                    ProcessingJob.status.in_([JobStatus.QUEUED.value, JobStatus.RUNNING.value]),
+                    ProcessingJob.visible_at <= now,
+                )
+                .order_by(ProcessingJob.visible_at.asc())
+                .limit(10)
+                .all()
+            )
+
+            for candidate in candidates:
+                # Reason: Only one worker can win the update for an unchanged row
+                claimed = (
+                    session.query(ProcessingJob)
+                    .filter(
+                        ProcessingJob.id == candidate.id,
+                        ProcessingJob.status == candidate.status,
+                        ProcessingJob.visible_at == candidate.visible_at,
+                    )
+                    .update(
+                        {
+                            ProcessingJob.status: JobStatus.RUNNING.value,
+                            ProcessingJob.visible_at: lease_until,
+                            ProcessingJob.worker_id: worker_id,
+                            ProcessingJob.attempts: ProcessingJob.attempts + 1,
+                            ProcessingJob.updated_at: now,
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                session.commit()
+
+                if claimed:
+                    return Job(
+                        id=candidate.id,
+                        audio_id=candidate.audio_file_id,
+                        stage=candidate.stage,
+                        attempts=candidate.attempts + 1,
+                        max_attempts=candidate.max_attempts,
+                        use_cache=candidate.use_cache,
+                        worker_id=worker_id,
+                    )
+
+        return None
+
+    def ack(self, job: Job, next_stage: str | None = None) -> bool:
+        """
+        Acknowledge a finished stage and queue the next one in one transaction.
+
+        Args:
+            job: Claimed job
+            next_stage: Stage to queue next, if any
+
+        Returns:
+            bool: False if the lease was lost to another worker
+        """
+        with self.session_factory() as session:
+            acked = (
+                session.query(ProcessingJob)
+                .filter(
+                    ProcessingJob.id == job.id,
+                    ProcessingJob.status == JobStatus.RUNNING.value,
+                    ProcessingJob.worker_id == job.worker_id,
+                )
+                .update(
+                    {ProcessingJob.status: JobStatus.SUCCEEDED.value},
+                    synchronize_session=False,
+                )
+            )
+            if acked and next_stage:
+                self.enqueue(job.audio_id, next_stage, job.use_cache, db=session)
+            session.commit()
+
+        return bool(acked)
+
+    def heartbeat(self, job: Job) -> bool:
+        """
+        Extend the lease of a running job by the visibility timeout.
+
+        Args:
+            job: Claimed job
+
+        Returns:
+            bool: False if the lease was lost to another worker
+        """
+        now = datetime.utcnow()
+        with self.session_factory() as session:
+            extended = (
+                session.query(ProcessingJob)
+                .filter(
+                    ProcessingJob.id == job.id,
+                    ProcessingJob.status == JobStatus.RUNNING.value,
+                    ProcessingJob.worker_id == job.worker_id,
+                )
+                .update(
+                    {
+                        ProcessingJob.visible_at: now
+                        + timedelta(seconds=settings.job_visibility_timeout_seconds),
+                        ProcessingJob.updated_at: now,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            session.commit()
+
+        return bool(extended)
+
+    def retry(self, job: Job, error: str) -> bool:
+        """
+        Requeue a failed job with exponential backoff.
+
+        Args:
+            job: Claimed job
+            error: Error message of the failed attempt
+
+        Returns:
+            bool: True if requeued; False if the job is now permanently failed,
+                or if the lease was lost and another worker owns the job
+        """
+        will_retry = job.attempts < job.max_attempts
+        values = {
+            ProcessingJob.status: (
+                JobStatus.QUEUED.value if will_retry else JobStatus.FAILED.value
+            ),
+            ProcessingJob.last_error: error[:1000],
+        }
+        if will_retry:
+            values[ProcessingJob.visible_at] = datetime.utcnow() + _retry_delay(job.attempts)
+
+        with self.session_factory() as session:
+            updated = (
+                session.query(ProcessingJob)
+                .filter(
+                    ProcessingJob.id == job.id,
+                    ProcessingJob.status == JobStatus.RUNNING.value,
+                    ProcessingJob.worker_id == job.worker_id,
+                )
+                .update(values, synchronize_session=False)
+            )
+            session.commit()
+
+        return will_retry and bool(updated)
+
+
+class MemoryBroker:
+    """
+    In-process job broker with the same lease semantics as DatabaseBroker.
+
+    Jobs are lost on restart; intended for tests and embedded workers.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty in-memory queue."""
+        self.jobs: dict[UUID, tuple[Job, str, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self, audio_id: UUID, stage: str, use_cache: bool = True, db: Session | None = None
+    ) -> UUID:
+        """Queue a pipeline stage (db is ignored)."""
+        job = Job(
+            id=uuid.uuid4(),
+            audio_id=audio_id,
+            stage=stage,
+            attempts=0,
+            max_attempts=settings.job_max_attempts,
+            use_cache=use_cache,
+        )
+        with self._lock:
+            self.jobs[job.id] = (job, JobStatus.QUEUED.value, datetime.utcnow())
+        return job.id
+
+    def claim(self, worker_id: str) -> Job | None:
+        """Lease the oldest visible job."""
+        now = datetime.utcnow()
+        with self._lock:
+            visible = [
+                (visible_at, job)
+                for job, status, visible_at in self.jobs.values()
+                if status in (JobStatus.QUEUED.value, JobStatus.RUNNING.value) and visible_at <= now
+            ]
+            if not visible:
+                return None
+
+            _, job = min(visible, key=lambda item: item[0])
+            claimed = replace(job, attempts=job.attempts + 1, worker_id=worker_id)
+            lease_until = now + timedelta(seconds=settings.job_visibility_timeout_seconds)
+            self.jobs[job.id] = (claimed, JobStatus.RUNNING.value, lease_until)
+            return claimed
+
+    def ack(self, job: Job, next_stage: str | None = None) -> bool:
+        """Acknowledge a finished stage and queue the next one."""
+        with self._lock:
+            current, status, visible_at = self.jobs[job.id]
+            if status != JobStatus.RUNNING.value or current.worker_id != job.worker_id:
+                return False
+            self.jobs[job.id] = (current, JobStatus.SUCCEEDED.value, visible_at)
+
+        if next_stage:
+            self.enqueue(job.audio_id, next_stage, job.use_cache)
+        return True
+
+    def heartbeat(self, job: Job) -> bool:
+        """Extend the lease of a running job."""
+        with self._lock:
+            current, status, _ = self.jobs[job.id]
+            if status != JobStatus.RUNNING.value or current.worker_id != job.worker_id:
+                return False
+            lease_until = datetime.utcnow() + timedelta(
+                seconds=settings.job_visibility_timeout_seconds
+            )
+            self.jobs[job.id] = (current, status, lease_until)
+        return True
+
+    def retry(self, job: Job, error: str) -> bool:
+        """Requeue a failed job with exponential backoff."""
+        will_retry = job.attempts < job.max_attempts
+        with self._lock:
+            current, status, _ = self.jobs[job.id]
+            if status != JobStatus.RUNNING.value or current.worker_id != job.worker_id:
+                return False
+            if will_retry:
+                visible_at = datetime.utcnow() + _retry_delay(job.attempts)
+                self.jobs[job.id] = (job, JobStatus.QUEUED.value, visible_at)
+            else:
+                self.jobs[job.id] = (job, JobStatus.FAILED.value, datetime.utcnow())
+        return will_retry
+
+
+_broker: JobBroker | None = None
+
+
+def get_broker() -> JobBroker:
+    """
+    Get the process-wide job broker selected by settings.queue_broker.
+
+    Returns:
+        JobBroker: Configured broker
+
+    Raises:
+        ValueError: If the configured broker is unknown
+    """
+    global _broker
+    if _broker is None:
+        if settings.queue_broker == "database":
+            _broker = DatabaseBroker()
+        elif settings.queue_broker == "memory":
+            _broker = MemoryBroker()
+        else:
+            raise ValueError(f"Unknown queue broker: {settings.queue_broker}")
+    return _broker
@@ -0,0 +1,498 @@
+"""
+Live recording service for meetings streamed while they are recorded.
+
+Appends MediaRecorder WebM chunks to the stored file as they arrive and
+transcribes each finished segment in the background, so when recording
+stops only the last segment is left to transcribe. A running summary is
+updated from the new transcript every few minutes, so summarizing at stop
+is a merge of that state rather than a pass over the whole meeting.
+"""
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import math
+import time
+from collections.abc import Callable
+from datetime import UTC
+from pathlib import Path
+from typing import BinaryIO
+
+from openai import AsyncOpenAI
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import SessionLocal
+from app.core.settings import settings
+from app.models.audio import AudioFile, AudioStatus
+from app.models.summary import SummaryStatus
+from app.models.transcription import Transcription, TranscriptionStatus
+from app.services.job_queue import get_broker
+from app.services.pipeline_service import PipelineStage
+from app.services.status_events import ProcessingStage, publish_status
+from app.services.storage_service import StorageService
+from app.services.summary_service import SummaryService
+from app.services.transcription_service import TranscriptionService
+from app.utils.audio import ChunkSpan
+from app.utils.ebml import ClusterScanner, ClusterStart, EBMLError
+from app.utils.probe import ProbeError, probe_audio
+from app.utils.transcript import ChunkTranscript, StitchedTranscript, TextSegment, stitch_chunks
+
+logger = logging.getLogger(__name__)
+
+
+class LiveRecordingError(Exception):
+    """Raised when a live stream cannot be accepted (not WebM, or over a limit)."""
+
+
+class LiveRecording:
+    """
+    One meeting being recorded live.
+
+    The stream is cut at WebM cluster boundaries into segments of about
+    settings.live_segment_seconds. Each segment is sent to Whisper as the
+    stream's init segment (header and tracks) followed by its clusters,
+    starting a little earlier so words at a cut are heard by both sides,
+    and the results are stitched like the chunks of an uploaded recording.
+
+    Every settings.live_summary_interval_seconds of transcribed audio, the
+    new text is folded into a running summary stored on the meeting's
+    summary record (in progress until the meeting ends).
+    """
+
+    def __init__(
+        self, db: Session, audio_file: AudioFile, client: AsyncOpenAI | None = None
+    ) -> None:
+        """
+        Initialize a live recording for an audio file record.
+
+        Args:
+            db: Database session
+            audio_file: Audio file record the stream is stored under
+            client: OpenAI client (defaults to the shared process-wide client)
+        """
+        self.db = db
+        self.audio_file = audio_file
+        self.transcription_service = TranscriptionService(db, client)
+        self.summary_service = SummaryService(db, client)
+        self.scanner = ClusterScanner()
+        self.received_bytes = 0
+        self._hash = hashlib.sha256()
+        self._file: BinaryIO = open(audio_file.file_path, "wb")
+        self._boundary: ClusterStart | None = None  # Reason: Start of the segment being recorded
+        self._tasks: list[asyncio.Task[ChunkTranscript]] = []
+        self._reported = 0
+        self._semaphore = asyncio.Semaphore(settings.transcription_max_concurrency)
+        self._summary_task: asyncio.Task[None] | None = None
+        self._summary_parts = 0
+        self._summarized_until = 0.0  # Reason: Recording time the running summary covers
+        self._summary_update: dict | None = None  # Reason: Running state not yet reported
+
+    @classmethod
+    def start(
+        cls, db: Session, filename: str, client: AsyncOpenAI | None = None
+    ) -> "LiveRecording":
+        """
+        Create the audio file record of a new live recording.
+
+        Args:
+            db: Database session
+            filename: Name shown for the recording
+            client: OpenAI client (defaults to the shared process-wide client)
+
+        Returns:
+            LiveRecording: Recording ready to receive chunks
+        """
+        audio_file = AudioFile(
+            filename=filename,
+            file_path="",
+            file_size=0,
+            mime_type="audio/webm",
+            status=AudioStatus.RECORDING.value,
+        )
+        db.add(audio_file)
+        db.flush()
+        audio_file.file_path = str(StorageService().live_path(audio_file.id))
+        db.commit()
+        return cls(db, audio_file, client)
+
+    @property
+    def recorded_seconds(self) -> float:
+        """Timestamp of the latest cluster received."""
+        clusters = self.scanner.clusters
+        return self._seconds(clusters[-1].timecode) if clusters else 0.0
+
+    async def append(self, chunk: bytes) -> None:
+        """
+        Store the next chunk of the stream and start transcribing finished segments.
+
+        Args:
+            chunk: Bytes following everything received before
+
+        Raises:
+            LiveRecordingError: If the stream is not WebM or exceeds the size limit
+                (the chunk is not stored) or the duration limit
+        """
+        if self.received_bytes + len(chunk) > settings.max_upload_size_bytes:
+            raise LiveRecordingError(
+                f"Recording too large. Max size: {settings.max_upload_size_mb}MB"
+            )
+        try:
+            clusters = self.scanner.feed(chunk)
+        except EBMLError as e:
+            raise LiveRecordingError(f"Stream is not WebM audio: {e}")
+
+        # Reason: Disk writes would stall every other connection on the event loop
+        await asyncio.to_thread(self._write, chunk)
+        self._hash.update(chunk)
+        self.received_bytes += len(chunk)
+
+        for cluster in clusters:
+            if self._boundary is None:
+                self._boundary = cluster
+            elif self._seconds(cluster.timecode - self._boundary.timecode) >= (
+                settings.live_segment_seconds
+            ):
+                # Reason: The segment before this cluster is complete - it can be transcribed
+                self._schedule(self._boundary, cluster)
+                self._boundary = cluster
+        self._poll_summary()
+
+        if self.recorded_seconds > settings.max_audio_duration_minutes * 60:
+            raise LiveRecordingError(
+                f"Recording too long. Max duration: {settings.max_audio_duration_minutes} minutes"
+            )
+
+    def progress(self) -> dict:
+        """
+        Describe what was received and transcribed since the last call.
+
+        Returns:
+            dict: Message with bytes received, seconds recorded, newly
+                transcribed segments (chunk text, not yet stitched) and the
+                running summary when it was updated
+        """
+        segments = []
+        while self._reported < len(self._tasks) and self._tasks[self._reported].done():
+            task = self._tasks[self._reported]
+            self._reported += 1
+            if task.cancelled() or task.exception():
+                continue
+            chunk = task.result()
+            segments.append(
+                {"start": chunk.span.keep_start, "end": chunk.span.keep_end, "text": chunk.text}
+            )
+        message = {
+            "type": "progress",
+            "received_bytes": self.received_bytes,
+            "recorded_seconds": round(self.recorded_seconds, 3),
+            "segments": segments,
+        }
+        if self._summary_update:
+            message["summary"], self._summary_update = self._summary_update, None
+        return message
+
+    async def finish(self) -> Transcription:
+        """
+        End the recording: transcribe the last segment, store the transcript and summarize.
+
+        Earlier segments were transcribed while recording, so this waits for
+        roughly one segment's transcription whatever the meeting length. With
+        a running summary, only the text since its last update is summarized
+        before the state is merged; otherwise the summary is queued.
+
+        Returns:
+            Transcription: Completed transcription record
+
+        Raises:
+            LiveRecordingError: If no audio was received
+            Exception: If a segment could not be transcribed
+        """
+        started = time.perf_counter()
+        await asyncio.to_thread(self._file.close)
+        if self._boundary is None:
+            raise LiveRecordingError("Recording contains no audio")
+
+        try:
+            probe = await asyncio.to_thread(probe_audio, self.audio_file.file_path)
+        except ProbeError:
+            probe = None
+        duration = max((probe.duration_seconds if probe else None) or 0.0, self.recorded_seconds)
+        self._schedule(self._boundary, None, end=duration)
+        if self._summary_task:
+            await self._summary_task
+
+        try:
+            chunks = await asyncio.gather(*self._tasks)
+        except BaseException:
+            for task in self._tasks:
+                task.cancel()
+            raise
+        transcript = stitch_chunks(list(chunks), duration=duration)
+
+        audio_file = self.audio_file
+        audio_file.file_size = self.received_bytes
+        audio_file.content_hash = self._hash.hexdigest()
+        if probe is not None:
+            audio_file.sample_rate, audio_file.channels = probe.sample_rate, probe.channels
+        audio_file.status = AudioStatus.PROCESSING.value
+        audio_file.error_message = None
+        if not self._summary_parts:
+            # Reason: Transcript and summary job are committed together
+            get_broker().enqueue(audio_file.id, PipelineStage.SUMMARIZE.value, db=self.db)
+        transcription = self.transcription_service.save_transcript(
+            audio_file, transcript, int((time.perf_counter() - started) * 1000)
+        )
+        if self._summary_parts:
+            await self._finish_summary(transcription, transcript)
+        else:
+            publish_status(audio_file, ProcessingStage.QUEUED)
+        logger.info(
+            "Live recording %s: %.0fs in %d segments, %dms after stop",
+            audio_file.id,
+            duration,
+            len(chunks),
+            transcription.processing_time_ms,
+        )
+        return transcription
+
+    async def fail(self, error_message: str) -> None:
+        """
+        Mark the recording failed, keeping what was stored.
+
+        Args:
+            error_message: Reason for the failure
+        """
+        for task in [*self._tasks, self._summary_task]:
+            if task:
+                task.cancel()
+        await run_in_threadpool(self._store_failure, error_message)
+
+    def _store_failure(self, error_message: str) -> None:
+        """Close the file and commit the failed status (blocking)."""
+        self._file.close()
+        _fail_running_records(self.audio_file)
+        self.audio_file.file_size = self.received_bytes
+        self.audio_file.status = AudioStatus.FAILED.value
+        self.audio_file.error_message = error_message[:1000]
+        self.db.commit()
+        publish_status(self.audio_file, ProcessingStage.FAILED)
+
+    def _schedule(
+        self, boundary: ClusterStart, next_cluster: ClusterStart | None, end: float = 0.0
+    ) -> None:
+        """
+        Start transcribing the segment from boundary up to next_cluster (None for the end).
+
+        Args:
+            boundary: First cluster the segment is authoritative for
+            next_cluster: First cluster after the segment
+            end: End of the recording (seconds), used when next_cluster is None
+        """
+        clusters = self.scanner.clusters
+        keep_start = self._seconds(boundary.timecode)
+        keep_end = self._seconds(next_cluster.timecode) if next_cluster else end
+
+        # Reason: Start at the last cluster at least the overlap before the cut
+        overlap = settings.transcription_chunk_overlap_seconds * 1e9 / self.scanner.timecode_scale
+        timecodes = [cluster.timecode for cluster in clusters]
+        index = max(bisect.bisect_right(timecodes, boundary.timecode - overlap) - 1, 0)
+        first = clusters[index] if self._tasks else boundary
+
+        span = ChunkSpan(
+            index=len(self._tasks),
+            start=self._seconds(first.timecode),
+            end=keep_end,
+            keep_start=keep_start,
+            keep_end=keep_end,
+        )
+        end_offset = next_cluster.offset if next_cluster else None
+        self._tasks.append(asyncio.create_task(self._transcribe(span, first.offset, end_offset)))
+
+    async def _transcribe(
+        self, span: ChunkSpan, start_offset: int, end_offset: int | None
+    ) -> ChunkTranscript:
+        """Read a segment (init segment plus its clusters) and transcribe it."""
+        async with self._semaphore:
+            data = await asyncio.to_thread(self._read_segment, start_offset, end_offset)
+            return await self.transcription_service.transcribe_chunk(
+                span, f"live-{span.index:03d}.webm", data, "audio/webm"
+            )
+
+    def _write(self, chunk: bytes) -> None:
+        """Append a chunk to the stored file so segment reads see it."""
+        self._file.write(chunk)
+        self._file.flush()
+
+    def _read_segment(self, start_offset: int, end_offset: int | None) -> bytes:
+        """Return the init segment followed by the stored bytes start_offset:end_offset."""
+        with open(self.audio_file.file_path, "rb") as file:
+            init = file.read(self.scanner.init_size or 0)
+            file.seek(start_offset)
+            return init + file.read(-1 if end_offset is None else end_offset - start_offset)
+
+    def _poll_summary(self) -> None:
+        """Start the next running summary update once enough new transcript is ready."""
+        interval = settings.live_summary_interval_seconds
+        if not interval or (self._summary_task and not self._summary_task.done()):
+            return
+
+        # Reason: Only a gap-free run of transcribed segments has stable stitched text
+        chunks = []
+        for task in self._tasks:
+            if not task.done() or task.cancelled() or task.exception():
+                break
+            chunks.append(task.result())
+        if not chunks or chunks[-1].span.keep_end - self._summarized_until < interval:
+            return
+
+        until = chunks[-1].span.keep_end
+        segments = stitch_chunks(chunks, duration=until).segments
+        text = _text_between(segments, self._summarized_until, until)
+        self._summary_task = asyncio.create_task(self._update_summary(text, until))
+
+    async def _update_summary(self, text: str, until: float) -> None:
+        """Fold the transcript up to `until` seconds into the running summary."""
+        try:
+            summary = await self.summary_service.update_running_summary(
+                self._running_transcription(), text, self._summary_parts + 1
+            )
+        except Exception as e:
+            # Reason: The text stays unsummarized and is folded in by the next update
+            logger.warning("Running summary of %s not updated: %s", self.audio_file.id, e)
+            return
+
+        self._summary_parts += 1
+        self._summarized_until = until
+        self._summary_update = {
+            "summary_id": str(summary.id),
+            "covered_seconds": round(until, 3),
+            "summary_text": summary.summary_text,
+            "key_points": summary.key_points,
+            "action_items": summary.action_items,
+            "decisions": summary.decisions,
+            "participants": summary.participants,
+        }
+
+    def _running_transcription(self) -> Transcription:
+        """Return the meeting's transcription record, creating it in progress if needed."""
+        transcription = self.transcription_service.get_transcription_by_audio_id(self.audio_file.id)
+        if transcription is None:
+            # Reason: The running summary hangs off the transcription, which is filled at stop
+            transcription = Transcription(
+                audio_file_id=self.audio_file.id, status=TranscriptionStatus.IN_PROGRESS.value
+            )
+            self.db.add(transcription)
+            self.db.commit()
+        return transcription
+
+    async def _finish_summary(
+        self, transcription: Transcription, transcript: StitchedTranscript
+    ) -> None:
+        """Complete the running summary, or queue a full summary if that fails."""
+        audio_file = self.audio_file
+        text = _text_between(transcript.segments, self._summarized_until, math.inf)
+        publish_status(audio_file, ProcessingStage.SUMMARIZING)
+        try:
+            await self.summary_service.finalize_running_summary(
+                transcription, text, self._summary_parts + 1
+            )
+        except Exception as e:
+            logger.warning("Running summary of %s not completed, queued: %s", audio_file.id, e)
+            get_broker().enqueue(audio_file.id, PipelineStage.SUMMARIZE.value, db=self.db)
+            self.db.commit()
+            publish_status(audio_file, ProcessingStage.QUEUED)
+            return
+
+        get_broker().enqueue(audio_file.id, PipelineStage.EMBED.value, db=self.db)
+        self.db.commit()
+        publish_status(audio_file)
+
+    def _seconds(self, timecode: float) -> float:
+        """Convert a WebM timecode to seconds."""
+        return timecode * self.scanner.timecode_scale / 1e9
+
+
+def recover_orphaned_recordings(db: Session) -> int:
+    """
+    Release live recordings left behind by an API process that stopped mid-stream.
+
+    A recording whose file was not written for
+    settings.live_orphan_timeout_seconds no longer receives chunks
+    (MediaRecorder sends one every few seconds). It becomes uploaded if
+    audio was stored, so it can be processed like an upload, and failed
+    otherwise.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of recordings released
+    """
+    cutoff = time.time() - settings.live_orphan_timeout_seconds
+    released = []
+    recordings = db.query(AudioFile).filter(AudioFile.status == AudioStatus.RECORDING.value)
+    for audio_file in recordings.all():
+        path = Path(audio_file.file_path)
+        try:
+            stat = path.stat()
+            last_write, size = stat.st_mtime, stat.st_size
+        except OSError:
+            last_write, size = audio_file.created_at.replace(tzinfo=UTC).timestamp(), 0
+        if last_write > cutoff:
+            continue
+
+        _fail_running_records(audio_file)
+        audio_file.file_size = size
+        if size:
+            with open(path, "rb") as file:
+                audio_file.content_hash = hashlib.file_digest(file, "sha256").hexdigest()
+            audio_file.status = AudioStatus.UPLOADED.value
+            audio_file.error_message = None
+        else:
+            audio_file.status = AudioStatus.FAILED.value
+            audio_file.error_message = "Live recording stopped before any audio was stored"
+        released.append(audio_file)
+
+    db.commit()
+    for audio_file in released:
+        logger.warning("Released orphaned live recording %s", audio_file.id)
+        publish_status(audio_file)
+    return len(released)
+
+
+async def sweep_orphaned_recordings(
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> None:
+    """
+    Release orphaned live recordings now and then periodically, until cancelled.
+
+    Args:
+        session_factory: Factory for the database session of each sweep
+    """
+    while True:
+        db = session_factory()
+        try:
+            await run_in_threadpool(recover_orphaned_recordings, db)
+        except Exception:
+            logger.exception("Sweeping orphaned live recordings failed")
+        finally:
+            db.close()
+        await asyncio.sleep(settings.live_orphan_timeout_seconds)
+
+
+def _fail_running_records(audio_file: AudioFile) -> None:
+    """Mark the unfinished transcription and summary of a recording failed."""
+    transcription = audio_file.transcription
+    if transcription and transcription.status != TranscriptionStatus.COMPLETED.value:
+        transcription.status = TranscriptionStatus.FAILED.value
+        if transcription.summary:
+            transcription.summary.status = SummaryStatus.FAILED.value
+
+
+def _text_between(segments: list[TextSegment], start: float, end: float) -> str:
+    """Join the text of segments whose midpoint lies in [start, end)."""
+    return " ".join(
+        segment.text for segment in segments if start <= (segment.start + segment.end) / 2 < end
+    )
@@ -0,0 +1,137 @@
+"""
+Pipeline service for running processing stages.
+
+Maps queued jobs onto the transcode, transcription, summary and embedding services.
+"""
+
+from enum import Enum
+from uuid import UUID
+
+from openai import AsyncOpenAI
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.audio import AudioStatus
+from app.services.audio_service import AudioService
+from app.services.embedding_service import EmbeddingService
+from app.services.status_events import ProcessingStage, publish_status
+from app.services.summary_service import SummaryService
+from app.services.transcode_service import TranscodeService
+from app.services.transcription_service import TranscriptionService
+
+
+class PipelineStage(str, Enum):
+    """Processing pipeline stages, in execution order."""
+
+    TRANSCODE = "transcode"
+    TRANSCRIBE = "transcribe"
+    SUMMARIZE = "summarize"
+    EMBED = "embed"
+
+
+# Stage queued after each stage is acknowledged
+NEXT_STAGE: dict[PipelineStage, PipelineStage | None] = {
+    PipelineStage.TRANSCODE: PipelineStage.TRANSCRIBE,
+    PipelineStage.TRANSCRIBE: PipelineStage.SUMMARIZE,
+    PipelineStage.SUMMARIZE: PipelineStage.EMBED,
+    PipelineStage.EMBED: None,
+}
+
+
+def first_stage() -> PipelineStage:
+    """Return the stage a new pipeline run starts with."""
+    return PipelineStage.TRANSCODE if settings.transcode_enabled else PipelineStage.TRANSCRIBE
+
+
+# Stages run after the meeting completed; their failures leave its status alone
+BACKGROUND_STAGES = {PipelineStage.EMBED}
+
+
+class PipelineService:
+    """
+    Service for executing individual pipeline stages.
+
+    Each stage is idempotent so a retried or redelivered job can run again.
+    Stage transitions are published as status events.
+    """
+
+    def __init__(self, db: Session, client: AsyncOpenAI | None = None) -> None:
+        """
+        Initialize pipeline service.
+
+        Args:
+            db: Database session
+            client: OpenAI client (defaults to the shared process-wide client)
+        """
+        self.db = db
+        self.audio_service = AudioService(db)
+        self.transcode_service = TranscodeService(db)
+        self.transcription_service = TranscriptionService(db, client)
+        self.summary_service = SummaryService(db, client)
+        self.embedding_service = EmbeddingService(db)
+
+    async def run_stage(self, audio_id: UUID, stage: PipelineStage, use_cache: bool = True) -> None:
+        """
+        Run one pipeline stage for an audio file.
+
+        Args:
+            audio_id: UUID of audio file
+            stage: Stage to run
+            use_cache: Whether cached results may be reused
+
+        Raises:
+            LookupError: If the audio file or its transcription is missing
+            Exception: If the stage fails (the job will be retried)
+        """
+        audio_file = self.audio_service.get_audio_by_id(audio_id)
+        if not audio_file:
+            raise LookupError(f"Audio file {audio_id} not found")
+
+        if stage == PipelineStage.TRANSCODE:
+            publish_status(audio_file, ProcessingStage.TRANSCODING)
+            await self.transcode_service.transcode_audio(audio_file)
+        elif stage == PipelineStage.TRANSCRIBE:
+            publish_status(audio_file, ProcessingStage.TRANSCRIBING)
+            await self.transcription_service.transcribe_audio(audio_file, use_cache=use_cache)
+        elif stage == PipelineStage.SUMMARIZE:
+            transcription = self.transcription_service.get_transcription_by_audio_id(audio_id)
+            if not transcription:
+                raise LookupError(f"Transcription for audio file {audio_id} not found")
+            publish_status(audio_file, ProcessingStage.SUMMARIZING)
+            await self.summary_service.generate_summary(transcription, use_cache=use_cache)
+            publish_status(audio_file)
+        elif stage == PipelineStage.EMBED:
+            await self.embedding_service.embed_meeting(audio_id)
+
+    def mark_retrying(self, audio_id: UUID, stage: PipelineStage | None = None) -> None:
+        """
+        Keep the audio file in processing state while a failed stage is retried.
+
+        Args:
+            audio_id: UUID of audio file
+            stage: Failed stage (background stages leave the status alone)
+        """
+        if stage in BACKGROUND_STAGES:
+            return
+        audio_file = self.audio_service.update_audio_status(audio_id, AudioStatus.PROCESSING)
+        if audio_file:
+            publish_status(audio_file, ProcessingStage.RETRYING)
+
+    def mark_failed(
+        self, audio_id: UUID, error_message: str, stage: PipelineStage | None = None
+    ) -> None:
+        """
+        Mark the audio file failed after the last attempt.
+
+        Args:
+            audio_id: UUID of audio file
+            error_message: Reason for the failure
+            stage: Failed stage (background stages leave the status alone)
+        """
+        if stage in BACKGROUND_STAGES:
+            return
+        audio_file = self.audio_service.update_audio_status(
+            audio_id, AudioStatus.FAILED, error_message[:1000]
+        )
+        if audio_file:
+            publish_status(audio_file, ProcessingStage.FAILED)
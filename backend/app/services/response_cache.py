@@ -0,0 +1,273 @@
+"""
+Response cache service.
+
+Read-through cache of serialized transcription and summary responses, so
+repeat reads of finished meetings skip the database, ORM hydration and
+Pydantic serialization.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import Response, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TieredCache, build_tiered_cache
+from app.core.events import get_event_bus
+from app.core.http_cache import cache_headers, etag_matches, not_modified
+from app.core.settings import settings
+
+# Resource kinds (part of the cache key)
+TRANSCRIPTION = "transcription"
+SUMMARY = "summary"
+
+# Event channel of invalidations
+INVALIDATION_CHANNEL = "response-cache"
+
+GENERATION_TTL_SECONDS = 86400  # Reason: Outlives any read; expiry only drops idle counters
+
+
+@dataclass(frozen=True)
+class ReadToken:
+    """
+    Invalidation state observed before a record was read.
+
+    Attributes:
+        invalidations: Invalidations seen by this process
+        generation: Shared-tier generation of the entry (None if never invalidated)
+    """
+
+    invalidations: int
+    generation: bytes | None = None
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Serialized response of one resource version.
+
+    Attributes:
+        body: JSON response body
+        etag: Entity tag of the resource version
+        cache_control: Cache-Control policy of the response
+    """
+
+    body: bytes
+    etag: str
+    cache_control: str
+
+    def to_bytes(self) -> bytes:
+        """Encode for a byte-oriented cache tier."""
+        return f"{self.etag}\n{self.cache_control}\n".encode() + self.body
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> "CachedResponse":
+        """Decode a value written by to_bytes."""
+        etag, cache_control, body = value.split(b"\n", 2)
+        return cls(body=body, etag=etag.decode(), cache_control=cache_control.decode())
+
+    def to_response(self, if_none_match: str | None = None) -> Response:
+        """
+        Build the HTTP response, or 304 if the client's copy is current.
+
+        Args:
+            if_none_match: Entity tags of the client's cached copies
+
+        Returns:
+            Response: JSON or 304 response with caching headers
+        """
+        headers = cache_headers(self.etag, self.cache_control)
+        if etag_matches(if_none_match, self.etag):
+            return not_modified(headers)
+        return Response(
+            content=self.body,
+            status_code=status.HTTP_200_OK,
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+class ResponseCache:
+    """
+    Cache of serialized API responses, keyed by resource kind and ID.
+
+    Only completed resources are stored, and entries are served without
+    reading the database. Every write to a cached resource must call
+    invalidate_response: it drops the entry from both tiers, bumps the
+    entry's generation in the shared tier and publishes the invalidation
+    on the event bus, so other processes drop their local copy too.
+    Readers take a ReadToken before loading a record, and their write is
+    skipped if an invalidation happened since, in any process.
+    """
+
+    def __init__(self, cache: TieredCache) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            cache: Underlying tiered cache
+        """
+        self.cache = cache
+        # Reason: Lets a reader detect invalidations made while it loaded the record
+        self.invalidations = 0
+
+    async def get(self, kind: str, resource_id: UUID) -> CachedResponse | None:
+        """
+        Look up a cached response.
+
+        Args:
+            kind: Resource kind (TRANSCRIPTION or SUMMARY)
+            resource_id: Resource ID
+
+        Returns:
+            Optional[CachedResponse]: Cached response or None on miss
+        """
+        value = await self.cache.get_async(f"{kind}:{resource_id}")
+        return CachedResponse.from_bytes(value) if value is not None else None
+
+    async def read_token(self, kind: str, resource_id: UUID) -> ReadToken:
+        """
+        Capture the invalidation state before a record is read.
+
+        Args:
+            kind: Resource kind
+            resource_id: Resource ID
+
+        Returns:
+            ReadToken: Token to pass to put
+        """
+        invalidations = self.invalidations
+        if self.cache.shared is None:
+            return ReadToken(invalidations)
+        generation = await run_in_threadpool(
+            self.cache.shared.get, _generation_key(f"{kind}:{resource_id}")
+        )
+        return ReadToken(invalidations, generation)
+
+    async def put(
+        self, kind: str, resource_id: UUID, response: CachedResponse, token: ReadToken
+    ) -> None:
+        """
+        Store a response unless an invalidation happened since it was read.
+
+        The shared-tier write is conditional on the entry's generation, so
+        an invalidation by another process whose event has not arrived yet
+        still prevents a stale payload from reaching every process.
+
+        Args:
+            kind: Resource kind
+            resource_id: Resource ID
+            response: Serialized response
+            token: Token from read_token, taken before the record was read
+        """
+        if token.invalidations != self.invalidations:
+            # Reason: The record may have changed after it was read
+            return
+        key = f"{kind}:{resource_id}"
+        value = response.to_bytes()
+        if self.cache.shared is not None:
+            stored = await run_in_threadpool(
+                self.cache.shared.set_if,
+                key,
+                value,
+                _generation_key(key),
+                token.generation,
+                self.cache.ttl_seconds,
+            )
+            if not stored:
+                return
+        self.cache.local.set(key, value, self.cache.ttl_seconds)
+
+    def invalidate(self, kind: str, resource_id: UUID) -> None:
+        """
+        Drop a cached response from both tiers and from other processes.
+
+        Args:
+            kind: Resource kind
+            resource_id: Resource ID
+        """
+        key = f"{kind}:{resource_id}"
+        event = {"kind": kind, "resource_id": str(resource_id)}
+        self.cache.local.delete(key)
+        self.invalidations += 1
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._invalidate_shared(key, event)
+            return
+        # Reason: Redis calls must not stall the event loop, and nothing waits for the result
+        loop.run_in_executor(None, self._invalidate_shared, key, event)
+
+    def _invalidate_shared(self, key: str, event: dict) -> None:
+        """Delete an entry from the shared tier and notify other processes."""
+        if self.cache.shared is not None:
+            # Reason: Bump before deleting, so a reader that loaded the old record cannot store it
+            self.cache.shared.incr(_generation_key(key), GENERATION_TTL_SECONDS)
+            self.cache.shared.delete(key)
+        get_event_bus().publish(INVALIDATION_CHANNEL, event)
+
+    def drop_local(self, event: dict) -> None:
+        """
+        Drop the local copy of an entry invalidated by any process.
+
+        Args:
+            event: Invalidation event published by invalidate
+        """
+        self.cache.local.delete(f"{event['kind']}:{event['resource_id']}")
+        self.invalidations += 1
+
+
+def _generation_key(key: str) -> str:
+    """Shared-tier key of the invalidation counter of an entry."""
+    return f"generation:{key}"
+
+
+def invalidations_reach_api() -> bool:
+    """
+    Check whether writes made by the pipeline can invalidate the API's cache.
+
+    Returns:
+        bool: True if the worker runs in the API process or events go through Redis
+    """
+    return settings.worker_embedded or settings.event_backend == "redis"
+
+
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """
+    Get the process-wide response cache.
+
+    The cache stays disabled when a separate worker could rewrite records
+    without its invalidations reaching this process.
+
+    Returns:
+        Optional[ResponseCache]: Shared cache, or None if disabled
+    """
+    global _response_cache
+    if _response_cache is None and invalidations_reach_api():
+        cache = build_tiered_cache(
+            "response",
+            settings.response_cache_backend,
+            settings.response_cache_max_entries,
+            settings.response_cache_ttl_seconds,
+        )
+        if cache:
+            _response_cache = ResponseCache(cache)
+            get_event_bus().add_listener(INVALIDATION_CHANNEL, _response_cache.drop_local)
+    return _response_cache
+
+
+def invalidate_response(kind: str, resource_id: UUID | None) -> None:
+    """
+    Drop the cached response of a resource whose record changed.
+
+    Args:
+        kind: Resource kind
+        resource_id: Resource ID (ignored if None)
+    """
+    cache = get_response_cache()
+    if cache and resource_id is not None:
+        cache.invalidate(kind, resource_id)
@@ -0,0 +1,299 @@
+"""
+Full-text search over transcripts and summaries.
+
+On PostgreSQL the pipeline writes a tsvector of each completed transcript
+and summary to its search_vector column (GIN-indexed) and searches rank
+with ts_rank_cd and highlight with ts_headline. On SQLite the same text is
+written to FTS5 tables and ranked with bm25, so tests exercise the same
+service locally.
+"""
+
+import re
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Float,
+    Select,
+    String,
+    Uuid,
+    and_,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    select,
+    text,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import execute
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.search import SUMMARIES_FTS, TRANSCRIPTIONS_FTS
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.schemas.search import SearchHit, SearchSource
+
+SNIPPET_START = "<mark>"
+SNIPPET_STOP = "</mark>"
+SNIPPET_WORDS = 24  # Reason: Enough context around a match to recognise the meeting
+
+_TERM = re.compile(r"\w+")
+
+_FTS_SEARCH = text(
+    f"""
+    SELECT hits.source, hits.doc_id, -hits.score AS rank, hits.snippet,
+           audio_files.id AS audio_id, audio_files.filename, audio_files.created_at
+    FROM (
+        SELECT '{SearchSource.TRANSCRIPT.value}' AS source, transcriptions.id AS doc_id,
+               transcriptions.audio_file_id AS audio_file_id,
+               bm25({TRANSCRIPTIONS_FTS}) AS score,
+               snippet({TRANSCRIPTIONS_FTS}, 0, :start, :stop, '…', :words) AS snippet
+        FROM {TRANSCRIPTIONS_FTS}
+        JOIN transcriptions ON transcriptions.rowid = {TRANSCRIPTIONS_FTS}.rowid
+        WHERE {TRANSCRIPTIONS_FTS} MATCH :query
+        UNION ALL
+        SELECT '{SearchSource.SUMMARY.value}', summaries.id, transcriptions.audio_file_id,
+               bm25({SUMMARIES_FTS}),
+               snippet({SUMMARIES_FTS}, 0, :start, :stop, '…', :words)
+        FROM {SUMMARIES_FTS}
+        JOIN summaries ON summaries.rowid = {SUMMARIES_FTS}.rowid
+        JOIN transcriptions ON transcriptions.id = summaries.transcription_id
+        WHERE {SUMMARIES_FTS} MATCH :query
+    ) AS hits
+    JOIN audio_files ON audio_files.id = hits.audio_file_id
+    ORDER BY hits.score, hits.doc_id
+    LIMIT :limit OFFSET :offset
+    """
+).columns(
+    source=String,
+    doc_id=Uuid,
+    rank=Float,
+    snippet=String,
+    audio_id=Uuid,
+    filename=String,
+    created_at=DateTime,
+)
+
+
+class SearchService:
+    """
+    Service for indexing and searching meeting text.
+
+    Indexing methods run on the pipeline's sync session inside its
+    transaction; search works on sync and async sessions.
+    """
+
+    def __init__(self, db: Session | AsyncSession) -> None:
+        """
+        Initialize search service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    @property
+    def is_postgres(self) -> bool:
+        """Whether the session is bound to PostgreSQL (otherwise SQLite FTS5 is used)."""
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    def index_transcription(self, transcription: Transcription) -> None:
+        """
+        Index the text of a completed transcription, replacing earlier entries.
+
+        Args:
+            transcription: Transcription whose full_text was just written
+        """
+        self.db.flush()
+        if self.is_postgres:
+            self._write_vector(Transcription, Transcription.full_text, transcription.id)
+        else:
+            self._write_fts(TRANSCRIPTIONS_FTS, "transcriptions", "full_text", transcription.id)
+
+    def index_summary(self, summary: Summary) -> None:
+        """
+        Index the text of a completed summary, replacing earlier entries.
+
+        Args:
+            summary: Summary whose summary_text was just written
+        """
+        self.db.flush()
+        if self.is_postgres:
+            self._write_vector(Summary, Summary.summary_text, summary.id)
+        else:
+            self._write_fts(SUMMARIES_FTS, "summaries", "summary_text", summary.id)
+
+    def remove_audio(self, audio_id: UUID) -> None:
+        """
+        Drop the index entries of an audio file's transcription and summary.
+
+        Must run before the rows are deleted; on PostgreSQL the vectors go
+        with their rows and nothing is done.
+
+        Args:
+            audio_id: UUID of audio file
+        """
+        if self.is_postgres:
+            return
+        audio_param = bindparam("audio_id", audio_id, type_=Uuid())
+        self.db.execute(
+            text(
+                f"DELETE FROM {SUMMARIES_FTS} WHERE rowid IN ("
+                "SELECT summaries.rowid FROM summaries JOIN transcriptions "
+                "ON transcriptions.id = summaries.transcription_id "
+                "WHERE transcriptions.audio_file_id = :audio_id)"
+            ).bindparams(audio_param)
+        )
+        self.db.execute(
+            text(
+                f"DELETE FROM {TRANSCRIPTIONS_FTS} WHERE rowid IN ("
+                "SELECT rowid FROM transcriptions WHERE audio_file_id = :audio_id)"
+            ).bindparams(audio_param)
+        )
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> list[SearchHit]:
+        """
+        Find transcripts and summaries matching a query, most relevant first.
+
+        Args:
+            query: Words to search for (PostgreSQL also accepts "quoted phrases",
+                OR and -excluded words)
+            limit: Maximum number of hits
+            offset: Number of hits to skip
+
+        Returns:
+            list[SearchHit]: Hits with highlighted snippets
+        """
+        if self.is_postgres:
+            statement = self._postgres_search(query, limit, offset)
+        else:
+            terms = _TERM.findall(query)
+            if not terms:
+                return []
+            # Reason: Quoted terms are plain words to FTS5 - user input cannot be a syntax error
+            statement = _FTS_SEARCH.bindparams(
+                query=" ".join(f'"{term}"' for term in terms),
+                start=SNIPPET_START,
+                stop=SNIPPET_STOP,
+                words=SNIPPET_WORDS,
+                limit=limit,
+                offset=offset,
+            )
+
+        result = await execute(self.db, statement)
+        return [
+            SearchHit(
+                audio_id=row.audio_id,
+                filename=row.filename,
+                created_at=row.created_at,
+                source=row.source,
+                document_id=row.doc_id,
+                rank=row.rank,
+                snippet=row.snippet or "",
+            )
+            for row in result
+        ]
+
+    def _write_vector(self, model: Any, column: Any, row_id: UUID) -> None:
+        """Recompute the tsvector of one row from its text column."""
+        self.db.execute(
+            update(model)
+            .where(model.id == row_id)
+            .values(search_vector=func.to_tsvector(_config(), func.coalesce(column, "")))
+            .execution_options(synchronize_session=False)
+        )
+
+    def _write_fts(self, fts_table: str, table: str, column: str, row_id: UUID) -> None:
+        """Replace the FTS5 entry of one row with its current text."""
+        row_param = bindparam("row_id", row_id, type_=Uuid())
+        self.db.execute(
+            text(
+                f"DELETE FROM {fts_table} WHERE rowid = "
+                f"(SELECT rowid FROM {table} WHERE id = :row_id)"
+            ).bindparams(row_param)
+        )
+        self.db.execute(
+            text(
+                f"INSERT INTO {fts_table} (rowid, body) SELECT rowid, {column} FROM {table} "
+                f"WHERE id = :row_id AND {column} IS NOT NULL"
+            ).bindparams(row_param)
+        )
+
+    def _postgres_search(self, query: str, limit: int, offset: int) -> Select:
+        """Build the ranked, highlighted tsvector search statement."""
+        tsquery = func.websearch_to_tsquery(_config(), query)
+
+        transcripts = select(
+            # Reason: Inlined - an untyped bind parameter in a UNION fails on asyncpg
+            literal_column(f"'{SearchSource.TRANSCRIPT.value}'").label("source"),
+            Transcription.id.label("doc_id"),
+            Transcription.audio_file_id.label("audio_file_id"),
+            func.ts_rank_cd(Transcription.search_vector, tsquery).label("rank"),
+        ).where(Transcription.search_vector.op("@@")(tsquery))
+        summaries = (
+            select(
+                literal_column(f"'{SearchSource.SUMMARY.value}'"),
+                Summary.id,
+                Transcription.audio_file_id,
+                func.ts_rank_cd(Summary.search_vector, tsquery),
+            )
+            .join(Transcription, Transcription.id == Summary.transcription_id)
+            .where(Summary.search_vector.op("@@")(tsquery))
+        )
+        hits = union_all(transcripts, summaries).subquery()
+        page = (
+            select(hits)
+            .order_by(hits.c.rank.desc(), hits.c.doc_id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        # Reason: ts_headline re-parses the document - only run it for the page
+        headline_options = (
+            f"StartSel={SNIPPET_START}, StopSel={SNIPPET_STOP}, "
+            f"MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}"
+        )
+        return (
+            select(
+                page.c.source,
+                page.c.doc_id,
+                page.c.rank,
+                func.ts_headline(
+                    _config(),
+                    func.coalesce(Transcription.full_text, Summary.summary_text, ""),
+                    tsquery,
+                    headline_options,
+                ).label("snippet"),
+                AudioFile.id.label("audio_id"),
+                AudioFile.filename,
+                AudioFile.created_at,
+            )
+            .select_from(page)
+            .join(AudioFile, AudioFile.id == page.c.audio_file_id)
+            .outerjoin(
+                Transcription,
+                and_(
+                    page.c.source == SearchSource.TRANSCRIPT.value,
+                    Transcription.id == page.c.doc_id,
+                ),
+            )
+            .outerjoin(
+                Summary,
+                and_(page.c.source == SearchSource.SUMMARY.value, Summary.id == page.c.doc_id),
+            )
+            .order_by(page.c.rank.desc(), page.c.doc_id)
+        )
+
+
+def _config() -> ColumnElement:
+    """Return the configured text search configuration as a regconfig expression."""
+    return cast(settings.search_language, REGCONFIG)
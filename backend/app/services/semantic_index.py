@@ -0,0 +1,268 @@
+"""
+In-memory vector index for semantic search.
+
+Holds the int8 embeddings of all passages in contiguous NumPy arrays and
+scores a query against them in blocks (exact brute force). For large
+corpora an inverted-file index (IVF) can be built: vectors are clustered
+with spherical k-means and a query only scans the clusters nearest to it,
+plus vectors added since the last build.
+"""
+
+import math
+from dataclasses import dataclass
+from uuid import UUID
+
+import numpy as np
+
+SCORE_BLOCK_ROWS = 16384  # Reason: Bounds the float32 copy made while scoring (4 bytes per value)
+CANDIDATES_PER_HIT = 8  # Reason: Passages scored per requested meeting before deduplication
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_PER_LIST = 64  # Reason: Training sample size per cluster
+IVF_REBUILD_FRACTION = 0.2  # Reason: Rebuild once this share of vectors is outside the clusters
+
+
+@dataclass(frozen=True)
+class VectorMatch:
+    """Best-scoring passage of one meeting."""
+
+    embedding_id: int
+    audio_id: UUID
+    score: float
+
+
+@dataclass(frozen=True)
+class _InvertedLists:
+    """Clusters of the first `size` vectors, as positions sorted by cluster."""
+
+    centroids: np.ndarray
+    positions: np.ndarray
+    offsets: np.ndarray
+    size: int
+
+
+class SemanticIndex:
+    """
+    Append-only index of quantized vectors.
+
+    Rows are appended to buffers that grow geometrically. Queries only read
+    the first `size` rows and the inverted lists are replaced atomically,
+    so building them in a worker thread does not disturb searches.
+    """
+
+    def __init__(self, dimensions: int) -> None:
+        """
+        Initialize empty index.
+
+        Args:
+            dimensions: Vector length
+        """
+        self.dimensions = dimensions
+        self.size = 0
+        self._ids = np.zeros(0, dtype=np.int64)
+        self._meetings = np.zeros(0, dtype=np.int32)
+        self._codes = np.zeros((0, dimensions), dtype=np.int8)
+        self._scales = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._meeting_codes: dict[UUID, int] = {}
+        self._meeting_ids: list[UUID] = []
+        self._lists: _InvertedLists | None = None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the stored rows (codes, scales, ids and meetings)."""
+        return self.size * (self.dimensions + 4 + 8 + 4 + 1)
+
+    @property
+    def has_inverted_lists(self) -> bool:
+        """Whether an IVF index is built."""
+        return self._lists is not None
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Check which embedding ids are already in the index.
+
+        Args:
+            ids: int64 array of embedding ids
+
+        Returns:
+            np.ndarray: Boolean mask over ids
+        """
+        return np.isin(ids, self._ids[: self.size])
+
+    def retain(self, live_ids: np.ndarray) -> None:
+        """
+        Mask out rows whose embedding ids are no longer stored.
+
+        Masked rows stay in the buffers until the index is rebuilt but are
+        skipped by search, so a deleted or re-embedded passage cannot hide
+        the live passages of its meeting.
+
+        Args:
+            live_ids: int64 array of the embedding ids still stored
+        """
+        self._live[: self.size] = np.isin(self._ids[: self.size], live_ids)
+
+    def add(
+        self, ids: list[int], audio_ids: list[UUID], codes: np.ndarray, scales: np.ndarray
+    ) -> None:
+        """
+        Append vectors; rows whose ids are already in the index are skipped.
+
+        Args:
+            ids: Embedding ids
+            audio_ids: Audio file of each row
+            codes: int8 array of shape (len(ids), dimensions)
+            scales: float32 array of shape (len(ids),)
+        """
+        # Reason: Two concurrent refreshes may load the same rows
+        keep = np.flatnonzero(~self.contains(np.asarray(ids, dtype=np.int64)))
+        if not keep.size:
+            return
+
+        count = keep.size
+        self._reserve(self.size + count)
+        end = self.size + count
+        self._ids[self.size : end] = np.asarray(ids, dtype=np.int64)[keep]
+        self._meetings[self.size : end] = [self._meeting_code(audio_ids[row]) for row in keep]
+        self._codes[self.size : end] = codes[keep]
+        self._scales[self.size : end] = scales[keep]
+        self._live[self.size : end] = True
+        self.size = end
+
+    def search(self, query: np.ndarray, limit: int, probes: int | None = None) -> list[VectorMatch]:
+        """
+        Find the meetings with the passages most similar to a query.
+
+        Args:
+            query: L2-normalized float32 query vector
+            limit: Maximum number of meetings
+            probes: Clusters to scan when inverted lists are built (None scans everything)
+
+        Returns:
+            list[VectorMatch]: Best passage per meeting, highest cosine similarity first
+        """
+        if self.size == 0 or limit <= 0:
+            return []
+
+        rows = self._candidates(query, probes) if probes else None
+        scores = self._score(query.astype(np.float32), rows)
+        if rows is None:
+            rows = np.arange(len(scores))
+
+        live = np.flatnonzero(self._live[rows])
+        if not live.size:
+            return []
+        wanted = min(live.size, limit * CANDIDATES_PER_HIT)
+        top = live[np.argpartition(-scores[live], wanted - 1)[:wanted]]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        matches: list[VectorMatch] = []
+        seen: set[int] = set()
+        for position in top:
+            row = rows[position]
+            meeting = int(self._meetings[row])
+            if meeting in seen:
+                continue
+            seen.add(meeting)
+            matches.append(
+                VectorMatch(
+                    embedding_id=int(self._ids[row]),
+                    audio_id=self._meeting_ids[meeting],
+                    score=float(scores[position]),
+                )
+            )
+            if len(matches) == limit:
+                break
+        return matches
+
+    def needs_inverted_lists(self, min_vectors: int) -> bool:
+        """Whether IVF lists are missing or cover too few of the vectors."""
+        if self.size < min_vectors:
+            return False
+        if self._lists is None:
+            return True
+        return self.size - self._lists.size > self._lists.size * IVF_REBUILD_FRACTION
+
+    def build_inverted_lists(self, seed: int = 0) -> None:
+        """
+        Cluster the current vectors with spherical k-means (CPU-heavy, thread-safe).
+
+        Args:
+            seed: Random seed for sampling and initial centroids
+        """
+        size = self.size
+        if size == 0:
+            return
+        lists = max(1, int(math.sqrt(size)))
+        rng = np.random.default_rng(seed)
+
+        sample_rows = np.sort(rng.choice(size, min(size, lists * KMEANS_SAMPLE_PER_LIST), False))
+        sample = self._vectors(sample_rows)
+        centroids = sample[rng.choice(len(sample), lists, replace=False)]
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # Reason: Empty clusters keep their previous centroid
+            centroids = np.where(norms > 0, sums / np.where(norms > 0, norms, 1.0), centroids)
+
+        assignment = np.empty(size, dtype=np.int32)
+        for start in range(0, size, SCORE_BLOCK_ROWS):
+            block = self._vectors(slice(start, min(start + SCORE_BLOCK_ROWS, size)))
+            assignment[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+
+        positions = np.argsort(assignment, kind="stable")
+        offsets = np.searchsorted(assignment[positions], np.arange(lists + 1))
+        self._lists = _InvertedLists(centroids.astype(np.float32), positions, offsets, size)
+
+    def _candidates(self, query: np.ndarray, probes: int) -> np.ndarray | None:
+        """Rows in the clusters nearest to the query plus rows added since the build."""
+        lists = self._lists
+        if lists is None:
+            return None
+        probes = min(probes, len(lists.centroids))
+        nearest = np.argpartition(-(lists.centroids @ query), probes - 1)[:probes]
+        parts = [lists.positions[lists.offsets[c] : lists.offsets[c + 1]] for c in nearest]
+        parts.append(np.arange(lists.size, self.size))
+        return np.concatenate(parts)
+
+    def _score(self, query: np.ndarray, rows: np.ndarray | None) -> np.ndarray:
+        """Cosine similarity of the query with all rows, or with the given rows."""
+        count = self.size if rows is None else len(rows)
+        scores = np.empty(count, dtype=np.float32)
+        for start in range(0, count, SCORE_BLOCK_ROWS):
+            end = min(start + SCORE_BLOCK_ROWS, count)
+            block = slice(start, end) if rows is None else rows[start:end]
+            scores[start:end] = self._vectors(block) @ query
+        return scores
+
+    def _vectors(self, rows: np.ndarray | slice) -> np.ndarray:
+        """Dequantize rows to float32."""
+        return self._codes[rows].astype(np.float32) * self._scales[rows, None]
+
+    def _meeting_code(self, audio_id: UUID) -> int:
+        """Return the small integer standing for an audio file."""
+        code = self._meeting_codes.get(audio_id)
+        if code is None:
+            code = self._meeting_codes[audio_id] = len(self._meeting_ids)
+            self._meeting_ids.append(audio_id)
+        return code
+
+    def _reserve(self, capacity: int) -> None:
+        """Grow the row buffers to hold at least capacity rows."""
+        if capacity <= len(self._ids):
+            return
+        new_capacity = max(capacity, 2 * len(self._ids), 1024)
+        self._ids = _grow(self._ids, new_capacity)
+        self._meetings = _grow(self._meetings, new_capacity)
+        self._codes = _grow(self._codes, new_capacity)
+        self._scales = _grow(self._scales, new_capacity)
+        self._live = _grow(self._live, new_capacity)
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Return a copy of array with room for capacity rows."""
+    grown = np.zeros((capacity, *array.shape[1:]), dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
@@ -0,0 +1,193 @@
+"""
+Status events for audio processing.
+
+Builds status snapshots of audio files, publishes them when the pipeline
+changes stage, and streams them to clients as Server-Sent Events.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from enum import Enum
+from uuid import UUID
+
+from app.core.database import close_session
+from app.core.events import Subscription, get_event_bus
+from app.core.settings import settings
+from app.models.audio import AudioFile, AudioStatus
+from app.models.summary import SummaryStatus
+from app.models.transcription import TranscriptionStatus
+from app.schemas.audio import AudioStatusResponse
+from app.services.audio_service import AudioService
+
+SSE_RETRY_MILLISECONDS = 3000  # Reason: Browser reconnect delay after a dropped stream
+
+
+class ProcessingStage(str, Enum):
+    """Pipeline stage reported to clients."""
+
+    UPLOADED = "uploaded"
+    RECORDING = "recording"
+    QUEUED = "queued"
+    TRANSCODING = "transcoding"
+    TRANSCRIBING = "transcribing"
+    SUMMARIZING = "summarizing"
+    RETRYING = "retrying"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+TERMINAL_STAGES = {ProcessingStage.COMPLETED.value, ProcessingStage.FAILED.value}
+# Reason: No pipeline work is queued - the next change comes from an API request
+IDLE_STAGES = {ProcessingStage.UPLOADED.value, ProcessingStage.RECORDING.value}
+
+
+def audio_channel(audio_id: UUID) -> str:
+    """Return the event channel of an audio file."""
+    return f"audio:{audio_id}"
+
+
+def infer_stage(audio_file: AudioFile) -> ProcessingStage:
+    """
+    Derive the pipeline stage from stored statuses.
+
+    Args:
+        audio_file: Audio file with its transcription and summary loaded
+
+    Returns:
+        ProcessingStage: Current stage
+    """
+    if audio_file.status != AudioStatus.PROCESSING.value:
+        return ProcessingStage(audio_file.status)
+
+    transcription = audio_file.transcription
+    if transcription is None:
+        return ProcessingStage.QUEUED
+    if transcription.status == TranscriptionStatus.FAILED.value:
+        return ProcessingStage.RETRYING
+    if transcription.status != TranscriptionStatus.COMPLETED.value:
+        return ProcessingStage.TRANSCRIBING
+    summary = transcription.summary
+    if summary is not None and summary.status == SummaryStatus.FAILED.value:
+        return ProcessingStage.RETRYING
+    return ProcessingStage.SUMMARIZING
+
+
+def build_status_response(
+    audio_file: AudioFile, stage: ProcessingStage | None = None
+) -> AudioStatusResponse:
+    """
+    Build the status snapshot of an audio file.
+
+    Args:
+        audio_file: Audio file with its transcription and summary loaded
+        stage: Stage being entered (derived from stored statuses if omitted)
+
+    Returns:
+        AudioStatusResponse: Status and related IDs
+    """
+    transcription = audio_file.transcription
+    summary = transcription.summary if transcription else None
+
+    return AudioStatusResponse(
+        id=audio_file.id,
+        filename=audio_file.filename,
+        status=audio_file.status,
+        stage=(stage or infer_stage(audio_file)).value,
+        duration_seconds=audio_file.duration_seconds,
+        error_message=audio_file.error_message,
+        transcription_id=transcription.id if transcription else None,
+        summary_id=summary.id if summary else None,
+        created_at=audio_file.created_at,
+        updated_at=audio_file.updated_at,
+    )
+
+
+def publish_status(audio_file: AudioFile, stage: ProcessingStage | None = None) -> None:
+    """
+    Publish the status snapshot of an audio file to its subscribers.
+
+    Args:
+        audio_file: Audio file (relationships are lazy-loaded if needed)
+        stage: Stage being entered (derived from stored statuses if omitted)
+    """
+    publish_event(build_status_response(audio_file, stage))
+
+
+def publish_event(event: AudioStatusResponse) -> None:
+    """
+    Publish a status snapshot built earlier to its audio file's subscribers.
+
+    Args:
+        event: Status snapshot
+    """
+    get_event_bus().publish(audio_channel(event.id), event.model_dump(mode="json"))
+
+
+def format_event(event: AudioStatusResponse) -> str:
+    """Format a status snapshot as a Server-Sent Event."""
+    return f"event: status\ndata: {event.model_dump_json()}\n\n"
+
+
+async def stream_status(
+    audio_service: AudioService,
+    audio_id: UUID,
+    subscription: Subscription,
+    first: AudioStatusResponse,
+) -> AsyncIterator[str]:
+    """
+    Stream status events of an audio file until it completes or fails.
+
+    Published events are forwarded as they arrive. When none arrives within
+    settings.events_resync_seconds the status is re-read from the database,
+    so the stream stays correct when a worker's events cannot reach this
+    process; an unchanged status is sent as a keepalive comment. While the
+    audio file waits in an idle stage (uploaded, recording) the re-reads
+    back off, doubling up to settings.events_idle_resync_seconds apart.
+
+    Args:
+        audio_service: Audio service whose session is only held while re-reading
+        audio_id: UUID of audio file
+        subscription: Subscription to the audio file's channel, opened before first was read
+        first: Status snapshot sent first
+
+    Yields:
+        str: Server-Sent Events
+    """
+    last = first
+    max_resync_every = max(
+        1, int(settings.events_idle_resync_seconds / settings.events_resync_seconds)
+    )
+    resync_every = 1  # Reason: Timeouts between database re-reads
+    timeouts = 0
+    try:
+        yield f"retry: {SSE_RETRY_MILLISECONDS}\n" + format_event(first)
+
+        while last.stage not in TERMINAL_STAGES:
+            try:
+                event = AudioStatusResponse.model_validate(
+                    await asyncio.wait_for(
+                        subscription.get(), timeout=settings.events_resync_seconds
+                    )
+                )
+            except asyncio.TimeoutError:
+                timeouts += 1
+                if timeouts < resync_every:
+                    yield ": keepalive\n\n"
+                    continue
+                timeouts = 0
+                audio_file = await audio_service.get_audio_by_id_async(audio_id, with_results=True)
+                await close_session(audio_service.db)
+                if audio_file is None:
+                    return
+                event = build_status_response(audio_file)
+                if event == last and last.stage in IDLE_STAGES:
+                    resync_every = min(resync_every * 2, max_resync_every)
+
+            if event == last:
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(event)
+            last = event
+            resync_every, timeouts = 1, 0
+    finally:
+        subscription.close()
@@ -4,12 +4,55 @@ Storage service for file operations.
 Handles file system operations for uploaded audio files.
 """
 
+import hashlib
 import os
 import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 
+import aiofiles
+from fastapi import UploadFile
+
 from app.core.settings import settings
 
+PLACE_ATTEMPTS = 3  # Reason: Retries when a concurrent delete prunes the fan-out directory
+
+
+class FileTooLargeError(Exception):
+    """Raised when a streamed upload exceeds the configured size limit."""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    """
+    Result of streaming an upload to disk.
+
+    Attributes:
+        file_path: Path of the stored file
+        filename: Generated filename on disk
+        size: Number of bytes written
+        content_hash: Hex SHA-256 digest of the file content
+        deduplicated: True if identical content was already stored
+        spare_path: The upload's own copy of deduplicated content, kept until
+            its record is committed (see settle_upload)
+    """
+
+    file_path: str
+    filename: str
+    size: int
+    content_hash: str
+    deduplicated: bool = False
+    spare_path: str | None = None
+
+
+class StorageMode(str, Enum):
+    """Layout used for stored audio files."""
+
+    FLAT = "flat"  # Reason: One uuid-named file per upload
+    CONTENT_ADDRESSED = "content_addressed"  # Reason: One file per distinct SHA-256
+
 
 class StorageService:
     """
@@ -22,54 +65,225 @@ class StorageService:
         """Initialize storage service and ensure upload directory exists."""
         self.upload_dir = Path(settings.upload_dir)
         self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = StorageMode(settings.storage_mode)
 
-    def save_audio_file(self, file_content: bytes, original_filename: str) -> tuple[str, str]:
+    async def save_audio_stream(
+        self, file: UploadFile, original_filename: str, max_size: int
+    ) -> StoredFile:
         """
-        Save uploaded audio file to disk.
+        Stream uploaded audio file to disk chunk by chunk.
+
+        Size and SHA-256 hash are computed while the bytes are written, so
+        the upload is never held in memory as a whole. In content-addressed
+        mode the file is then moved to its hash path or, if that content is
+        already stored, kept aside as a spare until settle_upload.
 
         Args:
-            file_content: Binary audio file content
+            file: Uploaded file to read from
             original_filename: Original filename from upload
+            max_size: Maximum number of bytes accepted
 
         Returns:
-            Tuple[str, str]: (file_path, generated_filename)
+            StoredFile: Location, size and content hash of the stored file
 
         Raises:
+            FileTooLargeError: If the upload exceeds max_size
             IOError: If file cannot be saved
         """
-        # Generate unique filename
-        # Reason: Prevent filename collisions and maintain original extension
         file_extension = Path(original_filename).suffix
         unique_filename = f"{uuid.uuid4()}{file_extension}"
         file_path = self.upload_dir / unique_filename
+        # Reason: Write under a temporary name so a partial upload is never visible
+        partial_path = file_path.with_name(f"{unique_filename}.part")
+
+        chunk_size = settings.upload_chunk_size_kb * 1024
+        digest = hashlib.sha256()
+        size = 0
 
-        # Save file
         try:
-            with open(file_path, "wb") as f:
-                f.write(file_content)
+            async with aiofiles.open(partial_path, "wb") as out:
+                while chunk := await file.read(chunk_size):
+                    size += len(chunk)
+                    if size > max_size:
+                        raise FileTooLargeError(f"Upload exceeds {max_size} bytes")
+                    digest.update(chunk)
+                    await out.write(chunk)
+        except FileTooLargeError:
+            self.delete_audio_file(str(partial_path))
+            raise
         except Exception as e:
+            self.delete_audio_file(str(partial_path))
             raise OSError(f"Failed to save audio file: {str(e)}")
 
-        return str(file_path), unique_filename
+        content_hash = digest.hexdigest()
+
+        if self.mode == StorageMode.CONTENT_ADDRESSED:
+            file_path = self.content_path(content_hash, file_extension)
+            unique_filename = file_path.name
+
+        for attempt in range(1, PLACE_ATTEMPTS + 1):
+            try:
+                deduplicated = self._place(partial_path, file_path)
+                break
+            except FileNotFoundError:
+                # Reason: A concurrent delete may prune the fan-out directory after mkdir
+                if attempt < PLACE_ATTEMPTS:
+                    continue
+                self.delete_audio_file(str(partial_path))
+                raise OSError(f"Failed to save audio file: {file_path.parent} keeps disappearing")
+            except Exception as e:
+                self.delete_audio_file(str(partial_path))
+                raise OSError(f"Failed to save audio file: {str(e)}")
+
+        return StoredFile(
+            file_path=str(file_path),
+            filename=unique_filename,
+            size=size,
+            content_hash=content_hash,
+            deduplicated=deduplicated,
+            spare_path=str(partial_path) if deduplicated else None,
+        )
 
-    def delete_audio_file(self, file_path: str) -> bool:
+    def _place(self, partial_path: Path, file_path: Path) -> bool:
+        """
+        Move a finished upload to its final path.
+
+        Args:
+            partial_path: Temporary file holding the upload
+            file_path: Final path
+
+        Returns:
+            bool: True if identical content is already stored there (nothing moved)
+        """
+        if self.mode == StorageMode.CONTENT_ADDRESSED:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if file_path.exists():
+                return True
+        os.replace(partial_path, file_path)
+        return False
+
+    def settle_upload(self, stored: StoredFile) -> None:
+        """
+        Drop or restore the spare copy of a deduplicated upload.
+
+        Call once the upload's record is committed. A concurrent delete may
+        have unlinked the shared file before it could see that record; the
+        spare is then moved into place, otherwise it is dropped.
+
+        Args:
+            stored: Result of save_audio_stream
+        """
+        if stored.spare_path is None:
+            return
+        if os.path.exists(stored.file_path):
+            self.delete_audio_file(stored.spare_path)
+            return
+        Path(stored.file_path).parent.mkdir(parents=True, exist_ok=True)
+        os.replace(stored.spare_path, stored.file_path)
+
+    def delete_shared_file(self, file_path: str, count_references: Callable[[], int]) -> bool:
+        """
+        Delete a stored file that other records may share, once none references it.
+
+        The file is moved aside before references are counted a second time,
+        so a deduplicating upload that commits in between either finds it
+        missing and restores its spare (see settle_upload) or gets it back.
+
+        Args:
+            file_path: Path of the stored file
+            count_references: Returns the number of records pointing at the file
+
+        Returns:
+            bool: True if deleted, False if file not found or still referenced
+        """
+        if count_references() > 0:
+            return False
+
+        doomed_path = f"{file_path}.{uuid.uuid4().hex}.deleted"
+        try:
+            os.replace(file_path, doomed_path)
+        except FileNotFoundError:
+            return False
+        if count_references() > 0:
+            os.replace(doomed_path, file_path)
+            return False
+        return self.delete_audio_file(doomed_path)
+
+    def content_path(self, content_hash: str, extension: str = "") -> Path:
+        """
+        Build the fan-out path for content-addressed storage.
+
+        Args:
+            content_hash: Hex SHA-256 digest of the file content
+            extension: File extension including the dot
+
+        Returns:
+            Path: Location such as upload_dir/ab/cd/abcd....webm
+        """
+        # Reason: Two directory levels keep each directory small
+        return self.upload_dir / content_hash[:2] / content_hash[2:4] / f"{content_hash}{extension}"
+
+    def transcoded_stem(self, audio_id: uuid.UUID) -> Path:
+        """
+        Build the location of an upload's transcoded copy (without extension).
+
+        Args:
+            audio_id: UUID of audio file
+
+        Returns:
+            Path: Location such as upload_dir/transcoded/<audio_id>
+        """
+        return self.upload_dir / "transcoded" / str(audio_id)
+
+    def live_path(self, audio_id: uuid.UUID) -> Path:
+        """
+        Build the location of a live recording, creating its directory.
+
+        Args:
+            audio_id: UUID of audio file
+
+        Returns:
+            Path: Location such as upload_dir/live/<audio_id>.webm
+        """
+        directory = self.upload_dir / "live"
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{audio_id}.webm"
+
+    def delete_audio_file(self, file_path: str, references: int = 0) -> bool:
         """
         Delete audio file from disk.
 
         Args:
             file_path: Path to file to delete
+            references: Number of records still pointing at the file
 
         Returns:
-            bool: True if deleted, False if file not found
+            bool: True if deleted, False if file not found or still referenced
         """
+        # Reason: Content-addressed files are shared between uploads
+        if references > 0:
+            return False
+
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
+                self._prune_empty_dirs(Path(file_path).parent)
                 return True
             return False
         except Exception:
             return False
 
+    def _prune_empty_dirs(self, directory: Path) -> None:
+        """Remove empty fan-out directories up to the upload directory."""
+        upload_dir = self.upload_dir.resolve()
+        directory = directory.resolve()
+        while directory != upload_dir and upload_dir in directory.parents:
+            try:
+                directory.rmdir()
+            except OSError:
+                return
+            directory = directory.parent
+
     def get_file_size(self, file_path: str) -> int:
         """
         Get size of file in bytes.
@@ -0,0 +1,98 @@
+"""
+Summary cache service.
+
+Reuses generated summaries for identical transcripts and prompt settings.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from app.core.cache import TieredCache, build_tiered_cache
+from app.core.settings import settings
+
+
+class SummaryCache:
+    """
+    Cache of parsed summary data.
+
+    Entries are keyed by (normalized transcript hash, model, prompt version,
+    temperature, max_tokens) and stored as JSON in a tiered cache.
+    """
+
+    def __init__(self, cache: TieredCache) -> None:
+        """
+        Initialize summary cache.
+
+        Args:
+            cache: Underlying tiered cache
+        """
+        self.cache = cache
+
+    @staticmethod
+    def make_key(
+        transcript: str, model: str, prompt_version: str, temperature: float, max_tokens: int
+    ) -> str:
+        """
+        Build the cache key for a summary request.
+
+        Args:
+            transcript: Transcription text
+            model: GPT model name
+            prompt_version: Version of the prompt template
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+
+        Returns:
+            str: Hex SHA-256 cache key
+        """
+        # Reason: Whitespace differences do not change the prompt meaning
+        normalized = " ".join(transcript.split())
+        transcript_hash = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        payload = json.dumps([transcript_hash, model, prompt_version, temperature, max_tokens])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, cache_key: str) -> dict[str, Any] | None:
+        """
+        Look up cached summary data.
+
+        Args:
+            cache_key: Key from make_key
+
+        Returns:
+            Optional[dict]: Parsed summary data or None on miss
+        """
+        value = await self.cache.get_async(cache_key)
+        return json.loads(value) if value is not None else None
+
+    async def put(self, cache_key: str, summary_data: dict[str, Any]) -> None:
+        """
+        Store summary data.
+
+        Args:
+            cache_key: Key from make_key
+            summary_data: Parsed summary data
+        """
+        await self.cache.set_async(cache_key, json.dumps(summary_data).encode("utf-8"))
+
+
+_summary_cache: SummaryCache | None = None
+
+
+def get_summary_cache() -> SummaryCache | None:
+    """
+    Get the process-wide summary cache.
+
+    Returns:
+        Optional[SummaryCache]: Shared cache, or None if disabled in settings
+    """
+    global _summary_cache
+    if _summary_cache is None:
+        cache = build_tiered_cache(
+            "summary",
+            settings.summary_cache_backend,
+            settings.summary_cache_max_entries,
+            settings.summary_cache_ttl_seconds,
+        )
+        _summary_cache = SummaryCache(cache) if cache else None
+    return _summary_cache
@@ -0,0 +1,381 @@
+"""
+Hierarchical (map-reduce) summarization for long transcripts.
+
+Transcripts longer than one chunk are split into token-bounded chunks. Each
+chunk is mined concurrently for key points, action items, decisions and
+participants (map), then the partial results are merged into one summary
+(reduce) - by the model, in as many rounds as the budget requires, or
+locally without further calls.
+"""
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from openai import AsyncOpenAI
+
+from app.core.settings import settings
+from app.utils.tokens import count_tokens, split_by_tokens
+
+# Bump whenever the map or reduce prompts change (part of the summary cache key)
+ENGINE_VERSION = "mapreduce-v1"
+
+SUMMARY_FIELDS = ("summary", "key_points", "action_items", "decisions", "participants")
+ENGINE_SYSTEM_PROMPT = "You are a precise meeting notes assistant. Extract ONLY facts stated in the input. Return valid JSON only."
+MAP_MAX_TOKENS = 800  # Reason: Partial results only need a few short items per chunk
+ENGINE_TEMPERATURE = 0.2  # Reason: Extraction and merging should be near-deterministic
+
+_JSON_SCHEMA = """{
+    "summary": "Brief overview",
+    "key_points": ["Point 1"],
+    "action_items": [{"item": "Brief task", "owner": "Name"}],
+    "decisions": ["Decision 1"],
+    "participants": ["Name 1"]
+}"""
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """
+    Tokens reported by the API for one or more calls.
+
+    Attributes:
+        prompt_tokens: Input tokens
+        total_tokens: Input plus completion tokens
+    """
+
+    prompt_tokens: int = 0
+    total_tokens: int = 0
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        """Sum the usage of two sets of calls."""
+        return TokenUsage(
+            self.prompt_tokens + other.prompt_tokens, self.total_tokens + other.total_tokens
+        )
+
+    @classmethod
+    def from_response(cls, response: Any) -> "TokenUsage":
+        """Read the usage block of a chat completion response."""
+        usage = response.usage
+        return cls(getattr(usage, "prompt_tokens", 0) or 0, usage.total_tokens)
+
+
+class ReduceStrategy(str, Enum):
+    """How partial chunk summaries are merged."""
+
+    LLM = "llm"  # Reason: Model merges and rewrites; best quality, extra calls
+    LOCAL = "local"  # Reason: Deterministic de-duplication, no extra calls
+
+
+def parse_summary(response_text: str) -> dict:
+    """
+    Parse a model response into summary fields.
+
+    Args:
+        response_text: Raw model output
+
+    Returns:
+        dict: Summary data (the raw text as summary if it is not JSON)
+    """
+    try:
+        data = json.loads(response_text)
+    except (json.JSONDecodeError, TypeError):
+        data = None
+    if not isinstance(data, dict):
+        # Fallback: Use raw text if JSON parsing fails
+        data = {"summary": response_text or ""}
+    return {
+        field: data.get(field) or ("" if field == "summary" else []) for field in SUMMARY_FIELDS
+    }
+
+
+def merge_summaries(parts: list[dict]) -> dict:
+    """
+    Merge partial summaries, removing duplicate items.
+
+    Items are compared ignoring case and punctuation; an action item seen
+    again with an owner fills in a missing owner.
+
+    Args:
+        parts: Partial summaries in transcript order
+
+    Returns:
+        dict: Merged summary data
+    """
+    merged: dict[str, Any] = {
+        "summary": " ".join(part["summary"].strip() for part in parts if part.get("summary")),
+    }
+
+    for field in ("key_points", "decisions", "participants"):
+        seen: dict[str, str] = {}
+        for part in parts:
+            for item in part.get(field) or []:
+                seen.setdefault(_normalize(str(item)), str(item))
+        merged[field] = [item for key, item in seen.items() if key]
+
+    actions: dict[str, dict] = {}
+    for part in parts:
+        for action in part.get("action_items") or []:
+            if not isinstance(action, dict):
+                action = {"item": str(action), "owner": None}
+            key = _normalize(str(action.get("item", "")))
+            if not key:
+                continue
+            if key not in actions:
+                actions[key] = dict(action)
+            elif not actions[key].get("owner") and action.get("owner"):
+                actions[key]["owner"] = action["owner"]
+    merged["action_items"] = list(actions.values())
+
+    return merged
+
+
+class SummaryEngine:
+    """
+    Map-reduce summarizer over an OpenAI-compatible chat client.
+
+    Any object exposing an async chat.completions.create can be used, so the
+    engine runs against a local stub model in tests and benchmarks.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str | None = None,
+        chunk_tokens: int | None = None,
+        fan_out: int | None = None,
+        reduce_strategy: str | None = None,
+        max_tokens: int = 1200,
+    ) -> None:
+        """
+        Initialize summary engine.
+
+        Args:
+            client: Chat completions client
+            model: Model name (defaults to settings.gpt_model)
+            chunk_tokens: Transcript tokens per map call (defaults to settings)
+            fan_out: Concurrent model calls (defaults to settings)
+            reduce_strategy: "llm" or "local" (defaults to settings)
+            max_tokens: Completion budget of reduce calls
+        """
+        self.client = client
+        self.model = model or settings.gpt_model
+        self.chunk_tokens = chunk_tokens or settings.summary_chunk_tokens
+        self.fan_out = fan_out or settings.summary_fan_out
+        self.reduce_strategy = ReduceStrategy(reduce_strategy or settings.summary_reduce_strategy)
+        self.max_tokens = max_tokens
+
+    def version(self, chunk_tokens: int | None = None) -> str:
+        """
+        Identify the engine configuration, for cache keys.
+
+        Args:
+            chunk_tokens: Chunk size used (defaults to self.chunk_tokens)
+
+        Returns:
+            str: Engine version, chunk size and reduce strategy
+        """
+        chunk_tokens = chunk_tokens or self.chunk_tokens
+        return f"{ENGINE_VERSION}:{chunk_tokens}:{self.reduce_strategy.value}"
+
+    async def summarize(
+        self, text: str, chunk_tokens: int | None = None
+    ) -> tuple[dict, TokenUsage]:
+        """
+        Summarize a long transcript with map-reduce.
+
+        Args:
+            text: Transcript text
+            chunk_tokens: Transcript tokens per map call (defaults to self.chunk_tokens)
+
+        Returns:
+            Tuple[dict, TokenUsage]: (summary data, usage summed over all calls)
+        """
+        chunk_tokens = chunk_tokens or self.chunk_tokens
+        chunks = split_by_tokens(text, chunk_tokens, self.model)
+        semaphore = asyncio.Semaphore(self.fan_out)
+
+        mapped = await self._gather(
+            [
+                self.extract(chunk, index, len(chunks))
+                for index, chunk in enumerate(chunks, start=1)
+            ],
+            semaphore,
+        )
+        parts = [part for part, _ in mapped]
+        usage = sum((call_usage for _, call_usage in mapped), TokenUsage())
+
+        if self.reduce_strategy is ReduceStrategy.LOCAL or len(parts) == 1:
+            return merge_summaries(parts), usage
+
+        merged, reduce_usage = await self.reduce(parts, chunk_tokens, semaphore)
+        return merged, usage + reduce_usage
+
+    async def extract(
+        self, text: str, index: int, total: int | None = None
+    ) -> tuple[dict, TokenUsage]:
+        """
+        Extract a partial summary from one part of a transcript (one map call).
+
+        Args:
+            text: Transcript part
+            index: 1-based part number
+            total: Number of parts (None while the meeting is still being recorded)
+
+        Returns:
+            Tuple[dict, TokenUsage]: (partial summary data, usage)
+        """
+        return await self._complete(self.map_prompt(text, index, total), MAP_MAX_TOKENS)
+
+    async def reduce(
+        self,
+        parts: list[dict],
+        chunk_tokens: int | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> tuple[dict, TokenUsage]:
+        """
+        Merge partial summaries with the model, in as many rounds as the budget requires.
+
+        At least one round is made, so a single part is rewritten as a
+        whole-meeting summary.
+
+        Args:
+            parts: Partial summaries in transcript order
+            chunk_tokens: Input tokens per reduce call (defaults to self.chunk_tokens)
+            semaphore: Limit on concurrent calls (defaults to fan_out)
+
+        Returns:
+            Tuple[dict, TokenUsage]: (summary data, usage summed over all calls)
+        """
+        chunk_tokens = chunk_tokens or self.chunk_tokens
+        semaphore = semaphore or asyncio.Semaphore(self.fan_out)
+        usage = TokenUsage()
+
+        while True:
+            reduced = await self._gather(
+                [
+                    self._complete(self._reduce_prompt(batch), self.max_tokens)
+                    for batch in self._batches(parts, chunk_tokens)
+                ],
+                semaphore,
+            )
+            parts = [part for part, _ in reduced]
+            usage += sum((call_usage for _, call_usage in reduced), TokenUsage())
+            if len(parts) == 1:
+                break
+
+        # Reason: The model may still repeat items - de-duplicate deterministically
+        return merge_summaries(parts), usage
+
+    async def _gather(
+        self, calls: list[Awaitable[tuple[dict, TokenUsage]]], semaphore: asyncio.Semaphore
+    ) -> list[tuple[dict, TokenUsage]]:
+        """Run model calls concurrently, at most fan_out at a time."""
+
+        async def bounded(call: Awaitable[tuple[dict, TokenUsage]]) -> tuple[dict, TokenUsage]:
+            async with semaphore:
+                return await call
+
+        tasks = [asyncio.create_task(bounded(call)) for call in calls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _complete(self, prompt: str, max_tokens: int) -> tuple[dict, TokenUsage]:
+        """Call the model and parse its JSON answer."""
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": ENGINE_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            temperature=ENGINE_TEMPERATURE,
+        )
+        return parse_summary(response.choices[0].message.content), TokenUsage.from_response(
+            response
+        )
+
+    def _batches(self, parts: list[dict], chunk_tokens: int) -> list[list[dict]]:
+        """Group partial summaries into reduce inputs that fit one chunk."""
+        batches: list[list[dict]] = []
+        current: list[dict] = []
+        current_tokens = 0
+
+        for part in parts:
+            tokens = count_tokens(json.dumps(part), self.model)
+            # Reason: At least two parts per batch, so every round makes progress
+            if len(current) >= 2 and current_tokens + tokens > chunk_tokens:
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(part)
+            current_tokens += tokens
+
+        if len(current) == 1 and batches:
+            batches[-1].append(current[0])
+        elif current:
+            batches.append(current)
+        return batches
+
+    def map_prompt(self, chunk: str, index: int, total: int | None) -> str:
+        """
+        Create the extraction prompt for one transcript chunk.
+
+        Args:
+            chunk: Transcript chunk
+            index: 1-based chunk number
+            total: Number of chunks (None while the meeting is still being recorded)
+
+        Returns:
+            str: Formatted prompt
+        """
+        position = (
+            f"part {index} of {total} of a meeting transcription"
+            if total
+            else f"part {index} of a meeting transcription that is still being recorded"
+        )
+        return f"""This is {position}.
+
+Extract ONLY what is said in this part:
+
+1. **Summary**: 1-2 sentences on what this part covers
+2. **Key Points**: Important points, each one sentence
+3. **Action Items**: Clear tasks with owners (owner null if not stated)
+4. **Decisions**: Decisions made in this part
+5. **Participants**: Names mentioned in this part
+
+Transcription part:
+{chunk}
+
+Return valid JSON with empty arrays [] for sections without data:
+{_JSON_SCHEMA}"""
+
+    def _reduce_prompt(self, parts: list[dict]) -> str:
+        """Create the merge prompt for a batch of partial summaries."""
+        return f"""These are notes extracted from consecutive parts of one meeting, in order.
+
+Merge them into ONE BRIEF, PRECISE summary of the whole meeting:
+
+1. **Summary**: 2-3 sentences maximum capturing the core purpose and outcome
+2. **Key Points**: Top 3-5 points only, merging duplicates
+3. **Action Items**: Every distinct task, once, with its owner
+4. **Decisions**: Top 3 critical decisions, merging duplicates
+5. **Participants**: Every distinct name, once
+
+Notes:
+{json.dumps(parts, indent=1)}
+
+Return valid JSON with empty arrays [] for sections without data:
+{_JSON_SCHEMA}"""
+
+
+def _normalize(text: str) -> str:
+    """Lowercase text and strip punctuation for duplicate detection."""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
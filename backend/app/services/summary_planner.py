@@ -0,0 +1,156 @@
+"""
+Token budget planner for summary requests.
+
+Estimates prompt tokens locally before any model call, picks the route
+(fast single call, single call, or map-reduce) and the completion budget,
+so over-length requests are never sent.
+"""
+
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from app.core.settings import settings
+from app.services.summary_engine import ENGINE_SYSTEM_PROMPT, MAP_MAX_TOKENS, SummaryEngine
+from app.utils.tokens import count_tokens
+
+# Context windows of supported chat models (prompt + completion tokens)
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 16385  # Reason: Conservative for unknown models
+
+MESSAGE_OVERHEAD_TOKENS = 4  # Reason: Role and separators per chat message
+REPLY_OVERHEAD_TOKENS = 3  # Reason: Every reply is primed with <|start|>assistant
+FAST_PATH_MAX_TOKENS = 500  # Reason: A short meeting needs a short summary
+MIN_CHUNK_TOKENS = 500
+
+
+class SummaryRoute(str, Enum):
+    """How a transcript is summarized."""
+
+    FAST = "fast"  # Reason: Short meeting - one call with a small completion budget
+    SINGLE = "single"  # Reason: One call with the full completion budget
+    CHUNKED = "chunked"  # Reason: Map-reduce through the SummaryEngine
+    INCREMENTAL = "incremental"  # Reason: Running summary updated while a live meeting records
+
+
+@dataclass(frozen=True)
+class SummaryPlan:
+    """
+    Planned summary request.
+
+    Attributes:
+        route: Summarization route
+        transcript_tokens: Tokens in the transcript
+        prompt_tokens: Estimated prompt tokens (for chunked plans, of the map calls)
+        max_tokens: Completion budget per call
+        chunk_tokens: Transcript tokens per map call (chunked plans)
+    """
+
+    route: SummaryRoute
+    transcript_tokens: int
+    prompt_tokens: int
+    max_tokens: int
+    chunk_tokens: int
+
+
+class SummaryPlanner:
+    """Plans summary requests against a model's context window."""
+
+    def __init__(
+        self,
+        engine: SummaryEngine,
+        fast_path_tokens: int | None = None,
+        context_window: int | None = None,
+    ) -> None:
+        """
+        Initialize summary planner.
+
+        Args:
+            engine: Map-reduce engine used for long transcripts (model and chunk size)
+            fast_path_tokens: Longest transcript taking the fast path (defaults to settings)
+            context_window: Model context window (defaults to MODEL_CONTEXT_WINDOWS)
+        """
+        self.engine = engine
+        self.fast_path_tokens = (
+            settings.summary_fast_path_tokens if fast_path_tokens is None else fast_path_tokens
+        )
+        self.context_window = context_window or MODEL_CONTEXT_WINDOWS.get(
+            engine.model, DEFAULT_CONTEXT_WINDOW
+        )
+
+    def estimate_prompt_tokens(self, system_prompt: str, prompt: str) -> int:
+        """
+        Estimate the prompt tokens of a system + user chat request.
+
+        Args:
+            system_prompt: System message
+            prompt: User message
+
+        Returns:
+            int: Estimated prompt tokens
+        """
+        return (
+            count_tokens(system_prompt, self.engine.model)
+            + count_tokens(prompt, self.engine.model)
+            + 2 * MESSAGE_OVERHEAD_TOKENS
+            + REPLY_OVERHEAD_TOKENS
+        )
+
+    def plan(
+        self,
+        transcript: str,
+        system_prompt: str,
+        build_prompt: Callable[[str], str],
+        max_tokens: int,
+    ) -> SummaryPlan:
+        """
+        Plan the summary request for a transcript.
+
+        Args:
+            transcript: Transcript text
+            system_prompt: System message of single-call requests
+            build_prompt: Builds the single-call user message from the transcript
+            max_tokens: Full completion budget
+
+        Returns:
+            SummaryPlan: Route, token estimate and budgets
+        """
+        chunk_tokens = self.engine.chunk_tokens
+        transcript_tokens = count_tokens(transcript, self.engine.model)
+        prompt_tokens = self.estimate_prompt_tokens(system_prompt, build_prompt(transcript))
+
+        if transcript_tokens <= self.fast_path_tokens:
+            budget = min(max_tokens, FAST_PATH_MAX_TOKENS)
+            if prompt_tokens + budget <= self.context_window:
+                return SummaryPlan(
+                    SummaryRoute.FAST, transcript_tokens, prompt_tokens, budget, chunk_tokens
+                )
+
+        if transcript_tokens <= chunk_tokens and prompt_tokens + max_tokens <= self.context_window:
+            return SummaryPlan(
+                SummaryRoute.SINGLE, transcript_tokens, prompt_tokens, max_tokens, chunk_tokens
+            )
+
+        map_template_tokens = self.estimate_prompt_tokens(
+            ENGINE_SYSTEM_PROMPT, self.engine.map_prompt("", 1, 1)
+        )
+        # Reason: Each map call must fit too, whatever the configured chunk size
+        chunk_tokens = min(
+            chunk_tokens,
+            max(MIN_CHUNK_TOKENS, self.context_window - map_template_tokens - MAP_MAX_TOKENS),
+        )
+        chunks = math.ceil(transcript_tokens / chunk_tokens)
+        return SummaryPlan(
+            SummaryRoute.CHUNKED,
+            transcript_tokens,
+            transcript_tokens + chunks * map_template_tokens,
+            MAP_MAX_TOKENS,
+            chunk_tokens,
+        )
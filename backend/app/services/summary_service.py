@@ -2,18 +2,43 @@
 Summary service using OpenAI GPT API.
 
 Handles meeting summary generation and structured data extraction.
+Transcripts too long for one prompt go through the map-reduce SummaryEngine;
+live recordings keep a running summary updated from each new stretch of transcript.
 """
 
-import json
+from datetime import datetime
 from uuid import UUID
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.ai_client import get_openai_client
+from app.core.database import execute
 from app.core.settings import settings
 from app.models.audio import AudioStatus
 from app.models.summary import Summary, SummaryStatus
 from app.models.transcription import Transcription
+from app.services.response_cache import SUMMARY, invalidate_response
+from app.services.search_service import SearchService
+from app.services.summary_cache import SummaryCache, get_summary_cache
+from app.services.summary_engine import (
+    ReduceStrategy,
+    SummaryEngine,
+    TokenUsage,
+    merge_summaries,
+    parse_summary,
+)
+from app.services.summary_planner import SummaryPlanner, SummaryRoute
+
+# Bump whenever _create_summary_prompt or the system prompt changes
+# Reason: Part of the summary cache key so stale results are not reused
+PROMPT_VERSION = "concise-v1"
+
+SYSTEM_PROMPT = "You are a precise meeting notes assistant. Extract ONLY essential information. Be extremely concise. Return valid JSON only."
+SUMMARY_MAX_TOKENS = 1200  # Reason: Reduced for more concise output
+SUMMARY_TEMPERATURE = 0.5  # Reason: Lower temperature for more focused responses
 
 
 class SummaryService:
@@ -23,22 +48,35 @@ class SummaryService:
     Manages summary generation and structured data extraction.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session | AsyncSession, client: AsyncOpenAI | None = None) -> None:
         """
         Initialize summary service.
 
         Args:
-            db: Database session
+            db: Database session (async sessions support the *_async lookups only)
+            client: OpenAI client (defaults to the shared process-wide client)
         """
         self.db = db
-        self.client = OpenAI(api_key=settings.openai_api_key)
-
-    async def generate_summary(self, transcription: Transcription) -> Summary:
+        self.client = client or get_openai_client()
+        self.cache = get_summary_cache()
+        self.engine = SummaryEngine(self.client, max_tokens=SUMMARY_MAX_TOKENS)
+        self.planner = SummaryPlanner(self.engine)
+        self.search = SearchService(db)
+
+    async def generate_summary(
+        self, transcription: Transcription, use_cache: bool = True
+    ) -> Summary:
         """
         Generate summary from transcription using OpenAI GPT API.
 
+        The planner picks the route (fast, single or chunked) and completion
+        budget before any call; estimated and actual prompt tokens are stored
+        on the summary. Identical transcripts summarized with the same model
+        and prompt settings are served from the summary cache with tokens_used=0.
+
         Args:
             transcription: Transcription database record
+            use_cache: Whether to read from and write to the summary cache
 
         Returns:
             Summary: Created summary record
@@ -46,81 +84,239 @@ class SummaryService:
         Raises:
             Exception: If summary generation fails
         """
+        # Reason: Plan before any call, so over-length requests are never sent
+        text = transcription.full_text or ""
+        plan = self.planner.plan(
+            text, SYSTEM_PROMPT, self._create_summary_prompt, SUMMARY_MAX_TOKENS
+        )
+        chunked = plan.route is SummaryRoute.CHUNKED
+
         # Create summary record
-        summary = Summary(
-            transcription_id=transcription.id,
-            status=SummaryStatus.IN_PROGRESS.value,
-            model_used=settings.gpt_model,
+        # Reason: Reuse the row of a previous failed attempt when the job is retried
+        summary = self.get_summary_by_transcription_id(transcription.id) or Summary(
+            transcription_id=transcription.id
         )
+        summary.status = SummaryStatus.IN_PROGRESS.value
+        summary.model_used = settings.gpt_model
+        summary.route = plan.route.value
+        summary.estimated_prompt_tokens = plan.prompt_tokens
+        summary.error_message = None
         self.db.add(summary)
         self.db.commit()
         self.db.refresh(summary)
-
-        try:
-            # Create prompt for GPT
-            prompt = self._create_summary_prompt(transcription.full_text)
-
-            # Call OpenAI GPT API
-            response = self.client.chat.completions.create(
-                model=settings.gpt_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a precise meeting notes assistant. Extract ONLY essential information. Be extremely concise. Return valid JSON only.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=1200,  # Reason: Reduced for more concise output
-                temperature=0.5,  # Reason: Lower temperature for more focused responses
+        invalidate_response(SUMMARY, summary.id)
+
+        cache_key = None
+        if use_cache and self.cache:
+            cache_key = SummaryCache.make_key(
+                text,
+                settings.gpt_model,
+                (
+                    f"{PROMPT_VERSION}+{self.engine.version(plan.chunk_tokens)}"
+                    if chunked
+                    else PROMPT_VERSION
+                ),
+                SUMMARY_TEMPERATURE,
+                plan.max_tokens,
             )
 
-            # Extract response text
-            response_text = response.choices[0].message.content
-
-            # Parse JSON response
-            try:
-                summary_data = json.loads(response_text)
-            except json.JSONDecodeError:
-                # Fallback: Use raw text if JSON parsing fails
-                summary_data = {
-                    "summary": response_text,
-                    "key_points": [],
-                    "action_items": [],
-                    "decisions": [],
-                    "participants": [],
-                }
+        try:
+            summary_data = await self.cache.get(cache_key) if cache_key else None
+
+            if summary_data is not None:
+                # Reason: No API call was made, so no tokens were spent
+                summary.tokens_used = 0
+                summary.prompt_tokens = 0
+                summary.cache_hit = True
+            else:
+                if chunked:
+                    summary_data, usage = await self.engine.summarize(text, plan.chunk_tokens)
+                else:
+                    summary_data, usage = await self._request_summary(text, plan.max_tokens)
+                summary.tokens_used = usage.total_tokens
+                summary.prompt_tokens = usage.prompt_tokens
+                # Reason: The row is reused on retry and reprocessing
+                summary.cache_hit = False
+                if cache_key:
+                    await self.cache.put(cache_key, summary_data)
 
             # Update summary record
-            summary.summary_text = summary_data.get("summary", "")
-            summary.key_points = summary_data.get("key_points", [])
-            summary.action_items = summary_data.get("action_items", [])
-            summary.decisions = summary_data.get("decisions", [])
-            summary.participants = summary_data.get("participants", [])
-            summary.tokens_used = response.usage.total_tokens
+            self._store_summary_data(summary, summary_data)
             summary.status = SummaryStatus.COMPLETED.value
 
             # Update audio file status to completed
             if transcription.audio_file:
                 transcription.audio_file.status = AudioStatus.COMPLETED.value
 
+            self.search.index_summary(summary)
             self.db.commit()
             self.db.refresh(summary)
+            invalidate_response(SUMMARY, summary.id)
 
             return summary
 
         except Exception as e:
-            # Update summary with error
+            # Reason: A failed flush leaves the session unusable until rolled back
+            self.db.rollback()
+            # Reason: The audio status is left to the worker, which may still retry the stage
             summary.status = SummaryStatus.FAILED.value
-            summary.error_message = str(e)
+            summary.error_message = str(e)[:1000]
+            self.db.commit()
+            invalidate_response(SUMMARY, summary.id)
+            raise
+
+    async def update_running_summary(
+        self, transcription: Transcription, text: str, part: int
+    ) -> Summary:
+        """
+        Fold newly transcribed text of a live meeting into its running summary.
+
+        Only the new text is sent to the model (one extraction call); the
+        result is merged locally into the state stored on the summary, which
+        stays in progress and readable while the meeting goes on.
+
+        Args:
+            transcription: Transcription of the meeting (may still be in progress)
+            text: Transcript text since the previous update
+            part: 1-based update number
 
-            # Update audio file status
+        Returns:
+            Summary: Summary holding the running state
+        """
+        summary = self.get_summary_by_transcription_id(transcription.id) or Summary(
+            transcription_id=transcription.id,
+            status=SummaryStatus.IN_PROGRESS.value,
+            model_used=settings.gpt_model,
+            route=SummaryRoute.INCREMENTAL.value,
+            tokens_used=0,
+            prompt_tokens=0,
+        )
+        extracted, usage = await self.engine.extract(text, part)
+        self._store_summary_data(summary, merge_summaries([self._summary_data(summary), extracted]))
+        self._add_usage(summary, usage)
+        self.db.add(summary)
+        self.db.commit()
+        self.db.refresh(summary)
+        invalidate_response(SUMMARY, summary.id)
+        return summary
+
+    async def finalize_running_summary(
+        self, transcription: Transcription, text: str, part: int
+    ) -> Summary:
+        """
+        Complete the running summary of a live meeting that has ended.
+
+        The text since the last update is folded in, then the running state
+        is merged into the final summary: as is with the local reduce
+        strategy, or by one reduce call over the state (not the transcript).
+
+        Args:
+            transcription: Completed transcription of the meeting
+            text: Transcript text since the last update
+            part: 1-based number of this last update
+
+        Returns:
+            Summary: Completed summary record
+
+        Raises:
+            LookupError: If the meeting has no running summary
+            Exception: If a model call fails (the summary is marked failed)
+        """
+        summary = self.get_summary_by_transcription_id(transcription.id)
+        if summary is None:
+            raise LookupError(f"No running summary for transcription {transcription.id}")
+
+        try:
+            summary_data = self._summary_data(summary)
+            if text.strip():
+                extracted, usage = await self.engine.extract(text, part)
+                summary_data = merge_summaries([summary_data, extracted])
+                self._add_usage(summary, usage)
+            if self.engine.reduce_strategy is ReduceStrategy.LLM:
+                summary_data, usage = await self.engine.reduce([summary_data])
+                self._add_usage(summary, usage)
+
+            self._store_summary_data(summary, summary_data)
+            summary.status = SummaryStatus.COMPLETED.value
+            summary.error_message = None
             if transcription.audio_file:
-                transcription.audio_file.status = AudioStatus.FAILED.value
-                transcription.audio_file.error_message = f"Summary generation failed: {str(e)}"
+                transcription.audio_file.status = AudioStatus.COMPLETED.value
+
+            self.search.index_summary(summary)
+            self.db.commit()
+            self.db.refresh(summary)
+            invalidate_response(SUMMARY, summary.id)
+            return summary
 
+        except Exception as e:
+            # Reason: A failed flush leaves the session unusable for this and the caller's fallback
+            self.db.rollback()
+            # Reason: The audio file is left alone - the caller falls back to a full summary
+            summary.status = SummaryStatus.FAILED.value
+            summary.error_message = str(e)[:1000]
             self.db.commit()
+            invalidate_response(SUMMARY, summary.id)
             raise
 
+    @staticmethod
+    def _summary_data(summary: Summary) -> dict:
+        """Read the summary fields stored on a summary record."""
+        return {
+            "summary": summary.summary_text or "",
+            "key_points": summary.key_points or [],
+            "action_items": summary.action_items or [],
+            "decisions": summary.decisions or [],
+            "participants": summary.participants or [],
+        }
+
+    @staticmethod
+    def _store_summary_data(summary: Summary, summary_data: dict) -> None:
+        """Write summary fields onto a summary record."""
+        summary.summary_text = summary_data.get("summary", "")
+        summary.key_points = summary_data.get("key_points", [])
+        summary.action_items = summary_data.get("action_items", [])
+        summary.decisions = summary_data.get("decisions", [])
+        summary.participants = summary_data.get("participants", [])
+
+    @staticmethod
+    def _add_usage(summary: Summary, usage: TokenUsage) -> None:
+        """Add the tokens of further model calls to a summary record."""
+        summary.tokens_used = (summary.tokens_used or 0) + usage.total_tokens
+        summary.prompt_tokens = (summary.prompt_tokens or 0) + usage.prompt_tokens
+
+    async def _request_summary(
+        self, transcription_text: str, max_tokens: int = SUMMARY_MAX_TOKENS
+    ) -> tuple[dict, TokenUsage]:
+        """
+        Call OpenAI GPT API and parse the structured summary.
+
+        Args:
+            transcription_text: Full transcription text
+            max_tokens: Completion budget chosen by the planner
+
+        Returns:
+            Tuple[dict, TokenUsage]: (summary data, token usage)
+        """
+        # Create prompt for GPT
+        prompt = self._create_summary_prompt(transcription_text)
+
+        # Call OpenAI GPT API
+        response = await self.client.chat.completions.create(
+            model=settings.gpt_model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=max_tokens,
+            temperature=SUMMARY_TEMPERATURE,
+        )
+
+        # Extract response text
+        response_text = response.choices[0].message.content
+
+        # Parse JSON response
+        return parse_summary(response_text), TokenUsage.from_response(response)
+
     def get_summary_by_id(self, summary_id: UUID) -> Summary | None:
         """
         Get summary by ID.
@@ -133,6 +329,50 @@ class SummaryService:
         """
         return self.db.query(Summary).filter(Summary.id == summary_id).first()
 
+    async def get_summary_by_id_async(self, summary_id: UUID) -> Summary | None:
+        """
+        Get summary by ID on a sync or async session.
+
+        Args:
+            summary_id: UUID of summary
+
+        Returns:
+            Optional[Summary]: Summary or None if not found
+        """
+        result = await execute(self.db, select(Summary).where(Summary.id == summary_id))
+        return result.scalars().first()
+
+    async def get_summaries_by_ids_async(self, summary_ids: list[UUID]) -> dict[UUID, Summary]:
+        """
+        Get several summaries with one IN query, on a sync or async session.
+
+        Args:
+            summary_ids: UUIDs of summaries
+
+        Returns:
+            dict[UUID, Summary]: Summaries found, by ID
+        """
+        if not summary_ids:
+            return {}
+        result = await execute(self.db, select(Summary).where(Summary.id.in_(summary_ids)))
+        return {summary.id: summary for summary in result.scalars().all()}
+
+    async def get_summary_version_async(self, summary_id: UUID) -> tuple[datetime, str] | None:
+        """
+        Get the modification time and status of a summary, without its content.
+
+        Args:
+            summary_id: UUID of summary
+
+        Returns:
+            Optional[Tuple[datetime, str]]: (updated_at, status) or None if not found
+        """
+        result = await execute(
+            self.db, select(Summary.updated_at, Summary.status).where(Summary.id == summary_id)
+        )
+        row = result.first()
+        return (row.updated_at, row.status) if row else None
+
     def get_summary_by_transcription_id(self, transcription_id: UUID) -> Summary | None:
         """
         Get summary by transcription ID.
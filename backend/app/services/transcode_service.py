@@ -0,0 +1,112 @@
+"""
+Transcode service for preparing uploads for transcription.
+
+Converts uploads to compact 16 kHz mono audio in a process pool, so
+Whisper requests carry far fewer bytes and the event loop stays free.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.services.storage_service import StorageService
+from app.utils.audio import AudioDecodeError, transcode_for_speech
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_transcode_pool() -> ProcessPoolExecutor:
+    """
+    Return the process-wide transcoding pool, creating it on first use.
+
+    Returns:
+        ProcessPoolExecutor: Pool of settings.transcode_workers processes
+    """
+    global _pool
+    if _pool is None:
+        # Reason: Forking a process that runs an event loop and threads is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.transcode_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_transcode_pool() -> None:
+    """Stop the transcoding pool's processes (a new pool starts on next use)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+    _pool = None
+
+
+class TranscodeService:
+    """
+    Service for transcoding uploads before transcription.
+
+    The original upload is kept for playback; the transcoded copy is only
+    kept when it is smaller.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initialize transcode service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+        self.storage = StorageService()
+
+    async def transcode_audio(self, audio_file: AudioFile) -> AudioFile:
+        """
+        Create the compact copy of an upload that transcription reads.
+
+        Recordings that cannot be decoded locally are left as uploaded.
+
+        Args:
+            audio_file: Audio file database record
+
+        Returns:
+            AudioFile: Updated audio file record
+        """
+        # Reason: A retried job must not transcode again
+        if audio_file.transcoded_path and os.path.exists(audio_file.transcoded_path):
+            return audio_file
+
+        loop = asyncio.get_running_loop()
+        try:
+            output = await loop.run_in_executor(
+                get_transcode_pool(),
+                transcode_for_speech,
+                audio_file.file_path,
+                self.storage.transcoded_stem(audio_file.id),
+                settings.transcode_bitrate_kbps,
+                # Reason: The stage timeout cannot cancel work inside the process pool
+                settings.processing_timeout_seconds,
+            )
+        except AudioDecodeError as e:
+            # Reason: Whisper accepts formats we cannot decode here - send the original
+            logger.info("Not transcoding audio %s: %s", audio_file.id, e)
+            return audio_file
+
+        size = os.path.getsize(output)
+        if size >= audio_file.file_size:
+            self.storage.delete_audio_file(str(output))
+            return audio_file
+
+        audio_file.transcoded_path = str(output)
+        audio_file.transcoded_size = size
+        self.db.commit()
+        logger.info(
+            "Transcoded audio %s from %d to %d bytes", audio_file.id, audio_file.file_size, size
+        )
+        return audio_file
@@ -0,0 +1,224 @@
+"""
+Transcription cache service.
+
+Persists Whisper results so identical audio is only transcribed once.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_cache_stats
+from app.core.settings import settings
+from app.models.cache_counter import CacheCounter
+from app.models.transcription_cache import TranscriptionCacheEntry
+from app.utils.transcript import TextSegment
+
+# Name of this cache in the stats registry and the cache_counters table
+CACHE_NAME = "transcription"
+
+# In-process hit/miss/eviction counters for this cache
+stats = get_cache_stats(CACHE_NAME)
+
+
+class TranscriptionCache:
+    """
+    Database-backed cache of Whisper results.
+
+    Entries are keyed by (audio content hash, Whisper model, request options)
+    and evicted least-recently-used when the entry or size bound is exceeded.
+    """
+
+    def __init__(self, db: Session) -> None:
+        """
+        Initialize transcription cache.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    @staticmethod
+    def make_key(content_hash: str, model: str, options: dict[str, Any]) -> str:
+        """
+        Build the cache key for a transcription request.
+
+        Args:
+            content_hash: SHA-256 of the audio content
+            model: Whisper model name
+            options: Request options that affect the result
+
+        Returns:
+            str: Hex SHA-256 cache key
+        """
+        payload = json.dumps([content_hash, model, options], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, cache_key: str) -> TranscriptionCacheEntry | None:
+        """
+        Look up a cached transcription and record the access.
+
+        Args:
+            cache_key: Key from make_key
+
+        Returns:
+            Optional[TranscriptionCacheEntry]: Cached result or None on miss
+        """
+        entry = self.db.get(TranscriptionCacheEntry, cache_key)
+        if entry is None:
+            stats.misses += 1
+            self._count(misses=1)
+            self.db.commit()
+            return None
+
+        stats.hits += 1
+        self._count(hits=1)
+        entry.hit_count += 1
+        entry.last_accessed_at = datetime.utcnow()
+        self.db.commit()
+
+        return entry
+
+    def put(
+        self,
+        cache_key: str,
+        content_hash: str,
+        model: str,
+        options: dict[str, Any],
+        full_text: str | None,
+        language: str | None,
+        duration_seconds: float | None,
+        segments: list[TextSegment] | None = None,
+    ) -> TranscriptionCacheEntry:
+        """
+        Store a transcription result and enforce the size bounds.
+
+        Args:
+            cache_key: Key from make_key
+            content_hash: SHA-256 of the audio content
+            model: Whisper model name
+            options: Request options used
+            full_text: Transcribed text
+            language: Detected language
+            duration_seconds: Audio duration reported by Whisper
+            segments: Timed segments of the transcript
+
+        Returns:
+            TranscriptionCacheEntry: Stored entry
+        """
+        values = {
+            "content_hash": content_hash,
+            "model": model,
+            "options": options,
+            "full_text": full_text,
+            "language": language,
+            "duration_seconds": duration_seconds,
+            "segments": [[segment.start, segment.end, segment.text] for segment in segments or []],
+            # Reason: Segment texts repeat the full text, roughly doubling the entry
+            "size_bytes": len((full_text or "").encode("utf-8"))
+            + sum(len(segment.text.encode("utf-8")) for segment in segments or []),
+            "last_accessed_at": datetime.utcnow(),
+        }
+
+        entry = self.db.get(TranscriptionCacheEntry, cache_key) or TranscriptionCacheEntry(
+            cache_key=cache_key, hit_count=0
+        )
+        for name, value in values.items():
+            setattr(entry, name, value)
+        self.db.add(entry)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Reason: Another worker cached the same audio since the lookup - update its entry
+            self.db.rollback()
+            entry = self.db.get(TranscriptionCacheEntry, cache_key)
+            for name, value in values.items():
+                setattr(entry, name, value)
+            self.db.commit()
+        self.evict()
+
+        return entry
+
+    def _count(self, **increments: int) -> None:
+        """
+        Add to the shared counters of this cache (not committed).
+
+        Lookups run in the worker processes, so the counters live in the
+        database where the API's stats endpoint can read them.
+
+        Args:
+            increments: Amount to add per counter (hits, misses, evictions)
+        """
+        values = {
+            getattr(CacheCounter, name): getattr(CacheCounter, name) + amount
+            for name, amount in increments.items()
+        }
+        counters = self.db.query(CacheCounter).filter(CacheCounter.name == CACHE_NAME)
+        if counters.update(values, synchronize_session=False):
+            return
+        try:
+            # Reason: First lookup ever - another process may create the row concurrently
+            with self.db.begin_nested():
+                self.db.add(CacheCounter(name=CACHE_NAME, **increments))
+        except IntegrityError:
+            counters.update(values, synchronize_session=False)
+
+    @staticmethod
+    def segments_of(entry: TranscriptionCacheEntry) -> list[TextSegment]:
+        """
+        Return the timed segments stored in a cache entry.
+
+        Args:
+            entry: Cached result
+
+        Returns:
+            list[TextSegment]: Segments (empty for entries cached without them)
+        """
+        return [TextSegment(start, end, text) for start, end, text in entry.segments or []]
+
+    def evict(self) -> int:
+        """
+        Remove least-recently-used entries until both bounds are met.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        max_entries = settings.transcription_cache_max_entries
+        max_bytes = settings.transcription_cache_max_mb * 1024 * 1024
+
+        count, total_bytes = self.db.query(
+            func.count(TranscriptionCacheEntry.cache_key),
+            func.coalesce(func.sum(TranscriptionCacheEntry.size_bytes), 0),
+        ).one()
+
+        if count <= max_entries and total_bytes <= max_bytes:
+            return 0
+
+        oldest_first = (
+            self.db.query(TranscriptionCacheEntry.cache_key, TranscriptionCacheEntry.size_bytes)
+            .order_by(TranscriptionCacheEntry.last_accessed_at.asc())
+            .all()
+        )
+
+        # Reason: Drop oldest entries only until both bounds are satisfied
+        stale_keys = []
+        for cache_key, size_bytes in oldest_first:
+            if count <= max_entries and total_bytes <= max_bytes:
+                break
+            stale_keys.append(cache_key)
+            count -= 1
+            total_bytes -= size_bytes
+
+        self.db.query(TranscriptionCacheEntry).filter(
+            TranscriptionCacheEntry.cache_key.in_(stale_keys)
+        ).delete(synchronize_session=False)
+        self._count(evictions=len(stale_keys))
+        self.db.commit()
+        stats.evictions += len(stale_keys)
+
+        return len(stale_keys)
@@ -1,18 +1,51 @@
 """
 Transcription service using OpenAI Whisper API.
 
-Handles audio transcription through the Whisper API.
+Handles audio transcription through the Whisper API. Long silences are cut
+out before sending, and long recordings are split at pauses and the chunks
+transcribed concurrently.
 """
 
+import asyncio
+import logging
+import tempfile
 import time
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
 from uuid import UUID
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.ai_client import get_openai_client
+from app.core.database import close_session, execute
 from app.core.settings import settings
 from app.models.audio import AudioFile, AudioStatus
+from app.models.transcript_segment import TranscriptSegment
 from app.models.transcription import Transcription, TranscriptionStatus
+from app.services.response_cache import TRANSCRIPTION, invalidate_response
+from app.services.search_service import SearchService
+from app.services.transcription_cache import TranscriptionCache
+from app.utils.audio import AudioDecodeError, ChunkSpan, encode_wav, measure_energy, plan_chunks
+from app.utils.transcript import (
+    ChunkTranscript,
+    StitchedTranscript,
+    TextSegment,
+    parse_segments,
+    stitch_chunks,
+)
+from app.utils.vad import SpeechMap, detect_speech, write_speech
+
+logger = logging.getLogger(__name__)
+
+# Whisper request options that affect the result (part of the cache key)
+TRANSCRIPTION_OPTIONS = {"response_format": "verbose_json"}
+
+TEXT_CHUNK_CHARS = 64 * 1024  # Reason: Characters read per query when streaming the text
+MAX_SEGMENT_SECONDS = 30  # Reason: Whisper decodes 30 s windows, segments never span more
 
 
 class TranscriptionService:
@@ -22,22 +55,31 @@ class TranscriptionService:
     Manages transcription jobs and Whisper API integration.
     """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: Session | AsyncSession, client: AsyncOpenAI | None = None) -> None:
         """
         Initialize transcription service.
 
         Args:
-            db: Database session
+            db: Database session (async sessions support the *_async lookups only)
+            client: OpenAI client (defaults to the shared process-wide client)
         """
         self.db = db
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = client or get_openai_client()
+        self.cache = TranscriptionCache(db)
+        self.search = SearchService(db)
 
-    async def transcribe_audio(self, audio_file: AudioFile) -> Transcription:
+    async def transcribe_audio(
+        self, audio_file: AudioFile, use_cache: bool = True
+    ) -> Transcription:
         """
         Transcribe audio file using Whisper API.
 
+        Results are reused from the transcription cache when the same audio
+        content was already transcribed with the same model and options.
+
         Args:
             audio_file: Audio file database record
+            use_cache: Whether to read from and write to the transcription cache
 
         Returns:
             Transcription: Created transcription record
@@ -46,59 +88,365 @@ class TranscriptionService:
             Exception: If transcription fails
         """
         # Create transcription record
-        transcription = Transcription(
-            audio_file_id=audio_file.id,
-            status=TranscriptionStatus.IN_PROGRESS.value,
+        # Reason: Reuse the row of a previous failed attempt when the job is retried
+        transcription = self.get_transcription_by_audio_id(audio_file.id) or Transcription(
+            audio_file_id=audio_file.id
         )
+        transcription.status = TranscriptionStatus.IN_PROGRESS.value
+        transcription.error_message = None
         self.db.add(transcription)
         self.db.commit()
         self.db.refresh(transcription)
+        invalidate_response(TRANSCRIPTION, transcription.id)
 
         # Update audio status
         audio_file.status = AudioStatus.PROCESSING.value
+        audio_file.error_message = None
         self.db.commit()
 
         start_time = time.time()
 
+        cache_key = None
+        if use_cache and settings.transcription_cache_enabled and audio_file.content_hash:
+            cache_key = TranscriptionCache.make_key(
+                audio_file.content_hash, settings.whisper_model, TRANSCRIPTION_OPTIONS
+            )
+
         try:
-            # Call Whisper API
-            with open(audio_file.file_path, "rb") as audio:
-                response = self.client.audio.transcriptions.create(
-                    model=settings.whisper_model,
-                    file=audio,
-                    response_format="verbose_json",  # Reason: Get additional metadata
+            cached = self.cache.get(cache_key) if cache_key else None
+
+            if cached:
+                # Reason: Identical audio already transcribed - skip the Whisper call
+                full_text = cached.full_text
+                language = cached.language
+                duration = cached.duration_seconds
+                segments = TranscriptionCache.segments_of(cached)
+            else:
+                # Call Whisper API
+                full_text, language, duration, segments, silence_removed = await self._call_whisper(
+                    audio_file
                 )
 
+                if cache_key:
+                    self._cache_result(
+                        cache_key, audio_file.content_hash, full_text, language, duration, segments
+                    )
+
             # Calculate processing time
             processing_time_ms = int((time.time() - start_time) * 1000)
 
             # Update transcription record
-            transcription.full_text = response.text
-            transcription.language = getattr(response, "language", None)
+            transcription.full_text = full_text
+            transcription.language = language
             transcription.processing_time_ms = processing_time_ms
+            transcription.cache_hit = cached is not None
+            transcription.silence_removed_seconds = None if cached else silence_removed
             transcription.status = TranscriptionStatus.COMPLETED.value
 
             # Update audio file duration if available
-            if hasattr(response, "duration"):
-                audio_file.duration_seconds = response.duration
+            if duration is not None:
+                audio_file.duration_seconds = duration
 
+            self._replace_segments(transcription.id, segments)
+            self.search.index_transcription(transcription)
             self.db.commit()
             self.db.refresh(transcription)
+            invalidate_response(TRANSCRIPTION, transcription.id)
 
             return transcription
 
         except Exception as e:
-            # Update transcription with error
+            # Reason: A failed flush leaves the session unusable until rolled back
+            self.db.rollback()
+            # Reason: The audio status is left to the worker, which may still retry the stage
             transcription.status = TranscriptionStatus.FAILED.value
             transcription.error_message = str(e)
+            self.db.commit()
+            invalidate_response(TRANSCRIPTION, transcription.id)
+            raise
 
-            # Update audio file status
-            audio_file.status = AudioStatus.FAILED.value
-            audio_file.error_message = f"Transcription failed: {str(e)}"
+    def _cache_result(
+        self,
+        cache_key: str,
+        content_hash: str,
+        full_text: str,
+        language: str | None,
+        duration: float | None,
+        segments: list[TextSegment],
+    ) -> None:
+        """
+        Store a Whisper result in the transcription cache.
 
-            self.db.commit()
+        A failed cache write is logged and rolled back; it never fails the
+        transcription, whose result has already been paid for.
+
+        Args:
+            cache_key: Key from TranscriptionCache.make_key
+            content_hash: SHA-256 of the audio content
+            full_text: Transcribed text
+            language: Detected language
+            duration: Audio duration reported by Whisper
+            segments: Timed segments of the transcript
+        """
+        try:
+            self.cache.put(
+                cache_key,
+                content_hash,
+                settings.whisper_model,
+                TRANSCRIPTION_OPTIONS,
+                full_text,
+                language,
+                duration,
+                segments,
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.warning("Caching transcription %s failed: %s", cache_key, e)
+
+    async def _call_whisper(
+        self, audio_file: AudioFile
+    ) -> tuple[str, str | None, float | None, list[TextSegment], float]:
+        """
+        Transcribe a recording with long silences cut out.
+
+        Segment timestamps always refer to the original recording.
+
+        Args:
+            audio_file: Audio file database record
+
+        Returns:
+            tuple[str, str | None, float | None, list[TextSegment], float]: Text, language,
+                duration (seconds), timed segments and seconds of silence removed
+        """
+        speech_map = await self._detect_speech(audio_file) if settings.vad_enabled else None
+        if speech_map is None:
+            return (*await self._transcribe_file(audio_file.speech_path), 0.0)
+
+        with tempfile.TemporaryDirectory() as workdir:
+            trimmed_path = Path(workdir) / "speech.wav"
+            await asyncio.to_thread(write_speech, audio_file.speech_path, speech_map, trimmed_path)
+            text, language, _, segments = await self._transcribe_file(trimmed_path)
+
+        logger.info(
+            "Removed %.1fs of silence from audio %s", speech_map.removed_seconds, audio_file.id
+        )
+        return (
+            text,
+            language,
+            speech_map.duration,
+            speech_map.map_segments(segments),
+            speech_map.removed_seconds,
+        )
+
+    async def _detect_speech(self, audio_file: AudioFile) -> SpeechMap | None:
+        """
+        Find the silences worth cutting from a recording.
+
+        Args:
+            audio_file: Audio file database record
+
+        Returns:
+            Optional[SpeechMap]: Spans to keep, or None to send the recording unchanged
+        """
+        try:
+            speech_map = await asyncio.to_thread(
+                detect_speech,
+                audio_file.speech_path,
+                min_silence_seconds=settings.vad_min_silence_seconds,
+                padding_seconds=settings.vad_padding_seconds,
+                gap_seconds=settings.vad_gap_seconds,
+            )
+        except AudioDecodeError as e:
+            logger.info("Not trimming silence from audio %s: %s", audio_file.id, e)
+            return None
+
+        # Reason: No speech found is more likely a detection miss than an empty meeting
+        if not speech_map.spans or speech_map.removed_seconds < settings.vad_min_removed_seconds:
+            return None
+        return speech_map
+
+    async def _transcribe_file(
+        self, file_path: str | Path
+    ) -> tuple[str, str | None, float | None, list[TextSegment]]:
+        """
+        Transcribe an audio file, in concurrent chunks when it is long.
+
+        Args:
+            file_path: Path of the audio to send
+
+        Returns:
+            tuple[str, str | None, float | None, list[TextSegment]]: Text, language,
+                duration (seconds) and timed segments
+        """
+        spans = None
+        if settings.transcription_chunking_enabled:
+            spans = await self._plan_chunks(file_path)
+
+        if spans and len(spans) > 1:
+            stitched = await self._transcribe_chunks(file_path, spans)
+            return stitched.text, stitched.language, stitched.duration, stitched.segments
+
+        with open(file_path, "rb") as audio:
+            response = await self.client.audio.transcriptions.create(
+                model=settings.whisper_model,
+                file=audio,
+                **TRANSCRIPTION_OPTIONS,  # Reason: verbose_json returns additional metadata
+            )
+        return (
+            response.text,
+            getattr(response, "language", None),
+            getattr(response, "duration", None),
+            parse_segments(getattr(response, "segments", None)),
+        )
+
+    def _replace_segments(self, transcription_id: UUID, segments: list[TextSegment]) -> None:
+        """
+        Store the timed segments of a transcription, replacing earlier ones (not committed).
+
+        Args:
+            transcription_id: UUID of transcription
+            segments: Segments on the recording timeline
+        """
+        self.db.execute(
+            delete(TranscriptSegment).where(TranscriptSegment.transcription_id == transcription_id)
+        )
+        self.db.add_all(
+            TranscriptSegment(
+                transcription_id=transcription_id,
+                position=position,
+                start_ms=round(segment.start * 1000),
+                end_ms=round(segment.end * 1000),
+                text=segment.text,
+            )
+            for position, segment in enumerate(segments)
+        )
+
+    async def _plan_chunks(self, file_path: str | Path) -> list[ChunkSpan] | None:
+        """
+        Plan silence-aligned chunks for a recording.
+
+        Args:
+            file_path: Path of the recording
+
+        Returns:
+            Optional[list[ChunkSpan]]: Chunks, or None if the audio cannot be decoded locally
+        """
+        try:
+            energies, duration = await asyncio.to_thread(measure_energy, file_path)
+        except AudioDecodeError as e:
+            # Reason: Whisper accepts formats we cannot decode here - send the file whole
+            logger.info("Not chunking audio %s: %s", file_path, e)
+            return None
+
+        return plan_chunks(
+            energies,
+            duration,
+            chunk_seconds=settings.transcription_chunk_seconds,
+            overlap_seconds=settings.transcription_chunk_overlap_seconds,
+            search_seconds=settings.transcription_silence_search_seconds,
+        )
+
+    async def _transcribe_chunks(
+        self, file_path: str | Path, spans: list[ChunkSpan]
+    ) -> StitchedTranscript:
+        """
+        Transcribe chunks concurrently and stitch the results.
+
+        At most settings.transcription_max_concurrency chunks are extracted
+        and in flight at once, which also bounds memory use.
+
+        Args:
+            file_path: Path of the recording
+            spans: Planned chunks
+
+        Returns:
+            StitchedTranscript: Combined transcript
+        """
+        semaphore = asyncio.Semaphore(settings.transcription_max_concurrency)
+
+        async def transcribe(span: ChunkSpan) -> ChunkTranscript:
+            async with semaphore:
+                data = await asyncio.to_thread(encode_wav, file_path, span.start, span.end)
+                return await self.transcribe_chunk(
+                    span, f"chunk-{span.index:03d}.wav", data, "audio/wav"
+                )
+
+        tasks = [asyncio.create_task(transcribe(span)) for span in spans]
+        try:
+            chunks = await asyncio.gather(*tasks)
+        except BaseException:
+            # Reason: One failed chunk fails the transcription - stop paying for the rest
+            for task in tasks:
+                task.cancel()
             raise
 
+        return stitch_chunks(list(chunks), duration=spans[-1].keep_end)
+
+    async def transcribe_chunk(
+        self, span: ChunkSpan, filename: str, data: bytes, media_type: str
+    ) -> ChunkTranscript:
+        """
+        Transcribe one chunk of a recording with a single Whisper request.
+
+        Args:
+            span: Position of the chunk in the recording
+            filename: Name sent with the audio (Whisper infers the format from it)
+            data: Encoded audio of the chunk
+            media_type: Media type of data
+
+        Returns:
+            ChunkTranscript: Chunk text with chunk-local segment timestamps
+        """
+        response = await self.client.audio.transcriptions.create(
+            model=settings.whisper_model,
+            file=(filename, data, media_type),
+            **TRANSCRIPTION_OPTIONS,
+        )
+        return ChunkTranscript(
+            span=span,
+            text=response.text,
+            language=getattr(response, "language", None),
+            segments=parse_segments(getattr(response, "segments", None)),
+        )
+
+    def save_transcript(
+        self, audio_file: AudioFile, transcript: StitchedTranscript, processing_time_ms: int
+    ) -> Transcription:
+        """
+        Store a transcript assembled outside transcribe_audio, such as a live recording's.
+
+        The transcription row and segments are added to the current
+        transaction and committed with it.
+
+        Args:
+            audio_file: Audio file database record
+            transcript: Transcript on the recording timeline
+            processing_time_ms: Time spent producing the transcript
+
+        Returns:
+            Transcription: Completed transcription record
+        """
+        transcription = self.get_transcription_by_audio_id(audio_file.id) or Transcription(
+            audio_file_id=audio_file.id
+        )
+        self.db.add(transcription)
+        self.db.flush()
+
+        transcription.full_text = transcript.text
+        transcription.language = transcript.language
+        transcription.processing_time_ms = processing_time_ms
+        transcription.cache_hit = False
+        transcription.error_message = None
+        transcription.status = TranscriptionStatus.COMPLETED.value
+        audio_file.duration_seconds = transcript.duration
+
+        self._replace_segments(transcription.id, transcript.segments)
+        self.search.index_transcription(transcription)
+        self.db.commit()
+        self.db.refresh(transcription)
+        invalidate_response(TRANSCRIPTION, transcription.id)
+        return transcription
+
     def get_transcription_by_id(self, transcription_id: UUID) -> Transcription | None:
         """
         Get transcription by ID.
@@ -111,6 +459,103 @@ class TranscriptionService:
         """
         return self.db.query(Transcription).filter(Transcription.id == transcription_id).first()
 
+    async def get_transcription_by_id_async(self, transcription_id: UUID) -> Transcription | None:
+        """
+        Get transcription by ID on a sync or async session.
+
+        Args:
+            transcription_id: UUID of transcription
+
+        Returns:
+            Optional[Transcription]: Transcription or None if not found
+        """
+        result = await execute(
+            self.db, select(Transcription).where(Transcription.id == transcription_id)
+        )
+        return result.scalars().first()
+
+    async def get_transcription_version_async(
+        self, transcription_id: UUID
+    ) -> tuple[datetime, str] | None:
+        """
+        Get the modification time and status of a transcription, without its text.
+
+        Args:
+            transcription_id: UUID of transcription
+
+        Returns:
+            Optional[Tuple[datetime, str]]: (updated_at, status) or None if not found
+        """
+        result = await execute(
+            self.db,
+            select(Transcription.updated_at, Transcription.status).where(
+                Transcription.id == transcription_id
+            ),
+        )
+        row = result.first()
+        return (row.updated_at, row.status) if row else None
+
+    async def get_segments_async(
+        self, transcription_id: UUID, start: float, end: float | None = None
+    ) -> list[TranscriptSegment]:
+        """
+        Get the segments of a transcription that overlap a time range.
+
+        Only the matching rows are read, through the (transcription_id,
+        start_ms) index; the full text is never loaded.
+
+        Args:
+            transcription_id: UUID of transcription
+            start: Range start (seconds)
+            end: Range end (seconds), None for the end of the recording
+
+        Returns:
+            list[TranscriptSegment]: Overlapping segments in transcript order
+        """
+        start_ms = round(start * 1000)
+        query = select(TranscriptSegment).where(
+            TranscriptSegment.transcription_id == transcription_id,
+            # Reason: Bounds the index scan - no segment is longer than one Whisper window
+            TranscriptSegment.start_ms > start_ms - MAX_SEGMENT_SECONDS * 1000,
+            TranscriptSegment.end_ms > start_ms,
+        )
+        if end is not None:
+            query = query.where(TranscriptSegment.start_ms < round(end * 1000))
+        result = await execute(
+            self.db, query.order_by(TranscriptSegment.start_ms, TranscriptSegment.position)
+        )
+        return list(result.scalars())
+
+    async def stream_text_async(self, transcription_id: UUID) -> AsyncIterator[str]:
+        """
+        Read the full text of a transcription in chunks.
+
+        Each chunk is cut out by the database (substr), so neither the
+        process nor the connection ever holds the whole text, and the
+        connection is returned to the pool between chunks.
+
+        Args:
+            transcription_id: UUID of transcription
+
+        Yields:
+            str: Consecutive pieces of at most TEXT_CHUNK_CHARS characters
+        """
+        position = 1  # Reason: SQL substr positions are 1-based
+        while True:
+            result = await execute(
+                self.db,
+                select(func.substr(Transcription.full_text, position, TEXT_CHUNK_CHARS)).where(
+                    Transcription.id == transcription_id
+                ),
+            )
+            chunk = result.scalar()
+            await close_session(self.db)
+            if chunk:
+                yield chunk
+            if not chunk or len(chunk) < TEXT_CHUNK_CHARS:
+                return
+            position += TEXT_CHUNK_CHARS
+
     def get_transcription_by_audio_id(self, audio_id: UUID) -> Transcription | None:
         """
         Get transcription by audio file ID.
@@ -0,0 +1,183 @@
+"""
+Database upgrade entry point.
+
+Base.metadata.create_all creates missing tables but never alters existing
+ones, so a database created by an earlier release lacks the columns and
+indexes added since. This adds them, drops the unique constraint on
+audio_files.file_path (content-addressed uploads share one file), then
+backfills the full-text index and the embeddings of processed meetings.
+Run once after upgrading, with the API and workers stopped:
+
+    python -m app.upgrade
+"""
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import Column, Connection, Index, exists, inspect, literal, select, text
+from sqlalchemy.orm import Session
+
+from app.core.database import Base, SessionLocal, engine, init_db
+from app.models.audio import AudioFile, AudioStatus
+from app.models.embedding import Embedding
+from app.models.summary import Summary, SummaryStatus
+from app.models.transcription import Transcription, TranscriptionStatus
+from app.services.embedding_service import EmbeddingService
+from app.services.search_service import SearchService
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_ROWS = 500  # Reason: Commit the backfill in bounded transactions
+
+
+def upgrade_schema(connection: Connection) -> list[str]:
+    """
+    Add the columns and indexes that existing tables are missing.
+
+    Args:
+        connection: Connection inside a transaction
+
+    Returns:
+        list[str]: Descriptions of the changes made
+
+    Raises:
+        ValueError: If a missing NOT NULL column has no scalar default
+    """
+    inspector = inspect(connection)
+    changes = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in columns:
+                connection.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN {_column_ddl(column, connection)}")
+                )
+                changes.append(f"added column {table.name}.{column.name}")
+
+        indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in indexes and _applies_to(index, connection):
+                index.create(connection)
+                changes.append(f"created index {index.name}")
+
+    for constraint in inspector.get_unique_constraints(AudioFile.__tablename__):
+        if constraint["column_names"] != ["file_path"]:
+            continue
+        if connection.dialect.name == "postgresql":
+            connection.execute(
+                text(f'ALTER TABLE audio_files DROP CONSTRAINT "{constraint["name"]}"')
+            )
+            changes.append(f"dropped constraint {constraint['name']}")
+        else:
+            # Reason: SQLite cannot drop a column constraint without rebuilding the table
+            logger.warning(
+                "audio_files.file_path stays unique on SQLite; keep STORAGE_MODE=flat "
+                "or recreate the database to use content-addressed storage"
+            )
+    return changes
+
+
+def backfill_search_index(db: Session) -> int:
+    """
+    Index the text of completed transcriptions and summaries.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of rows indexed
+    """
+    search = SearchService(db)
+    count = 0
+    for model, index, status in (
+        (Transcription, search.index_transcription, TranscriptionStatus.COMPLETED),
+        (Summary, search.index_summary, SummaryStatus.COMPLETED),
+    ):
+        for row in db.scalars(select(model).where(model.status == status.value)):
+            index(row)
+            count += 1
+            if count % BACKFILL_BATCH_ROWS == 0:
+                db.commit()
+    db.commit()
+    return count
+
+
+async def backfill_embeddings(db: Session) -> int:
+    """
+    Embed completed meetings that have no embeddings yet.
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of meetings embedded
+    """
+    audio_ids = db.scalars(
+        select(AudioFile.id).where(
+            AudioFile.status == AudioStatus.COMPLETED.value,
+            ~exists().where(Embedding.audio_file_id == AudioFile.id),
+        )
+    ).all()
+    service = EmbeddingService(db)
+    for audio_id in audio_ids:
+        try:
+            await service.embed_meeting(audio_id)
+        except LookupError:
+            # Reason: Completed meetings without a transcription have nothing to embed
+            continue
+    return len(audio_ids)
+
+
+def _column_ddl(column: Column, connection: Connection) -> str:
+    """Render a column definition for ALTER TABLE ADD COLUMN."""
+    ddl = f"{column.name} {column.type.compile(dialect=connection.dialect)}"
+    if column.nullable:
+        return ddl
+    default = column.default.arg if column.default is not None else None
+    if default is None or callable(default):
+        raise ValueError(f"Cannot add NOT NULL column {column} without a scalar default")
+    value = literal(default, column.type).compile(
+        dialect=connection.dialect, compile_kwargs={"literal_binds": True}
+    )
+    return f"{ddl} DEFAULT {value} NOT NULL"
+
+
+def _applies_to(index: Index, connection: Connection) -> bool:
+    """Whether an index created with ddl_if applies to the connection's dialect."""
+    ddl_if = index._ddl_if
+    return ddl_if is None or ddl_if.dialect in (None, connection.dialect.name)
+
+
+def main(backfill: bool) -> None:
+    """
+    Upgrade the configured database.
+
+    Args:
+        backfill: Also index and embed meetings processed before the upgrade
+    """
+    init_db()
+    with engine.begin() as connection:
+        for change in upgrade_schema(connection):
+            logger.info("Schema: %s", change)
+
+    if not backfill:
+        return
+    with SessionLocal() as db:
+        logger.info("Indexed %d transcripts and summaries", backfill_search_index(db))
+        logger.info("Embedded %d meetings", asyncio.run(backfill_embeddings(db)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Meeting Notes Summarizer database upgrade")
+    parser.add_argument(
+        "--skip-backfill",
+        action="store_true",
+        help="Only upgrade the schema; do not index or embed existing meetings",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    main(backfill=not args.skip_backfill)
@@ -0,0 +1,324 @@
+"""
+Audio decoding and silence-aware chunk planning.
+
+Decodes recordings to 16 kHz mono PCM (the stdlib wave module for PCM WAV,
+ffmpeg for everything else), transcodes them to compact speech audio,
+measures per-frame energy, and places chunk boundaries in the quietest
+stretch before each target cut.
+"""
+
+import io
+import shutil
+import subprocess
+import wave
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+SAMPLE_RATE = 16000  # Reason: Whisper resamples to 16 kHz mono internally
+FRAME_SECONDS = 0.03
+_BLOCK_SECONDS = 30  # Reason: Decode in blocks so long recordings never sit in memory
+_PAUSE_SECONDS = 0.3  # Reason: Smoothing window, so a cut lands in a pause, not a plosive
+
+
+class AudioDecodeError(Exception):
+    """Raised when a recording cannot be decoded to PCM."""
+
+
+@dataclass(frozen=True)
+class ChunkSpan:
+    """
+    A slice of a recording sent as one transcription request.
+
+    Attributes:
+        index: Position of the chunk in the recording
+        start: Start of the audio sent, including leading overlap (seconds)
+        end: End of the audio sent, including trailing overlap (seconds)
+        keep_start: Start of the region this chunk is authoritative for
+        keep_end: End of the region this chunk is authoritative for
+    """
+
+    index: int
+    start: float
+    end: float
+    keep_start: float
+    keep_end: float
+
+
+def iter_pcm(
+    file_path: str | Path, start: float = 0.0, duration: float | None = None
+) -> Iterator[np.ndarray]:
+    """
+    Decode a recording to blocks of 16 kHz mono int16 samples.
+
+    Args:
+        file_path: Path of the recording
+        start: Offset to start decoding at (seconds)
+        duration: Seconds to decode (None for the rest of the recording)
+
+    Yields:
+        np.ndarray: Block of int16 samples
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded
+    """
+    if _is_pcm_wav(file_path):
+        yield from _iter_wav(file_path, start, duration)
+    else:
+        yield from _iter_ffmpeg(file_path, start, duration)
+
+
+def measure_energy(file_path: str | Path) -> tuple[np.ndarray, float]:
+    """
+    Compute the RMS energy of every FRAME_SECONDS frame of a recording.
+
+    Args:
+        file_path: Path of the recording
+
+    Returns:
+        tuple[np.ndarray, float]: Per-frame energies and duration in seconds
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded or is empty
+    """
+    energies, _, duration = measure_frames(file_path)
+    return energies, duration
+
+
+def measure_frames(file_path: str | Path) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    Compute RMS energy and zero-crossing rate of every FRAME_SECONDS frame.
+
+    Args:
+        file_path: Path of the recording
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, float]: Per-frame energies, per-frame share
+            of samples where the sign flips, and duration in seconds
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded or is empty
+    """
+    frame = int(SAMPLE_RATE * FRAME_SECONDS)
+    energies: list[np.ndarray] = []
+    crossings: list[np.ndarray] = []
+    carry = np.empty(0, dtype=np.int16)
+    total_samples = 0
+
+    for block in iter_pcm(file_path):
+        total_samples += len(block)
+        samples = np.concatenate([carry, block])
+        usable = len(samples) // frame * frame
+        frames = samples[:usable].astype(np.float32).reshape(-1, frame)
+        energies.append(np.sqrt((frames**2).mean(axis=1)))
+        crossings.append(np.count_nonzero(np.diff(frames < 0, axis=1), axis=1) / frame)
+        carry = samples[usable:]
+
+    if total_samples == 0:
+        raise AudioDecodeError("Recording contains no audio")
+    return np.concatenate(energies), np.concatenate(crossings), total_samples / SAMPLE_RATE
+
+
+def plan_chunks(
+    energies: np.ndarray,
+    duration: float,
+    chunk_seconds: float,
+    overlap_seconds: float,
+    search_seconds: float,
+) -> list[ChunkSpan]:
+    """
+    Split a recording into chunks that end in pauses.
+
+    Each cut is placed at the quietest point of the search window that ends
+    at the target chunk length, so chunks never exceed chunk_seconds plus
+    overlap. Neighbouring chunks overlap so words at a cut are not lost.
+
+    Args:
+        energies: Per-frame energies from measure_energy
+        duration: Recording duration in seconds
+        chunk_seconds: Maximum chunk length
+        overlap_seconds: Audio shared by neighbouring chunks
+        search_seconds: Window before each target cut searched for a pause
+
+    Returns:
+        list[ChunkSpan]: Chunks in recording order (one chunk if short enough)
+    """
+    window = max(1, int(_PAUSE_SECONDS / FRAME_SECONDS))
+    smoothed = np.convolve(energies, np.ones(window) / window, mode="same")
+
+    cuts = [0.0]
+    while duration - cuts[-1] > chunk_seconds:
+        target = cuts[-1] + chunk_seconds
+        # Reason: Never search the first half of a chunk, so every cut makes progress
+        search_from = max(target - search_seconds, cuts[-1] + chunk_seconds / 2)
+        first = int(search_from / FRAME_SECONDS)
+        last = max(first + 1, int(target / FRAME_SECONDS))
+        quietest = first + int(np.argmin(smoothed[first:last]))
+        cuts.append(min(target, (quietest + 0.5) * FRAME_SECONDS))
+
+    bounds = cuts + [duration]
+    return [
+        ChunkSpan(
+            index=index,
+            start=max(0.0, keep_start - overlap_seconds),
+            end=min(duration, keep_end + overlap_seconds),
+            keep_start=keep_start,
+            keep_end=keep_end,
+        )
+        for index, (keep_start, keep_end) in enumerate(zip(bounds, bounds[1:], strict=False))
+    ]
+
+
+def encode_wav(file_path: str | Path, start: float, end: float) -> bytes:
+    """
+    Extract part of a recording as a 16 kHz mono 16-bit WAV file.
+
+    Args:
+        file_path: Path of the recording
+        start: Start of the extract (seconds)
+        end: End of the extract (seconds)
+
+    Returns:
+        bytes: WAV file contents
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded
+    """
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for block in iter_pcm(file_path, start, end - start):
+            wav.writeframes(block.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def transcode_for_speech(
+    file_path: str | Path,
+    output_stem: Path,
+    bitrate_kbps: int,
+    timeout_seconds: float | None = None,
+) -> Path:
+    """
+    Convert a recording to compact 16 kHz mono audio for speech recognition.
+
+    Uses ffmpeg to encode Opus when it is installed; otherwise PCM WAV input
+    is downmixed and resampled with NumPy and written as 16-bit WAV. Runs
+    in a worker process (CPU-bound, no event loop).
+
+    Args:
+        file_path: Path of the recording
+        output_stem: Output path without extension
+        bitrate_kbps: Opus bitrate
+        timeout_seconds: Kill ffmpeg after this long (None waits indefinitely)
+
+    Returns:
+        Path: Written file (.ogg or .wav)
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded, or ffmpeg timed out
+    """
+    output_stem.parent.mkdir(parents=True, exist_ok=True)
+    error = "ffmpeg is required to transcode non-WAV audio"
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is not None:
+        output = output_stem.with_suffix(".ogg")
+        command = [ffmpeg, "-nostdin", "-v", "error", "-y", "-i", str(file_path), "-vn"]
+        command += ["-ac", "1", "-ar", str(SAMPLE_RATE), "-c:a", "libopus"]
+        command += ["-b:a", f"{bitrate_kbps}k", "-application", "voip", str(output)]
+        try:
+            result = subprocess.run(command, capture_output=True, timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            # Reason: subprocess.run killed ffmpeg; a hostile file must not hold a pool process
+            output.unlink(missing_ok=True)
+            raise AudioDecodeError(f"ffmpeg did not finish within {timeout_seconds}s")
+        if result.returncode == 0:
+            return output
+        output.unlink(missing_ok=True)
+        error = result.stderr.decode(errors="replace").strip() or "ffmpeg could not transcode"
+
+    # Reason: Without ffmpeg (or libopus) PCM WAV can still be shrunk to 16 kHz mono
+    if not _is_pcm_wav(file_path):
+        raise AudioDecodeError(error)
+    output = output_stem.with_suffix(".wav")
+    with wave.open(str(output), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for block in _iter_wav(file_path, 0.0, None):
+            wav.writeframes(block.astype("<i2").tobytes())
+    return output
+
+
+def _is_pcm_wav(file_path: str | Path) -> bool:
+    """Check whether a file is 16-bit PCM WAV readable by the wave module."""
+    try:
+        with wave.open(str(file_path), "rb") as wav:
+            return wav.getsampwidth() == 2
+    except (wave.Error, EOFError):
+        return False
+
+
+def _to_mono_16k(samples: np.ndarray, channels: int, rate: int) -> np.ndarray:
+    """Downmix interleaved samples and resample them to SAMPLE_RATE."""
+    mono = samples.reshape(-1, channels).mean(axis=1) if channels > 1 else samples
+    if rate > SAMPLE_RATE and rate % SAMPLE_RATE == 0:
+        # Reason: Averaging each group of samples low-passes before decimating (less aliasing)
+        factor = rate // SAMPLE_RATE
+        usable = len(mono) // factor * factor
+        mono = mono[:usable].reshape(-1, factor).mean(axis=1)
+    elif rate != SAMPLE_RATE:
+        count = int(len(mono) * SAMPLE_RATE / rate)
+        positions = np.arange(count) * (rate / SAMPLE_RATE)
+        mono = np.interp(positions, np.arange(len(mono)), mono)
+    return mono.astype(np.int16)
+
+
+def _iter_wav(file_path: str | Path, start: float, duration: float | None) -> Iterator[np.ndarray]:
+    """Decode a PCM WAV file with the wave module."""
+    with wave.open(str(file_path), "rb") as wav:
+        rate, channels, total = wav.getframerate(), wav.getnchannels(), wav.getnframes()
+        wav.setpos(min(int(start * rate), total))
+        remaining = total - wav.tell()
+        if duration is not None:
+            remaining = min(remaining, int(duration * rate))
+
+        while remaining > 0:
+            data = wav.readframes(min(_BLOCK_SECONDS * rate, remaining))
+            if not data:
+                break
+            samples = np.frombuffer(data, dtype="<i2")
+            remaining -= len(samples) // channels
+            yield _to_mono_16k(samples, channels, rate)
+
+
+def _iter_ffmpeg(
+    file_path: str | Path, start: float, duration: float | None
+) -> Iterator[np.ndarray]:
+    """Decode any container/codec ffmpeg understands."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise AudioDecodeError("ffmpeg is required to decode non-WAV audio")
+
+    command = [ffmpeg, "-nostdin", "-v", "error", "-ss", f"{start:.3f}", "-i", str(file_path)]
+    if duration is not None:
+        command += ["-t", f"{duration:.3f}"]
+    command += ["-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "s16le", "-"]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        while data := process.stdout.read(_BLOCK_SECONDS * SAMPLE_RATE * 2):
+            yield np.frombuffer(data[: len(data) // 2 * 2], dtype="<i2")
+        error = process.stderr.read().decode(errors="replace").strip()
+        if process.wait() != 0:
+            raise AudioDecodeError(error or "ffmpeg could not decode the recording")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        process.stderr.close()
@@ -0,0 +1,254 @@
+"""
+EBML (Matroska/WebM) element reading.
+
+Decodes element IDs, sizes and values, and scans a growing WebM stream for
+the clusters it is cut into, so live recordings can be split while they are
+still being written.
+"""
+
+import struct
+from dataclasses import dataclass
+
+# Element IDs (marker bits included, as written in the file)
+EBML = 0x1A45DFA3
+DOC_TYPE = 0x4282
+SEGMENT = 0x18538067
+INFO = 0x1549A966
+TIMECODE_SCALE = 0x2AD7B1
+DURATION = 0x4489
+TRACKS = 0x1654AE6B
+TRACK_ENTRY = 0xAE
+TRACK_TYPE = 0x83
+AUDIO = 0xE1
+SAMPLING_FREQUENCY = 0xB5
+CHANNELS = 0x9F
+CLUSTER = 0x1F43B675
+TIMECODE = 0xE7
+SIMPLE_BLOCK = 0xA3
+BLOCK_GROUP = 0xA0
+BLOCK = 0xA1
+
+
+class EBMLError(ValueError):
+    """Raised when bytes do not form valid EBML elements."""
+
+
+def read_id(data: bytes, offset: int) -> tuple[int, int]:
+    """
+    Read an element ID.
+
+    Args:
+        data: Buffer to read from
+        offset: Position of the ID
+
+    Returns:
+        tuple[int, int]: ID (marker bit kept) and its length in bytes
+
+    Raises:
+        EBMLError: If no valid ID starts at offset
+    """
+    if offset >= len(data) or not data[offset]:
+        raise EBMLError("EBML element ID is corrupt")
+    length = 9 - data[offset].bit_length()
+    if length > 4 or offset + length > len(data):
+        raise EBMLError("EBML element ID is corrupt")
+    return int.from_bytes(data[offset : offset + length], "big"), length
+
+
+def read_size(data: bytes, offset: int) -> tuple[int | None, int]:
+    """
+    Read an element size (or any EBML varint).
+
+    Args:
+        data: Buffer to read from
+        offset: Position of the size
+
+    Returns:
+        tuple[int | None, int]: Value (None for the reserved "unknown size")
+            and its length in bytes
+
+    Raises:
+        EBMLError: If no valid varint starts at offset
+    """
+    if offset >= len(data) or not data[offset]:
+        raise EBMLError("EBML element size is corrupt")
+    length = 9 - data[offset].bit_length()
+    if offset + length > len(data):
+        raise EBMLError("EBML element size is corrupt")
+    value = int.from_bytes(data[offset : offset + length], "big") & ((1 << (7 * length)) - 1)
+    if value == (1 << (7 * length)) - 1:
+        return None, length
+    return value, length
+
+
+def elements(data: bytes, start: int, end: int) -> list[tuple[int, int, int]]:
+    """
+    List the elements in data[start:end]; a truncated last element is left out.
+
+    Returns:
+        list[tuple[int, int, int]]: (id, body start, body end) per element
+    """
+    found = []
+    offset = start
+    while offset < end:
+        element_id, id_length = read_id(data, offset)
+        element_size, size_length = read_size(data, offset + id_length)
+        body_start = offset + id_length + size_length
+        body_end = end if element_size is None else body_start + element_size
+        if body_end > end:
+            break
+        found.append((element_id, body_start, body_end))
+        offset = body_end
+    return found
+
+
+def children(data: bytes, start: int, end: int, wanted: int) -> list[tuple[int, int]]:
+    """Return the body bounds of every wanted element in data[start:end]."""
+    return [
+        (body_start, body_end)
+        for element_id, body_start, body_end in elements(data, start, end)
+        if element_id == wanted
+    ]
+
+
+def child(data: bytes, start: int, end: int, wanted: int) -> tuple[int, int] | None:
+    """Return the body bounds of the first wanted element in data[start:end], or None."""
+    found = children(data, start, end, wanted)
+    return found[0] if found else None
+
+
+def read_uint(data: bytes, bounds: tuple[int, int]) -> int:
+    """Decode an unsigned integer element body."""
+    return int.from_bytes(data[bounds[0] : bounds[1]], "big")
+
+
+def read_float(data: bytes, bounds: tuple[int, int]) -> float:
+    """Decode a float element body (4 or 8 bytes)."""
+    start, end = bounds
+    if end - start == 4:
+        return struct.unpack_from(">f", data, start)[0]
+    if end - start == 8:
+        return struct.unpack_from(">d", data, start)[0]
+    raise EBMLError("EBML float is corrupt")
+
+
+@dataclass(frozen=True)
+class ClusterStart:
+    """
+    Position of a cluster in a WebM stream.
+
+    Attributes:
+        offset: Byte offset of the cluster element in the stream
+        timecode: Cluster timestamp in timecode-scale units (milliseconds by default)
+    """
+
+    offset: int
+    timecode: int
+
+
+class ClusterScanner:
+    """
+    Incremental scanner for the clusters of a WebM stream.
+
+    Bytes are fed in arbitrary pieces, as a MediaRecorder delivers them.
+    Everything before the first cluster (EBML header, segment header,
+    Info, Tracks) is the init segment: prepended to any run of whole
+    clusters it makes a playable file. Only element headers are kept in
+    memory; block payloads are skipped.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scanner."""
+        self.clusters: list[ClusterStart] = []
+        self.init_size: int | None = None
+        self.timecode_scale = 1_000_000
+        self._buffer = bytearray()
+        self._buffer_offset = 0  # Reason: Stream offset of self._buffer[0]
+        self._skip = 0  # Reason: Payload bytes still to discard
+        self._pending_cluster: int | None = None  # Reason: Cluster still awaiting its Timecode
+        self._segment_started = False
+
+    def feed(self, data: bytes) -> list[ClusterStart]:
+        """
+        Scan the next bytes of the stream.
+
+        Args:
+            data: Bytes following everything fed before
+
+        Returns:
+            list[ClusterStart]: Clusters whose start was found in these bytes
+
+        Raises:
+            EBMLError: If the stream is not WebM
+        """
+        found_before = len(self.clusters)
+        if self._skip:
+            skipped = min(self._skip, len(data))
+            self._skip -= skipped
+            self._buffer_offset += skipped
+            data = data[skipped:]
+        self._buffer += data
+
+        while self._step():
+            pass
+        return self.clusters[found_before:]
+
+    def _step(self) -> bool:
+        """Consume one element header from the buffer; return False when more bytes are needed."""
+        if self._skip:
+            return False
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return False
+        try:
+            element_id, id_length = read_id(buffer, 0)
+            element_size, size_length = read_size(buffer, id_length)
+        except EBMLError:
+            # Reason: An ID or size cut off at the end of the buffer - wait for more bytes
+            if len(buffer) >= 12:
+                raise
+            return False
+        header_length = id_length + size_length
+        offset = self._buffer_offset
+
+        if not self._segment_started:
+            if element_id == EBML:
+                return self._consume(header_length, element_size)
+            if element_id != SEGMENT:
+                raise EBMLError("Stream is not a WebM segment")
+            self._segment_started = True
+            return self._consume(header_length, 0)
+
+        if element_id == CLUSTER:
+            if self.init_size is None:
+                self.init_size = offset
+            # Reason: Clusters of live streams have unknown size - step into them
+            self._pending_cluster = offset
+            return self._consume(header_length, 0)
+        if element_id == TIMECODE and self._pending_cluster is not None:
+            if element_size is None or len(buffer) < header_length + element_size:
+                return False
+            timecode = read_uint(buffer, (header_length, header_length + element_size))
+            self.clusters.append(ClusterStart(self._pending_cluster, timecode))
+            self._pending_cluster = None
+            return self._consume(header_length, element_size)
+        if element_id == INFO and element_size is not None:
+            # Reason: Keep Info whole to read TimecodeScale (a few dozen bytes)
+            if len(buffer) < header_length + element_size:
+                return False
+            scale = child(buffer, header_length, header_length + element_size, TIMECODE_SCALE)
+            if scale is not None:
+                self.timecode_scale = read_uint(buffer, scale)
+            return self._consume(header_length, element_size)
+        return self._consume(header_length, element_size)
+
+    def _consume(self, header_length: int, body_length: int | None) -> bool:
+        """Drop an element header from the buffer and skip body_length bytes after it."""
+        if body_length is None:
+            raise EBMLError("WebM element of unknown size outside a cluster")
+        consumed = header_length + body_length
+        available = min(consumed, len(self._buffer))
+        del self._buffer[:available]
+        self._buffer_offset += available
+        self._skip = consumed - available
+        return not self._skip
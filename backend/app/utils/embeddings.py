@@ -0,0 +1,160 @@
+"""
+Local text embeddings for semantic search.
+
+The default embedder is a hashing vectorizer: words and their character
+trigrams are hashed into a fixed number of signed buckets, so related word
+forms ("budget", "budgets", "budgeting") share most of their features. It
+needs no model download and no network. When sentence-transformers is
+installed, a local transformer model can be used instead.
+
+Vectors are L2-normalized and stored as int8 with one float scale each.
+"""
+
+import logging
+import math
+import re
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Protocol
+
+import numpy as np
+
+from app.core.settings import settings
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\w+")
+_TRIGRAM_WEIGHT = 0.5  # Reason: Whole words are stronger evidence than shared trigrams
+_STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it its of on or our so that the "
+    "their they this to was we were will with you".split()
+)
+
+
+class Embedder(Protocol):
+    """Turns texts into L2-normalized float32 vectors."""
+
+    name: str
+    dimensions: int
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts as an array of shape (len(texts), dimensions)."""
+
+
+class HashingEmbedder:
+    """Feature-hashing embedder (no model, no network)."""
+
+    def __init__(self, dimensions: int) -> None:
+        """
+        Initialize hashing embedder.
+
+        Args:
+            dimensions: Number of hash buckets (vector length)
+        """
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            np.ndarray: float32 array of shape (len(texts), dimensions), rows L2-normalized
+        """
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in _features(text).items():
+                # Reason: crc32 is stable across processes, unlike hash()
+                digest = zlib.crc32(feature.encode())
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                weight = _TRIGRAM_WEIGHT if feature.startswith("c:") else 1.0
+                vectors[row, digest % self.dimensions] += sign * weight * (1.0 + math.log(count))
+        return _normalize(vectors)
+
+
+class SentenceTransformerEmbedder:
+    """Local sentence-transformers model (CPU only)."""
+
+    def __init__(self, model_name: str) -> None:
+        """
+        Initialize transformer embedder.
+
+        Args:
+            model_name: Model name or local path
+        """
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+        self.name = f"st-{model_name}"[:100]
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed texts as L2-normalized float32 vectors."""
+        vectors = self.model.encode(texts, normalize_embeddings=True, convert_to_numpy=True)
+        return vectors.astype(np.float32)
+
+
+@lru_cache(maxsize=1)
+def get_embedder() -> Embedder:
+    """
+    Get the embedder configured by settings.embedding_backend.
+
+    Falls back to the hashing embedder when sentence-transformers is
+    requested but not installed.
+
+    Returns:
+        Embedder: Process-wide embedder
+
+    Raises:
+        ValueError: If the configured backend is unknown
+    """
+    if settings.embedding_backend == "sentence_transformers":
+        if SentenceTransformer is not None:
+            return SentenceTransformerEmbedder(settings.embedding_model)
+        logger.warning("sentence-transformers is not installed, using hashing embeddings")
+    elif settings.embedding_backend != "hashing":
+        raise ValueError(f"Unknown embedding backend: {settings.embedding_backend}")
+    return HashingEmbedder(settings.embedding_dimensions)
+
+
+def quantize(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize vectors to int8 with one scale per vector.
+
+    Args:
+        vectors: float32 array of shape (n, dimensions)
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: int8 codes and float32 scales; codes * scale
+            approximates the vector
+    """
+    peaks = np.abs(vectors).max(axis=1)
+    scales = np.where(peaks > 0, peaks / 127.0, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+def _features(text: str) -> Counter:
+    """Count the word and character-trigram features of a text."""
+    features: Counter = Counter()
+    for word in _WORD.findall(text.lower()):
+        if word in _STOP_WORDS:
+            continue
+        features[f"w:{word}"] += 1
+        padded = f"<{word}>"
+        for start in range(len(padded) - 2):
+            features[f"c:{padded[start:start + 3]}"] += 1
+    return features
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows, leaving zero rows unchanged."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
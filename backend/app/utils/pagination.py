@@ -0,0 +1,51 @@
+"""
+Keyset pagination cursors.
+
+A cursor is the sort key of the last row of a page, encoded as an opaque
+URL-safe token; the next page continues strictly after it.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a (created_at, id) sort key as a cursor.
+
+    Args:
+        created_at: Creation time of the last row of a page
+        row_id: ID of the last row of a page
+
+    Returns:
+        str: Opaque URL-safe cursor
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor created by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor
+
+    Returns:
+        tuple[datetime, UUID]: Sort key to continue after
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,426 @@
+"""
+Header-only probing of audio containers.
+
+Reads just the container structure of a recording (RIFF/WAV chunks, MP4
+atoms, WebM/EBML elements, MP3 frame headers) to find its real format,
+duration, sample rate and channel count without decoding any audio.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from app.utils import ebml
+
+_HEAD_BYTES = 64 * 1024  # Reason: Holds ID3 tags and the first MP3 frames in one read
+_TAIL_BYTES = 256 * 1024  # Reason: Holds the last WebM cluster of a browser recording
+_MAX_HEADER_BYTES = 64 * 2**20  # Reason: MP4 sample tables grow with length - bound the read
+
+_AUDIO_TRACK = 2  # Reason: Matroska TrackType of audio tracks
+
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # Reason: MPEG-1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),  # Reason: MPEG-2
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+# Extensions a file of each container format may carry
+FORMAT_EXTENSIONS = {
+    "wav": ("wav",),
+    "mp4": ("mp4", "m4a"),
+    "webm": ("webm",),
+    "mp3": ("mp3",),
+}
+_MIME_TYPES = {"wav": "audio/wav", "mp4": "audio/mp4", "webm": "audio/webm", "mp3": "audio/mpeg"}
+
+
+class ProbeError(Exception):
+    """Raised when a file is not a recognised audio container."""
+
+
+@dataclass(frozen=True)
+class AudioProbe:
+    """
+    Container metadata read from a recording's header.
+
+    Attributes:
+        format: Container format: wav, mp4, webm or mp3
+        duration_seconds: Duration (None if the container does not record it)
+        sample_rate: Sample rate of the audio track in Hz, if recorded
+        channels: Channel count of the audio track, if recorded
+    """
+
+    format: str
+    duration_seconds: float | None
+    sample_rate: int | None
+    channels: int | None
+
+    @property
+    def mime_type(self) -> str:
+        """Media type of the container."""
+        return _MIME_TYPES[self.format]
+
+
+def probe_audio(file_path: str | Path) -> AudioProbe:
+    """
+    Read format, duration, sample rate and channels from a recording's header.
+
+    Only headers are read (plus the tail of WebM recordings that do not
+    store their duration), so the cost does not depend on the file size.
+
+    Args:
+        file_path: Path of the recording
+
+    Returns:
+        AudioProbe: Container metadata
+
+    Raises:
+        ProbeError: If the file is not a WAV, MP4, WebM or MP3 recording
+        OSError: If the file cannot be read
+    """
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        magic = file.read(12)
+        try:
+            if magic[:4] == b"RIFF" and magic[8:12] == b"WAVE":
+                return _probe_wav(file, size)
+            if magic[4:8] == b"ftyp":
+                return _probe_mp4(file, size)
+            if magic[:4] == ebml.EBML.to_bytes(4, "big"):
+                return _probe_webm(file, size)
+            # Reason: MP3 has no magic number - look for a run of valid frame headers
+            return _probe_mp3(file, size)
+        except ebml.EBMLError as e:
+            raise ProbeError(str(e))
+        except (IndexError, struct.error) as e:
+            # Reason: A header cut short inside a field is a malformed upload, not a server error
+            raise ProbeError(f"Container header is corrupt: {e}")
+
+
+def _probe_wav(file: BinaryIO, size: int) -> AudioProbe:
+    """Read the fmt chunk and data chunk size of a RIFF/WAVE file."""
+    offset = 12
+    fmt: tuple[int, int, int] | None = None
+    while True:
+        file.seek(offset)
+        header = file.read(8)
+        if len(header) < 8:
+            raise ProbeError("WAV file has no data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+
+        if chunk_id == b"fmt ":
+            body = file.read(16)
+            if len(body) < 16:
+                raise ProbeError("WAV fmt chunk is truncated")
+            _, channels, rate, byte_rate = struct.unpack("<HHII", body[:12])
+            fmt = (channels, rate, byte_rate)
+        elif chunk_id == b"data":
+            if fmt is None or not fmt[2]:
+                raise ProbeError("WAV data chunk without a valid fmt chunk")
+            available = size - offset - 8
+            # Reason: Streaming writers leave the size 0 or 0xFFFFFFFF until they finish
+            data_size = min(chunk_size, available) if chunk_size else available
+            channels, rate, byte_rate = fmt
+            return AudioProbe("wav", data_size / byte_rate, rate or None, channels or None)
+
+        offset += 8 + chunk_size + (chunk_size & 1)
+
+
+def _probe_mp4(file: BinaryIO, size: int) -> AudioProbe:
+    """Find the moov box and read the duration and sample entry of its sound track."""
+    moov = _read_top_level_box(file, size, b"moov")
+    if moov is None:
+        raise ProbeError("MP4 file has no moov box")
+
+    duration = _mp4_duration(moov, _mp4_child(moov, 0, len(moov), b"mvhd"))
+    for kind, start, end in _mp4_boxes(moov, 0, len(moov)):
+        if kind != b"trak":
+            continue
+        hdlr = _mp4_child(moov, start, end, b"mdia", b"hdlr")
+        if hdlr is None or moov[hdlr[0] + 8 : hdlr[0] + 12] != b"soun":
+            continue
+
+        duration = _mp4_duration(moov, _mp4_child(moov, start, end, b"mdia", b"mdhd")) or duration
+        rate = channels = None
+        stsd = _mp4_child(moov, start, end, b"mdia", b"minf", b"stbl", b"stsd")
+        if stsd is not None and stsd[0] + 16 + 28 <= stsd[1]:
+            # Reason: Skip the entry count and the first entry's box header
+            entry = stsd[0] + 8 + 8
+            channels = struct.unpack_from(">H", moov, entry + 16)[0] or None
+            rate = (struct.unpack_from(">I", moov, entry + 24)[0] >> 16) or None
+        return AudioProbe("mp4", duration, rate, channels)
+
+    raise ProbeError("MP4 file has no audio track")
+
+
+def _read_top_level_box(file: BinaryIO, size: int, wanted: bytes) -> bytes | None:
+    """Seek over top-level MP4 boxes and return the payload of the wanted one."""
+    offset = 0
+    while offset + 8 <= size:
+        file.seek(offset)
+        header = file.read(16)
+        box_size, kind = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if box_size == 1:
+            if len(header) < 16:
+                break
+            box_size, header_size = struct.unpack(">Q", header[8:16])[0], 16
+        elif box_size == 0:
+            box_size = size - offset
+        if box_size < header_size:
+            raise ProbeError("MP4 box is corrupt")
+
+        if kind == wanted:
+            if box_size > _MAX_HEADER_BYTES:
+                raise ProbeError("MP4 header is too large")
+            file.seek(offset + header_size)
+            return file.read(box_size - header_size)
+        # Reason: mdat may come first - seeking past it reads none of the media
+        offset += box_size
+    return None
+
+
+def _mp4_boxes(data: bytes, start: int, end: int) -> list[tuple[bytes, int, int]]:
+    """List (type, payload start, payload end) of the boxes in data[start:end]."""
+    boxes = []
+    offset = start
+    while offset + 8 <= end:
+        box_size, kind = struct.unpack_from(">I4s", data, offset)
+        header_size = 8
+        if box_size == 1 and offset + 16 <= end:
+            box_size, header_size = struct.unpack_from(">Q", data, offset + 8)[0], 16
+        elif box_size == 0:
+            box_size = end - offset
+        if box_size < header_size:
+            raise ProbeError("MP4 box is corrupt")
+        boxes.append((kind, offset + header_size, min(offset + box_size, end)))
+        offset += box_size
+    return boxes
+
+
+def _mp4_child(data: bytes, start: int, end: int, *path: bytes) -> tuple[int, int] | None:
+    """Return the payload bounds of the first box along path, or None."""
+    for wanted in path:
+        for kind, box_start, box_end in _mp4_boxes(data, start, end):
+            if kind == wanted:
+                start, end = box_start, box_end
+                break
+        else:
+            return None
+    return start, end
+
+
+def _mp4_duration(data: bytes, bounds: tuple[int, int] | None) -> float | None:
+    """Read timescale and duration of an mvhd or mdhd box (versions 0 and 1)."""
+    if bounds is None:
+        return None
+    start, end = bounds
+    if start >= end:
+        return None
+    if data[start] == 1 and start + 32 <= end:
+        timescale, duration = struct.unpack_from(">IQ", data, start + 20)
+        unknown = 2**64 - 1
+    elif start + 20 <= end:
+        timescale, duration = struct.unpack_from(">II", data, start + 12)
+        unknown = 2**32 - 1
+    else:
+        return None
+    # Reason: Fragmented files leave the duration 0 (or all ones) in the header
+    if not timescale or not duration or duration == unknown:
+        return None
+    return duration / timescale
+
+
+def _probe_webm(file: BinaryIO, size: int) -> AudioProbe:
+    """Read the Info and Tracks elements of a WebM segment."""
+    file.seek(0)
+    header = file.read(1024)
+    element_id, id_length = ebml.read_id(header, 0)
+    body_size, size_length = ebml.read_size(header, id_length)
+    start = id_length + size_length
+    if element_id != ebml.EBML or body_size is None or start + body_size > len(header):
+        raise ProbeError("EBML header is corrupt")
+    doc_type = ebml.child(header, start, start + body_size, ebml.DOC_TYPE)
+    if doc_type is None or header[doc_type[0] : doc_type[1]].rstrip(b"\0") != b"webm":
+        raise ProbeError("EBML document is not WebM")
+
+    offset = start + body_size
+    file.seek(offset)
+    segment = file.read(12)
+    element_id, id_length = ebml.read_id(segment, 0)
+    segment_size, size_length = ebml.read_size(segment, id_length)
+    if element_id != ebml.SEGMENT:
+        raise ProbeError("WebM file has no segment")
+    offset += id_length + size_length
+    segment_end = size if segment_size is None else min(offset + segment_size, size)
+
+    info = tracks = None
+    while offset < segment_end and (info is None or tracks is None):
+        file.seek(offset)
+        header = file.read(12)
+        element_id, id_length = ebml.read_id(header, 0)
+        element_size, size_length = ebml.read_size(header, id_length)
+        # Reason: Clusters hold the media - the header elements all come before them
+        if element_id == ebml.CLUSTER or element_size is None:
+            break
+        if element_id in (ebml.INFO, ebml.TRACKS):
+            if element_size > _MAX_HEADER_BYTES:
+                raise ProbeError("WebM header is too large")
+            file.seek(offset + id_length + size_length)
+            body = file.read(element_size)
+            if element_id == ebml.INFO:
+                info = body
+            else:
+                tracks = body
+        offset += id_length + size_length + element_size
+
+    if tracks is None:
+        raise ProbeError("WebM file has no tracks")
+    rate = channels = None
+    for track_start, track_end in ebml.children(tracks, 0, len(tracks), ebml.TRACK_ENTRY):
+        track_type = ebml.child(tracks, track_start, track_end, ebml.TRACK_TYPE)
+        if track_type is None or ebml.read_uint(tracks, track_type) != _AUDIO_TRACK:
+            continue
+        audio = ebml.child(tracks, track_start, track_end, ebml.AUDIO)
+        if audio is not None:
+            frequency = ebml.child(tracks, *audio, ebml.SAMPLING_FREQUENCY)
+            count = ebml.child(tracks, *audio, ebml.CHANNELS)
+            # Reason: Matroska defaults when the elements are omitted
+            rate = round(ebml.read_float(tracks, frequency)) if frequency else 8000
+            channels = ebml.read_uint(tracks, count) if count else 1
+        break
+    else:
+        raise ProbeError("WebM file has no audio track")
+
+    timecode_scale = 1_000_000
+    duration = None
+    if info is not None:
+        scale = ebml.child(info, 0, len(info), ebml.TIMECODE_SCALE)
+        if scale is not None:
+            timecode_scale = ebml.read_uint(info, scale)
+        recorded = ebml.child(info, 0, len(info), ebml.DURATION)
+        if recorded is not None:
+            duration = ebml.read_float(info, recorded) * timecode_scale / 1e9
+    if duration is None:
+        # Reason: Browser MediaRecorder output has no Duration element
+        duration = _webm_tail_duration(file, size, timecode_scale)
+    return AudioProbe("webm", duration, rate, channels)
+
+
+def _webm_tail_duration(file: BinaryIO, size: int, timecode_scale: int) -> float | None:
+    """Estimate a WebM duration from the timestamp of the last block in the file."""
+    start = max(0, size - _TAIL_BYTES)
+    file.seek(start)
+    tail = file.read()
+    marker = ebml.CLUSTER.to_bytes(4, "big")
+
+    index = len(tail)
+    while (index := tail.rfind(marker, 0, index)) >= 0:
+        # Reason: The marker bytes may occur inside media data - only a parseable cluster counts
+        try:
+            timestamp = _cluster_end_time(tail, index)
+        except (IndexError, struct.error, ebml.EBMLError):
+            timestamp = None
+        if timestamp is not None:
+            return timestamp * timecode_scale / 1e9
+    return None
+
+
+def _cluster_end_time(data: bytes, offset: int) -> int | None:
+    """Return the timestamp of the last block of the cluster at offset, if it parses."""
+    cluster_size, size_length = ebml.read_size(data, offset + 4)
+    start = offset + 4 + size_length
+    end = len(data) if cluster_size is None else min(start + cluster_size, len(data))
+
+    elements = ebml.elements(data, start, end)
+    if not elements or elements[0][0] != ebml.TIMECODE:
+        return None
+    cluster_time = ebml.read_uint(data, elements[0][1:])
+
+    last = 0
+    for element_id, element_start, element_end in elements[1:]:
+        if element_id == ebml.BLOCK_GROUP:
+            block = ebml.child(data, element_start, element_end, ebml.BLOCK)
+            if block is None:
+                continue
+            element_start = block[0]
+        elif element_id != ebml.SIMPLE_BLOCK:
+            continue
+        # Reason: Block = track number (EBML varint), then a signed 16-bit relative timestamp
+        _, track_length = ebml.read_size(data, element_start)
+        last = max(last, struct.unpack_from(">h", data, element_start + track_length)[0])
+    return cluster_time + last
+
+
+def _probe_mp3(file: BinaryIO, size: int) -> AudioProbe:
+    """Find the first MPEG audio frame and read its Xing/VBRI header or bitrate."""
+    file.seek(0)
+    head = file.read(_HEAD_BYTES)
+    base = 0
+    if head[:3] == b"ID3" and len(head) >= 10:
+        # Reason: ID3v2 size is syncsafe (7 bits per byte); a footer adds 10 bytes
+        tag_size = sum((byte & 0x7F) << (7 * (3 - index)) for index, byte in enumerate(head[6:10]))
+        base = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+        file.seek(base)
+        head = file.read(_HEAD_BYTES)
+
+    offset = head.find(b"\xff")
+    while offset >= 0:
+        frame = _mp3_frame(head, offset)
+        # Reason: A single sync word can be chance - the next frame must follow it
+        if frame is not None and (
+            base + offset + frame[0] >= size or _mp3_frame(head, offset + frame[0]) is not None
+        ):
+            break
+        offset = head.find(b"\xff", offset + 1)
+    else:
+        raise ProbeError("No MPEG audio frames found")
+
+    length, rate, channels, samples, bitrate, version = frame
+    side_info = (32 if channels == 2 else 17) if version == 3 else (17 if channels == 2 else 9)
+    frames = None
+    xing = offset + 4 + side_info
+    if head[xing : xing + 4] in (b"Xing", b"Info") and len(head) >= xing + 12:
+        if struct.unpack_from(">I", head, xing + 4)[0] & 1:
+            frames = struct.unpack_from(">I", head, xing + 8)[0]
+    elif head[offset + 36 : offset + 40] == b"VBRI" and len(head) >= offset + 54:
+        frames = struct.unpack_from(">I", head, offset + 50)[0]
+
+    if frames:
+        duration = frames * samples / rate
+    else:
+        # Reason: Constant bitrate - every byte after the first frame is audio
+        audio_bytes = size - base - offset
+        file.seek(max(size - 128, 0))
+        if file.read(3) == b"TAG":
+            audio_bytes -= 128
+        duration = audio_bytes * 8 / (bitrate * 1000)
+    return AudioProbe("mp3", duration, rate, channels)
+
+
+def _mp3_frame(data: bytes, offset: int) -> tuple[int, int, int, int, int, int] | None:
+    """
+    Parse an MPEG Layer III frame header.
+
+    Returns:
+        Optional[tuple]: (frame length, sample rate, channels, samples per frame,
+            bitrate in kbit/s, version bits), or None if no valid header is at offset
+    """
+    if offset + 4 > len(data) or data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return None
+    version = (data[offset + 1] >> 3) & 3  # Reason: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5
+    layer = (data[offset + 1] >> 1) & 3  # Reason: 1 = Layer III
+    bitrate_index = data[offset + 2] >> 4
+    rate_index = (data[offset + 2] >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    bitrate = _MP3_BITRATES[3 if version == 3 else 2][bitrate_index]
+    rate = _MP3_SAMPLE_RATES[version][rate_index]
+    samples = 1152 if version == 3 else 576
+    padding = (data[offset + 2] >> 1) & 1
+    channels = 1 if data[offset + 3] >> 6 == 3 else 2
+    length = samples // 8 * bitrate * 1000 // rate + padding
+    return length, rate, channels, samples, bitrate, version
@@ -0,0 +1,101 @@
+"""
+Token counting and token-bounded text splitting.
+
+Uses tiktoken when it is installed and its encoding can be loaded; otherwise
+falls back to a characters-per-token estimate, which is close enough for
+budgeting prompts.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Any
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+_CHARS_PER_TOKEN = 4  # Reason: OpenAI's rule of thumb for English text
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str) -> Any | None:
+    """Load the tiktoken encoding for a model, or None to use the estimate."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # Reason: Encodings are downloaded on first use - offline hosts fall back
+        logger.warning("tiktoken unavailable for %s, estimating tokens: %s", model, e)
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Count (or estimate) the tokens in a text.
+
+    Args:
+        text: Text to measure
+        model: Model whose tokenizer applies
+
+    Returns:
+        int: Token count
+    """
+    encoding = _encoding(model)
+    if encoding is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def split_by_tokens(text: str, max_tokens: int, model: str) -> list[str]:
+    """
+    Split text into pieces of at most max_tokens, breaking between sentences.
+
+    Sentences longer than max_tokens are split between words.
+
+    Args:
+        text: Text to split
+        max_tokens: Token budget per piece
+        model: Model whose tokenizer applies
+
+    Returns:
+        list[str]: Pieces in order
+    """
+    pieces: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    def flush() -> None:
+        nonlocal current, current_tokens
+        if current:
+            pieces.append(" ".join(current))
+        current, current_tokens = [], 0
+
+    for sentence in filter(None, (part.strip() for part in _SENTENCE_BREAK.split(text))):
+        tokens = count_tokens(sentence, model) + 1
+        if tokens > max_tokens:
+            flush()
+            for word in sentence.split():
+                word_tokens = count_tokens(word, model) + 1
+                if current_tokens + word_tokens > max_tokens:
+                    flush()
+                current.append(word)
+                current_tokens += word_tokens
+            flush()
+            continue
+
+        if current_tokens + tokens > max_tokens:
+            flush()
+        current.append(sentence)
+        current_tokens += tokens
+
+    flush()
+    return pieces
@@ -0,0 +1,169 @@
+"""
+Stitching of per-chunk transcriptions into one transcript.
+
+Shifts chunk-local segment timestamps onto the recording timeline, keeps each
+segment only in the chunk that owns its midpoint, and removes words repeated
+across the overlap between neighbouring chunks.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from app.utils.audio import ChunkSpan
+
+_MAX_OVERLAP_WORDS = 30
+_MIN_OVERLAP_WORDS = 2  # Reason: A single shared word is usually a coincidence
+
+
+@dataclass(frozen=True)
+class TextSegment:
+    """
+    Transcribed text with its position in the audio.
+
+    Attributes:
+        start: Start time (seconds)
+        end: End time (seconds)
+        text: Transcribed text
+    """
+
+    start: float
+    end: float
+    text: str
+
+
+@dataclass(frozen=True)
+class ChunkTranscript:
+    """
+    Whisper result for one chunk, with chunk-local timestamps.
+
+    Attributes:
+        span: Chunk that was transcribed
+        text: Full chunk text
+        language: Detected language
+        segments: Timed segments relative to span.start
+    """
+
+    span: ChunkSpan
+    text: str
+    language: str | None = None
+    segments: list[TextSegment] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class StitchedTranscript:
+    """
+    Transcript of a whole recording assembled from chunks.
+
+    Attributes:
+        text: Full transcript text
+        language: Most common detected language
+        duration: Recording duration (seconds)
+        segments: Timed segments on the recording timeline
+    """
+
+    text: str
+    language: str | None
+    duration: float
+    segments: list[TextSegment]
+
+
+def parse_segments(raw_segments: list[Any] | None) -> list[TextSegment]:
+    """
+    Convert verbose_json segments (dicts or objects) to TextSegments.
+
+    Args:
+        raw_segments: Segments from a Whisper response
+
+    Returns:
+        list[TextSegment]: Parsed segments
+    """
+
+    def value(segment: Any, name: str) -> Any:
+        return segment.get(name) if isinstance(segment, dict) else getattr(segment, name, None)
+
+    return [
+        TextSegment(
+            start=float(value(segment, "start") or 0.0),
+            end=float(value(segment, "end") or 0.0),
+            text=(value(segment, "text") or "").strip(),
+        )
+        for segment in raw_segments or []
+    ]
+
+
+def remove_overlap(previous: str, text: str) -> str:
+    """
+    Drop the leading words of text that repeat the end of previous.
+
+    Comparison ignores case and punctuation.
+
+    Args:
+        previous: Text transcribed before the overlap
+        text: Text transcribed after it
+
+    Returns:
+        str: text without the repeated words
+    """
+    tail = [_normalize(word) for word in previous.split()[-_MAX_OVERLAP_WORDS:]]
+    words = text.split()
+    head = [_normalize(word) for word in words[:_MAX_OVERLAP_WORDS]]
+
+    for size in range(min(len(tail), len(head)), _MIN_OVERLAP_WORDS - 1, -1):
+        if tail[-size:] == head[:size]:
+            return " ".join(words[size:])
+    return text
+
+
+def stitch_chunks(chunks: list[ChunkTranscript], duration: float) -> StitchedTranscript:
+    """
+    Assemble chunk transcriptions into one transcript.
+
+    Args:
+        chunks: Chunk transcriptions (any order)
+        duration: Recording duration (seconds)
+
+    Returns:
+        StitchedTranscript: Combined transcript with global timestamps
+    """
+    ordered = sorted(chunks, key=lambda chunk: chunk.span.index)
+    segments: list[TextSegment] = []
+
+    for position, chunk in enumerate(ordered):
+        span = chunk.span
+        is_first, is_last = position == 0, position == len(ordered) - 1
+
+        if chunk.segments:
+            shifted = [
+                replace(segment, start=segment.start + span.start, end=segment.end + span.start)
+                for segment in chunk.segments
+            ]
+            # Reason: Overlapping audio is transcribed twice - the chunk owning the midpoint wins
+            kept = [
+                segment
+                for segment in shifted
+                if (is_first or (segment.start + segment.end) / 2 >= span.keep_start)
+                and (is_last or (segment.start + segment.end) / 2 < span.keep_end)
+            ]
+        else:
+            kept = [TextSegment(span.keep_start, span.keep_end, chunk.text.strip())]
+
+        # Reason: Only text from audio this chunk also heard can have been repeated
+        heard_twice = [segment.text for segment in segments if segment.end > span.start]
+        if heard_twice and kept:
+            kept[0] = replace(kept[0], text=remove_overlap(" ".join(heard_twice), kept[0].text))
+        segments.extend(segment for segment in kept if segment.text)
+
+    languages = Counter(chunk.language for chunk in ordered if chunk.language)
+    return StitchedTranscript(
+        text=" ".join(segment.text for segment in segments),
+        language=languages.most_common(1)[0][0] if languages else None,
+        duration=duration,
+        segments=segments,
+    )
+
+
+def _normalize(word: str) -> str:
+    """Lowercase a word and strip punctuation for overlap comparison."""
+    return re.sub(r"[^\w']", "", word.lower())
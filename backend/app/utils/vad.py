@@ -0,0 +1,215 @@
+"""
+Voice activity detection for trimming silence before transcription.
+
+Classifies FRAME_SECONDS frames as speech from their energy and
+zero-crossing rate, cuts long non-speech stretches out of the recording,
+and maps timestamps of the trimmed audio back onto the original.
+"""
+
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.utils.audio import FRAME_SECONDS, SAMPLE_RATE, iter_pcm, measure_frames
+from app.utils.transcript import TextSegment
+
+MIN_SPEECH_ENERGY = 100.0  # Reason: About -50 dBFS RMS - quieter frames are never speech
+NOISE_FLOOR_RATIO = 3.0  # Reason: Speech is this many times louder than the room noise
+LOUD_FRACTION = 0.5  # Reason: Caps the threshold when nearly every frame is speech
+UNVOICED_CROSSINGS = 0.25  # Reason: Fricatives (s, f, sh) are quiet but cross zero often
+
+
+@dataclass(frozen=True)
+class SpeechMap:
+    """
+    Speech kept from a recording and its layout in the trimmed audio.
+
+    Attributes:
+        spans: Kept (start, end) stretches of the recording in seconds, in order
+        gap_seconds: Silence placed between consecutive spans in the trimmed audio
+        duration: Duration of the original recording (seconds)
+    """
+
+    spans: list[tuple[float, float]]
+    gap_seconds: float
+    duration: float
+
+    @property
+    def kept_seconds(self) -> float:
+        """Duration of the trimmed audio."""
+        speech = sum(end - start for start, end in self.spans)
+        return speech + self.gap_seconds * max(0, len(self.spans) - 1)
+
+    @property
+    def removed_seconds(self) -> float:
+        """Seconds of the recording cut out."""
+        return max(0.0, self.duration - self.kept_seconds)
+
+    def to_original(self, times: np.ndarray) -> np.ndarray:
+        """
+        Map times in the trimmed audio onto the original recording.
+
+        Args:
+            times: Times in the trimmed audio (seconds)
+
+        Returns:
+            np.ndarray: Times in the original recording (seconds)
+        """
+        starts, _, trimmed_starts = self._layout()
+        index = self._span_index(trimmed_starts, times)
+        mapped = starts[index] + (times - trimmed_starts[index])
+        # Reason: Times in an inserted gap stay inside the silence that was cut
+        limits = np.append(starts[1:], self.duration)[index]
+        return np.minimum(mapped, limits)
+
+    def map_segments(self, segments: list[TextSegment]) -> list[TextSegment]:
+        """
+        Shift segments of the trimmed audio onto the original timeline.
+
+        A segment crossing a cut is kept within the span holding its
+        midpoint (plus the gap on either side), so it never stretches over
+        the silence that was removed.
+
+        Args:
+            segments: Segments with trimmed-audio timestamps
+
+        Returns:
+            list[TextSegment]: Segments with original timestamps
+        """
+        if not segments:
+            return []
+        trimmed_start = np.array([segment.start for segment in segments])
+        trimmed_end = np.array([segment.end for segment in segments])
+        starts, ends, trimmed_starts = self._layout()
+        owner = self._span_index(trimmed_starts, (trimmed_start + trimmed_end) / 2)
+
+        mapped_start = np.maximum(self.to_original(trimmed_start), starts[owner] - self.gap_seconds)
+        mapped_end = np.minimum(self.to_original(trimmed_end), ends[owner] + self.gap_seconds)
+        return [
+            TextSegment(start=float(start), end=float(max(start, end)), text=segment.text)
+            for segment, start, end in zip(segments, mapped_start, mapped_end, strict=True)
+        ]
+
+    def _layout(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return span starts and ends in the recording and span starts in the trimmed audio."""
+        starts = np.array([start for start, _ in self.spans])
+        ends = np.array([end for _, end in self.spans])
+        trimmed_starts = np.concatenate([[0.0], np.cumsum(ends - starts + self.gap_seconds)[:-1]])
+        return starts, ends, trimmed_starts
+
+    @staticmethod
+    def _span_index(trimmed_starts: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """Index of the span (or the gap after it) each trimmed-audio time falls in."""
+        return np.clip(np.searchsorted(trimmed_starts, times, side="right") - 1, 0, None)
+
+
+def classify_frames(energies: np.ndarray, crossings: np.ndarray) -> np.ndarray:
+    """
+    Mark frames that contain speech.
+
+    The energy threshold adapts to the recording: a multiple of its noise
+    floor (10th percentile), capped at half its loud level (90th percentile).
+    Frames just below the threshold count as speech when they cross zero
+    often, which catches unvoiced consonants.
+
+    Args:
+        energies: Per-frame RMS energies
+        crossings: Per-frame zero-crossing rates
+
+    Returns:
+        np.ndarray: Boolean speech flag per frame
+    """
+    noise_floor, loud = np.percentile(energies, [10, 90])
+    threshold = max(MIN_SPEECH_ENERGY, min(noise_floor * NOISE_FLOOR_RATIO, loud * LOUD_FRACTION))
+    return (energies > threshold) | ((energies > threshold / 2) & (crossings > UNVOICED_CROSSINGS))
+
+
+def detect_speech(
+    file_path: str | Path,
+    min_silence_seconds: float,
+    padding_seconds: float,
+    gap_seconds: float,
+) -> SpeechMap:
+    """
+    Find the parts of a recording to keep for transcription.
+
+    Speech frames are padded on both sides, and pauses shorter than
+    min_silence_seconds are kept, so only long silences are cut.
+
+    Args:
+        file_path: Path of the recording
+        min_silence_seconds: Shortest silence that is cut
+        padding_seconds: Audio kept before and after each speech stretch
+        gap_seconds: Silence left in place of each cut
+
+    Returns:
+        SpeechMap: Kept spans (empty if the recording contains no speech)
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded
+    """
+    energies, crossings, duration = measure_frames(file_path)
+    speech = classify_frames(energies, crossings)
+
+    pad = int(round(padding_seconds / FRAME_SECONDS))
+    if pad:
+        speech = np.convolve(speech, np.ones(2 * pad + 1), mode="same") > 0
+
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], speech.astype(np.int8), [0]])))
+    starts, ends = edges[::2], edges[1::2]
+    if len(starts) == 0:
+        return SpeechMap(spans=[], gap_seconds=gap_seconds, duration=duration)
+
+    # Reason: Merge speech stretches separated by pauses too short to cut
+    breaks = np.flatnonzero(starts[1:] - ends[:-1] >= min_silence_seconds / FRAME_SECONDS)
+    run_starts = np.concatenate([[starts[0]], starts[breaks + 1]])
+    run_ends = np.concatenate([ends[breaks], [ends[-1]]])
+
+    spans = [
+        (float(start * FRAME_SECONDS), float(min(end * FRAME_SECONDS, duration)))
+        for start, end in zip(run_starts, run_ends, strict=True)
+    ]
+    return SpeechMap(spans=spans, gap_seconds=gap_seconds, duration=duration)
+
+
+def write_speech(file_path: str | Path, speech_map: SpeechMap, output_path: str | Path) -> None:
+    """
+    Write the kept spans of a recording as one 16 kHz mono WAV file.
+
+    The recording is decoded once, block by block, so memory use does not
+    depend on its length.
+
+    Args:
+        file_path: Path of the recording
+        speech_map: Spans to keep
+        output_path: Path of the WAV file to write
+
+    Raises:
+        AudioDecodeError: If the recording cannot be decoded
+    """
+    bounds = [
+        (round(start * SAMPLE_RATE), round(end * SAMPLE_RATE)) for start, end in speech_map.spans
+    ]
+    gap = np.zeros(round(speech_map.gap_seconds * SAMPLE_RATE), dtype="<i2").tobytes()
+
+    with wave.open(str(output_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+
+        span = 0
+        position = 0
+        for block in iter_pcm(file_path):
+            block_end = position + len(block)
+            while span < len(bounds) and bounds[span][0] < block_end:
+                start, end = bounds[span]
+                piece = block[max(start - position, 0) : min(end, block_end) - position]
+                wav.writeframes(piece.astype("<i2").tobytes())
+                if end > block_end:
+                    break
+                span += 1
+                if span < len(bounds):
+                    wav.writeframes(gap)
+            position = block_end
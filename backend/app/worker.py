@@ -0,0 +1,242 @@
+"""
+Pipeline worker entry point.
+
+Claims jobs from the job queue and runs pipeline stages with bounded
+concurrency. Run as a separate process:
+
+    python -m app.worker --concurrency 4
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.ai_client import close_openai_client
+from app.core.database import SessionLocal, init_db
+from app.core.settings import settings
+from app.services.job_queue import Job, JobBroker, get_broker
+from app.services.pipeline_service import NEXT_STAGE, PipelineService, PipelineStage
+from app.services.transcode_service import shutdown_transcode_pool
+
+logger = logging.getLogger(__name__)
+
+
+def check_lease_settings() -> None:
+    """
+    Validate the job lease settings.
+
+    Raises:
+        ValueError: If a lease could expire before its stage times out, or
+            heartbeats are not sent well within the lease
+    """
+    if settings.job_visibility_timeout_seconds <= settings.processing_timeout_seconds:
+        raise ValueError("JOB_VISIBILITY_TIMEOUT_SECONDS must exceed PROCESSING_TIMEOUT_SECONDS")
+    if settings.job_heartbeat_seconds * 2 > settings.job_visibility_timeout_seconds:
+        raise ValueError(
+            "JOB_HEARTBEAT_SECONDS must be at most half of JOB_VISIBILITY_TIMEOUT_SECONDS"
+        )
+
+
+class Worker:
+    """
+    Pool of queue consumers sharing one event loop.
+
+    Each consumer claims a job, runs its stage in a fresh database session,
+    then acknowledges it (queueing the next stage) or schedules a retry.
+    """
+
+    def __init__(
+        self,
+        broker: JobBroker | None = None,
+        concurrency: int | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        """
+        Initialize worker.
+
+        Args:
+            broker: Job broker (defaults to the configured broker)
+            concurrency: Number of concurrent consumers
+            session_factory: Factory for per-job database sessions
+        """
+        check_lease_settings()
+        self.broker = broker or get_broker()
+        self.concurrency = concurrency or settings.worker_concurrency
+        self.session_factory = session_factory
+        self.name = f"{socket.gethostname()}-{os.getpid()}"
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Run consumers until stop() is called, letting in-flight jobs finish."""
+        consumers = [
+            asyncio.create_task(self._consume(f"{self.name}-{index}"))
+            for index in range(self.concurrency)
+        ]
+        await asyncio.gather(*consumers)
+
+    def stop(self) -> None:
+        """Stop claiming new jobs."""
+        self._stopping.set()
+
+    async def run_once(self, worker_id: str | None = None) -> bool:
+        """
+        Claim and process a single job.
+
+        Args:
+            worker_id: Lease holder identifier
+
+        Returns:
+            bool: True if a job was processed, False if the queue was empty
+        """
+        # Reason: Broker calls are blocking DB round-trips - keep the event loop responsive
+        job = await run_in_threadpool(self.broker.claim, worker_id or f"{self.name}-0")
+        if job is None:
+            return False
+        await self.process(job)
+        return True
+
+    async def process(self, job: Job) -> None:
+        """
+        Run a claimed job and acknowledge or retry it.
+
+        Args:
+            job: Claimed job
+        """
+        stage = PipelineStage(job.stage)
+        db = self.session_factory()
+        try:
+            pipeline = PipelineService(db)
+
+            if job.attempts > job.max_attempts:
+                # Reason: Lease expired repeatedly (worker crashes) - give up
+                await run_in_threadpool(self.broker.retry, job, "Exceeded maximum attempts")
+                await run_in_threadpool(
+                    pipeline.mark_failed,
+                    job.audio_id,
+                    f"{stage.value} exceeded maximum attempts",
+                    stage,
+                )
+                return
+
+            # Reason: Stages may outlive one lease - keep it while the stage runs
+            stage_run = asyncio.create_task(
+                asyncio.wait_for(
+                    pipeline.run_stage(job.audio_id, stage, use_cache=job.use_cache),
+                    timeout=settings.processing_timeout_seconds,
+                )
+            )
+            keep_lease = asyncio.create_task(self._keep_lease(job, stage_run))
+            try:
+                await stage_run
+            except asyncio.CancelledError:
+                if not keep_lease.done() or keep_lease.cancelled():
+                    raise
+                # Reason: Another worker holds the job now - leave the queue and status to it
+                db.rollback()
+                return
+            except Exception as e:
+                db.rollback()
+                error = str(e) or type(e).__name__
+                logger.warning(
+                    "Job %s (%s) attempt %d failed: %s", job.id, stage, job.attempts, error
+                )
+                if await run_in_threadpool(self.broker.retry, job, error):
+                    await run_in_threadpool(pipeline.mark_retrying, job.audio_id, stage)
+                elif job.attempts >= job.max_attempts:
+                    # Reason: A new holder past max_attempts marks the same failure itself
+                    await run_in_threadpool(
+                        pipeline.mark_failed, job.audio_id, f"{stage.value} failed: {error}", stage
+                    )
+                else:
+                    logger.warning("Job %s (%s) lost its lease, not requeued", job.id, stage)
+                return
+            finally:
+                keep_lease.cancel()
+
+            next_stage = NEXT_STAGE[stage]
+            await run_in_threadpool(self.broker.ack, job, next_stage.value if next_stage else None)
+        finally:
+            db.close()
+
+    async def _keep_lease(self, job: Job, stage_run: asyncio.Task) -> None:
+        """
+        Extend a job's lease every settings.job_heartbeat_seconds until cancelled.
+
+        If the lease was lost, another worker may already run the job, so
+        the stage is cancelled instead of racing it.
+
+        Args:
+            job: Claimed job
+            stage_run: Task running the job's stage
+        """
+        while True:
+            await asyncio.sleep(settings.job_heartbeat_seconds)
+            try:
+                extended = await run_in_threadpool(self.broker.heartbeat, job)
+            except Exception:
+                logger.exception("Failed to extend the lease of job %s", job.id)
+                continue
+            if not extended:
+                logger.warning("Job %s (%s) lost its lease, cancelling", job.id, job.stage)
+                stage_run.cancel()
+                return
+
+    async def _consume(self, worker_id: str) -> None:
+        """Claim and process jobs until stopped."""
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once(worker_id)
+            except Exception:
+                logger.exception("Worker %s failed to process a job", worker_id)
+                processed = False
+
+            if not processed:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=settings.worker_poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+
+async def main(concurrency: int) -> None:
+    """
+    Run a worker until SIGINT/SIGTERM.
+
+    Args:
+        concurrency: Number of concurrent consumers
+    """
+    init_db()
+    worker = Worker(concurrency=concurrency)
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    logger.info("Worker %s started with concurrency %d", worker.name, worker.concurrency)
+    try:
+        await worker.run()
+    finally:
+        await close_openai_client()
+        shutdown_transcode_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Meeting Notes Summarizer pipeline worker")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.worker_concurrency,
+        help="Number of jobs processed concurrently",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args.concurrency))
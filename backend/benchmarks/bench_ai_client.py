@@ -0,0 +1,180 @@
+"""
+Event-loop responsiveness benchmark: blocking vs shared async OpenAI client.
+
+Runs the API with an embedded worker against the local fake OpenAI server,
+starts many pipelines at once, and measures /health and status latency
+while they are in flight.
+
+Usage:
+    python -m benchmarks.bench_ai_client --pipelines 20 --latency 1.0
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+MODE_ENV = "BENCH_AI_MODE"
+
+
+def _configure_app() -> None:
+    """Swap in the original blocking per-service client when running in sync mode."""
+    from openai import OpenAI
+
+    from app.core.settings import settings
+    from app.services import summary_service, transcription_service
+
+    def blocking_client() -> SimpleNamespace:
+        # Reason: Mirrors the original code - a new sync client per service, called on the loop
+        client = OpenAI(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
+
+        async def transcribe(**kwargs: object) -> object:
+            return client.audio.transcriptions.create(**kwargs)
+
+        async def complete(**kwargs: object) -> object:
+            return client.chat.completions.create(**kwargs)
+
+        return SimpleNamespace(
+            audio=SimpleNamespace(transcriptions=SimpleNamespace(create=transcribe)),
+            chat=SimpleNamespace(completions=SimpleNamespace(create=complete)),
+        )
+
+    if os.environ.get(MODE_ENV) == "sync":
+        transcription_service.get_openai_client = blocking_client
+        summary_service.get_openai_client = blocking_client
+
+
+if os.environ.get(MODE_ENV):
+    _configure_app()
+    from app.main import app  # noqa: E402,F401
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values in milliseconds."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+def _start(module: str, port: int, env: dict) -> subprocess.Popen:
+    """Start a uvicorn server and wait until it accepts connections."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", module, "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/docs")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError(f"{module} did not start")
+
+
+def run_mode(mode: str, pipelines: int, api_port: int, fake_port: int, workdir: Path) -> dict:
+    """Benchmark one client mode against a fresh API process."""
+    env = {
+        **os.environ,
+        MODE_ENV: mode,
+        "DATABASE_URL": f"sqlite:///{workdir / f'{mode}.db'}",
+        "UPLOAD_DIR": str(workdir / mode),
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{fake_port}/v1",
+        "QUEUE_BROKER": "memory",
+        "WORKER_EMBEDDED": "true",
+        "WORKER_CONCURRENCY": str(pipelines),
+        "WORKER_POLL_INTERVAL_SECONDS": "0.05",
+        "TRANSCRIPTION_CACHE_ENABLED": "false",
+        "SUMMARY_CACHE_BACKEND": "none",
+        "DEBUG": "false",
+    }
+    server = _start("benchmarks.bench_ai_client:app", api_port, env)
+    base_url = f"http://127.0.0.1:{api_port}/api/v1"
+    health_latencies: list[float] = []
+    status_latencies: list[float] = []
+
+    try:
+        with httpx.Client(timeout=120) as client:
+            audio_ids = []
+            for index in range(pipelines):
+                upload = client.post(
+                    f"{base_url}/audio/upload",
+                    files={"file": (f"m{index}.webm", os.urandom(64 * 1024), "audio/webm")},
+                )
+                audio_ids.append(upload.json()["id"])
+
+            started = time.perf_counter()
+            for audio_id in audio_ids:
+                client.post(f"{base_url}/process/{audio_id}")
+
+            pending = set(audio_ids)
+            while pending:
+                start = time.perf_counter()
+                client.get(f"{base_url}/health")
+                health_latencies.append(time.perf_counter() - start)
+
+                for audio_id in list(pending):
+                    start = time.perf_counter()
+                    state = client.get(f"{base_url}/audio/{audio_id}").json()["status"]
+                    status_latencies.append(time.perf_counter() - start)
+                    if state in ("completed", "failed"):
+                        pending.discard(audio_id)
+                time.sleep(0.05)
+            elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "mode": mode,
+        "wall_s": elapsed,
+        "health_p50_ms": statistics.median(health_latencies) * 1000,
+        "health_p99_ms": _percentile(health_latencies, 99),
+        "status_p99_ms": _percentile(status_latencies, 99),
+    }
+
+
+def main() -> None:
+    """Run both modes and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pipelines", type=int, default=20, help="Concurrent pipelines")
+    parser.add_argument("--latency", type=float, default=1.0, help="Fake API latency (s)")
+    parser.add_argument("--api-port", type=int, default=8766)
+    parser.add_argument("--fake-port", type=int, default=9766)
+    args = parser.parse_args()
+
+    fake = _start(
+        "benchmarks.fake_openai:app",
+        args.fake_port,
+        {**os.environ, "FAKE_OPENAI_LATENCY": str(args.latency)},
+    )
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = [
+                run_mode(mode, args.pipelines, args.api_port, args.fake_port, Path(tmp))
+                for mode in ("sync", "async")
+            ]
+    finally:
+        fake.terminate()
+        fake.wait()
+
+    print(f"{args.pipelines} concurrent pipelines, fake API latency {args.latency}s per call")
+    print(f"{'mode':<6} {'wall':>8} {'health p50':>11} {'health p99':>11} {'status p99':>11}")
+    for r in results:
+        print(
+            f"{r['mode']:<6} {r['wall_s']:>7.1f}s {r['health_p50_ms']:>9.0f}ms"
+            f" {r['health_p99_ms']:>9.0f}ms {r['status_p99_ms']:>9.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
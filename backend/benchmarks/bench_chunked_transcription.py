@@ -0,0 +1,116 @@
+"""
+Long-recording transcription benchmark: one Whisper request vs parallel chunks.
+
+Generates a synthetic meeting (tone bursts separated by short pauses) and
+transcribes it in-process against a fake Whisper whose latency grows with
+the amount of audio sent, like the real API.
+
+Usage:
+    python -m benchmarks.bench_chunked_transcription --minutes 60 --fan-out 1 4 8
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.services.transcription_service import TranscriptionService
+from app.utils.audio import SAMPLE_RATE
+
+
+class TimedWhisper:
+    """Fake Whisper taking `speed` seconds per second of audio."""
+
+    def __init__(self, speed: float) -> None:
+        self.speed = speed
+        self.requests = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        upload = kwargs["file"]
+        size = len(upload[1]) if isinstance(upload, tuple) else Path(upload.name).stat().st_size
+        seconds = (size - 44) / (2 * SAMPLE_RATE)
+        self.requests += 1
+        await asyncio.sleep(seconds * self.speed)
+        segments = [{"start": 0.0, "end": seconds, "text": f"{seconds:.0f} seconds of speech."}]
+        return SimpleNamespace(
+            text=segments[0]["text"], language="en", duration=seconds, segments=segments
+        )
+
+
+def write_meeting(path: Path, minutes: float) -> None:
+    """Write a 16 kHz mono WAV of 12 s speech-like bursts and 0.7 s pauses."""
+    t = np.arange(int(12 * SAMPLE_RATE)) / SAMPLE_RATE
+    burst = (np.sin(2 * np.pi * 220 * t) * 6000).astype("<i2").tobytes()
+    pause = np.zeros(int(0.7 * SAMPLE_RATE), dtype="<i2").tobytes()
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for _ in range(int(minutes * 60 / 12.7)):
+            wav.writeframes(burst + pause)
+
+
+async def run_mode(path: Path, fan_out: int | None, speed: float) -> dict:
+    """Transcribe the meeting once; fan_out None sends the whole file."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    settings.transcription_chunking_enabled = fan_out is not None
+    settings.transcription_max_concurrency = fan_out or 1
+
+    whisper = TimedWhisper(speed)
+    with Session(engine) as db:
+        audio_file = AudioFile(
+            filename=path.name,
+            file_path=str(path),
+            file_size=path.stat().st_size,
+            mime_type="audio/wav",
+        )
+        db.add(audio_file)
+        db.commit()
+
+        client = SimpleNamespace(audio=SimpleNamespace(transcriptions=whisper))
+        started = time.perf_counter()
+        await TranscriptionService(db, client=client).transcribe_audio(audio_file, use_cache=False)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "mode": f"chunked x{fan_out}" if fan_out else "single",
+        "requests": whisper.requests,
+        "wall_s": elapsed,
+    }
+
+
+def main() -> None:
+    """Run each mode and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=60.0, help="Meeting length")
+    parser.add_argument("--speed", type=float, default=0.005, help="Fake seconds per audio second")
+    parser.add_argument("--fan-out", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "meeting.wav"
+        write_meeting(path, args.minutes)
+        results = [asyncio.run(run_mode(path, None, args.speed))]
+        results += [asyncio.run(run_mode(path, n, args.speed)) for n in args.fan_out]
+
+    print(f"{args.minutes:.0f}-minute meeting, fake Whisper at {args.speed}s per audio second")
+    print(f"{'mode':<12} {'requests':>9} {'wall':>8}")
+    for r in results:
+        print(f"{r['mode']:<12} {r['requests']:>9} {r['wall_s']:>7.1f}s")
+
+
+if __name__ == "__main__":
+    main()
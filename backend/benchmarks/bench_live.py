@@ -0,0 +1,127 @@
+"""
+Live recording benchmark: time from stop to transcript, live vs upload-after-stop.
+
+Streams a synthetic MediaRecorder-style WebM meeting (1 s clusters) into a
+LiveRecording at real-time pace and times finish(), then times sending the
+whole recording to Whisper in one request, as an upload after the meeting
+would. The fake Whisper takes `speed` seconds per second of audio it is
+sent. The run is compressed by --time-scale; times are reported in
+real-time seconds.
+
+Usage:
+    python -m benchmarks.bench_live --minutes 15 30 60
+    python -m benchmarks.bench_live --minutes 60 --segment 60 --speed 0.05
+"""
+
+import argparse
+import asyncio
+import struct
+import tempfile
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.core.settings import settings
+from app.services.live_service import LiveRecording
+
+
+def ebml(element_id: int, body: bytes) -> bytes:
+    """Encode an EBML element with an 8-byte size."""
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    return id_bytes + (1 << 56 | len(body)).to_bytes(8, "big") + body
+
+
+UNKNOWN_SIZE = b"\x01" + b"\xff" * 7
+CLUSTER_ID = bytes.fromhex("1F43B675")
+
+
+def init_segment() -> bytes:
+    """EBML header, segment start, Info and an Opus track, as MediaRecorder writes them."""
+    audio = ebml(0xB5, struct.pack(">d", 48000.0)) + ebml(0x9F, b"\x01")
+    tracks = ebml(0x1654AE6B, ebml(0xAE, ebml(0x83, b"\x02") + ebml(0xE1, audio)))
+    info = ebml(0x1549A966, ebml(0x2AD7B1, (1_000_000).to_bytes(3, "big")))
+    header = ebml(0x1A45DFA3, ebml(0x4282, b"webm"))
+    return header + bytes.fromhex("18538067") + UNKNOWN_SIZE + info + tracks
+
+
+def cluster(second: int) -> bytes:
+    """One second of 32 kbit/s audio in 20 ms blocks."""
+    block = ebml(0xA3, b"\x81" + struct.pack(">h", 0) + b"\x80" + bytes(60))
+    timecode = ebml(0xE7, struct.pack(">I", second * 1000))
+    return CLUSTER_ID + UNKNOWN_SIZE + timecode + block * 50
+
+
+class TimedWhisper:
+    """Fake Whisper taking `speed` seconds per second of WebM audio it is sent."""
+
+    def __init__(self, speed: float, time_scale: float) -> None:
+        self.speed = speed
+        self.time_scale = time_scale
+        self.requests = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        # Reason: Clusters are 1 s long; counting their IDs keeps parsing out of the timing
+        seconds = kwargs["file"][1].count(CLUSTER_ID)
+        self.requests += 1
+        await asyncio.sleep(seconds * self.speed * self.time_scale)
+        return SimpleNamespace(text=f"{seconds} seconds of speech.", language="en", segments=[])
+
+
+async def run_live(minutes: float, whisper: TimedWhisper, time_scale: float) -> float:
+    """Stream the meeting at real-time pace; return the seconds finish() took."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    client = SimpleNamespace(audio=SimpleNamespace(transcriptions=whisper))
+
+    with Session(engine) as db:
+        recording = LiveRecording.start(db, "meeting.webm", client)
+        await recording.append(init_segment())
+        for second in range(int(minutes * 60)):
+            await recording.append(cluster(second))
+            await asyncio.sleep(time_scale)
+        started = time.perf_counter()
+        await recording.finish()
+        return (time.perf_counter() - started) / time_scale
+
+
+async def run_upload(minutes: float, whisper: TimedWhisper, time_scale: float) -> float:
+    """Send the whole meeting in one request; return the seconds it took."""
+    data = init_segment() + b"".join(cluster(second) for second in range(int(minutes * 60)))
+    started = time.perf_counter()
+    await whisper.create(file=("meeting.webm", data, "audio/webm"))
+    return (time.perf_counter() - started) / time_scale
+
+
+def main() -> None:
+    """Run both modes per meeting length and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, nargs="+", default=[15.0, 30.0, 60.0])
+    parser.add_argument("--segment", type=int, default=120, help="LIVE_SEGMENT_SECONDS")
+    parser.add_argument("--speed", type=float, default=0.02, help="Fake seconds per audio second")
+    parser.add_argument(
+        "--time-scale", type=float, default=0.005, help="Wall seconds per real-time second"
+    )
+    args = parser.parse_args()
+    settings.live_segment_seconds = args.segment
+
+    print(
+        f"fake Whisper at {args.speed}s per audio second, {args.segment}s live segments, "
+        "stop-to-transcript in real-time seconds"
+    )
+    print(f"{'meeting':>8} {'segments':>9} {'live':>8} {'upload':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.upload_dir = tmp
+        for minutes in args.minutes:
+            whisper = TimedWhisper(args.speed, args.time_scale)
+            live = asyncio.run(run_live(minutes, whisper, args.time_scale))
+            segments = whisper.requests
+            upload = asyncio.run(run_upload(minutes, whisper, args.time_scale))
+            print(f"{minutes:>7.0f}m {segments:>9} {live:>7.1f}s {upload:>7.1f}s")
+
+
+if __name__ == "__main__":
+    main()
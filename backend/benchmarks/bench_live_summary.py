@@ -0,0 +1,166 @@
+"""
+Running summary benchmark: summary latency after stop and tokens, full vs incremental.
+
+Builds a synthetic meeting transcript (about 120 spoken words a minute) and
+summarizes it two ways against a fake chat model whose latency grows with
+the prompt and completion tokens:
+
+- full: SummaryService.generate_summary on the whole transcript after stop
+  (fast, single or map-reduce, as the planner decides)
+- incremental: update_running_summary with each --interval minutes of new
+  text while the meeting runs (not on the clock), then
+  finalize_running_summary on the last stretch after stop
+
+Usage:
+    python -m benchmarks.bench_live_summary --minutes 15 30 60 90
+    python -m benchmarks.bench_live_summary --minutes 60 --interval 10 --reduce local
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.transcription import Transcription
+from app.services.summary_service import SummaryService
+from app.utils.tokens import count_tokens
+
+PROMPT_TOKENS_PER_SECOND = 5000  # Reason: Rough prefill rate of a hosted model
+COMPLETION_TOKENS_PER_SECOND = 60
+
+
+class TimedChat:
+    """Fake chat model: latency and usage follow the real token counts."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        prompt = " ".join(message["content"] for message in kwargs["messages"])
+        content = json.dumps(
+            {
+                "summary": "The team reviewed the roadmap and agreed on next steps.",
+                "key_points": [f"Point {self.requests}"],
+                "action_items": [{"item": f"Task {self.requests}", "owner": "Ana"}],
+                "decisions": [f"Decision {self.requests}"],
+                "participants": ["Ana", "Ben"],
+            }
+        )
+        prompt_tokens = count_tokens(prompt, settings.gpt_model)
+        completion_tokens = count_tokens(content, settings.gpt_model)
+        self.requests += 1
+        await asyncio.sleep(
+            prompt_tokens / PROMPT_TOKENS_PER_SECOND
+            + completion_tokens / COMPLETION_TOKENS_PER_SECOND
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens, total_tokens=prompt_tokens + completion_tokens
+            ),
+        )
+
+
+def minute_of_speech(minute: int) -> str:
+    """About a minute of varied meeting talk."""
+    sentences = [
+        f"Ana said item {minute} on the roadmap needs another review before Friday.",
+        f"Ben answered that the budget for item {minute} is still under discussion.",
+        f"They agreed to revisit the timeline for milestone {minute % 7} next week.",
+        "Someone asked who owns the follow up and Ana volunteered to send notes.",
+        f"The group compared option {minute % 3} with the alternative proposed earlier.",
+        "Ben noted the risks and asked for numbers from the last quarter.",
+        "Everyone agreed the customer feedback should drive the priority order.",
+        "Ana summarized the open questions and moved on to the next topic.",
+        "Ben mentioned hiring plans and the effect on delivery dates.",
+        "They closed the topic after a short discussion of dependencies.",
+    ]
+    return " ".join(sentences)
+
+
+def make_session() -> Session:
+    """In-memory database with the application schema."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def add_transcription(db: Session, text: str) -> Transcription:
+    """Create a completed transcription with its audio record."""
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, full_text=text, status="completed")
+    db.add(transcription)
+    db.commit()
+    return transcription
+
+
+async def run_full(minutes: list[str]) -> tuple[float, int, int]:
+    """Summarize the whole transcript after stop; return (seconds, tokens, total tokens)."""
+    chat = TimedChat()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=chat))
+    with make_session() as db:
+        transcription = add_transcription(db, " ".join(minutes))
+        started = time.perf_counter()
+        summary = await SummaryService(db, client).generate_summary(transcription, use_cache=False)
+        elapsed = time.perf_counter() - started
+        return elapsed, summary.tokens_used, summary.tokens_used
+
+
+async def run_incremental(minutes: list[str], interval: int) -> tuple[float, int, int]:
+    """Update while recording, then finalize; return (seconds, tokens after stop, total tokens)."""
+    chat = TimedChat()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=chat))
+    with make_session() as db:
+        transcription = add_transcription(db, " ".join(minutes))
+        service = SummaryService(db, client)
+        stretches = [
+            " ".join(minutes[start : start + interval])
+            for start in range(0, len(minutes), interval)
+        ]
+        # Reason: The last stretch is still being spoken when the meeting stops
+        for part, text in enumerate(stretches[:-1], start=1):
+            await service.update_running_summary(transcription, text, part)
+        before = service.get_summary_by_transcription_id(transcription.id)
+        tokens_before = before.tokens_used if before else 0
+        started = time.perf_counter()
+        summary = await service.finalize_running_summary(
+            transcription, stretches[-1], len(stretches)
+        )
+        elapsed = time.perf_counter() - started
+        return elapsed, summary.tokens_used - tokens_before, summary.tokens_used
+
+
+def main() -> None:
+    """Run both modes per meeting length and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=int, nargs="+", default=[15, 30, 60, 90])
+    parser.add_argument("--interval", type=int, default=5, help="Update period in minutes")
+    parser.add_argument("--reduce", choices=["llm", "local"], default="llm")
+    args = parser.parse_args()
+    settings.summary_reduce_strategy = args.reduce
+
+    print(f"{args.interval}-minute running summary updates, {args.reduce} reduce")
+    print(f"{'':>8} {'-- after stop: latency / tokens --':>36} {'-- total tokens --':>22}")
+    print(f"{'meeting':>8} {'full':>17} {'incremental':>18} {'full':>10} {'incremental':>12}")
+    for length in args.minutes:
+        minutes = [minute_of_speech(minute) for minute in range(length)]
+        full_s, full_after, full_total = asyncio.run(run_full(minutes))
+        inc_s, inc_after, inc_total = asyncio.run(run_incremental(minutes, args.interval))
+        print(
+            f"{length:>7}m {full_s:>9.2f}s {full_after:>6} {inc_s:>10.2f}s {inc_after:>6}"
+            f" {full_total:>10} {inc_total:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
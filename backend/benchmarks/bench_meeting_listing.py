@@ -0,0 +1,171 @@
+"""
+Meeting listing benchmark: keyset cursor vs OFFSET pagination.
+
+Seeds a database with processed meetings (audio file, transcription and
+summary per row), then times fetching one page at increasing depths with
+the keyset query behind GET /meetings and with a plain OFFSET query.
+
+Usage:
+    python -m benchmarks.bench_meeting_listing --rows 1000000
+    python -m benchmarks.bench_meeting_listing --database-url postgresql://u:p@localhost/db
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, joinedload
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.models.audio import AudioFile
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.services.audio_service import AudioService
+
+_SEED_BATCH = 10_000
+
+
+def seed(engine: Engine, rows: int) -> None:
+    """Insert rows meetings, one second apart, in bulk batches."""
+    start = datetime(2020, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, rows, _SEED_BATCH):
+            audio, transcriptions, summaries = [], [], []
+            for index in range(offset, min(offset + _SEED_BATCH, rows)):
+                audio_id, transcription_id = uuid.uuid4(), uuid.uuid4()
+                created_at = start + timedelta(seconds=index)
+                audio.append(
+                    {
+                        "id": audio_id,
+                        "filename": f"meeting-{index}.webm",
+                        "file_path": f"/data/meeting-{index}.webm",
+                        "file_size": 1_000_000,
+                        "mime_type": "audio/webm",
+                        "status": "completed" if index % 10 else "failed",
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+                transcriptions.append(
+                    {
+                        "id": transcription_id,
+                        "audio_file_id": audio_id,
+                        "full_text": "Discussion of the quarterly budget. " * 50,
+                        "status": "completed",
+                        "cache_hit": False,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+                summaries.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "transcription_id": transcription_id,
+                        "summary_text": "Budget approved.",
+                        "status": "completed",
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                )
+            conn.execute(AudioFile.__table__.insert(), audio)
+            conn.execute(Transcription.__table__.insert(), transcriptions)
+            conn.execute(Summary.__table__.insert(), summaries)
+
+
+def offset_page(db: Session, depth: int, limit: int) -> list[AudioFile]:
+    """Fetch a page the pre-keyset way: full rows, skipping depth of them."""
+    statement = (
+        select(AudioFile)
+        .options(joinedload(AudioFile.transcription).joinedload(Transcription.summary))
+        .order_by(AudioFile.created_at.desc(), AudioFile.id.desc())
+        .offset(depth)
+        .limit(limit)
+    )
+    return list(db.execute(statement).scalars().all())
+
+
+async def keyset_page(db: Session, depth: int, limit: int) -> tuple[list[AudioFile], float]:
+    """Fetch a page through the listing endpoint's query and return it with its latency."""
+    after = None
+    if depth:
+        # Reason: Stands in for the cursor a client got with the previous page (not timed)
+        row = db.execute(
+            select(AudioFile.created_at, AudioFile.id)
+            .order_by(AudioFile.created_at.desc(), AudioFile.id.desc())
+            .offset(depth - 1)
+            .limit(1)
+        ).one()
+        after = (row.created_at, row.id)
+
+    start = time.perf_counter()
+    page = await AudioService(db).list_meetings_async(limit, after=after)
+    return page, time.perf_counter() - start
+
+
+def time_offset(db: Session, depth: int, limit: int, repeats: int) -> float:
+    """Return the median OFFSET page latency in milliseconds."""
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        offset_page(db, depth, limit)
+        latencies.append(time.perf_counter() - start)
+        db.expunge_all()
+    return statistics.median(latencies) * 1000
+
+
+async def time_keyset(db: Session, depth: int, limit: int, repeats: int) -> float:
+    """Return the median keyset page latency in milliseconds."""
+    latencies = []
+    for _ in range(repeats):
+        _, elapsed = await keyset_page(db, depth, limit)
+        latencies.append(elapsed)
+        db.expunge_all()
+    return statistics.median(latencies) * 1000
+
+
+def main() -> None:
+    """Seed the database, time each depth and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Meetings to seed")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed fetches per depth")
+    parser.add_argument("--database-url", help="Empty database to seed (default: temp SQLite)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'meetings.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+
+        with Session(engine) as db:
+            existing = db.scalar(select(func.count()).select_from(AudioFile))
+        if existing < args.rows:
+            start = time.perf_counter()
+            seed(engine, args.rows - existing)
+            print(f"Seeded {args.rows - existing} meetings in {time.perf_counter() - start:.0f}s")
+        rows = max(existing, args.rows)
+
+        depths = [0, 1_000, 10_000, 100_000, rows // 2, rows - args.limit]
+        depths = sorted({depth for depth in depths if 0 <= depth < rows})
+
+        print(f"{rows} meetings, page size {args.limit}, median of {args.repeats}")
+        print(f"{'depth':>10} {'keyset':>10} {'offset':>10}")
+        with Session(engine) as db:
+            for depth in depths:
+                keyset_ms = asyncio.run(time_keyset(db, depth, args.limit, args.repeats))
+                offset_ms = time_offset(db, depth, args.limit, args.repeats)
+                print(f"{depth:>10} {keyset_ms:>8.2f}ms {offset_ms:>8.2f}ms")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Container probe benchmark: header-only probing vs decoding, per format.
+
+Writes a large WAV, M4A (moov after the media data), browser-style WebM
+(no Duration, so the tail is read) and constant-bitrate MP3, then times
+probe_audio on each. Media data is left as sparse holes, so the files
+are quick to create but still that large. For the WAV the time to decode
+it (what finding the duration took before) is shown for comparison.
+
+Usage:
+    python -m benchmarks.bench_probe --mb 500
+    python -m benchmarks.bench_probe --mb 2000 --repeat 1000
+"""
+
+import argparse
+import statistics
+import struct
+import tempfile
+import time
+from pathlib import Path
+
+from app.utils.audio import measure_energy
+from app.utils.probe import probe_audio
+
+
+def ebml(element_id: int, body: bytes) -> bytes:
+    """Encode an EBML element with an 8-byte size."""
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    return id_bytes + (1 << 56 | len(body)).to_bytes(8, "big") + body
+
+
+def box(kind: bytes, body: bytes) -> bytes:
+    """Encode an MP4 box."""
+    return struct.pack(">I4s", 8 + len(body), kind) + body
+
+
+def write_wav(path: Path, size: int) -> None:
+    """48 kHz stereo 16-bit PCM."""
+    fmt = struct.pack("<HHIIHH", 1, 2, 48000, 48000 * 4, 4, 16)
+    header = b"RIFF" + struct.pack("<I", size - 8) + b"WAVE"
+    header += b"fmt " + struct.pack("<I", 16) + fmt + b"data" + struct.pack("<I", size - 44)
+    with path.open("wb") as file:
+        file.write(header)
+        file.truncate(size)
+
+
+def write_m4a(path: Path, size: int) -> None:
+    """AAC-style M4A at 128 kbit/s: ftyp, mdat, then moov with a 1 MB sample table."""
+    seconds = int(size * 8 / 128000)
+    mdhd = box(b"mdhd", bytes(12) + struct.pack(">II", 44100, seconds * 44100))
+    hdlr = box(b"hdlr", bytes(8) + b"soun" + bytes(12))
+    entry = box(b"mp4a", bytes(16) + struct.pack(">HH4xI", 2, 16, 44100 << 16))
+    stbl = box(b"stbl", box(b"stsd", struct.pack(">II", 0, 1) + entry) + box(b"stsz", bytes(2**20)))
+    moov = box(b"moov", box(b"trak", box(b"mdia", mdhd + hdlr + box(b"minf", stbl))))
+    ftyp = box(b"ftyp", b"M4A " + bytes(4) + b"isomM4A ")
+    mdat_size = size - len(ftyp) - len(moov)
+    with path.open("wb") as file:
+        file.write(ftyp + struct.pack(">I4sQ", 1, b"mdat", mdat_size))
+        file.seek(len(ftyp) + mdat_size)
+        file.write(moov)
+
+
+def write_webm(path: Path, size: int) -> None:
+    """Opus WebM as MediaRecorder writes it: unknown sizes, no Duration, 1 s clusters."""
+    audio = ebml(0xB5, struct.pack(">d", 48000.0)) + ebml(0x9F, b"\x01")
+    tracks = ebml(0x1654AE6B, ebml(0xAE, ebml(0x83, b"\x02") + ebml(0xE1, audio)))
+    info = ebml(0x1549A966, ebml(0x2AD7B1, (1_000_000).to_bytes(3, "big")))
+    header = ebml(0x1A45DFA3, ebml(0x4282, b"webm")) + bytes.fromhex("18538067") + b"\x01"
+    header += b"\xff" * 7 + info + tracks
+
+    seconds = int(size * 8 / 32000)
+    block = ebml(0xA3, b"\x81" + struct.pack(">h", 0) + b"\x80" + bytes(80))
+    clusters = b""
+    for start in range(max(0, seconds - 10), seconds):
+        clusters += ebml(0x1F43B675, ebml(0xE7, struct.pack(">I", start * 1000)) + block * 50)
+    with path.open("wb") as file:
+        file.write(header)
+        file.seek(size - len(clusters))
+        file.write(clusters)
+
+
+def write_mp3(path: Path, size: int) -> None:
+    """Constant 128 kbit/s 44.1 kHz stereo frames."""
+    frame = b"\xff\xfb\x90\x00" + bytes(413)
+    with path.open("wb") as file:
+        file.write(frame * 4)
+        file.truncate(size)
+
+
+def main() -> None:
+    """Create one file per format and print probe timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=500, help="File size in MB")
+    parser.add_argument("--repeat", type=int, default=200, help="Probes per format")
+    args = parser.parse_args()
+    size = args.mb * 10**6
+
+    writers = {"wav": write_wav, "m4a": write_m4a, "webm": write_webm, "mp3": write_mp3}
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{args.mb} MB files, median of {args.repeat} probes")
+        print(f"{'format':<6} {'duration':>10} {'rate':>6} {'ch':>3} {'probe':>10}")
+        for name, write in writers.items():
+            path = Path(tmp) / f"meeting.{name}"
+            write(path, size)
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                probe = probe_audio(path)
+                timings.append(time.perf_counter() - started)
+            print(
+                f"{name:<6} {probe.duration_seconds / 60:>8.1f}m {probe.sample_rate:>6} "
+                f"{probe.channels:>3} {statistics.median(timings) * 1e6:>8.0f}us"
+            )
+
+        started = time.perf_counter()
+        measure_energy(Path(tmp) / "meeting.wav")
+        print(f"wav decode for comparison: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Semantic search benchmark: embedding throughput, index build, memory and query latency.
+
+Embeds a sample of synthetic meeting passages to measure throughput, then
+fills a SemanticIndex with passages for N meetings (vectors of a pool of
+embedded passages plus noise, so large corpora do not take minutes to
+embed) and times exact and IVF queries. IVF recall is the share of the
+exact top-10 meetings it also returns.
+
+Usage:
+    python -m benchmarks.bench_semantic_search --meetings 100000
+    python -m benchmarks.bench_semantic_search --meetings 100000 --passages 16 --probes 4 8 16
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+
+import numpy as np
+
+from app.services.semantic_index import SemanticIndex
+from app.utils.embeddings import HashingEmbedder, quantize
+
+TOPICS = [
+    "budget forecast spending revenue quarter finance costs invoices",
+    "hiring candidates interviews recruiting onboarding offers salary",
+    "roadmap features release planning priorities milestones launch",
+    "marketing campaign brand social launch audience content",
+    "infrastructure outage servers latency database migration incident",
+    "customers support tickets churn feedback renewal contracts",
+    "legal compliance privacy contract review policy audit",
+    "office move facilities lease desks equipment travel",
+]
+
+
+def make_passages(count: int, rng: np.random.Generator) -> list[str]:
+    """Generate meeting-like passages mixing one topic with filler words."""
+    filler = "we should discuss next week team update please follow up agreed".split()
+    passages = []
+    for _ in range(count):
+        topic = TOPICS[rng.integers(len(TOPICS))].split()
+        words = list(rng.choice(topic, 12)) + list(rng.choice(filler, 28))
+        rng.shuffle(words)
+        passages.append(" ".join(words))
+    return passages
+
+
+def time_queries(
+    index: SemanticIndex, queries: np.ndarray, probes: int | None
+) -> tuple[list[float], list[set[uuid.UUID]]]:
+    """Run each query and return latencies (ms) and the returned meetings."""
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        matches = index.search(query, 10, probes=probes)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append({match.audio_id for match in matches})
+    return latencies, results
+
+
+def main() -> None:
+    """Build the index and print build, memory and latency figures."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--meetings", type=int, default=100_000, help="Meetings in the index")
+    parser.add_argument("--passages", type=int, default=8, help="Passages per meeting")
+    parser.add_argument("--dimensions", type=int, default=256, help="Hashing vector length")
+    parser.add_argument("--embed-sample", type=int, default=5000, help="Passages embedded")
+    parser.add_argument("--queries", type=int, default=100, help="Timed queries per mode")
+    parser.add_argument("--probes", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    embedder = HashingEmbedder(args.dimensions)
+
+    start = time.perf_counter()
+    pool = embedder.embed(make_passages(args.embed_sample, rng))
+    embed_rate = args.embed_sample / (time.perf_counter() - start)
+
+    total = args.meetings * args.passages
+    meetings = [uuid.uuid4() for _ in range(args.meetings)]
+    index = SemanticIndex(args.dimensions)
+    start = time.perf_counter()
+    for offset in range(0, total, 100_000):
+        count = min(100_000, total - offset)
+        vectors = pool[rng.integers(len(pool), size=count)]
+        vectors = vectors + rng.normal(scale=0.02, size=vectors.shape).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        codes, scales = quantize(vectors)
+        ids = list(range(offset + 1, offset + count + 1))
+        index.add(
+            ids,
+            [meetings[i // args.passages] for i in range(offset, offset + count)],
+            codes,
+            scales,
+        )
+    load_seconds = time.perf_counter() - start
+
+    queries = embedder.embed(
+        [" ".join(rng.choice(TOPICS[i % len(TOPICS)].split(), 3)) for i in range(args.queries)]
+    )
+    exact_ms, exact_results = time_queries(index, queries, None)
+
+    start = time.perf_counter()
+    index.build_inverted_lists()
+    ivf_seconds = time.perf_counter() - start
+
+    print(f"{args.meetings} meetings x {args.passages} passages = {total} vectors")
+    print(f"embedding: {embed_rate:,.0f} passages/s (hashing, {args.dimensions} dims)")
+    print(f"memory: {index.nbytes / total:.0f} bytes/vector, {index.nbytes / 2**20:,.0f} MiB total")
+    print(f"build: load {load_seconds:.1f}s, IVF {ivf_seconds:.1f}s")
+    print(f"{'mode':<10} {'p50':>9} {'p99':>9} {'recall@10':>10}")
+    print(
+        f"{'exact':<10} {statistics.median(exact_ms):>7.1f}ms "
+        f"{np.percentile(exact_ms, 99):>7.1f}ms {1.0:>10.2f}"
+    )
+    for probes in args.probes:
+        ivf_ms, ivf_results = time_queries(index, queries, probes)
+        recall = statistics.mean(
+            len(found & expected) / max(1, len(expected))
+            for found, expected in zip(ivf_results, exact_results, strict=True)
+        )
+        print(
+            f"{f'ivf/{probes}':<10} {statistics.median(ivf_ms):>7.1f}ms "
+            f"{np.percentile(ivf_ms, 99):>7.1f}ms {recall:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Status endpoint throughput benchmark: sync vs async database layer.
+
+Starts the API once with ASYNC_DATABASE_ENABLED=false and once with true,
+then hammers GET /audio/{id} from many concurrent pollers.
+
+Usage:
+    python -m benchmarks.bench_status_polling --pollers 100 --seconds 10
+    python -m benchmarks.bench_status_polling --database-url postgresql://u:p@localhost/db
+"""
+
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import httpx
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values in milliseconds."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+async def _poll(url: str, pollers: int, seconds: float) -> list[float]:
+    """Poll url from concurrent clients and collect request latencies."""
+    latencies: list[float] = []
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=pollers)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+
+        async def poller() -> None:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                response = await client.get(url)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        await asyncio.gather(*(poller() for _ in range(pollers)))
+
+    return latencies
+
+
+def run_mode(async_db: bool, args: argparse.Namespace, workdir: Path) -> dict:
+    """Benchmark one database layer against a fresh API process."""
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.database_url or f"sqlite:///{workdir / 'status.db'}",
+        "ASYNC_DATABASE_ENABLED": str(async_db).lower(),
+        "UPLOAD_DIR": str(workdir / "uploads"),
+        "DEBUG": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{args.port}/api/v1"
+
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        # Reason: Uploads are probed, so the sample needs a real WAV header
+        sample = io.BytesIO()
+        with wave.open(sample, "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(16000)
+            out.writeframes(bytes(32000))
+        upload = httpx.post(
+            f"{base_url}/audio/upload",
+            files={"file": ("meeting.wav", sample.getvalue(), "audio/wav")},
+        ).json()
+        latencies = asyncio.run(
+            _poll(f"{base_url}/audio/{upload['id']}", args.pollers, args.seconds)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "mode": "async" if async_db else "sync",
+        "rps": len(latencies) / args.seconds,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": _percentile(latencies, 99),
+    }
+
+
+def main() -> None:
+    """Run both modes and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pollers", type=int, default=100, help="Concurrent pollers")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration per mode")
+    parser.add_argument("--database-url", help="Sync database URL (default: temp SQLite)")
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = [run_mode(async_db, args, Path(tmp)) for async_db in (False, True)]
+
+    print(f"{args.pollers} concurrent pollers for {args.seconds:.0f}s on GET /audio/{{id}}")
+    print(f"{'mode':<6} {'req/s':>8} {'p50':>9} {'p99':>9}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['rps']:>8.0f} {r['p50_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
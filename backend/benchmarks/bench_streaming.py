@@ -0,0 +1,81 @@
+"""
+Audio content streaming benchmark: peak memory and throughput per request.
+
+Serves a generated file through FileRangeResponse (whole file and a
+range) and, for comparison, as one in-memory Response, sending the body
+to a discarding ASGI receiver. Peak memory is measured with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_streaming --mb 200
+    python -m benchmarks.bench_streaming --mb 1000 --range-mb 10
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from fastapi import Response
+
+from app.core.http_range import file_response
+
+
+async def _discard(message: dict) -> None:
+    """ASGI send that drops the message."""
+
+
+async def _receive() -> dict:
+    """ASGI receive that never delivers a request body."""
+    return {"type": "http.disconnect"}
+
+
+def measure(build: Callable[[], Response], size_mb: float) -> tuple[float, float]:
+    """Send one response and return (peak MiB, MB/s)."""
+    scope = {"type": "http", "method": "GET", "extensions": {}}
+    tracemalloc.start()
+    start = time.perf_counter()
+    asyncio.run(build()(scope, _receive, _discard))
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, size_mb / seconds
+
+
+def main() -> None:
+    """Generate the file and print memory and throughput per mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=200, help="File size in MB")
+    parser.add_argument("--range-mb", type=int, default=10, help="Size of the requested range")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "meeting.webm"
+        with path.open("wb") as file:
+            for _ in range(args.mb):
+                file.write(os.urandom(2**20))
+        stat_result = os.stat(path)
+        middle = stat_result.st_size // 2
+        range_header = f"bytes={middle}-{middle + args.range_mb * 2**20 - 1}"
+
+        modes = {
+            "in-memory": (lambda: Response(path.read_bytes(), media_type="audio/webm"), args.mb),
+            "streamed": (lambda: file_response(path, stat_result, '"bench"'), args.mb),
+            "range": (
+                lambda: file_response(path, stat_result, '"bench"', range_header=range_header),
+                args.range_mb,
+            ),
+        }
+
+        print(f"{args.mb} MB file")
+        print(f"{'mode':<10} {'peak MiB':>9} {'MB/s':>9}")
+        for name, (build, size_mb) in modes.items():
+            peak, rate = measure(build, size_mb)
+            print(f"{name:<10} {peak:>9.1f} {rate:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Transcoding benchmark: end-to-end transcription latency with and without transcoding.
+
+Generates a synthetic 48 kHz stereo meeting and transcribes it in-process
+against a fake Whisper whose latency is the upload time of the bytes sent
+(at a given uplink bandwidth) plus processing time per audio second. The
+transcoded run includes the time spent transcoding in the process pool.
+
+Usage:
+    python -m benchmarks.bench_transcode --minutes 8 60
+    python -m benchmarks.bench_transcode --minutes 30 --uplink-mbps 10
+"""
+
+import argparse
+import asyncio
+import io
+import tempfile
+import time
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401
+from app.core.database import Base
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.services.transcode_service import TranscodeService, shutdown_transcode_pool
+from app.services.transcription_service import TranscriptionService
+
+
+class UplinkWhisper:
+    """Fake Whisper that waits for the upload at uplink_mbps plus speed per audio second."""
+
+    def __init__(self, uplink_mbps: float, speed: float) -> None:
+        self.bytes_per_second = uplink_mbps * 1e6 / 8
+        self.speed = speed
+        self.bytes_sent = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        upload = kwargs["file"]
+        data = upload[1] if isinstance(upload, tuple) else upload.read()
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            seconds = wav.getnframes() / wav.getframerate()
+        self.bytes_sent += len(data)
+        await asyncio.sleep(len(data) / self.bytes_per_second + seconds * self.speed)
+        segments = [{"start": 0.0, "end": seconds, "text": f"{seconds:.0f} seconds of speech."}]
+        return SimpleNamespace(
+            text=segments[0]["text"], language="en", duration=seconds, segments=segments
+        )
+
+
+def write_meeting(path: Path, minutes: float) -> None:
+    """Write a 48 kHz stereo WAV of 12 s speech-like bursts and 0.7 s pauses."""
+    rate = 48000
+    t = np.arange(12 * rate) / rate
+    burst = np.repeat((np.sin(2 * np.pi * 220 * t) * 6000).astype("<i2")[:, None], 2, axis=1)
+    pause = np.zeros((int(0.7 * rate), 2), dtype="<i2")
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        for _ in range(int(minutes * 60 / 12.7)):
+            wav.writeframes(burst.tobytes() + pause.tobytes())
+
+
+async def run_mode(path: Path, transcode: bool, args: argparse.Namespace) -> dict:
+    """Transcode (optionally) and transcribe the meeting once."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    whisper = UplinkWhisper(args.uplink_mbps, args.speed)
+
+    with Session(engine) as db:
+        audio_file = AudioFile(
+            filename=path.name,
+            file_path=str(path),
+            file_size=path.stat().st_size,
+            mime_type="audio/wav",
+        )
+        db.add(audio_file)
+        db.commit()
+
+        client = SimpleNamespace(audio=SimpleNamespace(transcriptions=whisper))
+        started = time.perf_counter()
+        if transcode:
+            await TranscodeService(db).transcode_audio(audio_file)
+        transcoded = time.perf_counter() - started
+        await TranscriptionService(db, client=client).transcribe_audio(audio_file, use_cache=False)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "mode": "transcoded" if transcode else "original",
+        "mb_sent": whisper.bytes_sent / 1e6,
+        "transcode_s": transcoded,
+        "wall_s": elapsed,
+    }
+
+
+def main() -> None:
+    """Run both modes per meeting length and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, nargs="+", default=[8.0, 60.0])
+    parser.add_argument("--uplink-mbps", type=float, default=20.0, help="Upload bandwidth")
+    parser.add_argument("--speed", type=float, default=0.005, help="Fake seconds per audio second")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.upload_dir = tmp
+        print(f"48 kHz stereo WAV, {args.uplink_mbps:.0f} Mbit/s uplink")
+        print(f"{'minutes':>7} {'mode':<11} {'MB sent':>8} {'transcode':>10} {'wall':>8}")
+        for minutes in args.minutes:
+            path = Path(tmp) / f"meeting-{minutes:.0f}.wav"
+            write_meeting(path, minutes)
+            for transcode in (False, True):
+                r = asyncio.run(run_mode(path, transcode, args))
+                print(
+                    f"{minutes:>7.0f} {r['mode']:<11} {r['mb_sent']:>8.1f} "
+                    f"{r['transcode_s']:>9.1f}s {r['wall_s']:>7.1f}s"
+                )
+        shutdown_transcode_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Upload benchmark: buffered vs streamed uploads.
+
+Starts the API in a uvicorn subprocess once per mode, fires concurrent
+uploads at it while probing /health, and reports the server's peak RSS
+plus p50/p99 latencies.
+
+Usage:
+    python -m benchmarks.bench_upload --uploads 10 --size-mb 100
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+MODE_ENV = "BENCH_UPLOAD_MODE"
+
+
+def _configure_app() -> None:
+    """Swap in the pre-streaming upload path when running in buffered mode."""
+    from fastapi import HTTPException, UploadFile, status
+
+    from app.core.settings import settings
+    from app.models.audio import AudioFile, AudioStatus
+    from app.services.audio_service import AudioService
+
+    async def buffered_upload_audio(self: AudioService, file: UploadFile) -> AudioFile:
+        # Reason: Mirrors the original implementation (whole file in memory, blocking write)
+        self._validate_audio_file(file)
+        file_content = await file.read()
+        if len(file_content) > settings.max_upload_size_bytes:
+            raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        file_path = self.storage.upload_dir / f"{uuid.uuid4()}{Path(file.filename).suffix}"
+        with open(file_path, "wb") as out:
+            out.write(file_content)
+        audio_file = AudioFile(
+            filename=file.filename,
+            file_path=str(file_path),
+            file_size=len(file_content),
+            mime_type=file.content_type or "audio/webm",
+            status=AudioStatus.UPLOADED.value,
+        )
+        self.db.add(audio_file)
+        self.db.commit()
+        self.db.refresh(audio_file)
+        return audio_file
+
+    if os.environ.get(MODE_ENV) == "buffered":
+        AudioService.upload_audio = buffered_upload_audio
+
+
+if os.environ.get(MODE_ENV):
+    _configure_app()
+    from app.main import app  # noqa: E402,F401
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values in milliseconds."""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+def _peak_rss_mb(pid: int) -> float:
+    """Read the peak resident set size of a process from /proc."""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def _wait_ready(base_url: str) -> None:
+    """Block until the server answers health checks."""
+    for _ in range(100):
+        try:
+            if httpx.get(f"{base_url}/api/v1/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("Server did not start")
+
+
+def run_mode(mode: str, sample: Path, uploads: int, port: int, workdir: Path) -> dict:
+    """Benchmark one upload mode against a fresh server process."""
+    env = {
+        **os.environ,
+        MODE_ENV: mode,
+        "DATABASE_URL": f"sqlite:///{workdir / f'{mode}.db'}",
+        "UPLOAD_DIR": str(workdir / mode),
+        "MAX_UPLOAD_SIZE_MB": "1024",
+        "DEBUG": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.bench_upload:app", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    upload_latencies: list[float] = []
+    health_latencies: list[float] = []
+    done = threading.Event()
+
+    def upload() -> None:
+        with sample.open("rb") as fh, httpx.Client(timeout=600) as client:
+            start = time.perf_counter()
+            response = client.post(
+                f"{base_url}/api/v1/audio/upload",
+                files={"file": ("meeting.wav", fh, "audio/wav")},
+            )
+            upload_latencies.append(time.perf_counter() - start)
+            response.raise_for_status()
+
+    def probe_health() -> None:
+        with httpx.Client(timeout=600) as client:
+            while not done.is_set():
+                start = time.perf_counter()
+                client.get(f"{base_url}/api/v1/health")
+                health_latencies.append(time.perf_counter() - start)
+                time.sleep(0.02)
+
+    try:
+        _wait_ready(base_url)
+        prober = threading.Thread(target=probe_health)
+        prober.start()
+        with ThreadPoolExecutor(max_workers=uploads) as pool:
+            for future in [pool.submit(upload) for _ in range(uploads)]:
+                future.result()
+        done.set()
+        prober.join()
+        peak_rss = _peak_rss_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "mode": mode,
+        "peak_rss_mb": peak_rss,
+        "upload_p50_ms": statistics.median(upload_latencies) * 1000,
+        "upload_p99_ms": _percentile(upload_latencies, 99),
+        "health_p99_ms": _percentile(health_latencies, 99),
+    }
+
+
+def main() -> None:
+    """Run both modes and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=10, help="Concurrent uploads")
+    parser.add_argument("--size-mb", type=int, default=100, help="Size of each upload")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        sample = workdir / "sample.wav"
+        # Reason: Uploads are probed, so the noise needs a real WAV header
+        with wave.open(str(sample), "wb") as out:
+            out.setnchannels(1)
+            out.setsampwidth(2)
+            out.setframerate(48000)
+            for _ in range(args.size_mb):
+                out.writeframes(os.urandom(1024 * 1024))
+
+        results = [
+            run_mode(mode, sample, args.uploads, args.port, workdir)
+            for mode in ("buffered", "streaming")
+        ]
+
+    print(f"{args.uploads} concurrent uploads of {args.size_mb} MB")
+    print(
+        f"{'mode':<10} {'peak RSS MB':>12} {'upload p50':>11} {'upload p99':>11} {'health p99':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['mode']:<10} {r['peak_rss_mb']:>12.1f} {r['upload_p50_ms']:>9.0f}ms"
+            f" {r['upload_p99_ms']:>9.0f}ms {r['health_p99_ms']:>9.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Voice activity detection benchmark: audio removed and CPU cost.
+
+Generates a synthetic meeting of noisy speech-like bursts with short
+pauses, a long wait at the start and breaks in between, then times speech
+detection and writing of the trimmed audio. Whisper bills per audio
+minute, so the removed share is the share of the transcription bill saved.
+
+Usage:
+    python -m benchmarks.bench_vad --minutes 60
+    python -m benchmarks.bench_vad --minutes 120 --wait-minutes 10 --breaks 3
+"""
+
+import argparse
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from app.core.settings import settings
+from app.utils.audio import SAMPLE_RATE
+from app.utils.vad import detect_speech, write_speech
+
+
+def write_meeting(path: Path, minutes: float, wait_minutes: float, breaks: int) -> float:
+    """Write the meeting WAV and return its seconds of silence longer than 2 s."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(8 * SAMPLE_RATE)) / SAMPLE_RATE
+    burst = np.sin(2 * np.pi * 180 * t) * 5000 * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    burst = (burst + rng.normal(scale=150, size=len(t))).astype("<i2").tobytes()
+    pause = rng.normal(scale=60, size=int(0.6 * SAMPLE_RATE)).astype("<i2").tobytes()
+
+    def silence(seconds: float) -> bytes:
+        return rng.normal(scale=60, size=int(seconds * SAMPLE_RATE)).astype("<i2").tobytes()
+
+    talk_seconds = minutes * 60 - wait_minutes * 60 - breaks * 120
+    bursts = int(talk_seconds / 8.6)
+    break_after = {bursts * (index + 1) // (breaks + 1) for index in range(breaks)}
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(silence(wait_minutes * 60))
+        for index in range(bursts):
+            wav.writeframes(burst + pause)
+            if index in break_after:
+                wav.writeframes(silence(120))
+    return wait_minutes * 60 + breaks * 120
+
+
+def main() -> None:
+    """Detect speech in the meeting and print removed audio and timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--minutes", type=float, default=60.0, help="Meeting length")
+    parser.add_argument("--wait-minutes", type=float, default=5.0, help="Silence before start")
+    parser.add_argument("--breaks", type=int, default=2, help="Two-minute breaks")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "meeting.wav"
+        silent = write_meeting(path, args.minutes, args.wait_minutes, args.breaks)
+
+        started = time.perf_counter()
+        speech_map = detect_speech(
+            path,
+            min_silence_seconds=settings.vad_min_silence_seconds,
+            padding_seconds=settings.vad_padding_seconds,
+            gap_seconds=settings.vad_gap_seconds,
+        )
+        detect_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        write_speech(path, speech_map, Path(tmp) / "speech.wav")
+        write_seconds = time.perf_counter() - started
+
+    duration = speech_map.duration
+    print(f"{duration / 60:.0f}-minute meeting, {silent / 60:.1f} minutes of long silence")
+    print(f"spans kept:   {len(speech_map.spans)}")
+    print(
+        f"removed:      {speech_map.removed_seconds / 60:.1f} min "
+        f"({speech_map.removed_seconds / duration:.0%} of billed audio)"
+    )
+    print(f"detect:       {detect_seconds:.2f}s ({duration / detect_seconds:,.0f}x realtime)")
+    print(f"write:        {write_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
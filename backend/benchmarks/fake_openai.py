@@ -0,0 +1,70 @@
+"""
+Local fake of the OpenAI endpoints used by the pipeline.
+
+Answers Whisper transcriptions and chat completions after a configurable
+delay, without any network access. Point the app at it with
+OPENAI_BASE_URL=http://127.0.0.1:<port>/v1.
+
+Usage:
+    FAKE_OPENAI_LATENCY=2.0 python -m uvicorn benchmarks.fake_openai:app --port 9000
+"""
+
+import asyncio
+import json
+import os
+import time
+
+from fastapi import FastAPI, Request
+
+# Seconds each fake API call takes
+LATENCY = float(os.environ.get("FAKE_OPENAI_LATENCY", "1.0"))
+
+app = FastAPI(title="Fake OpenAI")
+
+
+@app.post("/v1/audio/transcriptions")
+async def transcriptions(request: Request) -> dict:
+    """Return a verbose_json transcription after the configured delay."""
+    form = await request.form()
+    upload = form["file"]
+    size = len(await upload.read())
+    await asyncio.sleep(LATENCY)
+    duration = max(size / 32000, 1.0)  # Reason: Pretend 16 kHz mono 16-bit audio
+    return {
+        "text": f"Fake transcript of {size} bytes.",
+        "language": "en",
+        "duration": duration,
+        "segments": [
+            {"id": 0, "start": 0.0, "end": duration, "text": f"Fake transcript of {size} bytes."}
+        ],
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request) -> dict:
+    """Return a JSON meeting summary after the configured delay."""
+    body = await request.json()
+    await asyncio.sleep(LATENCY)
+    content = json.dumps(
+        {
+            "summary": "Fake summary.",
+            "key_points": ["Fake point"],
+            "action_items": [{"item": "Fake task", "owner": "Ana"}],
+            "decisions": ["Fake decision"],
+            "participants": ["Ana"],
+        }
+    )
+    return {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "fake"),
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150},
+    }
@@ -4,8 +4,13 @@ Pytest configuration and shared fixtures.
 Provides test database, client, and common utilities.
 """
 
+import json
 import os
+import struct
+import wave
 from collections.abc import Generator
+from pathlib import Path
+from types import SimpleNamespace
 
 # Set environment variables BEFORE importing app modules
 # Reason: Settings are loaded at import time
@@ -18,13 +23,16 @@ os.environ.setdefault("POSTGRES_DB", "test")
 os.environ.setdefault("POSTGRES_HOST", "localhost")
 os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.database import Base, get_db
+from app.core.settings import settings
 from app.main import app
+from app.utils.audio import SAMPLE_RATE
 
 # Use in-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -88,3 +96,211 @@ def client(db: Session) -> TestClient:
 
     # Clean up
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def upload_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Point the upload directory at a per-test temporary folder.
+
+    Returns:
+        Path: Temporary upload directory
+
+    Reason: Keeps uploaded test files out of the real uploads folder
+    """
+    directory = tmp_path / "uploads"
+    monkeypatch.setattr(settings, "upload_dir", str(directory))
+    return directory
+
+
+@pytest.fixture(scope="function")
+def session_factory(db: Session) -> sessionmaker:
+    """
+    Session factory bound to the test database.
+
+    Returns:
+        sessionmaker: Factory for additional sessions (workers, brokers)
+    """
+    return TestingSessionLocal
+
+
+class QueryCounter:
+    """Records SQL statements executed on the test engine."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def __call__(self, conn: object, cursor: object, statement: str, *args: object) -> None:
+        self.statements.append(statement)
+
+    @property
+    def count(self) -> int:
+        """Number of statements recorded."""
+        return len(self.statements)
+
+    def reset(self) -> None:
+        """Forget recorded statements."""
+        self.statements.clear()
+
+
+@pytest.fixture(scope="function")
+def query_counter(db: Session) -> Generator[QueryCounter, None, None]:
+    """
+    Count SQL statements sent to the test database.
+
+    Yields:
+        QueryCounter: Recorder of executed statements
+    """
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+
+
+class FakeTranscriptions:
+    """Stand-in for client.audio.transcriptions that records calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+        self.error: Exception | None = None
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(text=f"transcript {len(self.calls)}", language="en", duration=12.5)
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that records calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+        self.summary = {
+            "summary": "Budget approved.",
+            "key_points": ["Budget"],
+            "action_items": [{"item": "Send report", "owner": "Ana"}],
+            "decisions": ["Approve budget"],
+            "participants": ["Ana", "Ben"],
+        }
+        self.error: Exception | None = None
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        message = SimpleNamespace(content=json.dumps(self.summary))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)],
+            usage=SimpleNamespace(prompt_tokens=300, completion_tokens=21, total_tokens=321),
+        )
+
+
+class FakeOpenAI:
+    """Offline stand-in for the shared AsyncOpenAI client."""
+
+    def __init__(self, **kwargs: object) -> None:
+        self.audio = SimpleNamespace(transcriptions=FakeTranscriptions())
+        self.chat = SimpleNamespace(completions=FakeCompletions())
+
+
+@pytest.fixture(scope="function")
+def fake_openai(monkeypatch: pytest.MonkeyPatch) -> FakeOpenAI:
+    """
+    Install a fake as the process-wide OpenAI client.
+
+    Returns:
+        FakeOpenAI: Fake client whose calls can be inspected
+    """
+    client = FakeOpenAI()
+    monkeypatch.setattr("app.core.ai_client._client", client)
+    return client
+
+
+def write_wav(
+    path: Path, pattern: list[tuple[float, bool]], rate: int = SAMPLE_RATE, channels: int = 1
+) -> Path:
+    """
+    Write a test recording of tone and silence stretches.
+
+    Args:
+        path: Output path
+        pattern: (seconds, is_tone) stretches in order
+        rate: Sample rate
+        channels: Channel count
+
+    Returns:
+        Path: Written file
+    """
+    parts = []
+    for seconds, is_tone in pattern:
+        t = np.arange(int(seconds * rate)) / rate
+        parts.append(np.sin(2 * np.pi * 440 * t) * 8000 if is_tone else np.zeros(len(t)))
+    samples = np.repeat(np.concatenate(parts).astype("<i2")[:, None], channels, axis=1)
+
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.tobytes())
+    return path
+
+
+def ebml_element(element_id: int, body: bytes) -> bytes:
+    """Encode an EBML element with an 8-byte size."""
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    return id_bytes + (1 << 56 | len(body)).to_bytes(8, "big") + body
+
+
+def make_webm(duration_seconds: float | None = 60.0, payload: bytes = b"") -> bytes:
+    """
+    Build a WebM file: headers of a 48 kHz mono audio track, then payload.
+
+    Args:
+        duration_seconds: Duration stored in the Info element (None to omit it,
+            like browser MediaRecorder output)
+        payload: Bytes appended inside the segment (clusters or filler)
+
+    Returns:
+        bytes: File content
+    """
+    header = ebml_element(0x1A45DFA3, ebml_element(0x4282, b"webm"))
+    info = ebml_element(0x2AD7B1, (1_000_000).to_bytes(3, "big"))
+    if duration_seconds is not None:
+        info += ebml_element(0x4489, struct.pack(">d", duration_seconds * 1000))
+    audio = ebml_element(0xB5, struct.pack(">d", 48000.0)) + ebml_element(0x9F, b"\x01")
+    track = ebml_element(0x83, b"\x02") + ebml_element(0xE1, audio)
+    tracks = ebml_element(0xAE, track)
+    # Reason: Live recorders write the segment with an unknown size
+    segment = bytes.fromhex("18538067") + b"\x01" + b"\xff" * 7
+    return (
+        header
+        + segment
+        + ebml_element(0x1549A966, info)
+        + ebml_element(0x1654AE6B, tracks)
+        + payload
+    )
+
+
+def live_cluster(timecode: int, payload: int = 300) -> bytes:
+    """
+    Build a cluster of unknown size holding one block, as MediaRecorder writes while recording.
+
+    Args:
+        timecode: Cluster timestamp in milliseconds
+        payload: Block payload size in bytes
+
+    Returns:
+        bytes: Cluster element
+    """
+    block = ebml_element(0xA3, b"\x81" + struct.pack(">h", 0) + b"\x80" + bytes(payload))
+    timecode_element = ebml_element(0xE7, struct.pack(">I", timecode))
+    return bytes.fromhex("1F43B675") + b"\x01" + b"\xff" * 7 + timecode_element + block
+
+
+def make_mp3(frames: int = 100) -> bytes:
+    """Build a constant-bitrate MP3 of 128 kbit/s 44.1 kHz stereo frames of silence."""
+    frame = b"\xff\xfb\x90\x00" + bytes(413)  # Reason: 144 * 128000 / 44100 = 417 bytes
+    return frame * frames
@@ -0,0 +1,48 @@
+"""
+Shared OpenAI client tests.
+
+Tests for the process-wide async client used by the AI services.
+"""
+
+import pytest
+from openai import AsyncOpenAI
+from sqlalchemy.orm import Session
+
+from app.core import ai_client
+from app.core.settings import settings
+from app.services.summary_service import SummaryService
+from app.services.transcription_service import TranscriptionService
+
+
+async def test_services_share_one_pooled_client(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that services reuse the process-wide client.
+
+    Expected behavior: One AsyncOpenAI instance with the configured pool limits.
+    """
+    monkeypatch.setattr(ai_client, "_client", None)
+    monkeypatch.setattr(settings, "openai_max_keepalive_connections", 7)
+
+    client = ai_client.get_openai_client()
+
+    assert isinstance(client, AsyncOpenAI)
+    assert TranscriptionService(db).client is client
+    assert SummaryService(db).client is client
+    assert client._client._transport._pool._max_keepalive_connections == 7
+
+    await ai_client.close_openai_client()
+    assert ai_client._client is None
+
+
+def test_services_accept_injected_client(db: Session) -> None:
+    """
+    Test explicit client injection.
+
+    Expected behavior: Injected client is used instead of the shared one.
+    """
+    injected = object()
+
+    assert TranscriptionService(db, client=injected).client is injected
+    assert SummaryService(db, client=injected).client is injected
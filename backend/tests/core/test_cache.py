@@ -0,0 +1,105 @@
+"""
+Cache primitive tests.
+
+Tests for the in-process LRU/TTL tier and the two-tier cache.
+"""
+
+from app.core.cache import MemoryCache, TieredCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_memory_cache_evicts_least_recently_used() -> None:
+    """
+    Test the entry bound of the memory cache.
+
+    Expected behavior: Oldest untouched entry is dropped first.
+    """
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+    assert cache.stats.evictions == 1
+
+
+def test_memory_cache_expires_entries() -> None:
+    """
+    Test time-to-live expiry.
+
+    Expected behavior: Entry disappears once its TTL has elapsed.
+    """
+    clock = FakeClock()
+    cache = MemoryCache(max_entries=10, ttl_seconds=60, clock=clock)
+    cache.set("a", b"1")
+
+    clock.now = 59
+    assert cache.get("a") == b"1"
+
+    clock.now = 61
+    assert cache.get("a") is None
+
+
+def test_tiered_cache_promotes_shared_hits() -> None:
+    """
+    Test reads that miss locally but hit the shared tier.
+
+    Expected behavior: Value is returned, counted as a hit and copied locally.
+    """
+    shared = MemoryCache(max_entries=10)
+    writer = TieredCache("test-writer", MemoryCache(max_entries=10), shared=shared)
+    reader = TieredCache("test-reader", MemoryCache(max_entries=10), shared=shared)
+
+    writer.set("key", b"value")
+
+    assert reader.get("key") == b"value"
+    assert reader.local.get("key") == b"value"
+    assert reader.get("missing") is None
+    assert reader.stats.hits == 1
+    assert reader.stats.misses == 1
+
+
+async def test_tiered_cache_async_methods_use_shared_tier() -> None:
+    """
+    Test the async lookups used from the event loop.
+
+    Expected behavior: Same results and counters as the blocking methods.
+    """
+    shared = MemoryCache(max_entries=10)
+    writer = TieredCache("test-async-writer", MemoryCache(max_entries=10), shared=shared)
+    reader = TieredCache("test-async-reader", MemoryCache(max_entries=10), shared=shared)
+
+    await writer.set_async("key", b"value")
+
+    assert await reader.get_async("key") == b"value"
+    assert reader.local.get("key") == b"value"
+    assert await reader.get_async("missing") is None
+    assert reader.stats.hits == 1
+    assert reader.stats.misses == 1
+
+
+def test_memory_cache_conditional_set_checks_guard() -> None:
+    """
+    Test the guarded write used against stale shared-tier writes.
+
+    Expected behavior: Value is stored only while the guard counter is unchanged.
+    """
+    cache = MemoryCache(max_entries=10)
+
+    assert cache.set_if("a", b"1", "guard", None, None) is True
+    cache.incr("guard")
+    assert cache.set_if("a", b"2", "guard", None, None) is False
+    assert cache.set_if("a", b"3", "guard", b"1", None) is True
+    assert cache.get("a") == b"3"
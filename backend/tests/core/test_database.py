@@ -0,0 +1,132 @@
+"""
+Database layer tests.
+
+Tests for the optional async engine, the read-session dependency and the
+schema upgrade of pre-upgrade databases.
+"""
+
+import asyncio
+import uuid
+from pathlib import Path
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core import database
+from app.core.database import Base, async_database_url
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.services.search_service import SearchService
+from app.upgrade import backfill_search_index, upgrade_schema
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("postgresql://u:p@db:5432/notes", "postgresql+asyncpg://u:p@db:5432/notes"),
+        ("postgresql+psycopg2://u:p@db/notes", "postgresql+asyncpg://u:p@db/notes"),
+        ("sqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+    ],
+)
+def test_async_database_url(url: str, expected: str) -> None:
+    """
+    Test conversion of sync URLs to async drivers.
+
+    Expected behavior: Postgres uses asyncpg, SQLite uses aiosqlite.
+    """
+    assert async_database_url(url) == expected
+
+
+@pytest.fixture
+def async_reads(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve read endpoints through an aiosqlite session on the test database."""
+    engine = create_async_engine(async_database_url(TEST_DATABASE_URL), poolclass=NullPool)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(settings, "async_database_enabled", True)
+    monkeypatch.setattr(database, "_async_session_factory", factory)
+
+
+def test_read_endpoints_use_async_session(
+    client: TestClient, db: Session, async_reads: None
+) -> None:
+    """
+    Test status, transcription and summary lookups in async mode.
+
+    Expected behavior: Related IDs are eager-loaded and every lookup succeeds.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, full_text="Hello", status="completed")
+    summary = Summary(transcription=transcription, summary_text="Hi", status="completed")
+    db.add_all([audio_file, transcription, summary])
+    db.commit()
+
+    response = client.get(f"/api/v1/audio/{audio_file.id}")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["transcription_id"] == str(transcription.id)
+    assert data["summary_id"] == str(summary.id)
+
+    response = client.get(f"/api/v1/transcription/{transcription.id}")
+    assert response.json()["full_text"] == "Hello"
+
+    response = client.get(f"/api/v1/summary/{summary.id}")
+    assert response.json()["summary_text"] == "Hi"
+
+    missing = "00000000-0000-0000-0000-000000000000"
+    assert client.get(f"/api/v1/audio/{missing}").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_upgrade_adds_columns_to_pre_upgrade_database(tmp_path: Path) -> None:
+    """
+    Test upgrading a database created by the release before this schema.
+
+    Expected behavior: Missing columns and indexes are added, existing rows
+    load through the ORM and their text is indexed for search.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    audio_id, transcription_id = uuid.uuid4().hex, uuid.uuid4().hex
+    with engine.begin() as connection:
+        for statement in (
+            "CREATE TABLE audio_files (id CHAR(32) PRIMARY KEY, filename VARCHAR(255) NOT NULL, "
+            "file_path VARCHAR(500) NOT NULL UNIQUE, file_size INTEGER NOT NULL, "
+            "mime_type VARCHAR(100) NOT NULL, duration_seconds FLOAT, status VARCHAR(20) NOT NULL, "
+            "error_message VARCHAR(1000), created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)",
+            "CREATE TABLE transcriptions (id CHAR(32) PRIMARY KEY, "
+            "audio_file_id CHAR(32) NOT NULL UNIQUE REFERENCES audio_files (id), full_text TEXT, "
+            "language VARCHAR(10), confidence_score FLOAT, processing_time_ms INTEGER, "
+            "status VARCHAR(20) NOT NULL, error_message VARCHAR(1000), "
+            "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)",
+            f"INSERT INTO audio_files VALUES ('{audio_id}', 'old.webm', '/tmp/old.webm', 1, "
+            "'audio/webm', NULL, 'completed', NULL, '2024-01-01', '2024-01-01')",
+            f"INSERT INTO transcriptions VALUES ('{transcription_id}', '{audio_id}', "
+            "'The quarterly budget was approved.', 'en', NULL, 10, 'completed', NULL, "
+            "'2024-01-01', '2024-01-01')",
+        ):
+            connection.execute(text(statement))
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        changes = upgrade_schema(connection)
+
+    assert "added column audio_files.content_hash" in changes
+    assert "added column transcriptions.cache_hit" in changes
+    assert "created index ix_audio_files_created_at_id" in changes
+    with Session(engine) as session:
+        transcription = session.get(Transcription, uuid.UUID(transcription_id))
+        assert transcription.cache_hit is False
+        assert transcription.audio_file.content_hash is None
+        assert backfill_search_index(session) == 1
+        hits = asyncio.run(SearchService(session).search("budget", limit=5))
+        assert [hit.audio_id for hit in hits] == [uuid.UUID(audio_id)]
+    with engine.begin() as connection:
+        assert upgrade_schema(connection) == []
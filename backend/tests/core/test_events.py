@@ -0,0 +1,78 @@
+"""
+Event bus tests.
+
+Tests for in-process publish/subscribe delivery.
+"""
+
+import asyncio
+import threading
+
+from app.core.events import SUBSCRIBER_QUEUE_SIZE, EventBus
+
+
+async def test_event_bus_delivers_to_channel_subscribers() -> None:
+    """
+    Test publishing to subscribed and unrelated channels.
+
+    Expected behavior: Each subscriber receives only its channel's events.
+    """
+    bus = EventBus()
+    first = bus.subscribe("audio:1")
+    second = bus.subscribe("audio:1")
+    other = bus.subscribe("audio:2")
+
+    bus.publish("audio:1", {"stage": "transcribing"})
+
+    assert await asyncio.wait_for(first.get(), 1) == {"stage": "transcribing"}
+    assert await asyncio.wait_for(second.get(), 1) == {"stage": "transcribing"}
+    assert other.queue.empty()
+
+
+async def test_event_bus_publish_from_worker_thread() -> None:
+    """
+    Test publishing from a thread other than the subscriber's loop.
+
+    Expected behavior: Event is handed to the subscriber's loop.
+    """
+    bus = EventBus()
+    subscription = bus.subscribe("audio:1")
+
+    thread = threading.Thread(target=bus.publish, args=("audio:1", {"stage": "completed"}))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(subscription.get(), 1) == {"stage": "completed"}
+
+
+async def test_event_bus_slow_subscriber_keeps_latest_events() -> None:
+    """
+    Test a subscriber that does not keep up.
+
+    Expected behavior: Oldest events are dropped, the latest one is kept.
+    """
+    bus = EventBus()
+    subscription = bus.subscribe("audio:1")
+
+    for index in range(SUBSCRIBER_QUEUE_SIZE + 5):
+        bus.publish("audio:1", {"index": index})
+    await asyncio.sleep(0)
+
+    assert subscription.queue.qsize() == SUBSCRIBER_QUEUE_SIZE
+    assert (await subscription.get())["index"] == 5
+
+
+async def test_event_bus_close_unsubscribes() -> None:
+    """
+    Test closing a subscription.
+
+    Expected behavior: Channel has no subscribers and publishing is a no-op.
+    """
+    bus = EventBus()
+    subscription = bus.subscribe("audio:1")
+    subscription.close()
+
+    bus.publish("audio:1", {"stage": "failed"})
+    await asyncio.sleep(0)
+
+    assert bus.subscriber_count("audio:1") == 0
+    assert subscription.queue.empty()
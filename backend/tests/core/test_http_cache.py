@@ -0,0 +1,42 @@
+"""
+HTTP caching helper tests.
+
+Tests for ETag generation and If-None-Match evaluation.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+from app.core.http_cache import etag_matches, make_etag
+
+
+def test_make_etag_changes_with_version() -> None:
+    """
+    Test ETags of two versions of a resource.
+
+    Expected behavior: Same version gives the same strong tag, a new version a new one.
+    """
+    resource_id = uuid.uuid4()
+    updated_at = datetime(2024, 1, 15, 10, 30)
+
+    etag = make_etag(resource_id, updated_at)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert make_etag(resource_id, updated_at) == etag
+    assert make_etag(resource_id, updated_at + timedelta(microseconds=1)) != etag
+    assert make_etag(uuid.uuid4(), updated_at) != etag
+
+
+def test_etag_matches_if_none_match_forms() -> None:
+    """
+    Test the forms of the If-None-Match header.
+
+    Expected behavior: Lists, weak tags and "*" match; other tags and no header do not.
+    """
+    etag = '"abc"'
+
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"xyz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"xyz"', etag)
+    assert not etag_matches(None, etag)
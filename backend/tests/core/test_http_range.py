@@ -0,0 +1,48 @@
+"""
+HTTP range helper tests.
+
+Tests for Range header parsing.
+"""
+
+import pytest
+
+from app.core.http_range import RangeNotSatisfiableError, parse_range
+
+
+def test_parse_range_forms() -> None:
+    """
+    Test the single-range forms of the Range header.
+
+    Expected behavior: Closed, open-ended and suffix ranges are clamped to the file.
+    """
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=900-5000", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=-5000", 1000) == (0, 999)
+
+
+def test_parse_range_ignores_unsupported_headers() -> None:
+    """
+    Test headers that are served as a whole file.
+
+    Expected behavior: Missing, malformed, reversed and multi-range headers give None.
+    """
+    assert parse_range(None, 1000) is None
+    assert parse_range("items=0-10", 1000) is None
+    assert parse_range("bytes=abc", 1000) is None
+    assert parse_range("bytes=-", 1000) is None
+    assert parse_range("bytes=50-10", 1000) is None
+    assert parse_range("bytes=0-10,20-30", 1000) is None
+
+
+def test_parse_range_not_satisfiable() -> None:
+    """
+    Test ranges selecting no bytes.
+
+    Expected behavior: Starting beyond the end or an empty suffix raises.
+    """
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range("bytes=1000-", 1000)
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_range("bytes=-0", 1000)
@@ -0,0 +1,507 @@
+"""
+Audio endpoint tests.
+
+Tests for the /api/v1/audio endpoints.
+"""
+
+import json
+import threading
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from fastapi import WebSocket, WebSocketDisconnect, status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.events import get_event_bus
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.job import ProcessingJob
+from app.models.transcription import Transcription
+from app.services.audio_service import AudioService
+from app.services.status_events import audio_channel
+from tests.conftest import FakeOpenAI, live_cluster, make_webm
+
+
+def read_status_events(client: TestClient, audio_id: str) -> list[dict]:
+    """Read a status event stream to its end and return the event payloads."""
+    events = []
+    with client.stream("GET", f"/api/v1/audio/{audio_id}/events") as response:
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/event-stream")
+        for line in response.iter_lines():
+            if line.startswith("data: "):
+                events.append(json.loads(line[len("data: ") :]))
+    return events
+
+
+def test_upload_audio_success(client: TestClient, upload_dir: Path) -> None:
+    """
+    Test uploading a valid audio file.
+
+    Expected behavior: Returns 201 and stores the file on disk.
+    """
+    content = make_webm(payload=b"fake-webm-audio" * 100)
+    response = client.post(
+        "/api/v1/audio/upload",
+        files={"file": ("meeting.webm", content, "audio/webm")},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+
+    data = response.json()
+    assert data["filename"] == "meeting.webm"
+    assert data["file_size"] == len(content)
+    assert data["status"] == "uploaded"
+
+    stored_files = list(upload_dir.iterdir())
+    assert len(stored_files) == 1
+    assert stored_files[0].read_bytes() == content
+
+
+def test_upload_audio_too_large(
+    client: TestClient, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test uploading a file above the size limit.
+
+    Expected behavior: Returns 413 and nothing is stored.
+    """
+    monkeypatch.setattr(settings, "max_upload_size_mb", 1)
+
+    response = client.post(
+        "/api/v1/audio/upload",
+        files={"file": ("meeting.webm", b"x" * (1024 * 1024 + 1), "audio/webm")},
+    )
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert not upload_dir.exists() or list(upload_dir.iterdir()) == []
+
+
+def test_upload_audio_invalid_format(client: TestClient, upload_dir: Path) -> None:
+    """
+    Test uploading a file with an unsupported extension.
+
+    Expected behavior: Returns 400.
+    """
+    response = client.post(
+        "/api/v1/audio/upload",
+        files={"file": ("notes.txt", b"hello", "text/plain")},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_upload_audio_checks_container_header(
+    client: TestClient, db: Session, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test uploads validated by their container header.
+
+    Expected behavior: Header metadata is stored; mislabelled or over-length
+    recordings are rejected with 400 and not kept on disk.
+    """
+    monkeypatch.setattr(settings, "max_audio_duration_minutes", 60)
+
+    response = client.post(
+        "/api/v1/audio/upload",
+        files={"file": ("meeting.webm", make_webm(1830.4), "audio/webm;codecs=opus")},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["duration_seconds"] == pytest.approx(1830.4)
+    audio_file = db.get(AudioFile, UUID(response.json()["id"]))
+    assert (audio_file.mime_type, audio_file.sample_rate, audio_file.channels) == (
+        "audio/webm",
+        48000,
+        1,
+    )
+
+    rejected = {
+        "meeting.mp3": make_webm(),
+        "meeting.webm": b"fake-webm-audio" * 100,
+        "meeting.m4a": make_webm(61 * 60),
+        "long.webm": make_webm(61 * 60),
+    }
+    details = []
+    for filename, content in rejected.items():
+        response = client.post(
+            "/api/v1/audio/upload", files={"file": (filename, content, "audio/webm")}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        details.append(response.json()["detail"])
+
+    assert details[0] == "File content is webm, not mp3"
+    assert details[1].startswith("File is not a valid webm recording")
+    assert details[3] == "Recording too long. Max duration: 60 minutes"
+    assert len(list(upload_dir.iterdir())) == 1
+
+
+def test_delete_deduplicated_upload(
+    client: TestClient, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test deleting uploads that share one content-addressed file.
+
+    Expected behavior: File is unlinked only when the last upload is deleted.
+    """
+    monkeypatch.setattr(settings, "storage_mode", "content_addressed")
+    files = {"file": ("meeting.webm", make_webm(), "audio/webm")}
+
+    first = client.post("/api/v1/audio/upload", files=files).json()
+    second = client.post("/api/v1/audio/upload", files=files).json()
+
+    assert first["content_hash"] == second["content_hash"]
+    stored = [p for p in upload_dir.rglob("*") if p.is_file()]
+    assert len(stored) == 1
+
+    assert client.delete(f"/api/v1/audio/{first['id']}").status_code == status.HTTP_204_NO_CONTENT
+    assert stored[0].exists()
+
+    assert client.delete(f"/api/v1/audio/{second['id']}").status_code == status.HTTP_204_NO_CONTENT
+    assert not stored[0].exists()
+
+    assert client.get(f"/api/v1/audio/{second['id']}").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_stream_audio_events_forwards_published_stages(
+    client: TestClient, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test streaming status events published by the pipeline.
+
+    Expected behavior: Current status first, then each published stage; ends on failure.
+    """
+    monkeypatch.setattr(settings, "events_resync_seconds", 30.0)
+    upload = client.post(
+        "/api/v1/audio/upload", files={"file": ("meeting.webm", make_webm(), "audio/webm")}
+    ).json()
+    client.post(f"/api/v1/process/{upload['id']}")
+    snapshot = client.get(f"/api/v1/audio/{upload['id']}").json()
+
+    def publish(stage: str, **fields: object) -> None:
+        event = {**snapshot, "stage": stage, **fields}
+        get_event_bus().publish(audio_channel(upload["id"]), event)
+
+    timers = [
+        threading.Timer(0.1, publish, args=("transcribing",)),
+        threading.Timer(0.2, publish, args=("failed",), kwargs={"status": "failed"}),
+    ]
+    for timer in timers:
+        timer.start()
+    events = read_status_events(client, upload["id"])
+
+    assert [event["stage"] for event in events] == ["queued", "transcribing", "failed"]
+    assert events[-1]["status"] == "failed"
+
+
+def test_stream_audio_events_resyncs_from_database(
+    client: TestClient,
+    upload_dir: Path,
+    session_factory: sessionmaker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test a stream whose events are published by an unreachable worker.
+
+    Expected behavior: Status changes are picked up by re-reading the database.
+    """
+    monkeypatch.setattr(settings, "events_resync_seconds", 0.05)
+    upload = client.post(
+        "/api/v1/audio/upload", files={"file": ("meeting.webm", make_webm(), "audio/webm")}
+    ).json()
+
+    def complete() -> None:
+        with session_factory() as session:
+            session.get(AudioFile, UUID(upload["id"])).status = "completed"
+            session.commit()
+
+    threading.Timer(0.2, complete).start()
+    events = read_status_events(client, upload["id"])
+
+    assert [event["stage"] for event in events] == ["uploaded", "completed"]
+
+
+def test_stream_audio_events_backs_off_while_idle(
+    client: TestClient, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a stream opened for an uploaded file that is not processed yet.
+
+    Expected behavior: Keepalives continue, but the database is re-read less
+    and less often until the status changes.
+    """
+    monkeypatch.setattr(settings, "events_resync_seconds", 0.01)
+    monkeypatch.setattr(settings, "events_idle_resync_seconds", 0.08)
+    upload = client.post(
+        "/api/v1/audio/upload", files={"file": ("meeting.webm", make_webm(), "audio/webm")}
+    ).json()
+    reads = []
+    get_audio = AudioService.get_audio_by_id_async
+
+    async def counting_get_audio(self: AudioService, *args: object, **kwargs: object) -> object:
+        reads.append(args)
+        return await get_audio(self, *args, **kwargs)
+
+    monkeypatch.setattr(AudioService, "get_audio_by_id_async", counting_get_audio)
+    snapshot = client.get(f"/api/v1/audio/{upload['id']}").json()
+    reads.clear()
+    event = {**snapshot, "stage": "failed", "status": "failed"}
+    threading.Timer(0.5, get_event_bus().publish, args=(audio_channel(upload["id"]), event)).start()
+
+    with client.stream("GET", f"/api/v1/audio/{upload['id']}/events") as response:
+        keepalives = sum(1 for line in response.iter_lines() if line == ": keepalive")
+
+    # Reason: The first read is the initial snapshot; one re-read per keepalive without backoff
+    assert len(reads) - 1 < keepalives / 2
+
+
+def test_stream_audio_events_not_found(client: TestClient) -> None:
+    """
+    Test streaming events of an unknown audio file.
+
+    Expected behavior: Returns 404 and leaves no subscription behind.
+    """
+    audio_id = "00000000-0000-0000-0000-000000000000"
+    response = client.get(f"/api/v1/audio/{audio_id}/events")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert get_event_bus().subscriber_count(audio_channel(audio_id)) == 0
+
+
+def test_get_audio_content_supports_ranges(client: TestClient, upload_dir: Path) -> None:
+    """
+    Test playback of an uploaded file.
+
+    Expected behavior: Whole file with Accept-Ranges, 206 for a range, 304 for a
+    current ETag, 416 beyond the end and a full response for a stale If-Range.
+    """
+    content = make_webm(payload=bytes(range(256)) * 1024)
+    upload = client.post(
+        "/api/v1/audio/upload", files={"file": ("meeting.webm", content, "audio/webm")}
+    ).json()
+    url = f"/api/v1/audio/{upload['id']}/content"
+
+    whole = client.get(url)
+    assert whole.status_code == status.HTTP_200_OK
+    assert whole.content == content
+    assert whole.headers["accept-ranges"] == "bytes"
+    assert whole.headers["content-type"] == "audio/webm"
+    etag = whole.headers["etag"]
+
+    part = client.get(url, headers={"Range": "bytes=1000-70999"})
+    assert part.status_code == status.HTTP_206_PARTIAL_CONTENT
+    assert part.content == content[1000:71000]
+    assert part.headers["content-range"] == f"bytes 1000-70999/{len(content)}"
+    assert part.headers["content-length"] == "70000"
+
+    suffix = client.get(url, headers={"Range": "bytes=-10", "If-Range": etag})
+    assert suffix.content == content[-10:]
+
+    stale = client.get(url, headers={"Range": "bytes=-10", "If-Range": '"old"'})
+    assert stale.status_code == status.HTTP_200_OK
+    assert len(stale.content) == len(content)
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    beyond = client.get(url, headers={"Range": f"bytes={len(content)}-"})
+    assert beyond.status_code == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+    assert beyond.headers["content-range"] == f"bytes */{len(content)}"
+
+    missing = client.get("/api/v1/audio/00000000-0000-0000-0000-000000000000/content")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_audio_content_while_recording_is_revalidated(
+    client: TestClient, db: Session, upload_dir: Path
+) -> None:
+    """
+    Test playback of a recording that is still receiving audio.
+
+    Expected behavior: Not marked immutable, and the ETag changes as the file grows.
+    """
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    path = upload_dir / "live.webm"
+    path.write_bytes(make_webm(None))
+    audio_file = AudioFile(
+        filename="live.webm",
+        file_path=str(path),
+        file_size=0,
+        mime_type="audio/webm",
+        status="recording",
+    )
+    db.add(audio_file)
+    db.commit()
+    url = f"/api/v1/audio/{audio_file.id}/content"
+
+    first = client.get(url)
+    assert first.headers["cache-control"] == "no-cache"
+    etag = first.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    with path.open("ab") as stream:
+        stream.write(live_cluster(0))
+
+    grown = client.get(url, headers={"If-None-Match": etag})
+    assert grown.status_code == status.HTTP_200_OK
+    assert grown.headers["etag"] != etag
+    assert grown.content == path.read_bytes()
+
+
+def test_record_live_transcribes_while_recording(
+    client: TestClient,
+    db: Session,
+    upload_dir: Path,
+    fake_openai: FakeOpenAI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test streaming a recording over the live WebSocket.
+
+    Expected behavior: Finished segments are transcribed before stop, each
+    sent with the stream's init segment and a leading overlap cluster; at
+    stop the transcript is stored and summarization is queued.
+    """
+    monkeypatch.setattr(settings, "live_segment_seconds", 4)
+    monkeypatch.setattr(settings, "transcription_chunk_overlap_seconds", 1.0)
+    init = make_webm(None)
+    clusters = [live_cluster(timecode) for timecode in range(0, 10_000, 1000)]
+    calls = fake_openai.audio.transcriptions.calls
+
+    with client.websocket_connect("/api/v1/audio/live?filename=standup.webm") as websocket:
+        started = websocket.receive_json()
+        assert started["type"] == "started"
+        websocket.send_bytes(init[:20])
+        websocket.receive_json()
+        websocket.send_bytes(init[20:] + clusters[0])
+        websocket.receive_json()
+        segments = []
+        for cluster in clusters[1:]:
+            websocket.send_bytes(cluster)
+            progress = websocket.receive_json()
+            segments += progress["segments"]
+        assert progress["received_bytes"] == len(init) + sum(len(c) for c in clusters)
+        assert progress["recorded_seconds"] == 9.0
+        # Reason: The first segment ended at 4 s and was transcribed while recording
+        assert segments[0] == {"start": 0.0, "end": 4.0, "text": "transcript 1"}
+
+        websocket.send_text("stop")
+        completed = websocket.receive_json()
+
+    assert completed["type"] == "completed"
+    assert completed["audio_id"] == started["audio_id"]
+    assert len(calls) == 3
+    assert calls[1]["file"][1] == init + b"".join(clusters[3:8])
+    assert calls[2]["file"][1] == init + b"".join(clusters[7:])
+
+    audio_file = db.get(AudioFile, UUID(started["audio_id"]))
+    db.refresh(audio_file)
+    assert (audio_file.filename, audio_file.status) == ("standup.webm", "processing")
+    assert audio_file.duration_seconds == pytest.approx(9.0)
+    assert Path(audio_file.file_path).read_bytes() == init + b"".join(clusters)
+    transcription = db.query(Transcription).one()
+    assert transcription.full_text == "transcript 1 transcript 2 transcript 3"
+    assert db.query(ProcessingJob).one().stage == "summarize"
+
+
+def test_record_live_finishes_when_progress_cannot_be_sent(
+    client: TestClient,
+    db: Session,
+    upload_dir: Path,
+    fake_openai: FakeOpenAI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test a client that drops right after sending a chunk.
+
+    Expected behavior: The failed progress message ends the stream, and the
+    meeting is transcribed instead of marked failed.
+    """
+    send_json = WebSocket.send_json
+
+    async def dropping_send_json(websocket: WebSocket, data: dict, mode: str = "text") -> None:
+        if data["type"] == "progress":
+            raise WebSocketDisconnect(code=1006)
+        await send_json(websocket, data, mode)
+
+    monkeypatch.setattr(WebSocket, "send_json", dropping_send_json)
+
+    with client.websocket_connect("/api/v1/audio/live") as websocket:
+        started = websocket.receive_json()
+        websocket.send_bytes(make_webm(None) + live_cluster(0))
+        completed = websocket.receive_json()
+
+    assert completed["type"] == "completed"
+    audio_file = db.get(AudioFile, UUID(started["audio_id"]))
+    db.refresh(audio_file)
+    assert audio_file.status == "processing"
+    assert db.query(Transcription).one().status == "completed"
+
+
+def test_record_live_rejects_other_streams(
+    client: TestClient, db: Session, upload_dir: Path, fake_openai: FakeOpenAI
+) -> None:
+    """
+    Test streaming bytes that are not WebM over the live WebSocket.
+
+    Expected behavior: Error message, and the recording is marked failed
+    without any transcription request.
+    """
+    with client.websocket_connect("/api/v1/audio/live") as websocket:
+        started = websocket.receive_json()
+        websocket.send_bytes(b"RIFF\x00\x00\x00\x00WAVEfmt " + bytes(64))
+        error = websocket.receive_json()
+
+    assert error["type"] == "error"
+    assert error["detail"].startswith("Stream is not WebM audio")
+    audio_file = db.get(AudioFile, UUID(started["audio_id"]))
+    db.refresh(audio_file)
+    assert audio_file.status == "failed"
+    assert fake_openai.audio.transcriptions.calls == []
+
+
+def test_record_live_keeps_running_summary(
+    client: TestClient,
+    db: Session,
+    upload_dir: Path,
+    fake_openai: FakeOpenAI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test the running summary of a meeting streamed over the live WebSocket.
+
+    Expected behavior: The summary is readable in progress while recording,
+    no model call sees the whole transcript, and at stop the running state
+    becomes the completed summary with only embedding left to queue.
+    """
+    monkeypatch.setattr(settings, "live_segment_seconds", 2)
+    monkeypatch.setattr(settings, "live_summary_interval_seconds", 4)
+    clusters = [live_cluster(timecode) for timecode in range(0, 10_000, 1000)]
+
+    with client.websocket_connect("/api/v1/audio/live") as websocket:
+        started = websocket.receive_json()
+        websocket.send_bytes(make_webm(None))
+        websocket.receive_json()
+        running = None
+        for cluster in clusters:
+            websocket.send_bytes(cluster)
+            progress = websocket.receive_json()
+            running = running or progress.get("summary")
+        assert running is not None
+        assert running["key_points"] == ["Budget"]
+        in_progress = client.get(f"/api/v1/summary/{running['summary_id']}").json()
+        assert (in_progress["status"], in_progress["route"]) == ("in_progress", "incremental")
+
+        websocket.send_text("stop")
+        completed = websocket.receive_json()
+
+    assert completed["summary_id"] == running["summary_id"]
+    summary = client.get(f"/api/v1/summary/{completed['summary_id']}").json()
+    assert summary["status"] == "completed"
+    assert summary["participants"] == ["Ana", "Ben"]
+    prompts = [call["messages"][1]["content"] for call in fake_openai.chat.completions.calls]
+    assert not any("transcript 1 " in prompt and "transcript 5" in prompt for prompt in prompts)
+
+    audio_file = db.get(AudioFile, UUID(started["audio_id"]))
+    db.refresh(audio_file)
+    assert audio_file.status == "completed"
+    assert db.query(ProcessingJob).one().stage == "embed"
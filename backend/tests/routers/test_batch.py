@@ -0,0 +1,119 @@
+"""
+Batch endpoint tests.
+
+Tests for batch upload, processing and summary retrieval.
+"""
+
+import uuid
+from pathlib import Path
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.audio import AudioFile
+from app.models.job import ProcessingJob
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from tests.conftest import QueryCounter, make_mp3, make_webm
+
+
+def test_upload_audio_batch_reports_items(
+    client: TestClient, db: Session, upload_dir: Path
+) -> None:
+    """
+    Test uploading several files with one invalid.
+
+    Expected behavior: Valid files are stored; the invalid one is reported, not fatal.
+    """
+    monday = make_webm()
+    files = [
+        ("files", ("monday.webm", monday, "audio/webm")),
+        ("files", ("notes.txt", b"not audio", "text/plain")),
+        ("files", ("tuesday.mp3", make_mp3(), "audio/mpeg")),
+    ]
+
+    response = client.post("/api/v1/audio/upload/batch", files=files)
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (2, 1)
+    assert [item["filename"] for item in data["items"]] == [
+        "monday.webm",
+        "notes.txt",
+        "tuesday.mp3",
+    ]
+    assert data["items"][0]["audio"]["file_size"] == len(monday)
+    assert data["items"][1]["error"]["status_code"] == status.HTTP_400_BAD_REQUEST
+    assert db.query(AudioFile).count() == 2
+    assert len(list(upload_dir.iterdir())) == 2
+
+
+def test_start_processing_batch(
+    client: TestClient, db: Session, upload_dir: Path, query_counter: QueryCounter
+) -> None:
+    """
+    Test queuing several pipelines in one request.
+
+    Expected behavior: One lookup query; accepted files are queued, others reported.
+    """
+    uploads = [
+        client.post(
+            "/api/v1/audio/upload", files={"file": (f"{name}.webm", make_webm(), "audio/webm")}
+        ).json()
+        for name in ("a", "b", "c")
+    ]
+    client.post(f"/api/v1/process/{uploads[2]['id']}")
+    missing = str(uuid.uuid4())
+    ids = [uploads[0]["id"], missing, uploads[1]["id"], uploads[0]["id"], uploads[2]["id"]]
+
+    query_counter.reset()
+    response = client.post("/api/v1/process", json={"audio_ids": ids})
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (2, 2)
+    errors = {item["audio_id"]: item["error"] for item in data["items"] if item["error"]}
+    assert errors[missing]["status_code"] == status.HTTP_404_NOT_FOUND
+    assert errors[uploads[2]["id"]]["status_code"] == status.HTTP_400_BAD_REQUEST
+    assert sum("FROM audio_files" in sql for sql in query_counter.statements) == 1
+    assert db.query(ProcessingJob).count() == 3
+    assert client.get(f"/api/v1/audio/{uploads[1]['id']}").json()["stage"] == "queued"
+
+
+def test_get_summaries_single_query(
+    client: TestClient, db: Session, query_counter: QueryCounter
+) -> None:
+    """
+    Test fetching several summaries at once.
+
+    Expected behavior: One IN query; unknown and malformed IDs are reported per item.
+    """
+    summaries = []
+    for index in range(3):
+        audio_file = AudioFile(
+            filename=f"{index}.webm", file_path=f"/tmp/{index}.webm", file_size=1, mime_type="a"
+        )
+        transcription = Transcription(audio_file=audio_file, full_text="Hi", status="completed")
+        summaries.append(
+            Summary(
+                transcription=transcription, summary_text=f"Meeting {index}", status="completed"
+            )
+        )
+        db.add_all([audio_file, transcription, summaries[-1]])
+    db.commit()
+    ids = [str(summary.id) for summary in summaries]
+    missing = str(uuid.uuid4())
+
+    query_counter.reset()
+    response = client.get("/api/v1/summaries", params={"ids": ",".join([*ids, missing, "bad"])})
+
+    assert query_counter.count == 1
+    items = response.json()["items"]
+    assert [item["summary"]["summary_text"] for item in items[:3]] == [
+        "Meeting 0",
+        "Meeting 1",
+        "Meeting 2",
+    ]
+    assert items[3]["error"]["status_code"] == status.HTTP_404_NOT_FOUND
+    assert items[4]["error"]["status_code"] == status.HTTP_422_UNPROCESSABLE_ENTITY
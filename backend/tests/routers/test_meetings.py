@@ -0,0 +1,198 @@
+"""
+Meeting endpoint tests.
+
+Tests for the /api/v1/meetings endpoint and the query cost of status reads.
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.audio import AudioFile
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from tests.conftest import QueryCounter
+
+
+@pytest.fixture
+def meeting(db: Session) -> tuple[UUID, UUID, UUID]:
+    """IDs of a processed audio file, its transcription and its summary."""
+    audio_file = AudioFile(
+        filename="meeting.webm",
+        file_path="/tmp/meeting.webm",
+        file_size=1,
+        mime_type="audio/webm",
+        status="completed",
+    )
+    transcription = Transcription(
+        audio_file=audio_file, full_text="Budget approved.", status="completed"
+    )
+    summary = Summary(
+        transcription=transcription,
+        summary_text="Budget approved.",
+        key_points=["Budget"],
+        status="completed",
+    )
+    db.add_all([audio_file, transcription, summary])
+    db.commit()
+    return audio_file.id, transcription.id, summary.id
+
+
+def test_audio_status_is_one_query(
+    client: TestClient, meeting: tuple[UUID, UUID, UUID], query_counter: QueryCounter
+) -> None:
+    """
+    Test the query cost of the status endpoint.
+
+    Expected behavior: Audio file, transcription and summary come from one query.
+    """
+    audio_id, transcription_id, summary_id = meeting
+    query_counter.reset()
+
+    data = client.get(f"/api/v1/audio/{audio_id}").json()
+
+    assert query_counter.count == 1
+    assert data["transcription_id"] == str(transcription_id)
+    assert data["summary_id"] == str(summary_id)
+    assert data["stage"] == "completed"
+
+
+def test_get_meeting_bundle_is_one_query(
+    client: TestClient, meeting: tuple[UUID, UUID, UUID], query_counter: QueryCounter
+) -> None:
+    """
+    Test fetching a whole meeting.
+
+    Expected behavior: Status, transcript and summary are returned from one query.
+    """
+    audio_id, transcription_id, summary_id = meeting
+    query_counter.reset()
+
+    response = client.get(f"/api/v1/meetings/{audio_id}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert query_counter.count == 1
+    data = response.json()
+    assert data["audio"]["summary_id"] == str(summary_id)
+    assert data["transcription"]["full_text"] == "Budget approved."
+    assert data["summary"]["key_points"] == ["Budget"]
+
+
+def test_get_meeting_selected_parts(
+    client: TestClient, db: Session, meeting: tuple[UUID, UUID, UUID], query_counter: QueryCounter
+) -> None:
+    """
+    Test include=summary.
+
+    Expected behavior: Transcript is neither loaded nor returned; IDs still are.
+    """
+    audio_id, transcription_id, _ = meeting
+    db.expunge_all()
+    query_counter.reset()
+
+    response = client.get(f"/api/v1/meetings/{audio_id}", params={"include": "summary"})
+
+    assert query_counter.count == 1
+    assert "full_text" not in query_counter.statements[0]
+    data = response.json()
+    assert data["transcription"] is None
+    assert data["audio"]["transcription_id"] == str(transcription_id)
+    assert data["summary"]["summary_text"] == "Budget approved."
+
+
+def test_get_meeting_errors(client: TestClient, meeting: tuple[UUID, UUID, UUID]) -> None:
+    """
+    Test unknown include parts and unknown audio files.
+
+    Expected behavior: Returns 400 and 404.
+    """
+    audio_id, _, _ = meeting
+
+    response = client.get(f"/api/v1/meetings/{audio_id}", params={"include": "audio"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = client.get("/api/v1/meetings/00000000-0000-0000-0000-000000000000")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def meetings(db: Session) -> list[UUID]:
+    """IDs of 25 audio files, newest first, several sharing a creation time."""
+    start = datetime(2024, 1, 1)
+    audio_files = [
+        AudioFile(
+            filename=f"meeting-{index}.webm",
+            file_path=f"/tmp/meeting-{index}.webm",
+            file_size=1,
+            mime_type="audio/webm",
+            status="failed" if index % 5 == 0 else "completed",
+            # Reason: Pairs of rows share a timestamp so the id tie-breaker is exercised
+            created_at=start + timedelta(hours=index // 2),
+        )
+        for index in range(25)
+    ]
+    db.add_all(audio_files)
+    db.commit()
+    ordered = sorted(audio_files, key=lambda audio_file: (audio_file.created_at, audio_file.id))
+    return [audio_file.id for audio_file in reversed(ordered)]
+
+
+def test_list_meetings_pages_through_all_rows(
+    client: TestClient, meetings: list[UUID], query_counter: QueryCounter
+) -> None:
+    """
+    Test following next_cursor until the last page.
+
+    Expected behavior: Every meeting appears once, newest first, one query per page.
+    """
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        query_counter.reset()
+        params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/meetings", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        assert query_counter.count == 1
+        data = response.json()
+        seen.extend(item["id"] for item in data["items"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == [str(audio_id) for audio_id in meetings]
+
+
+def test_list_meetings_filters(client: TestClient, meetings: list[UUID]) -> None:
+    """
+    Test filtering by status and creation time.
+
+    Expected behavior: Only matching meetings are returned.
+    """
+    failed = client.get("/api/v1/meetings", params={"status": "failed"}).json()
+    assert len(failed["items"]) == 5
+    assert all(item["status"] == "failed" for item in failed["items"])
+
+    ranged = client.get(
+        "/api/v1/meetings",
+        params={"created_from": "2024-01-01T02:00:00", "created_to": "2024-01-01T04:00:00"},
+    ).json()
+    assert len(ranged["items"]) == 4
+    assert ranged["next_cursor"] is None
+
+
+def test_list_meetings_rejects_bad_parameters(client: TestClient) -> None:
+    """
+    Test malformed cursor, status and limit.
+
+    Expected behavior: 400 for the cursor, 422 for the others.
+    """
+    assert client.get("/api/v1/meetings", params={"cursor": "bogus"}).status_code == 400
+    assert client.get("/api/v1/meetings", params={"status": "bogus"}).status_code == 422
+    assert client.get("/api/v1/meetings", params={"limit": 0}).status_code == 422
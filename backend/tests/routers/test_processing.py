@@ -0,0 +1,434 @@
+"""
+Processing endpoint tests.
+
+Tests for the /api/v1/process endpoints.
+"""
+
+import asyncio
+import uuid
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCache, TieredCache
+from app.core.events import EventBus
+from app.core.http_cache import COMPLETED_CACHE_CONTROL
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.job import JobStatus, ProcessingJob
+from app.models.summary import Summary
+from app.models.transcript_segment import TranscriptSegment
+from app.models.transcription import Transcription
+from app.services import transcription_service
+from app.services.response_cache import (
+    INVALIDATION_CHANNEL,
+    SUMMARY,
+    TRANSCRIPTION,
+    CachedResponse,
+    ResponseCache,
+    get_response_cache,
+    invalidate_response,
+)
+from app.services.transcription_service import MAX_SEGMENT_SECONDS, TranscriptionService
+from tests.conftest import QueryCounter, make_webm, write_wav
+
+
+def test_start_processing_enqueues_job(client: TestClient, db: Session, upload_dir: Path) -> None:
+    """
+    Test starting the pipeline for an uploaded file.
+
+    Expected behavior: Returns 202, queues a transcribe job, rejects a second start.
+    """
+    upload = client.post(
+        "/api/v1/audio/upload", files={"file": ("meeting.webm", make_webm(), "audio/webm")}
+    ).json()
+
+    response = client.post(f"/api/v1/process/{upload['id']}")
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+    assert data["status"] == "processing"
+
+    job = db.query(ProcessingJob).one()
+    assert str(job.id) == data["job_id"]
+    assert job.stage == "transcode"
+    assert job.status == JobStatus.QUEUED.value
+
+    assert client.get(f"/api/v1/audio/{upload['id']}").json()["status"] == "processing"
+    assert client.post(f"/api/v1/process/{upload['id']}").status_code == 400
+
+
+def test_start_processing_not_found(client: TestClient) -> None:
+    """
+    Test starting the pipeline for an unknown audio file.
+
+    Expected behavior: Returns 404.
+    """
+    response = client.post("/api/v1/process/00000000-0000-0000-0000-000000000000")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def event_bus(monkeypatch: pytest.MonkeyPatch) -> EventBus:
+    """Fresh in-process event bus installed for the test."""
+    bus = EventBus()
+    monkeypatch.setattr("app.core.events._event_bus", bus)
+    return bus
+
+
+@pytest.fixture
+def response_cache(monkeypatch: pytest.MonkeyPatch, event_bus: EventBus) -> ResponseCache:
+    """Empty in-process response cache of an API running the worker."""
+    monkeypatch.setattr("app.services.response_cache._response_cache", None)
+    monkeypatch.setattr(settings, "response_cache_backend", "memory")
+    monkeypatch.setattr(settings, "worker_embedded", True)
+    return get_response_cache()
+
+
+@pytest.fixture
+def no_response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Disable the response cache for the test."""
+    monkeypatch.setattr("app.services.response_cache._response_cache", None)
+    monkeypatch.setattr(settings, "response_cache_backend", "none")
+
+
+def test_get_summary_conditional_requests(
+    client: TestClient, db: Session, query_counter: QueryCounter, no_response_cache: None
+) -> None:
+    """
+    Test ETag revalidation of a completed summary without the response cache.
+
+    Expected behavior: 200 with a revalidated ETag, then 304 from a single column query.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, full_text="Hello", status="completed")
+    summary = Summary(transcription=transcription, summary_text="Hi", status="completed")
+    db.add_all([audio_file, transcription, summary])
+    db.commit()
+    url = f"/api/v1/summary/{summary.id}"
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == COMPLETED_CACHE_CONTROL
+
+    query_counter.reset()
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert query_counter.count == 1
+    assert "summary_text" not in query_counter.statements[0]
+
+    response = client.get(url, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["summary_text"] == "Hi"
+
+
+def test_get_transcription_in_progress_is_revalidated(client: TestClient, db: Session) -> None:
+    """
+    Test caching headers of an unfinished transcription.
+
+    Expected behavior: Must be revalidated; its ETag changes once it is updated.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, status="in_progress")
+    db.add_all([audio_file, transcription])
+    db.commit()
+    url = f"/api/v1/transcription/{transcription.id}"
+
+    response = client.get(url)
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+
+    transcription.full_text = "Hello"
+    transcription.status = "completed"
+    db.commit()
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+    assert response.headers["cache-control"] == COMPLETED_CACHE_CONTROL
+
+
+def test_completed_responses_are_served_from_cache(
+    client: TestClient,
+    db: Session,
+    query_counter: QueryCounter,
+    response_cache: ResponseCache,
+) -> None:
+    """
+    Test the read-through response cache.
+
+    Expected behavior: Repeat reads and revalidations do not query the
+    database; after a write is invalidated the new version is served.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, full_text="Hello", status="completed")
+    db.add_all([audio_file, transcription])
+    db.commit()
+    transcription_id = transcription.id
+    url = f"/api/v1/transcription/{transcription_id}"
+
+    first = client.get(url)
+    query_counter.reset()
+    second = client.get(url)
+    revalidated = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert query_counter.count == 0
+    assert second.json() == first.json()
+    assert second.headers["etag"] == first.headers["etag"]
+    assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response_cache.cache.stats.hits == 2
+
+    transcription.full_text = "Hello again"
+    db.commit()
+    invalidate_response(TRANSCRIPTION, transcription_id)
+
+    third = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert third.status_code == status.HTTP_200_OK
+    assert third.json()["full_text"] == "Hello again"
+    assert third.headers["etag"] != first.headers["etag"]
+
+
+def test_invalidation_from_other_process_drops_cached_response(
+    client: TestClient, db: Session, event_bus: EventBus, response_cache: ResponseCache
+) -> None:
+    """
+    Test an invalidation published by a worker process.
+
+    Expected behavior: The relayed event drops the entry from the local tier,
+    and a response read before the invalidation is not stored.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, full_text="Hello", status="completed")
+    summary = Summary(transcription=transcription, status="completed", summary_text="Short")
+    db.add_all([audio_file, transcription, summary])
+    db.commit()
+
+    response = client.get(f"/api/v1/summary/{summary.id}")
+    assert asyncio.run(response_cache.get(SUMMARY, summary.id)) is not None
+
+    token = asyncio.run(response_cache.read_token(SUMMARY, summary.id))
+    # Reason: What the Redis listener does with an event published by another process
+    event_bus._deliver(INVALIDATION_CHANNEL, {"kind": SUMMARY, "resource_id": str(summary.id)})
+    assert asyncio.run(response_cache.get(SUMMARY, summary.id)) is None
+
+    stale = CachedResponse(body=response.content, etag=response.headers["etag"], cache_control="")
+    asyncio.run(response_cache.put(SUMMARY, summary.id, stale, token))
+    assert asyncio.run(response_cache.get(SUMMARY, summary.id)) is None
+
+
+async def test_shared_tier_rejects_response_read_before_remote_invalidation() -> None:
+    """
+    Test a worker invalidating an entry whose event has not reached the API yet.
+
+    Expected behavior: A response read before the invalidation is stored in
+    neither tier, while one read afterwards is.
+    """
+    shared = MemoryCache(max_entries=10)
+    api = ResponseCache(TieredCache("test-api", MemoryCache(max_entries=10), shared=shared))
+    worker = ResponseCache(TieredCache("test-worker", MemoryCache(max_entries=10), shared=shared))
+    summary_id = uuid.uuid4()
+    response = CachedResponse(body=b"{}", etag='"v1"', cache_control="")
+
+    token = await api.read_token(SUMMARY, summary_id)
+    # Reason: The worker's shared-tier step; its event has not reached the API yet
+    worker._invalidate_shared(
+        f"{SUMMARY}:{summary_id}", {"kind": SUMMARY, "resource_id": str(summary_id)}
+    )
+    await api.put(SUMMARY, summary_id, response, token)
+    assert await api.get(SUMMARY, summary_id) is None
+
+    token = await api.read_token(SUMMARY, summary_id)
+    await api.put(SUMMARY, summary_id, response, token)
+    assert await api.get(SUMMARY, summary_id) == response
+
+
+def test_response_cache_requires_invalidations_to_reach_api(
+    monkeypatch: pytest.MonkeyPatch, event_bus: EventBus
+) -> None:
+    """
+    Test enabling the response cache.
+
+    Expected behavior: Disabled while a separate worker would publish
+    invalidations only to its own process.
+    """
+    monkeypatch.setattr("app.services.response_cache._response_cache", None)
+    monkeypatch.setattr(settings, "response_cache_backend", "memory")
+    monkeypatch.setattr(settings, "worker_embedded", False)
+    monkeypatch.setattr(settings, "event_backend", "memory")
+    assert get_response_cache() is None
+
+    monkeypatch.setattr(settings, "event_backend", "redis")
+    assert get_response_cache() is not None
+
+
+def test_unfinished_responses_are_not_cached(
+    client: TestClient, db: Session, response_cache: ResponseCache
+) -> None:
+    """
+    Test reading a summary that is still being generated.
+
+    Expected behavior: Nothing is cached until it completes.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path="/tmp/meeting.webm", file_size=1, mime_type="audio/webm"
+    )
+    transcription = Transcription(audio_file=audio_file, full_text="Hello", status="completed")
+    summary = Summary(transcription=transcription, status="in_progress")
+    db.add_all([audio_file, transcription, summary])
+    db.commit()
+
+    response = client.get(f"/api/v1/summary/{summary.id}")
+    assert response.json()["status"] == "in_progress"
+    assert asyncio.run(response_cache.get(SUMMARY, summary.id)) is None
+
+
+def test_get_transcript_segments_by_time_range(client: TestClient, db: Session) -> None:
+    """
+    Test reading part of a transcript by time range.
+
+    Expected behavior: Returns the overlapping segments in seconds, 404 for an
+    unknown transcription and 400 for an empty range.
+    """
+    audio_file = AudioFile(
+        filename="m.webm", file_path="/tmp/m.webm", file_size=1, mime_type="audio/webm"
+    )
+    db.add(audio_file)
+    db.flush()
+    transcription = Transcription(
+        audio_file_id=audio_file.id, full_text="a b c", status="completed"
+    )
+    db.add(transcription)
+    db.flush()
+    db.add_all(
+        TranscriptSegment(
+            transcription_id=transcription.id,
+            position=position,
+            start_ms=position * 300_000,
+            end_ms=(position + 1) * 300_000,
+            text=text,
+        )
+        for position, text in enumerate(["Intro.", "Budget review.", "Hiring plan."])
+    )
+    db.commit()
+
+    response = client.get(
+        f"/api/v1/transcription/{transcription.id}/segments", params={"start": 600, "end": 900}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "transcription_id": str(transcription.id),
+        "start": 600.0,
+        "end": 900.0,
+        "segments": [{"start": 600.0, "end": 900.0, "text": "Hiring plan."}],
+    }
+
+    missing = client.get("/api/v1/transcription/00000000-0000-0000-0000-000000000000/segments")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    empty_range = client.get(
+        f"/api/v1/transcription/{transcription.id}/segments", params={"start": 900, "end": 600}
+    )
+    assert empty_range.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class CutCrossingWhisper:
+    """Fake Whisper with a segment running from the first speech stretch into the second."""
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        with wave.open(kwargs["file"], "rb") as wav:
+            seconds = wav.getnframes() / wav.getframerate()
+        segments = [
+            {"start": 0.0, "end": 4.5, "text": "Hello."},
+            {"start": 4.5, "end": 7.5, "text": "Across the cut."},
+            {"start": 7.5, "end": seconds, "text": "Bye."},
+        ]
+        return SimpleNamespace(text="Hello. Across the cut. Bye.", language="en", segments=segments)
+
+
+def test_get_transcript_segments_after_silence_removal(
+    client: TestClient, db: Session, upload_dir: Path
+) -> None:
+    """
+    Test range reads of a transcript whose long silence was cut before Whisper.
+
+    Expected behavior: A segment crossing the cut does not stretch over the
+    removed silence, so no stored segment is longer than MAX_SEGMENT_SECONDS
+    and every range returns exactly the segments overlapping it.
+    """
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    path = write_wav(upload_dir / "meeting.wav", [(5.0, True), (60.0, False), (5.0, True)])
+    audio_file = AudioFile(
+        filename="meeting.wav", file_path=str(path), file_size=1, mime_type="audio/wav"
+    )
+    db.add(audio_file)
+    db.commit()
+    whisper = SimpleNamespace(audio=SimpleNamespace(transcriptions=CutCrossingWhisper()))
+    transcription = asyncio.run(
+        TranscriptionService(db, client=whisper).transcribe_audio(audio_file, use_cache=False)
+    )
+
+    stored = db.query(TranscriptSegment).order_by(TranscriptSegment.position).all()
+    assert len(stored) == 3
+    assert all(s.end_ms - s.start_ms <= MAX_SEGMENT_SECONDS * 1000 for s in stored)
+    for start in [0, 5, 30, 50, 64, 66, 69]:
+        response = client.get(
+            f"/api/v1/transcription/{transcription.id}/segments", params={"start": start}
+        )
+        expected = [s.text for s in stored if s.end_ms > start * 1000]
+        assert [segment["text"] for segment in response.json()["segments"]] == expected
+
+
+def test_get_transcription_text_is_streamed_in_chunks(
+    client: TestClient, db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test streaming the full text of a transcription.
+
+    Expected behavior: The chunks join to the exact text (multi-byte characters
+    included), completed text must be revalidated after a minute, and unknown IDs return 404.
+    """
+    monkeypatch.setattr(transcription_service, "TEXT_CHUNK_CHARS", 7)
+    audio_file = AudioFile(
+        filename="m.webm", file_path="/tmp/m.webm", file_size=1, mime_type="audio/webm"
+    )
+    db.add(audio_file)
+    db.flush()
+    text = "Grüße aus München – budget approved. " * 5
+    transcription = Transcription(audio_file_id=audio_file.id, full_text=text, status="completed")
+    db.add(transcription)
+    db.commit()
+
+    response = client.get(f"/api/v1/transcription/{transcription.id}/text")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert response.headers["cache-control"] == COMPLETED_CACHE_CONTROL
+    assert response.text == text
+
+    cached = client.get(
+        f"/api/v1/transcription/{transcription.id}/text",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    missing = client.get("/api/v1/transcription/00000000-0000-0000-0000-000000000000/text")
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,93 @@
+"""
+Search endpoint tests.
+
+Tests for the /api/v1/search endpoint.
+"""
+
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.audio import AudioFile
+from app.models.transcription import Transcription
+from app.services.embedding_service import EmbeddingService, reset_index
+from app.services.search_service import SearchService
+
+
+def test_search_pages_through_hits(client: TestClient, db: Session) -> None:
+    """
+    Test following next_offset.
+
+    Expected behavior: Every matching meeting is returned once.
+    """
+    search = SearchService(db)
+    for index in range(5):
+        audio_file = AudioFile(
+            filename=f"meeting-{index}.webm",
+            file_path=f"/tmp/meeting-{index}.webm",
+            file_size=1,
+            mime_type="audio/webm",
+            status="completed",
+        )
+        text = "Roadmap planning." if index == 4 else f"Budget review number {index}."
+        transcription = Transcription(audio_file=audio_file, full_text=text, status="completed")
+        db.add_all([audio_file, transcription])
+        db.flush()
+        search.index_transcription(transcription)
+    db.commit()
+
+    filenames: list[str] = []
+    offset = 0
+    while offset is not None:
+        response = client.get(
+            "/api/v1/search", params={"q": "budget", "limit": 2, "offset": offset}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        filenames.extend(item["filename"] for item in data["items"])
+        offset = data["next_offset"]
+
+    assert sorted(filenames) == [f"meeting-{index}.webm" for index in range(4)]
+
+
+def test_search_rejects_bad_parameters(client: TestClient) -> None:
+    """
+    Test an empty query and an oversized page.
+
+    Expected behavior: 422 validation errors.
+    """
+    assert client.get("/api/v1/search", params={"q": ""}).status_code == 422
+    assert client.get("/api/v1/search", params={"q": "budget", "limit": 500}).status_code == 422
+
+
+async def test_semantic_search_endpoint(client: TestClient, db: Session) -> None:
+    """
+    Test semantic search over an embedded meeting.
+
+    Expected behavior: The meeting is returned with its best passage.
+    """
+    audio_file = AudioFile(
+        filename="planning.webm",
+        file_path="/tmp/planning.webm",
+        file_size=1,
+        mime_type="audio/webm",
+        status="completed",
+    )
+    db.add_all(
+        [
+            audio_file,
+            Transcription(
+                audio_file=audio_file, full_text="Roadmap priorities.", status="completed"
+            ),
+        ]
+    )
+    db.commit()
+    await EmbeddingService(db).embed_meeting(audio_file.id)
+    reset_index()
+
+    response = client.get("/api/v1/search/semantic", params={"q": "roadmaps"})
+
+    assert response.status_code == status.HTTP_200_OK
+    [item] = response.json()["items"]
+    assert item["filename"] == "planning.webm"
+    assert item["passage"] == "Roadmap priorities."
@@ -0,0 +1,206 @@
+"""
+Embedding service tests.
+
+Tests for embedding meetings, the in-memory vector index and semantic search.
+"""
+
+import uuid
+from collections.abc import Generator
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.embedding import Embedding
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.services.audio_service import AudioService
+from app.services.embedding_service import EmbeddingService, reset_index
+from app.services.pipeline_service import PipelineService, PipelineStage
+from app.services.semantic_index import SemanticIndex
+from app.utils.embeddings import quantize
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Start each test with an empty index that refreshes on every search."""
+    monkeypatch.setattr(settings, "semantic_refresh_seconds", 0.0)
+    reset_index()
+    yield
+    reset_index()
+
+
+def _make_meeting(db: Session, transcript: str, summary_text: str) -> AudioFile:
+    """Create a completed meeting with transcript and summary."""
+    audio_file = AudioFile(
+        filename="meeting.webm",
+        file_path="/tmp/meeting.webm",
+        file_size=1,
+        mime_type="audio/webm",
+        status="completed",
+    )
+    transcription = Transcription(audio_file=audio_file, full_text=transcript, status="completed")
+    summary = Summary(
+        transcription=transcription,
+        summary_text=summary_text,
+        key_points=["Hiring plan", "Office move"],
+        status="completed",
+    )
+    db.add_all([audio_file, transcription, summary])
+    db.commit()
+    return audio_file
+
+
+async def test_embed_meeting_stores_quantized_passages(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test embedding a meeting twice.
+
+    Expected behavior: Summary, key points and transcript chunks are stored once as int8.
+    """
+    monkeypatch.setattr(settings, "semantic_chunk_words", 4)
+    audio_file = _make_meeting(db, "one two three four five six", "Budget approved.")
+    service = EmbeddingService(db)
+
+    await service.embed_meeting(audio_file.id)
+    assert await service.embed_meeting(audio_file.id) == 5
+
+    rows = db.query(Embedding).order_by(Embedding.id).all()
+    assert [(row.kind, row.position) for row in rows] == [
+        ("summary", 0),
+        ("key_point", 0),
+        ("key_point", 1),
+        ("transcript", 0),
+        ("transcript", 1),
+    ]
+    assert rows[-1].text == "five six"
+    assert len(rows[0].vector) == service.embedder.dimensions
+
+
+async def test_semantic_search_finds_meeting_by_related_words(db: Session) -> None:
+    """
+    Test searching embedded meetings, including one deleted after indexing.
+
+    Expected behavior: The related meeting ranks first; deleted meetings are not returned.
+    """
+    budget = _make_meeting(db, "We reviewed quarterly spending.", "Budgets were approved.")
+    design = _make_meeting(db, "New logo drafts were shown.", "Designers presented branding.")
+    service = EmbeddingService(db)
+    await service.embed_meeting(budget.id)
+    await service.embed_meeting(design.id)
+
+    hits = await service.search("budgeting", limit=2)
+    assert hits[0].audio_id == budget.id
+    assert hits[0].source == "summary"
+    assert hits[0].passage == "Budgets were approved."
+    assert hits[0].score > hits[1].score
+
+    AudioService(db).delete_audio(budget.id)
+    assert budget.id not in [hit.audio_id for hit in await service.search("budgeting", limit=2)]
+    assert await service.search("the", limit=2) == []
+
+
+async def test_refresh_loads_rows_committed_out_of_id_order(db: Session) -> None:
+    """
+    Test a refresh after a row with a lower id commits once higher ids are indexed.
+
+    Expected behavior: The late row is loaded and found by search.
+    """
+    budget = _make_meeting(db, "We reviewed quarterly spending.", "Budgets were approved.")
+    design = _make_meeting(db, "New logo drafts were shown.", "Designers presented branding.")
+    service = EmbeddingService(db)
+    await service.embed_meeting(budget.id)
+    await service.embed_meeting(design.id)
+
+    late = db.query(Embedding).filter(Embedding.audio_file_id == budget.id).all()
+    copies = [
+        {column.name: getattr(row, column.name) for column in Embedding.__table__.columns}
+        for row in late
+    ]
+    service.remove_audio(budget.id)
+    db.commit()
+    assert [hit.audio_id for hit in await service.search("budgeting", limit=2)] == [design.id]
+
+    db.add_all(Embedding(**copy) for copy in copies)
+    db.commit()
+
+    assert (await service.search("budgeting", limit=2))[0].audio_id == budget.id
+
+
+async def test_reembedded_meeting_is_still_found(db: Session) -> None:
+    """
+    Test searching after a meeting was re-embedded without rebuilding the index.
+
+    Expected behavior: The stale passages are skipped and the meeting is found by its live ones.
+    """
+    meetings = [
+        _make_meeting(db, f"Topic {number} was discussed.", f"Meeting number {number}.")
+        for number in range(6)
+    ]
+    service = EmbeddingService(db)
+    for meeting in meetings:
+        await service.embed_meeting(meeting.id)
+    await service.search("budgeting", limit=6)
+
+    await service.embed_meeting(meetings[0].id)
+    hits = await service.search("Meeting number 0.", limit=6)
+
+    assert hits[0].audio_id == meetings[0].id
+    assert len(hits) == 6
+    assert {hit.audio_id for hit in hits} == {meeting.id for meeting in meetings}
+
+
+async def test_embed_stage_failure_leaves_meeting_completed(db: Session) -> None:
+    """
+    Test a failing embedding stage.
+
+    Expected behavior: The stage raises, but a completed meeting stays completed.
+    """
+    audio_file = AudioFile(
+        filename="meeting.webm",
+        file_path="/tmp/meeting.webm",
+        file_size=1,
+        mime_type="audio/webm",
+        status="completed",
+    )
+    db.add(audio_file)
+    db.commit()
+    pipeline = PipelineService(db)
+
+    with pytest.raises(LookupError):
+        await pipeline.run_stage(audio_file.id, PipelineStage.EMBED)
+    pipeline.mark_failed(audio_file.id, "embed failed", PipelineStage.EMBED)
+
+    db.refresh(audio_file)
+    assert audio_file.status == "completed"
+
+
+def test_index_ivf_matches_exact_search() -> None:
+    """
+    Test the approximate index on clustered vectors.
+
+    Expected behavior: Probing a few clusters finds the same best meeting as a full scan.
+    """
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, 64))
+    vectors = centers[rng.integers(0, 20, 4000)] + rng.normal(scale=0.3, size=(4000, 64))
+    vectors = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+    codes, scales = quantize(vectors)
+    meetings = [uuid.uuid4() for _ in range(1000)]
+
+    index = SemanticIndex(64)
+    index.add(list(range(1, 4001)), [meetings[row % 1000] for row in range(4000)], codes, scales)
+    index.add([4000], [meetings[0]], codes[:1], scales[:1])
+    assert index.size == 4000
+
+    exact = index.search(vectors[123], limit=5)
+    index.build_inverted_lists()
+    approximate = index.search(vectors[123], limit=5, probes=4)
+
+    assert exact[0].embedding_id == 124
+    assert exact[0].audio_id == meetings[123]
+    assert approximate[0] == exact[0]
+    assert len({match.audio_id for match in exact}) == 5
@@ -0,0 +1,280 @@
+"""
+Job queue and worker tests.
+
+Tests for broker lease/ack/retry semantics and the pipeline worker.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.embedding import Embedding
+from app.models.job import JobStatus, ProcessingJob
+from app.services.job_queue import DatabaseBroker, MemoryBroker
+from app.services.pipeline_service import PipelineService
+from app.worker import Worker
+from tests.conftest import FakeOpenAI
+
+
+def _make_audio(db: Session, upload_dir: Path) -> AudioFile:
+    """Create an uploaded audio record backed by a small file."""
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    file_path = upload_dir / "meeting.webm"
+    file_path.write_bytes(b"audio")
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path=str(file_path), file_size=5, mime_type="audio/webm"
+    )
+    db.add(audio_file)
+    db.commit()
+    return audio_file
+
+
+def test_database_broker_ack_queues_next_stage(
+    db: Session, session_factory: sessionmaker, upload_dir: Path
+) -> None:
+    """
+    Test claiming and acknowledging a stage.
+
+    Expected behavior: Leased job is invisible; ack queues the next stage.
+    """
+    broker = DatabaseBroker(session_factory)
+    audio_file = _make_audio(db, upload_dir)
+    broker.enqueue(audio_file.id, "transcribe")
+
+    job = broker.claim("worker-a")
+    assert job is not None
+    assert job.stage == "transcribe"
+    assert job.attempts == 1
+    assert broker.claim("worker-b") is None
+
+    assert broker.ack(job, "summarize") is True
+
+    next_job = broker.claim("worker-b")
+    assert next_job is not None
+    assert next_job.stage == "summarize"
+    assert next_job.audio_id == audio_file.id
+
+
+def test_database_broker_redelivers_expired_lease(
+    db: Session, session_factory: sessionmaker, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test the visibility timeout.
+
+    Expected behavior: A job whose lease expired is claimed again and the
+    stale worker can no longer acknowledge or requeue it.
+    """
+    monkeypatch.setattr(settings, "job_visibility_timeout_seconds", 0)
+    broker = DatabaseBroker(session_factory)
+    broker.enqueue(_make_audio(db, upload_dir).id, "transcribe")
+
+    stale = broker.claim("worker-a")
+    redelivered = broker.claim("worker-b")
+
+    assert redelivered is not None
+    assert redelivered.id == stale.id
+    assert redelivered.attempts == 2
+    assert broker.retry(stale, "late failure") is False
+    assert broker.ack(stale) is False
+    assert broker.ack(redelivered) is True
+
+    job = db.get(ProcessingJob, stale.id)
+    db.refresh(job)
+    assert job.status == JobStatus.SUCCEEDED.value
+    assert job.last_error is None
+
+
+def test_database_broker_retries_until_max_attempts(
+    db: Session, session_factory: sessionmaker, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test retry and dead-lettering.
+
+    Expected behavior: Job is requeued until max attempts, then failed.
+    """
+    monkeypatch.setattr(settings, "job_retry_backoff_seconds", 0)
+    monkeypatch.setattr(settings, "job_max_attempts", 2)
+    broker = DatabaseBroker(session_factory)
+    job_id = broker.enqueue(_make_audio(db, upload_dir).id, "transcribe")
+
+    assert broker.retry(broker.claim("worker-a"), "boom") is True
+    assert broker.retry(broker.claim("worker-a"), "boom again") is False
+    assert broker.claim("worker-a") is None
+
+    job = db.get(ProcessingJob, job_id)
+    db.refresh(job)
+    assert job.status == JobStatus.FAILED.value
+    assert job.last_error == "boom again"
+
+
+def test_database_broker_heartbeat_extends_lease(
+    db: Session, session_factory: sessionmaker, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test extending the lease of a running job.
+
+    Expected behavior: The holder's heartbeat keeps the job invisible; a stale
+    worker's heartbeat is rejected.
+    """
+    monkeypatch.setattr(settings, "job_visibility_timeout_seconds", 0)
+    broker = DatabaseBroker(session_factory)
+    broker.enqueue(_make_audio(db, upload_dir).id, "transcribe")
+    stale = broker.claim("worker-a")
+    current = broker.claim("worker-b")
+
+    monkeypatch.setattr(settings, "job_visibility_timeout_seconds", 900)
+    assert broker.heartbeat(stale) is False
+    assert broker.heartbeat(current) is True
+    assert broker.claim("worker-c") is None
+    assert broker.ack(current) is True
+
+
+async def test_worker_keeps_lease_of_long_stage(
+    db: Session,
+    session_factory: sessionmaker,
+    upload_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test a stage that runs longer than the lease.
+
+    Expected behavior: Heartbeats keep the job from being claimed by another
+    consumer, and the worker acknowledges it.
+    """
+    monkeypatch.setattr(settings, "processing_timeout_seconds", 5)
+    monkeypatch.setattr(settings, "job_visibility_timeout_seconds", 10)
+    monkeypatch.setattr(settings, "job_heartbeat_seconds", 0.02)
+    broker = MemoryBroker()
+    worker = Worker(broker=broker, concurrency=1, session_factory=session_factory)
+    audio_file = _make_audio(db, upload_dir)
+    job_id = broker.enqueue(audio_file.id, "transcribe")
+    claimed_meanwhile = []
+
+    async def slow_stage(*args: object, **kwargs: object) -> None:
+        for _ in range(5):
+            await asyncio.sleep(0.02)
+            # Reason: Expire the lease unless a heartbeat renewed it
+            job, status, _ = broker.jobs[job_id]
+            broker.jobs[job_id] = (job, status, datetime.utcnow() - timedelta(seconds=1))
+            await asyncio.sleep(0.1)
+            claimed_meanwhile.append(broker.claim("other-worker"))
+
+    monkeypatch.setattr(PipelineService, "run_stage", slow_stage)
+    await worker.run_once()
+
+    assert claimed_meanwhile == [None] * 5
+    assert broker.jobs[job_id][1] == JobStatus.SUCCEEDED.value
+
+
+async def test_worker_abandons_stage_when_lease_is_lost(
+    db: Session,
+    session_factory: sessionmaker,
+    upload_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test a stage whose job is re-claimed by another worker.
+
+    Expected behavior: The stage is cancelled and neither the job nor the
+    audio status is touched, so the new holder owns both.
+    """
+    monkeypatch.setattr(settings, "job_heartbeat_seconds", 0.02)
+    broker = MemoryBroker()
+    worker = Worker(broker=broker, concurrency=1, session_factory=session_factory)
+    audio_file = _make_audio(db, upload_dir)
+    job_id = broker.enqueue(audio_file.id, "transcribe")
+    cancelled = []
+
+    async def stolen_stage(*args: object, **kwargs: object) -> None:
+        job, status, _ = broker.jobs[job_id]
+        broker.jobs[job_id] = (job, status, datetime.utcnow() - timedelta(seconds=1))
+        assert broker.claim("other-worker") is not None
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    monkeypatch.setattr(PipelineService, "run_stage", stolen_stage)
+    await worker.run_once()
+
+    job, status, _ = broker.jobs[job_id]
+    assert cancelled == [True]
+    assert (status, job.worker_id) == (JobStatus.RUNNING.value, "other-worker")
+    db.refresh(audio_file)
+    assert audio_file.status == "uploaded"
+
+
+def test_worker_rejects_lease_shorter_than_stage_timeout(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test starting a worker whose lease could expire before a stage times out.
+
+    Expected behavior: Raises ValueError.
+    """
+    monkeypatch.setattr(settings, "job_visibility_timeout_seconds", 300)
+    monkeypatch.setattr(settings, "processing_timeout_seconds", 600)
+
+    with pytest.raises(ValueError):
+        Worker(broker=MemoryBroker())
+
+
+async def test_worker_runs_full_pipeline(
+    db: Session, session_factory: sessionmaker, upload_dir: Path, fake_openai: FakeOpenAI
+) -> None:
+    """
+    Test a worker draining an in-memory queue.
+
+    Expected behavior: Transcribe, summarize and embed stages run and audio completes.
+    """
+    broker = MemoryBroker()
+    worker = Worker(broker=broker, concurrency=1, session_factory=session_factory)
+    audio_file = _make_audio(db, upload_dir)
+    broker.enqueue(audio_file.id, "transcribe")
+
+    assert await worker.run_once() is True
+    assert await worker.run_once() is True
+    assert await worker.run_once() is True
+    assert await worker.run_once() is False
+
+    db.refresh(audio_file)
+    assert audio_file.status == "completed"
+    assert audio_file.transcription.full_text == "transcript 1"
+    assert audio_file.transcription.summary.summary_text == "Budget approved."
+    assert db.query(Embedding).filter(Embedding.audio_file_id == audio_file.id).count() == 3
+
+
+async def test_worker_retries_failed_stage(
+    db: Session,
+    session_factory: sessionmaker,
+    upload_dir: Path,
+    fake_openai: FakeOpenAI,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test a stage failing once and succeeding on retry.
+
+    Expected behavior: Audio stays processing after the failure, then completes.
+    """
+    monkeypatch.setattr(settings, "job_retry_backoff_seconds", 0)
+    broker = MemoryBroker()
+    worker = Worker(broker=broker, concurrency=1, session_factory=session_factory)
+    audio_file = _make_audio(db, upload_dir)
+    broker.enqueue(audio_file.id, "transcribe")
+
+    fake_openai.audio.transcriptions.error = RuntimeError("Whisper unavailable")
+    await worker.run_once()
+    db.refresh(audio_file)
+    assert audio_file.status == "processing"
+
+    fake_openai.audio.transcriptions.error = None
+    await worker.run_once()
+    await worker.run_once()
+    db.refresh(audio_file)
+    assert audio_file.status == "completed"
@@ -0,0 +1,88 @@
+"""
+Live recording service tests.
+
+Tests for failing live recordings and releasing the ones a crashed
+process left behind.
+"""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.services.live_service import LiveRecording, recover_orphaned_recordings
+from tests.conftest import FakeOpenAI, live_cluster, make_webm
+
+
+def add_running_summary(db: Session, recording: LiveRecording) -> Transcription:
+    """Add the in-progress transcription and summary of a running summary."""
+    transcription = Transcription(audio_file_id=recording.audio_file.id, status="in_progress")
+    db.add(transcription)
+    db.flush()
+    db.add(Summary(transcription_id=transcription.id, status="in_progress"))
+    db.commit()
+    return transcription
+
+
+async def test_fail_keeps_stored_audio(db: Session, upload_dir: Path) -> None:
+    """
+    Test failing a recording after some audio arrived.
+
+    Expected behavior: The audio file is failed with the reason and the size
+    stored so far, and the running transcription and summary are failed.
+    """
+    data = make_webm(None) + live_cluster(0)
+    recording = LiveRecording.start(db, "standup.webm", FakeOpenAI())
+    await recording.append(data)
+    transcription = add_running_summary(db, recording)
+
+    await recording.fail("Client went away")
+
+    audio_file = recording.audio_file
+    assert audio_file.status == "failed"
+    assert audio_file.error_message == "Client went away"
+    assert audio_file.file_size == len(data)
+    assert Path(audio_file.file_path).read_bytes() == data
+    db.refresh(transcription)
+    assert transcription.status == "failed"
+    assert transcription.summary.status == "failed"
+
+
+async def test_recover_orphaned_recordings(db: Session, upload_dir: Path) -> None:
+    """
+    Test the sweep after the process recording a meeting crashed.
+
+    Expected behavior: A recording with stored audio becomes uploaded (so it
+    can be processed), one without audio fails, and one still being written
+    is left alone.
+    """
+    data = make_webm(None) + live_cluster(0) + live_cluster(1000)
+    crashed = LiveRecording.start(db, "crashed.webm", FakeOpenAI())
+    await crashed.append(data)
+    transcription = add_running_summary(db, crashed)
+    empty = LiveRecording.start(db, "empty.webm", FakeOpenAI())
+    active = LiveRecording.start(db, "active.webm", FakeOpenAI())
+    await active.append(data)
+    for recording in (crashed, empty):
+        # Reason: What a process killed mid-stream leaves behind
+        recording._file.close()
+        stale = time.time() - settings.live_orphan_timeout_seconds - 1
+        os.utime(recording.audio_file.file_path, (stale, stale))
+
+    assert recover_orphaned_recordings(db) == 2
+
+    crashed_file = crashed.audio_file
+    assert crashed_file.status == "uploaded"
+    assert crashed_file.file_size == len(data)
+    assert crashed_file.content_hash == hashlib.sha256(data).hexdigest()
+    db.refresh(transcription)
+    assert transcription.status == "failed"
+    assert transcription.summary.status == "failed"
+    assert empty.audio_file.status == "failed"
+    assert active.audio_file.status == "recording"
+    assert recover_orphaned_recordings(db) == 0
@@ -0,0 +1,121 @@
+"""
+Search service tests.
+
+Tests for indexing meeting text and searching it with SQLite FTS5.
+"""
+
+from pathlib import Path
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.audio import AudioFile
+from app.models.transcription import Transcription
+from app.services.audio_service import AudioService
+from app.services.search_service import SearchService
+from app.services.summary_service import SummaryService
+from app.services.transcription_service import TranscriptionService
+from tests.conftest import FakeOpenAI
+
+
+def _make_meeting(db: Session, text: str) -> Transcription:
+    """Create an audio file with a completed, indexed transcription."""
+    audio_file = AudioFile(
+        filename="meeting.webm",
+        file_path="/tmp/meeting.webm",
+        file_size=1,
+        mime_type="audio/webm",
+        status="completed",
+    )
+    transcription = Transcription(audio_file=audio_file, full_text=text, status="completed")
+    db.add_all([audio_file, transcription])
+    db.commit()
+    SearchService(db).index_transcription(transcription)
+    db.commit()
+    return transcription
+
+
+async def test_pipeline_indexes_transcript_and_summary(
+    db: Session, upload_dir: Path, fake_openai: FakeOpenAI
+) -> None:
+    """
+    Test searching the results of a pipeline run.
+
+    Expected behavior: Transcript and summary are found with highlighted snippets.
+    """
+    upload_dir.mkdir(parents=True)
+    file_path = upload_dir / "meeting.webm"
+    file_path.write_bytes(b"audio")
+    audio_file = AudioFile(
+        filename="meeting.webm", file_path=str(file_path), file_size=5, mime_type="audio/webm"
+    )
+    db.add(audio_file)
+    db.commit()
+
+    transcription = await TranscriptionService(db).transcribe_audio(audio_file, use_cache=False)
+    summary = await SummaryService(db).generate_summary(transcription, use_cache=False)
+
+    search = SearchService(db)
+    [transcript_hit] = await search.search("transcript", limit=10)
+    [summary_hit] = await search.search("budgets", limit=10)
+
+    assert transcript_hit.source == "transcript"
+    assert transcript_hit.document_id == transcription.id
+    assert transcript_hit.audio_id == audio_file.id
+    assert "<mark>transcript</mark>" in transcript_hit.snippet
+    assert summary_hit.source == "summary"
+    assert summary_hit.document_id == summary.id
+    assert summary_hit.snippet == "<mark>Budget</mark> approved."
+
+
+async def test_search_ranks_and_reindexes(db: Session) -> None:
+    """
+    Test ranking and re-indexing changed text.
+
+    Expected behavior: Denser matches rank first; replaced text is no longer found.
+    """
+    sparse = _make_meeting(db, "We talked about hiring and briefly the budget.")
+    dense = _make_meeting(db, "Q3 budget review: the budget is over, budget cuts agreed.")
+    search = SearchService(db)
+
+    hits = await search.search("Q3 budget?", limit=10)
+    assert [hit.document_id for hit in hits] == [dense.id]
+
+    hits = await search.search("budget", limit=10)
+    assert [hit.document_id for hit in hits] == [dense.id, sparse.id]
+    assert hits[0].rank > hits[1].rank
+
+    sparse.full_text = "Only hiring was discussed."
+    search.index_transcription(sparse)
+    db.commit()
+    assert [hit.document_id for hit in await search.search("budget", limit=10)] == [dense.id]
+    assert await search.search("?!", limit=10) == []
+
+
+async def test_delete_audio_drops_index_entries(db: Session) -> None:
+    """
+    Test deleting a searchable meeting.
+
+    Expected behavior: It no longer appears in search results.
+    """
+    transcription = _make_meeting(db, "Budget approved.")
+    kept = _make_meeting(db, "Budget postponed.")
+
+    assert AudioService(db).delete_audio(transcription.audio_file_id)
+
+    hits = await SearchService(db).search("budget", limit=10)
+    assert [hit.document_id for hit in hits] == [kept.id]
+
+
+def test_postgres_search_statement(db: Session) -> None:
+    """
+    Test the PostgreSQL search statement.
+
+    Expected behavior: Matches tsvectors, ranks them and only highlights the page.
+    """
+    statement = SearchService(db)._postgres_search("budget", limit=10, offset=20)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("@@ websearch_to_tsquery") == 2
+    assert "ts_rank_cd" in sql
+    assert sql.index("ts_headline") < sql.index("LIMIT")
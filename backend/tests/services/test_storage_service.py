@@ -0,0 +1,175 @@
+"""
+Storage service tests.
+
+Tests for streaming audio uploads to disk.
+"""
+
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.settings import settings
+from app.services.storage_service import FileTooLargeError, StorageService
+
+
+async def test_save_audio_stream_writes_file_and_hash(
+    upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test streaming an upload in several chunks.
+
+    Expected behavior: File content, size and SHA-256 match the upload.
+    """
+    monkeypatch.setattr(settings, "upload_chunk_size_kb", 1)
+    content = b"RIFF" + bytes(range(256)) * 20
+    upload = UploadFile(io.BytesIO(content), filename="meeting.wav")
+
+    stored = await StorageService().save_audio_stream(upload, "meeting.wav", max_size=1_000_000)
+
+    assert stored.size == len(content)
+    assert stored.content_hash == hashlib.sha256(content).hexdigest()
+    assert stored.filename.endswith(".wav")
+    assert Path(stored.file_path).read_bytes() == content
+    assert list(upload_dir.glob("*.part")) == []
+
+
+async def test_save_audio_stream_rejects_oversized_upload(
+    upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test that the size limit is enforced while streaming.
+
+    Expected behavior: Raises FileTooLargeError and leaves no file behind.
+    """
+    monkeypatch.setattr(settings, "upload_chunk_size_kb", 1)
+    upload = UploadFile(io.BytesIO(b"x" * 4096), filename="meeting.wav")
+
+    with pytest.raises(FileTooLargeError):
+        await StorageService().save_audio_stream(upload, "meeting.wav", max_size=2048)
+
+    assert list(upload_dir.iterdir()) == []
+
+
+async def test_content_addressed_mode_deduplicates(
+    upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test storing the same content twice in content-addressed mode.
+
+    Expected behavior: Both uploads resolve to one fan-out path on disk once
+    the second upload is settled.
+    """
+    monkeypatch.setattr(settings, "storage_mode", "content_addressed")
+    content = b"same recording"
+    content_hash = hashlib.sha256(content).hexdigest()
+    storage = StorageService()
+
+    first = await storage.save_audio_stream(
+        UploadFile(io.BytesIO(content), filename="a.webm"), "a.webm", max_size=1024
+    )
+    second = await storage.save_audio_stream(
+        UploadFile(io.BytesIO(content), filename="b.webm"), "b.webm", max_size=1024
+    )
+
+    expected = upload_dir / content_hash[:2] / content_hash[2:4] / f"{content_hash}.webm"
+    assert first.file_path == second.file_path == str(expected)
+    assert not first.deduplicated
+    assert second.deduplicated
+    storage.settle_upload(first)
+    storage.settle_upload(second)
+    assert len([p for p in upload_dir.rglob("*") if p.is_file()]) == 1
+
+
+async def test_content_addressed_upload_survives_pruned_directory(
+    upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a concurrent delete pruning the fan-out directory before the move.
+
+    Expected behavior: The directory is recreated and the upload is stored
+    without a partial file left behind.
+    """
+    monkeypatch.setattr(settings, "storage_mode", "content_addressed")
+    replace = os.replace
+    pruned = []
+
+    def prune_then_replace(source: Path, target: Path) -> None:
+        if not pruned:
+            pruned.append(Path(target).parent)
+            Path(target).parent.rmdir()
+        replace(source, target)
+
+    monkeypatch.setattr(os, "replace", prune_then_replace)
+
+    stored = await StorageService().save_audio_stream(
+        UploadFile(io.BytesIO(b"recording"), filename="a.webm"), "a.webm", max_size=1024
+    )
+
+    assert pruned == [Path(stored.file_path).parent]
+    assert Path(stored.file_path).read_bytes() == b"recording"
+    assert list(upload_dir.glob("*.part")) == []
+
+
+async def test_settle_upload_restores_file_deleted_before_commit(
+    upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a delete that unlinks the shared file while a duplicate upload is in flight.
+
+    Expected behavior: Settling the upload puts its own copy back in place.
+    """
+    monkeypatch.setattr(settings, "storage_mode", "content_addressed")
+    storage = StorageService()
+    first = await storage.save_audio_stream(
+        UploadFile(io.BytesIO(b"same recording"), filename="a.webm"), "a.webm", max_size=1024
+    )
+    second = await storage.save_audio_stream(
+        UploadFile(io.BytesIO(b"same recording"), filename="b.webm"), "b.webm", max_size=1024
+    )
+
+    # Reason: The first record is deleted before the second one is committed
+    assert storage.delete_shared_file(first.file_path, lambda: 0) is True
+    storage.settle_upload(second)
+
+    assert Path(second.file_path).read_bytes() == b"same recording"
+    assert [p for p in upload_dir.rglob("*") if p.is_file()] == [Path(second.file_path)]
+
+
+def test_delete_shared_file_keeps_file_referenced_meanwhile(upload_dir: Path) -> None:
+    """
+    Test a duplicate upload committing while its shared file is being deleted.
+
+    Expected behavior: The second reference count sees it and the file is put back.
+    """
+    storage = StorageService()
+    file_path = upload_dir / "ab" / "cd" / "abcd.webm"
+    file_path.parent.mkdir(parents=True)
+    file_path.write_bytes(b"audio")
+    counts = iter([0, 1])
+
+    assert storage.delete_shared_file(str(file_path), lambda: next(counts)) is False
+    assert file_path.read_bytes() == b"audio"
+    assert [p for p in upload_dir.rglob("*") if p.is_file()] == [file_path]
+
+
+def test_delete_audio_file_keeps_referenced_file(upload_dir: Path) -> None:
+    """
+    Test deleting a file that other records still reference.
+
+    Expected behavior: File stays until the reference count reaches zero.
+    """
+    storage = StorageService()
+    file_path = upload_dir / "ab" / "cd" / "abcd.webm"
+    file_path.parent.mkdir(parents=True)
+    file_path.write_bytes(b"audio")
+
+    assert storage.delete_audio_file(str(file_path), references=1) is False
+    assert file_path.exists()
+
+    assert storage.delete_audio_file(str(file_path), references=0) is True
+    assert not file_path.exists()
+    assert list(upload_dir.iterdir()) == []
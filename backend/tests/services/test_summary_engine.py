@@ -0,0 +1,136 @@
+"""
+Summary engine tests.
+
+Tests for map-reduce summarization against a local stub model.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from app.services.summary_engine import SummaryEngine, merge_summaries
+
+TRANSCRIPT = " ".join(
+    [
+        "Ana opened the meeting.",
+        "The budget was approved.",
+        "Ben will send the report.",
+        "Hiring starts in May.",
+        "The budget was approved.",
+        "Ben will send the report.",
+        "Cleo closed the meeting.",
+    ]
+)
+
+
+class StubModel:
+    """
+    Local stand-in for the chat model.
+
+    Map calls return every sentence as a key point; "X will Y" sentences also
+    become action items. Reduce calls concatenate the notes they are given.
+    """
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        prompt = kwargs["messages"][-1]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        if "Transcription part:" in prompt:
+            text = prompt.split("Transcription part:\n")[1].split("\n\nReturn valid JSON")[0]
+            sentences = [s.strip() for s in text.split(".") if s.strip()]
+            result = {
+                "summary": f"{len(sentences)} sentences.",
+                "key_points": sentences,
+                "action_items": [
+                    {"item": s.split(" will ")[1], "owner": s.split(" will ")[0]}
+                    for s in sentences
+                    if " will " in s
+                ],
+                "decisions": [],
+                "participants": [s.split()[0] for s in sentences if s.split()[0] in "Ana Ben Cleo"],
+            }
+        else:
+            notes = json.loads(prompt.split("Notes:\n")[1].split("\n\nReturn valid JSON")[0])
+            result = {
+                field: sum((note[field] for note in notes), [])
+                for field in ("key_points", "action_items", "decisions", "participants")
+            }
+            result["summary"] = f"Merged {len(notes)} notes."
+
+        message = SimpleNamespace(content=json.dumps(result))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message)],
+            usage=SimpleNamespace(prompt_tokens=8, total_tokens=10),
+        )
+
+
+def _engine(model: StubModel, reduce_strategy: str) -> SummaryEngine:
+    """Engine with a tiny chunk budget so the transcript needs several chunks."""
+    client = SimpleNamespace(chat=SimpleNamespace(completions=model))
+    return SummaryEngine(
+        client, model="gpt-4o-mini", chunk_tokens=20, fan_out=2, reduce_strategy=reduce_strategy
+    )
+
+
+async def test_long_transcript_is_mapped_then_reduced_by_the_model() -> None:
+    """
+    Test map-reduce with the model as reducer.
+
+    Expected behavior: Chunks are extracted at most fan_out at a time, merged by
+    the model until one result is left, and duplicates removed.
+    """
+    model = StubModel()
+    engine = _engine(model, "llm")
+
+    summary, usage = await engine.summarize(TRANSCRIPT)
+
+    map_calls = [p for p in model.prompts if "Transcription part:" in p]
+    assert len(map_calls) > 2
+    assert model.peak == 2
+    assert usage.total_tokens == 10 * len(model.prompts)
+    assert usage.prompt_tokens == 8 * len(model.prompts)
+    assert summary["summary"].startswith("Merged")
+    assert summary["key_points"].count("The budget was approved") == 1
+    assert summary["action_items"] == [{"item": "send the report", "owner": "Ben"}]
+    assert summary["participants"] == ["Ana", "Ben", "Cleo"]
+
+
+async def test_local_reduce_makes_no_extra_calls() -> None:
+    """
+    Test the local reduce strategy.
+
+    Expected behavior: Only map calls are made and partial summaries are joined.
+    """
+    model = StubModel()
+
+    summary, _ = await _engine(model, "local").summarize(TRANSCRIPT)
+
+    assert all("Transcription part:" in prompt for prompt in model.prompts)
+    assert summary["key_points"][0] == "Ana opened the meeting"
+    assert summary["key_points"].count("Ben will send the report") == 1
+
+
+def test_merge_fills_missing_action_owner() -> None:
+    """
+    Test action item de-duplication.
+
+    Expected behavior: Same task (ignoring case/punctuation) is kept once with its owner.
+    """
+    merged = merge_summaries(
+        [
+            {"summary": "A.", "action_items": [{"item": "Send the report", "owner": None}]},
+            {"summary": "B.", "action_items": [{"item": "send the report!", "owner": "Ben"}]},
+        ]
+    )
+
+    assert merged["summary"] == "A. B."
+    assert merged["action_items"] == [{"item": "Send the report", "owner": "Ben"}]
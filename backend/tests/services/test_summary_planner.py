@@ -0,0 +1,61 @@
+"""
+Summary planner tests.
+
+Tests for route and token budget planning before summary calls.
+"""
+
+from types import SimpleNamespace
+
+from app.services.summary_engine import SummaryEngine
+from app.services.summary_planner import SummaryPlan, SummaryPlanner, SummaryRoute
+
+
+def _planner(chunk_tokens: int, context_window: int | None = None) -> SummaryPlanner:
+    """Planner over an engine that is never called."""
+    engine = SummaryEngine(SimpleNamespace(), model="gpt-4o-mini", chunk_tokens=chunk_tokens)
+    return SummaryPlanner(engine, fast_path_tokens=100, context_window=context_window)
+
+
+def _plan(planner: SummaryPlanner, transcript: str) -> SummaryPlan:
+    """Plan with a minimal single-call prompt."""
+    return planner.plan(transcript, "System.", lambda text: f"Summarize:\n{text}", 1200)
+
+
+def test_short_meeting_takes_fast_path() -> None:
+    """
+    Test planning for a short transcript.
+
+    Expected behavior: Fast route with a reduced completion budget and a
+    prompt estimate covering the whole request.
+    """
+    plan = _plan(_planner(chunk_tokens=1000), "We approved the budget.")
+
+    assert plan.route is SummaryRoute.FAST
+    assert plan.max_tokens == 500
+    assert plan.prompt_tokens > plan.transcript_tokens
+
+
+def test_transcript_within_chunk_is_one_call() -> None:
+    """
+    Test planning for a transcript that fits one prompt.
+
+    Expected behavior: Single route with the full completion budget.
+    """
+    plan = _plan(_planner(chunk_tokens=1000), "word " * 400)
+
+    assert plan.route is SummaryRoute.SINGLE
+    assert plan.max_tokens == 1200
+
+
+def test_over_length_request_is_chunked_to_fit_the_window() -> None:
+    """
+    Test planning when the prompt would not fit the model's context window.
+
+    Expected behavior: Chunked route, with a chunk size lowered so each map
+    call fits, even though the configured chunk size is larger.
+    """
+    plan = _plan(_planner(chunk_tokens=50000, context_window=4000), "word " * 8000)
+
+    assert plan.route is SummaryRoute.CHUNKED
+    assert plan.chunk_tokens < 4000 - plan.max_tokens
+    assert plan.prompt_tokens > plan.transcript_tokens
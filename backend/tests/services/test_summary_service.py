@@ -0,0 +1,286 @@
+"""
+Summary service tests.
+
+Tests for GPT summary generation and the summary cache.
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCache, TieredCache
+from app.models.audio import AudioFile
+from app.models.summary import Summary
+from app.models.transcription import Transcription
+from app.services.summary_cache import SummaryCache
+from app.services.summary_engine import ReduceStrategy
+from app.services.summary_service import SummaryService
+from tests.conftest import FakeOpenAI
+
+
+def _make_transcription(db: Session, text: str) -> Transcription:
+    """Create a completed transcription with its audio record."""
+    audio_file = AudioFile(
+        filename="meeting.webm",
+        file_path=f"/tmp/{len(text)}-{id(text)}.webm",
+        file_size=1,
+        mime_type="audio/webm",
+    )
+    transcription = Transcription(audio_file=audio_file, full_text=text, status="completed")
+    db.add(transcription)
+    db.commit()
+    return transcription
+
+
+@pytest.fixture
+def service(db: Session, fake_openai: FakeOpenAI) -> SummaryService:
+    """Summary service with a fake GPT client and a fresh two-tier cache."""
+    summary_service = SummaryService(db)
+    # Reason: A MemoryCache stands in for the shared Redis tier
+    summary_service.cache = SummaryCache(
+        TieredCache("summary-test", MemoryCache(max_entries=10), shared=MemoryCache(10))
+    )
+    return summary_service
+
+
+async def test_identical_transcript_is_served_from_cache(
+    db: Session, service: SummaryService
+) -> None:
+    """
+    Test summarizing the same transcript twice.
+
+    Expected behavior: GPT is called once; the cached summary spends no tokens.
+    """
+    first = await service.generate_summary(_make_transcription(db, "We approved the budget."))
+    # Reason: Whitespace-only differences normalize to the same key
+    second = await service.generate_summary(_make_transcription(db, "We  approved the\nbudget. "))
+
+    assert len(service.client.chat.completions.calls) == 1
+    assert service.client.chat.completions.calls[0]["max_tokens"] == 500
+    assert first.route == "fast"
+    assert first.estimated_prompt_tokens > 0
+    assert first.prompt_tokens == 300
+    assert first.tokens_used == 321
+    assert first.cache_hit is False
+    assert second.tokens_used == 0
+    assert second.cache_hit is True
+    assert second.summary_text == "Budget approved."
+    assert second.participants == ["Ana", "Ben"]
+    assert second.transcription.audio_file.status == "completed"
+
+
+async def test_summary_cache_can_be_bypassed(db: Session, service: SummaryService) -> None:
+    """
+    Test per-request cache bypass.
+
+    Expected behavior: GPT is called again when use_cache is False.
+    """
+    await service.generate_summary(_make_transcription(db, "Same text"))
+    bypassed = await service.generate_summary(_make_transcription(db, "Same text"), use_cache=False)
+
+    assert len(service.client.chat.completions.calls) == 2
+    assert bypassed.cache_hit is False
+
+
+async def test_failed_summary_leaves_audio_status_to_worker(
+    db: Session, service: SummaryService, fake_openai: FakeOpenAI
+) -> None:
+    """
+    Test a model error during summary generation.
+
+    Expected behavior: The error is recorded on the summary; the audio file
+    status is not changed.
+    """
+    transcription = _make_transcription(db, "We approved the budget.")
+    transcription.audio_file.status = "processing"
+    db.commit()
+    fake_openai.chat.completions.error = RuntimeError("Model unavailable")
+
+    with pytest.raises(RuntimeError):
+        await service.generate_summary(transcription)
+
+    db.refresh(transcription)
+    assert transcription.audio_file.status == "processing"
+    assert transcription.summary.status == "failed"
+    assert transcription.summary.error_message == "Model unavailable"
+
+
+async def test_failed_index_write_marks_summary_failed(
+    db: Session, service: SummaryService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a database error while indexing the finished summary.
+
+    Expected behavior: The session is rolled back and the summary is marked
+    failed with the original error instead of staying in progress.
+    """
+    transcription = _make_transcription(db, "We approved the budget.")
+
+    def failing_index(summary: Summary) -> None:
+        db.add(AudioFile(filename=None, file_path="/tmp/x", file_size=1, mime_type="audio/webm"))
+        db.flush()
+
+    monkeypatch.setattr(service.search, "index_summary", failing_index)
+
+    with pytest.raises(IntegrityError):
+        await service.generate_summary(transcription)
+
+    db.refresh(transcription)
+    assert transcription.summary.status == "failed"
+    assert "NOT NULL" in transcription.summary.error_message
+    assert len(transcription.summary.error_message) <= 1000
+
+
+async def test_reprocessed_summary_clears_cache_hit(db: Session, service: SummaryService) -> None:
+    """
+    Test reprocessing a summary that was served from the cache.
+
+    Expected behavior: The reused row reports a miss after the paid API call.
+    """
+    await service.generate_summary(_make_transcription(db, "Same text"))
+    transcription = _make_transcription(db, "Same text")
+    cached = await service.generate_summary(transcription)
+    assert cached.cache_hit is True
+
+    reprocessed = await service.generate_summary(transcription, use_cache=False)
+
+    assert reprocessed.id == cached.id
+    assert reprocessed.cache_hit is False
+    assert reprocessed.tokens_used == 321
+
+
+def test_summary_cache_key_depends_on_prompt_settings() -> None:
+    """
+    Test that prompt version and sampling settings are part of the key.
+
+    Expected behavior: Changing any of them produces a different key.
+    """
+    base = SummaryCache.make_key("text", "gpt-4o-mini", "v1", 0.5, 1200)
+
+    assert base != SummaryCache.make_key("text", "gpt-4o-mini", "v2", 0.5, 1200)
+    assert base != SummaryCache.make_key("text", "gpt-4o-mini", "v1", 0.7, 1200)
+    assert base != SummaryCache.make_key("text", "gpt-4o-mini", "v1", 0.5, 800)
+    assert base != SummaryCache.make_key("text", "gpt-4o", "v1", 0.5, 1200)
+
+
+async def test_long_transcript_is_summarized_with_map_reduce(
+    db: Session, service: SummaryService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test routing of transcripts longer than one chunk.
+
+    Expected behavior: The engine makes several calls and all their tokens are counted.
+    """
+    monkeypatch.setattr(service.planner, "fast_path_tokens", 0)
+    monkeypatch.setattr(service.engine, "chunk_tokens", 10)
+
+    summary = await service.generate_summary(_make_transcription(db, "Ana spoke. " * 20))
+
+    calls = service.client.chat.completions.calls
+    assert len(calls) > 2
+    assert summary.route == "chunked"
+    assert summary.tokens_used == 321 * len(calls)
+    assert summary.prompt_tokens == 300 * len(calls)
+    assert summary.summary_text == "Budget approved."
+    assert summary.participants == ["Ana", "Ben"]
+
+
+async def test_running_summary_is_updated_from_new_text_only(
+    db: Session, service: SummaryService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a live meeting's running summary with the local reduce strategy.
+
+    Expected behavior: Each update sends only the new text and merges its
+    result into the stored state; finalizing makes no further call.
+    """
+    monkeypatch.setattr(service.engine, "reduce_strategy", ReduceStrategy.LOCAL)
+    completions = service.client.chat.completions
+    transcription = _make_transcription(db, "")
+    completions.summary = {
+        "summary": "Budget discussed.",
+        "key_points": ["Budget"],
+        "action_items": [{"item": "Send report", "owner": None}],
+        "participants": ["Ana"],
+    }
+    first = await service.update_running_summary(transcription, "Ana: the budget is fine.", 1)
+    assert (first.status, first.route, first.key_points) == (
+        "in_progress",
+        "incremental",
+        ["Budget"],
+    )
+
+    completions.summary = {
+        "summary": "Hiring agreed.",
+        "key_points": ["budget", "Hiring"],
+        "action_items": [{"item": "Send report.", "owner": "Ana"}],
+        "decisions": ["Hire two engineers"],
+        "participants": ["Ana", "Ben"],
+    }
+    second = await service.update_running_summary(transcription, "Ben: we hire two engineers.", 2)
+    prompts = [call["messages"][1]["content"] for call in completions.calls]
+    assert "budget is fine" in prompts[0] and "hire two" not in prompts[0]
+    assert "hire two" in prompts[1] and "budget is fine" not in prompts[1]
+    assert "part 2 of a meeting transcription that is still being recorded" in prompts[1]
+    assert second.summary_text == "Budget discussed. Hiring agreed."
+    assert second.key_points == ["Budget", "Hiring"]
+    assert second.action_items == [{"item": "Send report", "owner": "Ana"}]
+    assert second.tokens_used == 2 * 321
+
+    final = await service.finalize_running_summary(transcription, " ", 3)
+
+    assert len(completions.calls) == 2
+    assert final.status == "completed"
+    assert final.decisions == ["Hire two engineers"]
+    assert transcription.audio_file.status == "completed"
+
+
+async def test_running_summary_is_finalized_from_its_state(
+    db: Session, service: SummaryService
+) -> None:
+    """
+    Test finalizing a running summary with the model reduce strategy.
+
+    Expected behavior: The text since the last update is extracted, then one
+    reduce call merges the running state - the earlier transcript is not resent.
+    """
+    completions = service.client.chat.completions
+    transcription = _make_transcription(db, "")
+    await service.update_running_summary(transcription, "Ana: the budget is fine.", 1)
+
+    final = await service.finalize_running_summary(transcription, "Ben: meeting closed.", 2)
+
+    prompts = [call["messages"][1]["content"] for call in completions.calls]
+    assert len(prompts) == 3
+    assert "meeting closed" in prompts[1]
+    assert "Merge them" in prompts[2] and "Budget approved." in prompts[2]
+    assert "budget is fine" not in prompts[2] and "meeting closed" not in prompts[2]
+    assert final.status == "completed"
+    assert final.summary_text == "Budget approved."
+    assert final.tokens_used == 3 * 321
+
+
+async def test_failed_index_write_marks_running_summary_failed(
+    db: Session, service: SummaryService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a database error while indexing a finalized running summary.
+
+    Expected behavior: The summary is marked failed and the session stays
+    usable for the caller's fallback.
+    """
+    transcription = _make_transcription(db, "")
+    await service.update_running_summary(transcription, "Ana: the budget is fine.", 1)
+
+    def failing_index(summary: Summary) -> None:
+        db.add(AudioFile(filename=None, file_path="/tmp/x", file_size=1, mime_type="audio/webm"))
+        db.flush()
+
+    monkeypatch.setattr(service.search, "index_summary", failing_index)
+
+    with pytest.raises(IntegrityError):
+        await service.finalize_running_summary(transcription, "Ben: meeting closed.", 2)
+
+    db.refresh(transcription)
+    assert transcription.summary.status == "failed"
+    assert transcription.summary.error_message.startswith("(sqlite3.IntegrityError)")
@@ -0,0 +1,77 @@
+"""
+Transcode service tests.
+
+Tests for preparing uploads for transcription in the process pool.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.audio import AudioFile
+from app.services.transcode_service import TranscodeService, shutdown_transcode_pool
+from tests.conftest import write_wav
+
+
+@pytest.fixture(autouse=True)
+def transcode_pool() -> Iterator[None]:
+    """Stop the transcoding processes after each test."""
+    yield
+    shutdown_transcode_pool()
+
+
+def _make_audio(db: Session, file_path: Path, mime_type: str) -> AudioFile:
+    """Create an audio record for a stored file."""
+    audio_file = AudioFile(
+        filename=file_path.name,
+        file_path=str(file_path),
+        file_size=file_path.stat().st_size,
+        mime_type=mime_type,
+    )
+    db.add(audio_file)
+    db.commit()
+    return audio_file
+
+
+async def test_stereo_wav_is_transcoded_for_transcription(db: Session, upload_dir: Path) -> None:
+    """
+    Test transcoding a 48 kHz stereo upload.
+
+    Expected behavior: A smaller copy is recorded next to the original size and
+    becomes the path transcription reads; a second run keeps it.
+    """
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    path = write_wav(upload_dir / "meeting.wav", [(2.0, True)], rate=48000, channels=2)
+    audio_file = _make_audio(db, path, "audio/wav")
+
+    await TranscodeService(db).transcode_audio(audio_file)
+    db.refresh(audio_file)
+
+    assert audio_file.transcoded_path is not None
+    assert audio_file.speech_path == audio_file.transcoded_path
+    assert Path(audio_file.transcoded_path).stat().st_size == audio_file.transcoded_size
+    assert audio_file.transcoded_size < audio_file.file_size / 5
+    assert audio_file.file_path == str(path)
+
+    transcoded_path = audio_file.transcoded_path
+    await TranscodeService(db).transcode_audio(audio_file)
+    assert audio_file.transcoded_path == transcoded_path
+
+
+async def test_undecodable_upload_is_sent_as_uploaded(db: Session, upload_dir: Path) -> None:
+    """
+    Test an upload that cannot be decoded locally.
+
+    Expected behavior: No transcoded copy; transcription reads the original.
+    """
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    path = upload_dir / "meeting.webm"
+    path.write_bytes(b"audio")
+    audio_file = _make_audio(db, path, "audio/webm")
+
+    await TranscodeService(db).transcode_audio(audio_file)
+
+    assert audio_file.transcoded_path is None
+    assert audio_file.speech_path == str(path)
@@ -0,0 +1,344 @@
+"""
+Transcription service tests.
+
+Tests for Whisper transcription and the transcription cache.
+"""
+
+import asyncio
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.cache import CacheStats
+from app.core.cache import cache_stats as cache_registry
+from app.core.settings import settings
+from app.models.audio import AudioFile
+from app.models.transcription_cache import TranscriptionCacheEntry
+from app.services.transcription_cache import TranscriptionCache
+from app.services.transcription_cache import stats as cache_stats
+from app.services.transcription_service import TranscriptionService
+from app.utils.audio import SAMPLE_RATE
+from tests.conftest import FakeOpenAI, write_wav
+
+
+def _make_audio(db: Session, upload_dir: Path, content_hash: str) -> AudioFile:
+    """Create an audio record backed by a small file."""
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    file_path = upload_dir / f"{content_hash}-{len(list(upload_dir.iterdir()))}.webm"
+    file_path.write_bytes(b"audio")
+    audio_file = AudioFile(
+        filename="meeting.webm",
+        file_path=str(file_path),
+        file_size=5,
+        content_hash=content_hash,
+        mime_type="audio/webm",
+    )
+    db.add(audio_file)
+    db.commit()
+    return audio_file
+
+
+@pytest.fixture
+def service(db: Session, fake_openai: FakeOpenAI) -> TranscriptionService:
+    """Transcription service with a fake Whisper client."""
+    return TranscriptionService(db)
+
+
+async def test_identical_audio_is_served_from_cache(
+    db: Session, upload_dir: Path, service: TranscriptionService
+) -> None:
+    """
+    Test transcribing the same content twice.
+
+    Expected behavior: Whisper is called once and the second row clones the result.
+    """
+    hits_before = cache_stats.hits
+
+    first = await service.transcribe_audio(_make_audio(db, upload_dir, "a" * 64))
+    second_audio = _make_audio(db, upload_dir, "a" * 64)
+    second = await service.transcribe_audio(second_audio)
+
+    assert len(service.client.audio.transcriptions.calls) == 1
+    assert second.full_text == first.full_text == "transcript 1"
+    assert second.language == "en"
+    assert second.cache_hit is True
+    assert first.cache_hit is False
+    assert second_audio.duration_seconds == 12.5
+    assert cache_stats.hits == hits_before + 1
+
+
+async def test_cache_can_be_bypassed(
+    db: Session, upload_dir: Path, service: TranscriptionService
+) -> None:
+    """
+    Test per-request cache bypass.
+
+    Expected behavior: Whisper is called again when use_cache is False.
+    """
+    await service.transcribe_audio(_make_audio(db, upload_dir, "b" * 64))
+    bypassed = await service.transcribe_audio(
+        _make_audio(db, upload_dir, "b" * 64), use_cache=False
+    )
+
+    assert len(service.client.audio.transcriptions.calls) == 2
+    assert bypassed.full_text == "transcript 2"
+    assert bypassed.cache_hit is False
+
+
+class ChunkedWhisper:
+    """Fake Whisper that answers per chunk and tracks requests in flight."""
+
+    def __init__(self) -> None:
+        self.files: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        name, data, _ = kwargs["file"]
+        self.files.append(name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        seconds = (len(data) - 44) / (2 * SAMPLE_RATE)
+        text = f"part {int(name[6:9])}"
+        segments = [{"start": 0.0, "end": seconds, "text": text}]
+        return SimpleNamespace(text=text, language="en", duration=seconds, segments=segments)
+
+
+async def test_long_recording_is_transcribed_in_parallel_chunks(
+    db: Session, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test chunked transcription of a recording longer than the chunk length.
+
+    Expected behavior: One request per chunk with bounded concurrency, and the
+    parts stitched in order with the full recording duration.
+    """
+    monkeypatch.setattr(settings, "transcription_chunk_seconds", 10)
+    monkeypatch.setattr(settings, "transcription_silence_search_seconds", 4.0)
+    monkeypatch.setattr(settings, "transcription_max_concurrency", 2)
+    audio_file = _make_audio(db, upload_dir, "f" * 64)
+    write_wav(
+        Path(audio_file.file_path),
+        [(8.0, True), (0.5, False), (8.0, True), (0.5, False), (8.0, True)],
+    )
+    whisper = ChunkedWhisper()
+    service = TranscriptionService(
+        db, client=SimpleNamespace(audio=SimpleNamespace(transcriptions=whisper))
+    )
+
+    transcription = await service.transcribe_audio(audio_file, use_cache=False)
+
+    assert sorted(whisper.files) == ["chunk-000.wav", "chunk-001.wav", "chunk-002.wav"]
+    assert whisper.peak == 2
+    assert transcription.full_text == "part 0 part 1 part 2"
+    assert audio_file.duration_seconds == 25.0
+
+
+class SegmentedWhisper:
+    """Fake Whisper returning a one-minute transcript in 10 second segments."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        self.calls += 1
+        segments = [
+            {"start": start, "end": start + 10.0, "text": f" minute part {start // 10:.0f}"}
+            for start in range(0, 60, 10)
+        ]
+        text = " ".join(segment["text"].strip() for segment in segments)
+        return SimpleNamespace(text=text, language="en", duration=60.0, segments=segments)
+
+
+async def test_segments_are_stored_and_served_by_time_range(db: Session, upload_dir: Path) -> None:
+    """
+    Test persisting Whisper segments and reading a time range.
+
+    Expected behavior: Segments are stored for fresh and cached transcriptions,
+    and a range returns only the segments overlapping it, in order.
+    """
+    whisper = SegmentedWhisper()
+    service = TranscriptionService(
+        db, client=SimpleNamespace(audio=SimpleNamespace(transcriptions=whisper))
+    )
+
+    first = await service.transcribe_audio(_make_audio(db, upload_dir, "9" * 64))
+    cached = await service.transcribe_audio(_make_audio(db, upload_dir, "9" * 64))
+
+    assert whisper.calls == 1
+    assert cached.cache_hit is True
+    for transcription in (first, cached):
+        segments = await service.get_segments_async(transcription.id, 15.0, 35.0)
+        assert [(s.start_ms, s.end_ms, s.text) for s in segments] == [
+            (10000, 20000, "minute part 1"),
+            (20000, 30000, "minute part 2"),
+            (30000, 40000, "minute part 3"),
+        ]
+
+    tail = await service.get_segments_async(first.id, 50.0)
+    assert [segment.text for segment in tail] == ["minute part 5"]
+
+
+class WavWhisper:
+    """Fake Whisper answering with one segment at each end of the received WAV."""
+
+    def __init__(self) -> None:
+        self.durations: list[float] = []
+
+    async def create(self, **kwargs: object) -> SimpleNamespace:
+        with wave.open(kwargs["file"], "rb") as wav:
+            seconds = wav.getnframes() / wav.getframerate()
+        self.durations.append(seconds)
+        segments = [
+            {"start": 0.0, "end": 1.0, "text": "Hello."},
+            {"start": seconds - 1.0, "end": seconds, "text": "Bye."},
+        ]
+        return SimpleNamespace(
+            text="Hello. Bye.", language="en", duration=seconds, segments=segments
+        )
+
+
+async def test_long_silence_is_cut_before_transcription(
+    db: Session, upload_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test voice activity detection ahead of the Whisper call.
+
+    Expected behavior: Whisper receives the recording without the long pause,
+    the removed seconds are reported, and timestamps refer to the original.
+    """
+    monkeypatch.setattr(settings, "vad_min_removed_seconds", 10.0)
+    audio_file = _make_audio(db, upload_dir, "7" * 64)
+    write_wav(Path(audio_file.file_path), [(5.0, True), (30.0, False), (5.0, True)])
+    whisper = WavWhisper()
+    service = TranscriptionService(
+        db, client=SimpleNamespace(audio=SimpleNamespace(transcriptions=whisper))
+    )
+
+    transcription = await service.transcribe_audio(audio_file, use_cache=False)
+
+    assert whisper.durations == [pytest.approx(11.1, abs=0.1)]
+    assert transcription.silence_removed_seconds == pytest.approx(28.9, abs=0.1)
+    assert audio_file.duration_seconds == 40.0
+    segments = await service.get_segments_async(transcription.id, 0.0)
+    assert segments[0].start_ms == 0
+    assert segments[-1].end_ms == pytest.approx(40000, abs=100)
+    assert segments[-1].start_ms == pytest.approx(39000, abs=100)
+
+
+async def test_failed_transcription_leaves_audio_status_to_worker(
+    db: Session, upload_dir: Path, service: TranscriptionService, fake_openai: FakeOpenAI
+) -> None:
+    """
+    Test a Whisper error during transcription.
+
+    Expected behavior: The error is recorded on the transcription; the audio
+    file stays processing until the worker decides whether to retry.
+    """
+    audio_file = _make_audio(db, upload_dir, "f" * 64)
+    fake_openai.audio.transcriptions.error = RuntimeError("Whisper unavailable")
+
+    with pytest.raises(RuntimeError):
+        await service.transcribe_audio(audio_file)
+
+    db.refresh(audio_file)
+    assert audio_file.status == "processing"
+    assert audio_file.transcription.status == "failed"
+    assert audio_file.transcription.error_message == "Whisper unavailable"
+
+
+async def test_failed_cache_write_keeps_transcription(
+    db: Session, upload_dir: Path, service: TranscriptionService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test a cache write that fails after Whisper answered.
+
+    Expected behavior: The transcription still completes with the Whisper result.
+    """
+
+    def failing_put(*args: object) -> None:
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(service.cache, "put", failing_put)
+
+    transcription = await service.transcribe_audio(_make_audio(db, upload_dir, "0" * 64))
+
+    assert transcription.status == "completed"
+    assert transcription.full_text == "transcript 1"
+
+
+def test_cache_put_updates_entry_inserted_concurrently(
+    db: Session, session_factory: sessionmaker, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test two workers caching the same audio.
+
+    Expected behavior: The later write updates the entry instead of raising.
+    """
+    cache_key = TranscriptionCache.make_key("1" * 64, "whisper-1", {})
+    with session_factory() as other:
+        TranscriptionCache(other).put(cache_key, "1" * 64, "whisper-1", {}, "one", "en", 1.0)
+
+    # Reason: The first lookup misses, as if it ran before the other worker committed
+    lookup = db.get
+    lookups: list[object] = []
+
+    def stale_get(*args: object) -> object:
+        lookups.append(args)
+        return None if len(lookups) == 1 else lookup(*args)
+
+    monkeypatch.setattr(db, "get", stale_get)
+
+    TranscriptionCache(db).put(cache_key, "1" * 64, "whisper-1", {}, "two", "en", 2.0)
+
+    entry = db.get(TranscriptionCacheEntry, cache_key)
+    assert (entry.full_text, entry.duration_seconds) == ("two", 2.0)
+
+
+async def test_cache_counters_are_shared_with_api(
+    client: TestClient,
+    db: Session,
+    upload_dir: Path,
+    service: TranscriptionService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test the stats endpoint when lookups ran in another process.
+
+    Expected behavior: The API reports the counters stored in the database,
+    not its own in-process ones.
+    """
+    await service.transcribe_audio(_make_audio(db, upload_dir, "2" * 64))
+    await service.transcribe_audio(_make_audio(db, upload_dir, "2" * 64))
+    # Reason: The API process never counted these lookups itself
+    monkeypatch.setitem(cache_registry, "transcription", CacheStats())
+
+    counters = client.get("/api/v1/cache/stats").json()["caches"]["transcription"]
+
+    assert (counters["hits"], counters["misses"], counters["hit_ratio"]) == (1, 1, 0.5)
+
+
+def test_cache_evicts_least_recently_used(db: Session, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test the entry bound of the transcription cache.
+
+    Expected behavior: Oldest entry is evicted, recently read entries survive.
+    """
+    monkeypatch.setattr(settings, "transcription_cache_max_entries", 2)
+    cache = TranscriptionCache(db)
+    keys = [TranscriptionCache.make_key(h * 64, "whisper-1", {}) for h in "cde"]
+
+    cache.put(keys[0], "c" * 64, "whisper-1", {}, "one", "en", 1.0)
+    cache.put(keys[1], "d" * 64, "whisper-1", {}, "two", "en", 1.0)
+    assert cache.get(keys[0]) is not None  # Reason: Refresh first entry
+    cache.put(keys[2], "e" * 64, "whisper-1", {}, "three", "en", 1.0)
+
+    remaining = {entry.cache_key for entry in db.query(TranscriptionCacheEntry).all()}
+    assert remaining == {keys[0], keys[2]}
@@ -0,0 +1,134 @@
+"""
+Audio utility tests.
+
+Tests for PCM decoding, silence-aware chunk planning, WAV extraction and transcoding.
+"""
+
+import io
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.utils import audio
+from app.utils.audio import (
+    SAMPLE_RATE,
+    AudioDecodeError,
+    encode_wav,
+    measure_energy,
+    plan_chunks,
+    transcode_for_speech,
+)
+from tests.conftest import write_wav
+
+
+def test_chunks_are_cut_in_pauses(tmp_path: Path) -> None:
+    """
+    Test silence-aware chunk planning.
+
+    Expected behavior: Cuts land inside the pauses before each target length,
+    chunks overlap, and together they cover the whole recording.
+    """
+    path = write_wav(
+        tmp_path / "meeting.wav",
+        [(7.0, True), (0.6, False), (6.0, True), (0.6, False), (5.0, True)],
+    )
+    energies, duration = measure_energy(path)
+
+    spans = plan_chunks(energies, duration, chunk_seconds=10, overlap_seconds=0.5, search_seconds=5)
+
+    assert duration == 19.2
+    assert len(spans) == 3
+    assert 7.0 < spans[0].keep_end < 7.6
+    assert 13.6 < spans[1].keep_end < 14.2
+    assert spans[1].keep_start == spans[0].keep_end
+    assert spans[1].start == spans[0].keep_end - 0.5
+    assert spans[-1].keep_end == spans[-1].end == duration
+
+
+def test_short_recording_is_one_chunk(tmp_path: Path) -> None:
+    """
+    Test planning for a recording shorter than the chunk length.
+
+    Expected behavior: A single chunk covering the recording.
+    """
+    energies, duration = measure_energy(write_wav(tmp_path / "short.wav", [(3.0, True)]))
+
+    spans = plan_chunks(energies, duration, chunk_seconds=10, overlap_seconds=1, search_seconds=5)
+
+    assert [(span.start, span.end) for span in spans] == [(0.0, 3.0)]
+
+
+def test_extracted_chunk_is_16k_mono(tmp_path: Path) -> None:
+    """
+    Test chunk extraction from a 44.1 kHz stereo recording.
+
+    Expected behavior: WAV with 16 kHz mono samples for exactly the requested range.
+    """
+    path = write_wav(tmp_path / "stereo.wav", [(4.0, True)], rate=44100, channels=2)
+
+    with wave.open(io.BytesIO(encode_wav(path, 1.0, 3.5)), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getframerate() == SAMPLE_RATE
+        assert wav.getnframes() == int(2.5 * SAMPLE_RATE)
+
+
+def test_transcode_without_ffmpeg_downmixes_wav(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test transcoding a 48 kHz stereo WAV when ffmpeg is not installed.
+
+    Expected behavior: A 16 kHz mono WAV of the same duration and tone, a sixth of the size.
+    """
+    monkeypatch.setattr(audio.shutil, "which", lambda name: None)
+    path = write_wav(tmp_path / "stereo.wav", [(3.0, True)], rate=48000, channels=2)
+
+    output = transcode_for_speech(path, tmp_path / "out" / "speech", bitrate_kbps=24)
+
+    assert output == tmp_path / "out" / "speech.wav"
+    with wave.open(str(output), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getframerate() == SAMPLE_RATE
+        assert wav.getnframes() == 3 * SAMPLE_RATE
+        samples = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+    assert 7500 < np.abs(samples).max() <= 8000
+    assert output.stat().st_size < path.stat().st_size / 5
+
+
+def test_transcode_without_ffmpeg_rejects_compressed_audio(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Test transcoding a non-WAV file when ffmpeg is not installed.
+
+    Expected behavior: AudioDecodeError and no output file.
+    """
+    monkeypatch.setattr(audio.shutil, "which", lambda name: None)
+    path = tmp_path / "meeting.m4a"
+    path.write_bytes(b"not audio")
+
+    with pytest.raises(AudioDecodeError):
+        transcode_for_speech(path, tmp_path / "speech", bitrate_kbps=24)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_transcode_kills_hanging_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test transcoding a file that makes ffmpeg hang.
+
+    Expected behavior: AudioDecodeError after the timeout and no output file.
+    """
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text("#!/bin/sh\nexec sleep 30\n")
+    ffmpeg.chmod(0o755)
+    monkeypatch.setattr(audio.shutil, "which", lambda name: str(ffmpeg))
+    path = tmp_path / "meeting.webm"
+    path.write_bytes(b"not audio")
+
+    with pytest.raises(AudioDecodeError, match="did not finish"):
+        transcode_for_speech(
+            path, tmp_path / "out" / "speech", bitrate_kbps=24, timeout_seconds=0.2
+        )
+    assert list((tmp_path / "out").iterdir()) == []
@@ -0,0 +1,55 @@
+"""
+EBML reading tests.
+
+Tests for element decoding and the incremental WebM cluster scanner.
+"""
+
+import pytest
+
+from app.utils.ebml import ClusterScanner, ClusterStart, EBMLError, read_size
+from tests.conftest import live_cluster, make_webm
+
+
+def test_read_size_unknown() -> None:
+    """
+    Test reading the reserved all-ones size.
+
+    Expected behavior: Returns None with the varint length.
+    """
+    assert read_size(b"\x01" + b"\xff" * 7, 0) == (None, 8)
+    assert read_size(b"\x42\x80", 0) == (0x280, 2)
+
+
+@pytest.mark.parametrize("piece", [1, 7, 64, 100_000])
+def test_cluster_scanner_handles_any_chunking(piece: int) -> None:
+    """
+    Test feeding a live WebM stream in pieces of different sizes.
+
+    Expected behavior: Same cluster offsets, timecodes and init size whatever
+    the piece size; each cluster is reported once.
+    """
+    init = make_webm(None)
+    clusters = [live_cluster(timecode) for timecode in range(0, 5000, 1000)]
+    stream = init + b"".join(clusters)
+
+    scanner = ClusterScanner()
+    found = []
+    for start in range(0, len(stream), piece):
+        found += scanner.feed(stream[start : start + piece])
+
+    offsets = [len(init) + sum(len(c) for c in clusters[:i]) for i in range(len(clusters))]
+    expected = [ClusterStart(offset, i * 1000) for i, offset in enumerate(offsets)]
+    assert found == expected
+    assert scanner.clusters == expected
+    assert scanner.init_size == len(init)
+    assert scanner.timecode_scale == 1_000_000
+
+
+def test_cluster_scanner_rejects_other_streams() -> None:
+    """
+    Test feeding bytes that are not a WebM stream.
+
+    Expected behavior: Raises EBMLError.
+    """
+    with pytest.raises(EBMLError):
+        ClusterScanner().feed(b"RIFF\x00\x00\x00\x00WAVEfmt " + bytes(64))
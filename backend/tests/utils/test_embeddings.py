@@ -0,0 +1,43 @@
+"""
+Embedding utility tests.
+
+Tests for the hashing embedder and int8 quantization.
+"""
+
+import numpy as np
+
+from app.utils.embeddings import HashingEmbedder, quantize
+
+
+def test_hashing_embedder_relates_word_forms() -> None:
+    """
+    Test embedding related and unrelated texts.
+
+    Expected behavior: Vectors are stable and unit-length; shared word forms score higher.
+    """
+    embedder = HashingEmbedder(256)
+    query, related, unrelated = embedder.embed(
+        ["budgeting for Q3", "The quarterly budgets were approved", "Hiring a new designer"]
+    )
+
+    assert np.allclose(np.linalg.norm(query), 1.0)
+    assert np.array_equal(embedder.embed(["budgeting for Q3"])[0], query)
+    assert query @ related > query @ unrelated
+    assert not embedder.embed(["the and of"]).any()
+
+
+def test_quantize_preserves_similarity() -> None:
+    """
+    Test int8 quantization of unit vectors.
+
+    Expected behavior: Dequantized dot products stay within 1% of the originals.
+    """
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(100, 256)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    codes, scales = quantize(vectors)
+    restored = codes.astype(np.float32) * scales[:, None]
+
+    assert codes.dtype == np.int8
+    assert np.abs(restored @ vectors[0] - vectors @ vectors[0]).max() < 0.01
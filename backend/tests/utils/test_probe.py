@@ -0,0 +1,119 @@
+"""
+Container probe tests.
+
+Tests for header-only format, duration, sample rate and channel probing.
+"""
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from app.utils.probe import ProbeError, probe_audio
+from tests.conftest import ebml_element, make_mp3, make_webm, write_wav
+
+
+def mp4_box(kind: bytes, body: bytes) -> bytes:
+    """Encode an MP4 box."""
+    return struct.pack(">I4s", 8 + len(body), kind) + body
+
+
+def make_m4a(seconds: float, handler: bytes = b"soun") -> bytes:
+    """Build an M4A with its media data before the moov box, like most recorders write."""
+    timescale = 44100
+    mdhd = mp4_box(b"mdhd", bytes(12) + struct.pack(">II", timescale, int(seconds * timescale)))
+    hdlr = mp4_box(b"hdlr", bytes(8) + handler + bytes(12))
+    # Reason: AudioSampleEntry - SampleEntry, reserved, channels, size, reserved, rate 16.16
+    entry = mp4_box(b"mp4a", bytes(16) + struct.pack(">HH4xI", 2, 16, timescale << 16))
+    stsd = mp4_box(b"stsd", bytes(4) + struct.pack(">I", 1) + entry)
+    stbl = mp4_box(b"stbl", stsd)
+    mdia = mp4_box(b"mdia", mdhd + hdlr + mp4_box(b"minf", stbl))
+    mvhd = mp4_box(b"mvhd", bytes(12) + struct.pack(">II", 1000, 1) + bytes(80))
+    moov = mp4_box(b"moov", mvhd + mp4_box(b"trak", mdia))
+    ftyp = mp4_box(b"ftyp", b"M4A " + bytes(4) + b"isomM4A ")
+    return ftyp + mp4_box(b"mdat", bytes(50_000)) + moov
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (make_m4a(95.5), ("mp4", "audio/mp4", 95.5, 44100, 2)),
+        (make_webm(1830.4), ("webm", "audio/webm", 1830.4, 48000, 1)),
+        (make_mp3(1000), ("mp3", "audio/mpeg", 1000 * 417 * 8 / 128000, 44100, 2)),
+    ],
+)
+def test_probe_reads_container_header(tmp_path: Path, content: bytes, expected: tuple) -> None:
+    """
+    Test probing MP4, WebM and constant-bitrate MP3 files.
+
+    Expected behavior: Format, media type, duration, rate and channels from the header.
+    """
+    path = tmp_path / "recording"
+    path.write_bytes(content)
+
+    probe = probe_audio(path)
+
+    assert (probe.format, probe.mime_type) == expected[:2]
+    assert probe.duration_seconds == pytest.approx(expected[2], abs=1e-3)
+    assert (probe.sample_rate, probe.channels) == expected[3:]
+
+
+def test_probe_wav_and_vbr_mp3(tmp_path: Path) -> None:
+    """
+    Test probing a WAV file and an MP3 with a Xing header.
+
+    Expected behavior: WAV duration from the data chunk; MP3 duration from the
+    Xing frame count, not the file size.
+    """
+    wav = write_wav(tmp_path / "meeting.wav", [(2.5, True)], rate=48000, channels=2)
+    probe = probe_audio(wav)
+    assert (probe.format, probe.sample_rate, probe.channels) == ("wav", 48000, 2)
+    assert probe.duration_seconds == pytest.approx(2.5)
+
+    frame = bytearray(make_mp3(1))
+    frame[36:48] = b"Xing" + struct.pack(">II", 1, 5000)
+    mp3 = tmp_path / "meeting.mp3"
+    mp3.write_bytes(b"ID3\x04\x00\x00\x00\x00\x01\x00" + bytes(128) + frame + make_mp3(20))
+
+    assert probe_audio(mp3).duration_seconds == pytest.approx(5000 * 1152 / 44100)
+
+
+def test_probe_webm_without_duration_reads_last_cluster(tmp_path: Path) -> None:
+    """
+    Test probing browser MediaRecorder output, which stores no Duration.
+
+    Expected behavior: Duration is the last block's timestamp in the final cluster.
+    """
+    block = ebml_element(0xA3, b"\x81" + struct.pack(">h", 480) + b"\x80" + bytes(200))
+    clusters = b"".join(
+        ebml_element(0x1F43B675, ebml_element(0xE7, struct.pack(">I", start)) + block)
+        for start in range(0, 90_001, 1000)
+    )
+    path = tmp_path / "recording.webm"
+    path.write_bytes(make_webm(None, payload=clusters))
+
+    assert probe_audio(path).duration_seconds == pytest.approx(90.48)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"plain text, not audio" * 100,
+        make_m4a(10.0, handler=b"vide"),
+        ebml_element(0x1A45DFA3, ebml_element(0x4282, b"matroska")) + bytes(64),
+        b"RIFF\x00\x00\x00\x00WAVE" + bytes(16),
+        # Reason: Empty mvhd as the last box of moov
+        mp4_box(b"ftyp", b"M4A " + bytes(4)) + mp4_box(b"moov", mp4_box(b"mvhd", b"")),
+    ],
+)
+def test_probe_rejects_non_audio(tmp_path: Path, content: bytes) -> None:
+    """
+    Test probing files that are not audio recordings of a known container.
+
+    Expected behavior: Raises ProbeError.
+    """
+    path = tmp_path / "recording"
+    path.write_bytes(content)
+
+    with pytest.raises(ProbeError):
+        probe_audio(path)
@@ -0,0 +1,23 @@
+"""
+Token utility tests.
+
+Tests for token-bounded text splitting.
+"""
+
+from app.utils.tokens import count_tokens, split_by_tokens
+
+
+def test_split_respects_budget_and_sentences() -> None:
+    """
+    Test splitting text into token-bounded pieces.
+
+    Expected behavior: Pieces stay within budget, break between sentences,
+    and an over-long sentence is split between words.
+    """
+    text = "Short one. Another short one.\nThis sentence is far too long to fit in one piece."
+
+    pieces = split_by_tokens(text, max_tokens=8, model="gpt-4o-mini")
+
+    assert pieces[0] == "Short one."
+    assert all(count_tokens(piece, "gpt-4o-mini") <= 8 for piece in pieces)
+    assert " ".join(pieces).split() == text.split()
@@ -0,0 +1,57 @@
+"""
+Transcript stitching tests.
+
+Tests for joining chunk transcriptions on the recording timeline.
+"""
+
+from app.utils.audio import ChunkSpan
+from app.utils.transcript import ChunkTranscript, TextSegment, remove_overlap, stitch_chunks
+
+
+def test_repeated_words_across_overlap_are_removed() -> None:
+    """
+    Test overlap de-duplication.
+
+    Expected behavior: Words repeated at the start of the next chunk are dropped,
+    ignoring case and punctuation; a single shared word is kept.
+    """
+    assert remove_overlap("we agreed on the budget.", "The budget, then hiring.") == "then hiring."
+    assert remove_overlap("see you next week", "week two starts") == "week two starts"
+
+
+def test_stitched_segments_use_global_timestamps() -> None:
+    """
+    Test stitching chunks out of order.
+
+    Expected behavior: Segments are shifted by the chunk start, overlap segments
+    appear once, and the most common language wins.
+    """
+    first = ChunkTranscript(
+        span=ChunkSpan(index=0, start=0.0, end=11.0, keep_start=0.0, keep_end=10.0),
+        text="Hello everyone. Let's start with the budget for next year. Hiring",
+        language="en",
+        segments=[
+            TextSegment(0.0, 4.0, "Hello everyone."),
+            TextSegment(4.0, 10.4, "Let's start with the budget for next year."),
+            TextSegment(10.4, 11.0, "Hiring"),
+        ],
+    )
+    second = ChunkTranscript(
+        span=ChunkSpan(index=1, start=9.0, end=16.0, keep_start=10.0, keep_end=16.0),
+        text="next year. Hiring is approved. Any questions?",
+        language="en",
+        segments=[
+            TextSegment(0.0, 4.0, "next year. Hiring is approved."),
+            TextSegment(4.0, 7.0, "Any questions?"),
+        ],
+    )
+
+    stitched = stitch_chunks([second, first], duration=16.0)
+
+    assert stitched.text == (
+        "Hello everyone. Let's start with the budget for next year. "
+        "Hiring is approved. Any questions?"
+    )
+    assert stitched.segments[-1] == TextSegment(13.0, 16.0, "Any questions?")
+    assert stitched.language == "en"
+    assert stitched.duration == 16.0
@@ -0,0 +1,75 @@
+"""
+Voice activity detection tests.
+
+Tests for speech detection, trimmed audio and timestamp mapping.
+"""
+
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.utils.audio import SAMPLE_RATE
+from app.utils.transcript import TextSegment
+from app.utils.vad import SpeechMap, classify_frames, detect_speech, write_speech
+from tests.conftest import write_wav
+
+
+def test_long_silences_are_cut_and_short_pauses_kept(tmp_path: Path) -> None:
+    """
+    Test speech detection on tone bursts separated by a long and a short pause.
+
+    Expected behavior: Two padded spans; the 1 s pause stays inside the second one.
+    """
+    path = write_wav(
+        tmp_path / "meeting.wav",
+        [(5.0, True), (20.0, False), (5.0, True), (1.0, False), (4.0, True), (6.0, False)],
+    )
+
+    speech_map = detect_speech(path, min_silence_seconds=2.0, padding_seconds=0.3, gap_seconds=0.5)
+
+    assert speech_map.duration == 41.0
+    assert len(speech_map.spans) == 2
+    assert speech_map.spans[0] == pytest.approx((0.0, 5.3), abs=0.04)
+    assert speech_map.spans[1] == pytest.approx((24.7, 35.3), abs=0.04)
+    assert speech_map.removed_seconds == pytest.approx(41.0 - 5.3 - 0.5 - 10.6, abs=0.1)
+
+
+def test_quiet_frames_crossing_zero_often_are_speech() -> None:
+    """
+    Test the zero-crossing rule for unvoiced consonants.
+
+    Expected behavior: A frame just below the energy threshold is speech only
+    when its zero-crossing rate is high.
+    """
+    energies = np.array([700.0] * 10 + [4000.0] * 10 + [1500.0, 1500.0])
+    crossings = np.array([0.0] * 20 + [0.05, 0.4])
+
+    speech = classify_frames(energies, crossings)
+
+    assert not speech[:10].any()
+    assert speech[10:20].all()
+    assert speech[-2:].tolist() == [False, True]
+
+
+def test_trimmed_audio_and_timestamps_line_up(tmp_path: Path) -> None:
+    """
+    Test writing the kept spans and mapping timestamps back.
+
+    Expected behavior: The trimmed WAV holds the spans plus gaps, and its times
+    map onto the original recording, also for times inside a gap.
+    """
+    path = write_wav(tmp_path / "meeting.wav", [(2.0, True), (10.0, False), (3.0, True)])
+    speech_map = SpeechMap(spans=[(0.0, 2.0), (12.0, 15.0)], gap_seconds=0.5, duration=15.0)
+
+    write_speech(path, speech_map, tmp_path / "speech.wav")
+
+    with wave.open(str(tmp_path / "speech.wav"), "rb") as wav:
+        assert wav.getnframes() == int(5.5 * SAMPLE_RATE)
+    assert speech_map.to_original(np.array([1.0, 2.2, 3.0, 5.5])).tolist() == pytest.approx(
+        [1.0, 2.2, 12.5, 15.0]
+    )
+    assert speech_map.map_segments([TextSegment(2.5, 4.0, "Budget.")]) == [
+        TextSegment(12.0, 13.5, "Budget.")
+    ]
@@ -1,150 +1,154 @@
 /**
  * AudioRecorder component with Listen button.
  *
- * Handles microphone access, recording, upload, and processing coordination.
+ * Handles microphone access and streams the recording to the backend while
+ * it is recorded, so only the last few seconds are left to transcribe when
+ * recording stops.
  */
 
 import { useState, useRef, useEffect } from 'react';
+import { usePolling } from '../hooks/usePolling';
 import { api } from '../services/api';
-import type { ProcessingStatus, SummaryResponse } from '../types';
+import type { LiveMessage, ProcessingStatus } from '../types';
 import { ProcessingIndicator } from './ProcessingIndicator';
 import { SummaryDisplay } from './SummaryDisplay';
 
+// How often MediaRecorder hands a chunk to the live WebSocket
+const CHUNK_INTERVAL_MS = 1000;
+
 export function AudioRecorder() {
   const [status, setStatus] = useState<ProcessingStatus>('idle');
   const [recordingTime, setRecordingTime] = useState(0);
   const [errorMessage, setErrorMessage] = useState<string>('');
-  const [summary, setSummary] = useState<SummaryResponse | null>(null);
+  const [audioId, setAudioId] = useState<string | null>(null);
+  const [liveTranscript, setLiveTranscript] = useState('');
 
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
-  const audioChunksRef = useRef<Blob[]>([]);
+  const socketRef = useRef<WebSocket | null>(null);
   const timerRef = useRef<number | null>(null);
-  const pollingRef = useRef<number | null>(null);
+
+  // Follow the summary once the recording is stored (event stream, polling fallback)
+  const { audioStatus, summary, error } = usePolling({
+    audioId,
+    enabled: status === 'processing',
+  });
+
+  useEffect(() => {
+    if (status !== 'processing') return;
+
+    if (summary) {
+      setStatus('completed');
+    } else if (error) {
+      setErrorMessage(error);
+      setStatus('error');
+    }
+  }, [status, summary, error]);
 
   useEffect(() => {
     // Cleanup on unmount
     return () => {
       if (timerRef.current) clearInterval(timerRef.current);
-      if (pollingRef.current) clearInterval(pollingRef.current);
       if (mediaRecorderRef.current && mediaRecorderRef.current.state === 'recording') {
         mediaRecorderRef.current.stop();
       }
+      socketRef.current?.close();
     };
   }, []);
 
+  const stopTimer = () => {
+    if (timerRef.current) {
+      clearInterval(timerRef.current);
+      timerRef.current = null;
+    }
+  };
+
+  const fail = (message: string) => {
+    stopTimer();
+    socketRef.current = null;
+    if (mediaRecorderRef.current && mediaRecorderRef.current.state === 'recording') {
+      mediaRecorderRef.current.stop();
+    }
+    setErrorMessage(message);
+    setStatus('error');
+  };
+
   const startRecording = async () => {
+    let stream: MediaStream;
     try {
       // Request microphone access
-      const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
-
-      // Create MediaRecorder
-      const mediaRecorder = new MediaRecorder(stream, {
-        mimeType: 'audio/webm',
-      });
-
-      mediaRecorderRef.current = mediaRecorder;
-      audioChunksRef.current = [];
-
-      // Handle data available
-      mediaRecorder.ondataavailable = (event) => {
-        if (event.data.size > 0) {
-          audioChunksRef.current.push(event.data);
-        }
-      };
-
-      // Handle recording stopped
-      mediaRecorder.onstop = async () => {
-        const audioBlob = new Blob(audioChunksRef.current, { type: 'audio/webm' });
-        await uploadAudio(audioBlob);
-
-        // Stop all tracks
-        stream.getTracks().forEach((track) => track.stop());
-      };
-
-      // Start recording
-      mediaRecorder.start();
+      stream = await navigator.mediaDevices.getUserMedia({ audio: true });
+    } catch (error) {
+      console.error('Error accessing microphone:', error);
+      setErrorMessage('Failed to access microphone. Please grant permission.');
+      setStatus('error');
+      return;
+    }
+
+    // Create MediaRecorder
+    const mediaRecorder = new MediaRecorder(stream, {
+      mimeType: 'audio/webm',
+    });
+    const socket = new WebSocket(api.getLiveUrl(`recording_${Date.now()}.webm`));
+    mediaRecorderRef.current = mediaRecorder;
+    socketRef.current = socket;
+
+    // Send each chunk as soon as it is recorded
+    mediaRecorder.ondataavailable = (event) => {
+      if (event.data.size > 0 && socket.readyState === WebSocket.OPEN) {
+        socket.send(event.data);
+      }
+    };
+
+    // The last chunk is delivered before onstop, so the server has everything
+    mediaRecorder.onstop = () => {
+      stream.getTracks().forEach((track) => track.stop());
+      if (socketRef.current === socket && socket.readyState === WebSocket.OPEN) {
+        socket.send('stop');
+        setStatus('processing');
+      }
+    };
+
+    socket.onopen = () => {
+      mediaRecorder.start(CHUNK_INTERVAL_MS);
       setStatus('recording');
       setRecordingTime(0);
       setErrorMessage('');
+      setLiveTranscript('');
 
       // Start timer
       timerRef.current = window.setInterval(() => {
         setRecordingTime((prev) => prev + 1);
       }, 1000);
-    } catch (error) {
-      console.error('Error accessing microphone:', error);
-      setErrorMessage('Failed to access microphone. Please grant permission.');
-      setStatus('error');
-    }
+    };
+
+    socket.onmessage = (event) => {
+      const message: LiveMessage = JSON.parse(event.data);
+      if (message.type === 'progress' && message.segments.length > 0) {
+        const text = message.segments.map((segment) => segment.text).join(' ');
+        setLiveTranscript((prev) => (prev ? `${prev} ${text}` : text));
+      } else if (message.type === 'completed') {
+        // Transcript is stored; usePolling follows the summary from here
+        socketRef.current = null;
+        setAudioId(message.audio_id);
+      } else if (message.type === 'error') {
+        fail(message.detail);
+      }
+    };
+
+    socket.onclose = () => {
+      if (socketRef.current !== socket) return;
+      stream.getTracks().forEach((track) => track.stop());
+      fail('Connection to the server was lost');
+    };
   };
 
   const stopRecording = () => {
     if (mediaRecorderRef.current && mediaRecorderRef.current.state === 'recording') {
       mediaRecorderRef.current.stop();
-      if (timerRef.current) {
-        clearInterval(timerRef.current);
-        timerRef.current = null;
-      }
-    }
-  };
-
-  const uploadAudio = async (audioBlob: Blob) => {
-    setStatus('uploading');
-
-    try {
-      // Create file from blob
-      const file = new File([audioBlob], `recording_${Date.now()}.webm`, {
-        type: 'audio/webm',
-      });
-
-      // Upload to backend
-      const uploadResponse = await api.uploadAudio(file);
-
-      // Start processing
-      await api.startProcessing(uploadResponse.id);
-      setStatus('processing');
-
-      // Start polling for status
-      startStatusPolling(uploadResponse.id);
-    } catch (error: any) {
-      console.error('Upload failed:', error);
-      setErrorMessage(error.response?.data?.detail || 'Failed to upload audio');
-      setStatus('error');
+      stopTimer();
     }
   };
 
-  const startStatusPolling = (audioId: string) => {
-    pollingRef.current = window.setInterval(async () => {
-      try {
-        const statusResponse = await api.getAudioStatus(audioId);
-
-        if (statusResponse.status === 'completed' && statusResponse.summary_id) {
-          // Fetch summary
-          const summaryResponse = await api.getSummary(statusResponse.summary_id);
-          setSummary(summaryResponse);
-          setStatus('completed');
-
-          // Stop polling
-          if (pollingRef.current) {
-            clearInterval(pollingRef.current);
-            pollingRef.current = null;
-          }
-        } else if (statusResponse.status === 'failed') {
-          setErrorMessage(statusResponse.error_message || 'Processing failed');
-          setStatus('error');
-
-          // Stop polling
-          if (pollingRef.current) {
-            clearInterval(pollingRef.current);
-            pollingRef.current = null;
-          }
-        }
-      } catch (error) {
-        console.error('Status polling error:', error);
-      }
-    }, 2000); // Poll every 2 seconds
-  };
-
   const formatTime = (seconds: number): string => {
     const mins = Math.floor(seconds / 60);
     const secs = seconds % 60;
@@ -155,7 +159,8 @@ export function AudioRecorder() {
     setStatus('idle');
     setRecordingTime(0);
     setErrorMessage('');
-    setSummary(null);
+    setAudioId(null);
+    setLiveTranscript('');
   };
 
   return (
@@ -189,11 +194,12 @@ export function AudioRecorder() {
             <span className="pulse-dot"></span>
             <span className="recording-time">{formatTime(recordingTime)}</span>
           </div>
+          {liveTranscript && <p className="live-transcript">{liveTranscript}</p>}
         </div>
       )}
 
       {(status === 'uploading' || status === 'processing') && (
-        <ProcessingIndicator status={status} />
+        <ProcessingIndicator status={status} stage={audioStatus?.stage} />
       )}
 
       {status === 'completed' && summary && (
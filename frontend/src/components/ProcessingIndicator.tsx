@@ -4,19 +4,31 @@
  * Shows upload and processing status.
  */
 
-import type { ProcessingStatus } from '../types';
+import type { PipelineStage, ProcessingStatus } from '../types';
 
 interface ProcessingIndicatorProps {
   status: ProcessingStatus;
+  stage?: PipelineStage;
 }
 
-export function ProcessingIndicator({ status }: ProcessingIndicatorProps) {
+const STAGE_MESSAGES: Partial<Record<PipelineStage, string>> = {
+  queued: 'Waiting for a worker...',
+  transcoding: 'Preparing your audio...',
+  transcribing: 'Transcribing your meeting...',
+  summarizing: 'Summarizing your meeting...',
+  retrying: 'Something went wrong, retrying...',
+};
+
+export function ProcessingIndicator({ status, stage }: ProcessingIndicatorProps) {
+  const stageMessage = stage && STAGE_MESSAGES[stage];
+
   return (
     <div className="processing-indicator">
       <div className="spinner"></div>
       <p className="processing-message">
         {status === 'uploading' && 'Uploading audio...'}
-        {status === 'processing' && 'Processing your meeting (transcription + summarization)...'}
+        {status === 'processing' &&
+          (stageMessage || 'Processing your meeting (transcription + summarization)...')}
       </p>
       <p className="processing-note">This may take a minute or two</p>
     </div>
@@ -1,5 +1,8 @@
 /**
- * usePolling hook for polling API status.
+ * usePolling hook for following audio processing status.
+ *
+ * Listens to the server's status event stream and falls back to polling
+ * the status endpoint when the stream is unavailable.
  */
 
 import { useState, useEffect, useCallback, useRef } from 'react';
@@ -31,8 +34,13 @@ export function usePolling({
   const [isPolling, setIsPolling] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const pollingRef = useRef<number | null>(null);
+  const eventSourceRef = useRef<EventSource | null>(null);
 
   const stopPolling = useCallback(() => {
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
+    }
     if (pollingRef.current) {
       clearInterval(pollingRef.current);
       pollingRef.current = null;
@@ -40,39 +48,80 @@ export function usePolling({
     setIsPolling(false);
   }, []);
 
+  const handleStatus = useCallback(
+    async (status: AudioStatusResponse) => {
+      setAudioStatus(status);
+
+      try {
+        if (status.status === 'completed' && status.summary_id) {
+          stopPolling();
+          const summaryData = await api.getSummary(status.summary_id);
+          setSummary(summaryData);
+        } else if (status.status === 'failed') {
+          setError(status.error_message || 'Processing failed');
+          stopPolling();
+        }
+      } catch (err: any) {
+        setError(err.message || 'Failed to fetch summary');
+      }
+    },
+    [stopPolling]
+  );
+
   const poll = useCallback(async () => {
     if (!audioId) return;
 
     try {
       const status = await api.getAudioStatus(audioId);
-      setAudioStatus(status);
-
-      if (status.status === 'completed' && status.summary_id) {
-        const summaryData = await api.getSummary(status.summary_id);
-        setSummary(summaryData);
-        stopPolling();
-      } else if (status.status === 'failed') {
-        setError(status.error_message || 'Processing failed');
-        stopPolling();
-      }
+      await handleStatus(status);
     } catch (err: any) {
       setError(err.message || 'Polling failed');
       stopPolling();
     }
-  }, [audioId, stopPolling]);
+  }, [audioId, handleStatus, stopPolling]);
+
+  const startIntervalPolling = useCallback(() => {
+    // Initial poll
+    poll();
+
+    // Set up interval
+    pollingRef.current = window.setInterval(poll, interval);
+  }, [interval, poll]);
 
   const startPolling = useCallback(() => {
-    if (!audioId || pollingRef.current) return;
+    if (!audioId || eventSourceRef.current || pollingRef.current) return;
 
     setIsPolling(true);
     setError(null);
 
-    // Initial poll
-    poll();
+    if (typeof EventSource === 'undefined') {
+      startIntervalPolling();
+      return;
+    }
 
-    // Set up interval
-    pollingRef.current = window.setInterval(poll, interval);
-  }, [audioId, interval, poll]);
+    // The stream sends the current status first, then every stage transition
+    const source = new EventSource(api.getEventsUrl(audioId));
+    eventSourceRef.current = source;
+
+    source.addEventListener('status', (event) => {
+      handleStatus(JSON.parse((event as MessageEvent).data));
+    });
+
+    source.onerror = () => {
+      // Stream unavailable or dropped before completion: fall back to polling
+      if (eventSourceRef.current !== source) return;
+      source.close();
+      eventSourceRef.current = null;
+      startIntervalPolling();
+    };
+  }, [audioId, handleStatus, startIntervalPolling]);
+
+  useEffect(() => {
+    // Results belong to one audio file
+    setAudioStatus(null);
+    setSummary(null);
+    setError(null);
+  }, [audioId]);
 
   useEffect(() => {
     if (enabled && audioId) {
@@ -44,6 +44,23 @@ export const api = {
     return response.data;
   },
 
+  /**
+   * URL of the audio status event stream (Server-Sent Events).
+   */
+  getEventsUrl(audioId: string): string {
+    return `${API_BASE_URL}/api/v1/audio/${audioId}/events`;
+  },
+
+  /**
+   * URL of the live recording WebSocket (chunks are transcribed while recording).
+   */
+  getLiveUrl(filename: string): string {
+    const url = new URL('/api/v1/audio/live', API_BASE_URL);
+    url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+    url.searchParams.set('filename', filename);
+    return url.toString();
+  },
+
   /**
    * Start processing audio file (transcription + summarization).
    */
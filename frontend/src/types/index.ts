@@ -12,6 +12,7 @@ export interface AudioStatusResponse {
   id: string;
   filename: string;
   status: string;
+  stage?: PipelineStage;
   duration_seconds?: number;
   error_message?: string;
   transcription_id?: string;
@@ -30,6 +31,7 @@ export interface SummaryResponse {
   participants: string[];
   tokens_used?: number;
   model_used?: string;
+  route?: 'fast' | 'single' | 'chunked' | 'incremental';
   status: string;
   created_at: string;
 }
@@ -44,4 +46,38 @@ export interface TranscriptionResponse {
   created_at: string;
 }
 
+export interface LiveSegment {
+  start: number;
+  end: number;
+  text: string;
+}
+
+// Messages sent by the live recording WebSocket
+export type LiveMessage =
+  | { type: 'started'; audio_id: string }
+  | {
+      type: 'progress';
+      received_bytes: number;
+      recorded_seconds: number;
+      segments: LiveSegment[];
+    }
+  | {
+      type: 'completed';
+      audio_id: string;
+      transcription_id: string;
+      summary_id: string | null;
+    }
+  | { type: 'error'; detail: string };
+
 export type ProcessingStatus = 'idle' | 'recording' | 'uploading' | 'processing' | 'completed' | 'error';
+
+export type PipelineStage =
+  | 'recording'
+  | 'uploaded'
+  | 'queued'
+  | 'transcoding'
+  | 'transcribing'
+  | 'summarizing'
+  | 'retrying'
+  | 'completed'
+  | 'failed';